@@ -0,0 +1,72 @@
+"""add_classification_batches
+
+Revision ID: add_classification_batches
+Revises: add_llm_result_cache
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_classification_batches'
+down_revision = 'add_llm_result_cache'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add classification_batches table and raw_transcripts.classification_batch_id.
+
+    Tracks OpenAI Batch API backfill jobs so submit/poll/apply can resume
+    across worker restarts.
+    """
+    op.create_table(
+        'classification_batches',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('workspace_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('workspaces.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('openai_batch_id', sa.String(length=100), nullable=True, unique=True),
+        sa.Column('input_file_id', sa.String(length=100), nullable=True),
+        sa.Column('output_file_id', sa.String(length=100), nullable=True),
+        sa.Column('error_file_id', sa.String(length=100), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='submitted'),
+        sa.Column('openai_status', sa.String(length=30), nullable=True),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('prompt_version', sa.String(length=100), nullable=True),
+        sa.Column('request_meta', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='{}'),
+        sa.Column('transcript_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('request_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_request_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('failed_request_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('applied_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('prompt_tokens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completion_tokens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('cost_usd', sa.Float(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('submitted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('applied_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index('ix_classification_batches_id', 'classification_batches', ['id'])
+    op.create_index('idx_classification_batches_status', 'classification_batches', ['status'])
+
+    op.add_column(
+        'raw_transcripts',
+        sa.Column('classification_batch_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('classification_batches.id', ondelete='SET NULL'), nullable=True)
+    )
+    op.create_index('idx_raw_transcripts_classification_batch', 'raw_transcripts', ['classification_batch_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_raw_transcripts_classification_batch', table_name='raw_transcripts')
+    op.drop_column('raw_transcripts', 'classification_batch_id')
+    op.drop_index('idx_classification_batches_status', table_name='classification_batches')
+    op.drop_index('ix_classification_batches_id', table_name='classification_batches')
+    op.drop_table('classification_batches')
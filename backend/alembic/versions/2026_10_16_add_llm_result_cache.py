@@ -0,0 +1,47 @@
+"""add_llm_result_cache
+
+Revision ID: add_llm_result_cache
+Revises: add_theme_arrays
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_llm_result_cache'
+down_revision = 'add_theme_arrays'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add llm_result_cache table.
+
+    Stores LLM results keyed by a hash of the input text, prompt version and
+    taxonomy version so duplicate transcripts are not classified twice.
+    """
+    op.create_table(
+        'llm_result_cache',
+        sa.Column('cache_key', sa.String(length=64), primary_key=True),
+        sa.Column('namespace', sa.String(length=50), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('prompt_version', sa.String(length=100), nullable=False),
+        sa.Column('taxonomy_version', sa.String(length=64), nullable=False, server_default=''),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    )
+    op.create_index('idx_llm_result_cache_last_used', 'llm_result_cache', ['last_used_at'])
+    op.create_index('idx_llm_result_cache_namespace_content', 'llm_result_cache', ['namespace', 'content_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_llm_result_cache_namespace_content', table_name='llm_result_cache')
+    op.drop_index('idx_llm_result_cache_last_used', table_name='llm_result_cache')
+    op.drop_table('llm_result_cache')
@@ -0,0 +1,67 @@
+"""add_raw_transcript_dedup_key
+
+Revision ID: add_raw_transcript_dedup_key
+Revises: add_classification_batches
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_raw_transcript_dedup_key'
+down_revision = 'add_classification_batches'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add raw_transcripts.dedup_key with a partial unique index per workspace.
+
+    dedup_key = lower(trim(title)) || '|' || UTC date of the transcript, the
+    same "same meeting name on the same day" rule ingestion used to enforce by
+    loading every (title, date) pair of the workspace into memory.
+    Transcripts without a date get 'undated|<id>', never a duplicate.
+
+    Existing duplicates stay in the table: only the most recently created row
+    of each group gets the key (the row the message list already showed), the
+    older copies keep NULL. scripts/cleanup_duplicate_transcripts.py deletes
+    those NULL-key rows.
+    """
+    op.add_column('raw_transcripts', sa.Column('dedup_key', sa.String(length=520), nullable=True))
+
+    op.execute("""
+        UPDATE raw_transcripts rt
+        SET dedup_key = keyed.dedup_key
+        FROM (
+            SELECT DISTINCT ON (workspace_id, dedup_key) id, dedup_key
+            FROM (
+                SELECT
+                    id,
+                    workspace_id,
+                    created_at,
+                    CASE WHEN transcript_date IS NULL THEN 'undated|' || id::text
+                    ELSE lower(btrim(coalesce(title, ''))) || '|' ||
+                        to_char((transcript_date AT TIME ZONE 'UTC')::date, 'YYYY-MM-DD')
+                    END AS dedup_key
+                FROM raw_transcripts
+            ) candidates
+            ORDER BY workspace_id, dedup_key, created_at DESC
+        ) keyed
+        WHERE rt.id = keyed.id
+    """)
+
+    op.create_index(
+        'uq_raw_transcripts_dedup_key',
+        'raw_transcripts',
+        ['workspace_id', 'dedup_key'],
+        unique=True,
+        postgresql_where=sa.text('dedup_key IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_raw_transcripts_dedup_key', table_name='raw_transcripts')
+    op.drop_column('raw_transcripts', 'dedup_key')
@@ -0,0 +1,45 @@
+"""add_sync_watermarks
+
+Revision ID: add_sync_watermarks
+Revises: add_raw_transcript_dedup_key
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_sync_watermarks'
+down_revision = 'add_raw_transcript_dedup_key'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add sync_watermarks: per connector (and channel/label) high-water marks
+    for incremental periodic syncs.
+
+    No backfill: a connector without a watermark does one sync with its
+    previous fixed window, which then sets the mark.
+    """
+    op.create_table(
+        'sync_watermarks',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('connector_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('workspace_connectors.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('scope', sa.String(length=255), nullable=False, server_default=''),
+        sa.Column('cursor', sa.String(length=255), nullable=True),
+        sa.Column('last_item_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.UniqueConstraint('connector_id', 'scope', name='uq_sync_watermarks_connector_scope'),
+    )
+    op.create_index('ix_sync_watermarks_id', 'sync_watermarks', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sync_watermarks_id', table_name='sync_watermarks')
+    op.drop_table('sync_watermarks')
@@ -0,0 +1,48 @@
+"""add_transcript_insight_rollups
+
+Revision ID: add_transcript_insight_rollups
+Revises: add_sync_watermarks
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_transcript_insight_rollups'
+down_revision = 'add_sync_watermarks'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add transcript_insight_rollups: per workspace/day counters behind the
+    transcript insights endpoint, kept up to date as classifications are saved.
+
+    Table only. Existing completed classifications are counted by a deploy step
+    run after this migration (the counting logic lives in
+    TranscriptInsightsService.rebuild):
+
+        python scripts/rebuild_transcript_insights.py --all
+    """
+    op.create_table(
+        'transcript_insight_rollups',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('workspace_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('workspaces.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('dimension', sa.String(length=50), nullable=False),
+        sa.Column('key', sa.String(length=255), nullable=False, server_default=''),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.UniqueConstraint('workspace_id', 'day', 'dimension', 'key', name='uq_transcript_insight_rollups_key'),
+    )
+    op.create_index('ix_transcript_insight_rollups_id', 'transcript_insight_rollups', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transcript_insight_rollups_id', table_name='transcript_insight_rollups')
+    op.drop_table('transcript_insight_rollups')
@@ -8,6 +8,7 @@ import traceback
 
 from app.core.deps import get_current_user, get_db
 from app.services.auth_service import AuthService
+from app.services.principal_cache import principal_cache
 from app.schemas.auth import (
     UserCreate,
     UserUpdate,
@@ -121,6 +122,7 @@ async def login(
             # Update user's workspace_id for future logins
             user.workspace_id = workspace.id
             db.commit()
+            principal_cache.invalidate(user.id)
 
     return Token(**tokens)
 
@@ -169,6 +171,7 @@ async def login_json(
             # Update user's workspace_id for future logins
             user.workspace_id = workspace.id
             db.commit()
+            principal_cache.invalidate(user.id)
 
     return Token(**tokens)
 
@@ -225,6 +228,7 @@ async def login_google(
                 # Update user's workspace_id for future logins
                 user.workspace_id = workspace.id
                 db.commit()
+                principal_cache.invalidate(user.id)
 
         return Token(**tokens)
 
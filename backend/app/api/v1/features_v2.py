@@ -4,20 +4,20 @@ Replaces old features.py which used deprecated Feature model
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import List, Optional
 from pydantic import BaseModel
 import logging
 
-from app.core.deps import get_current_user, get_db
+from app.core.deps import get_async_db, get_current_user, get_db
 from app.models.user import User
 from app.models.customer_ask import CustomerAsk
 from app.models.sub_theme import SubTheme
 from app.models.theme import Theme
-from app.models.message import Message
-from app.models.customer import Customer
+from app.services.cache_service import bump_taxonomy_version
+from app.services.executive_insights_service import executive_insights_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -61,7 +61,7 @@ class ThemeResponse(BaseModel):
 # ============================================
 
 @router.get("/themes", response_model=List[ThemeResponse])
-async def get_themes(
+def get_themes(
     workspace_id: str,
     include_sub_themes: bool = True,
     current_user: User = Depends(get_current_user),
@@ -149,7 +149,7 @@ async def get_themes(
 
 
 @router.post("/themes", response_model=ThemeResponse)
-async def create_theme(
+def create_theme(
     request: ThemeCreateRequest,
     workspace_id: str,
     current_user: User = Depends(get_current_user),
@@ -187,6 +187,7 @@ async def create_theme(
         db.add(new_theme)
         db.commit()
         db.refresh(new_theme)
+        bump_taxonomy_version(workspace_id)
 
         return ThemeResponse(
             id=str(new_theme.id),
@@ -216,7 +217,7 @@ async def create_theme(
 
 
 @router.put("/themes/{theme_id}", response_model=ThemeResponse)
-async def update_theme(
+def update_theme(
     theme_id: str,
     request: ThemeUpdateRequest,
     workspace_id: str,
@@ -259,6 +260,7 @@ async def update_theme(
 
         db.commit()
         db.refresh(theme)
+        bump_taxonomy_version(workspace_id)
 
         # Get counts for response
         feature_count = db.query(func.count(CustomerAsk.id)).join(
@@ -301,7 +303,7 @@ async def update_theme(
 
 
 @router.delete("/themes/{theme_id}")
-async def delete_theme(
+def delete_theme(
     theme_id: str,
     workspace_id: str,
     current_user: User = Depends(get_current_user),
@@ -326,6 +328,7 @@ async def delete_theme(
         # Delete the theme (cascade will handle sub_themes and customer_asks)
         db.delete(theme)
         db.commit()
+        bump_taxonomy_version(workspace_id)
 
         return {"message": "Theme deleted successfully"}
 
@@ -349,7 +352,8 @@ async def delete_theme(
 @router.get("/executive-insights")
 async def get_executive_insights(
     workspace_id: str,
-    db: Session = Depends(get_db),
+    refresh: bool = False,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -364,319 +368,13 @@ async def get_executive_insights(
     - Recent activity (this week vs last week)
     - Customer industry breakdown
     - Customer health metrics
+
+    Served from a per-workspace snapshot (one query, cached for a few minutes and
+    dropped on customer ask changes); snapshot_age_seconds says how old it is.
+    Pass refresh=true to recompute.
     """
     try:
-        # 1. Summary metrics - all in SQL
-        total_features = db.query(func.count(CustomerAsk.id)).filter(
-            CustomerAsk.workspace_id == workspace_id
-        ).scalar() or 0
-
-        total_themes = db.query(func.count(Theme.id)).filter(
-            Theme.workspace_id == workspace_id
-        ).scalar() or 0
-
-        total_mentions = db.query(func.coalesce(func.sum(CustomerAsk.mention_count), 0)).filter(
-            CustomerAsk.workspace_id == workspace_id
-        ).scalar() or 0
-
-        # 2. Customer asks by status - aggregated in SQL
-        asks_by_status = db.query(
-            CustomerAsk.status,
-            func.count(CustomerAsk.id).label('count')
-        ).filter(
-            CustomerAsk.workspace_id == workspace_id
-        ).group_by(CustomerAsk.status).all()
-
-        status_counts = {
-            'new': 0,
-            'in_progress': 0,
-            'completed': 0,
-            'on_hold': 0
-        }
-
-        # Normalize status values to match expected keys
-        status_mapping = {
-            'new': 'new',
-            'under-review': 'in_progress',
-            'under_review': 'in_progress',
-            'in_progress': 'in_progress',
-            'in-progress': 'in_progress',
-            'planned': 'in_progress',
-            'completed': 'completed',
-            'shipped': 'completed',
-            'on_hold': 'on_hold',
-            'on-hold': 'on_hold',
-            'on hold': 'on_hold',
-        }
-
-        for status, count in asks_by_status:
-            if status:
-                # Normalize status (lowercase and handle variations)
-                normalized_status = status_mapping.get(status.lower(), 'new')
-                if normalized_status in status_counts:
-                    status_counts[normalized_status] += count
-                else:
-                    # If status doesn't match, default to 'new'
-                    status_counts['new'] += count
-
-        # 3. Customer asks by urgency - aggregated in SQL
-        asks_by_urgency = db.query(
-            CustomerAsk.urgency,
-            func.count(CustomerAsk.id).label('count')
-        ).filter(
-            CustomerAsk.workspace_id == workspace_id
-        ).group_by(CustomerAsk.urgency).all()
-
-        urgency_counts = {
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0
-        }
-        for urgency, count in asks_by_urgency:
-            if urgency in urgency_counts:
-                urgency_counts[urgency] = count
-
-        # 4. Top themes - aggregated in SQL
-        # Count customer asks per theme (through sub_themes)
-        top_themes = db.query(
-            Theme.id,
-            Theme.name,
-            func.count(CustomerAsk.id).label('feature_count')
-        ).outerjoin(
-            SubTheme, SubTheme.theme_id == Theme.id
-        ).outerjoin(
-            CustomerAsk, CustomerAsk.sub_theme_id == SubTheme.id
-        ).filter(
-            Theme.workspace_id == workspace_id
-        ).group_by(
-            Theme.id, Theme.name
-        ).order_by(
-            func.count(CustomerAsk.id).desc()
-        ).limit(5).all()
-
-        # 5. Top 10 customer asks by mentions - with theme info
-        top_features_query = db.query(
-            CustomerAsk.id,
-            CustomerAsk.name,
-            CustomerAsk.description,
-            CustomerAsk.urgency,
-            CustomerAsk.status,
-            CustomerAsk.mention_count,
-            CustomerAsk.sub_theme_id,
-            CustomerAsk.first_mentioned_at,
-            CustomerAsk.last_mentioned_at,
-            CustomerAsk.created_at,
-            CustomerAsk.updated_at,
-            SubTheme.theme_id,
-            Theme.id.label('theme_id_obj'),
-            Theme.name.label('theme_name'),
-            Theme.description.label('theme_description')
-        ).join(
-            SubTheme, CustomerAsk.sub_theme_id == SubTheme.id
-        ).join(
-            Theme, SubTheme.theme_id == Theme.id
-        ).filter(
-            CustomerAsk.workspace_id == workspace_id
-        ).order_by(
-            CustomerAsk.mention_count.desc()
-        ).limit(10).all()
-
-        # 6. Recent activity - this week vs last week
-        now = datetime.now(dt_timezone.utc)
-        one_week_ago = now - timedelta(days=7)
-        two_weeks_ago = now - timedelta(days=14)
-
-        features_this_week = db.query(func.count(CustomerAsk.id)).filter(
-            CustomerAsk.workspace_id == workspace_id,
-            CustomerAsk.created_at >= one_week_ago
-        ).scalar() or 0
-
-        features_last_week = db.query(func.count(CustomerAsk.id)).filter(
-            CustomerAsk.workspace_id == workspace_id,
-            CustomerAsk.created_at >= two_weeks_ago,
-            CustomerAsk.created_at < one_week_ago
-        ).scalar() or 0
-
-        # 7. Customers by industry - aggregated in SQL (top 10)
-        customers_by_industry = db.query(
-            Customer.industry,
-            func.count(Customer.id).label('count')
-        ).filter(
-            Customer.workspace_id == workspace_id,
-            Customer.is_active == True
-        ).group_by(Customer.industry).order_by(
-            func.count(Customer.id).desc()
-        ).limit(10).all()
-
-        # Format industry data
-        industry_data = [
-            {
-                'industry': industry if industry else 'Unknown',
-                'count': count
-            }
-            for industry, count in customers_by_industry
-        ]
-
-        # 8. Calls/Messages per day for the last 90 days - aggregated in SQL
-        ninety_days_ago = now - timedelta(days=90)
-
-        calls_per_day = db.query(
-            func.date(Message.sent_at).label('date'),
-            func.count(Message.id).label('count')
-        ).filter(
-            Message.workspace_id == workspace_id,
-            Message.sent_at >= ninety_days_ago
-        ).group_by(
-            func.date(Message.sent_at)
-        ).order_by(
-            func.date(Message.sent_at)
-        ).all()
-
-        # Format calls per day data
-        calls_per_day_data = [
-            {
-                'date': date.isoformat() if date else None,
-                'count': count
-            }
-            for date, count in calls_per_day
-        ]
-
-        # 9. Top 10 Most Engaged Customers - by message count
-        top_engaged_customers = db.query(
-            Customer.id,
-            Customer.name,
-            Customer.industry,
-            func.count(Message.id).label('message_count')
-        ).join(
-            Message, Customer.id == Message.customer_id
-        ).filter(
-            Customer.workspace_id == workspace_id,
-            Customer.is_active == True
-        ).group_by(
-            Customer.id, Customer.name, Customer.industry
-        ).order_by(
-            func.count(Message.id).desc()
-        ).limit(10).all()
-
-        # Format top engaged customers
-        top_engaged_data = [
-            {
-                'customer_id': str(customer_id),
-                'name': name,
-                'industry': industry if industry else 'Unknown',
-                'message_count': message_count
-            }
-            for customer_id, name, industry, message_count in top_engaged_customers
-        ]
-
-        # 10. Customer Health Score - categorize by last activity
-        seven_days_ago = now - timedelta(days=7)
-        thirty_days_ago_health = now - timedelta(days=30)
-
-        # Get all customers with their last message date
-        customer_health = db.query(
-            Customer.id,
-            Customer.name,
-            Customer.industry,
-            func.max(Message.sent_at).label('last_activity'),
-            func.count(Message.id).label('message_count')
-        ).outerjoin(
-            Message, Customer.id == Message.customer_id
-        ).filter(
-            Customer.workspace_id == workspace_id,
-            Customer.is_active == True
-        ).group_by(
-            Customer.id, Customer.name, Customer.industry
-        ).all()
-
-        # Categorize customers by health
-        healthy_count = 0  # Active in last 7 days
-        at_risk_count = 0  # Active 7-30 days ago
-        dormant_count = 0  # No activity in 30+ days or never active
-
-        customer_health_details = []
-
-        for customer_id, name, industry, last_activity, message_count in customer_health:
-            if last_activity is None:
-                health_status = 'dormant'
-                dormant_count += 1
-            elif last_activity >= seven_days_ago:
-                health_status = 'healthy'
-                healthy_count += 1
-            elif last_activity >= thirty_days_ago_health:
-                health_status = 'at_risk'
-                at_risk_count += 1
-            else:
-                health_status = 'dormant'
-                dormant_count += 1
-
-            customer_health_details.append({
-                'customer_id': str(customer_id),
-                'name': name,
-                'industry': industry if industry else 'Unknown',
-                'last_activity': last_activity.isoformat() if last_activity else None,
-                'message_count': message_count,
-                'health_status': health_status
-            })
-
-        # Sort by health status priority (healthy first, then at_risk, then dormant)
-        # and within each category by message count descending
-        status_priority = {'healthy': 0, 'at_risk': 1, 'dormant': 2}
-        customer_health_details.sort(
-            key=lambda x: (status_priority[x['health_status']], -x['message_count'])
-        )
-
-        customer_health_summary = {
-            'healthy': healthy_count,
-            'at_risk': at_risk_count,
-            'dormant': dormant_count
-        }
-
-        # Format response - keep 'features' naming for frontend compatibility
-        return {
-            'metrics': {
-                'total_features': total_features,
-                'total_themes': total_themes,
-                'total_mentions': total_mentions,
-                'features_by_status': status_counts,
-                'features_by_urgency': urgency_counts,
-                'top_themes': [
-                    {'name': name, 'feature_count': count}
-                    for _, name, count in top_themes
-                ],
-                'recent_activity': {
-                    'features_this_week': features_this_week,
-                    'features_last_week': features_last_week
-                },
-                'customers_by_industry': industry_data,
-                'calls_per_day': calls_per_day_data,
-                'top_engaged_customers': top_engaged_data,
-                'customer_health_summary': customer_health_summary
-            },
-            'customer_health_details': customer_health_details[:20],  # Top 20 for detailed view
-            'top_features': [
-                {
-                    'id': str(feature.id),
-                    'name': feature.name,
-                    'description': feature.description,
-                    'urgency': feature.urgency,
-                    'status': feature.status,
-                    'mention_count': feature.mention_count,
-                    'theme_id': str(feature.theme_id) if feature.theme_id else None,
-                    'theme': {
-                        'id': str(feature.theme_id_obj),
-                        'name': feature.theme_name,
-                        'description': feature.theme_description
-                    } if feature.theme_id_obj else None,
-                    'first_mentioned': feature.first_mentioned_at.isoformat() if feature.first_mentioned_at else None,
-                    'last_mentioned': feature.last_mentioned_at.isoformat() if feature.last_mentioned_at else None,
-                    'created_at': feature.created_at.isoformat() if feature.created_at else None,
-                    'updated_at': feature.updated_at.isoformat() if feature.updated_at else None
-                }
-                for feature in top_features_query
-            ]
-        }
+        return await executive_insights_service.aget(db, workspace_id, refresh=refresh)
 
     except Exception as e:
         logger.error(f"Error getting executive insights: {e}")
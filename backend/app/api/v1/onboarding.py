@@ -39,6 +39,7 @@ from app.schemas.onboarding import (
     ROLES,
 )
 from app.services.taxonomy_service import generate_taxonomy_from_url, themes_to_dict
+from app.services.cache_service import bump_taxonomy_version
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +149,8 @@ async def save_company_data(
 
     db.commit()
     db.refresh(company)
+    # Company name/domains are part of the classification prompt context
+    bump_taxonomy_version(str(workspace_id))
 
     return CompanyDataResponse(
         name=company.name,
@@ -335,6 +338,7 @@ async def save_themes_bulk(
         })
 
     db.commit()
+    bump_taxonomy_version(str(workspace_id))
 
     return BulkThemeResponse(
         created_count=len(created_themes),
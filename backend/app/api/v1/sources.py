@@ -63,7 +63,7 @@ def get_workspace_for_user(db: Session, current_user: dict) -> Workspace:
     summary="Get single message details",
     description="Returns full details of a specific message"
 )
-async def get_message_details(
+def get_message_details(
     workspace_id: UUID,
     message_id: UUID,
     current_user: dict = Depends(get_current_user),
@@ -97,7 +97,7 @@ async def get_message_details(
     summary="Get paginated messages from all sources (optimized)",
     description="Returns paginated list of messages using optimized SQL UNION query with Redis caching"
 )
-async def get_messages(
+def get_messages(
     workspace_id: UUID,
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=10, ge=1, le=50, description="Items per page"),
@@ -161,7 +161,7 @@ async def get_messages(
     summary="Get sync history",
     description="Returns paginated sync history for data sources and themes"
 )
-async def get_sync_history(
+def get_sync_history(
     workspace_id: UUID,
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=10, ge=1, le=50, description="Items per page"),
@@ -210,7 +210,7 @@ async def get_sync_history(
     summary="Get data sources status",
     description="Returns status of all connected data sources"
 )
-async def get_data_sources_status(
+def get_data_sources_status(
     workspace_id: UUID,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -244,7 +244,7 @@ async def get_data_sources_status(
     summary="Sync all data sources",
     description="Triggers sync for all connected data sources via Celery background tasks"
 )
-async def sync_all_sources(
+def sync_all_sources(
     workspace_id: UUID,
     request: Optional[SyncSourceRequest] = None,
     current_user: dict = Depends(get_current_user),
@@ -387,7 +387,7 @@ async def sync_all_sources(
     summary="Sync/update all themes",
     description="Process messages and update theme classifications via Celery"
 )
-async def sync_themes(
+def sync_themes(
     workspace_id: UUID,
     request: Optional[SyncThemeRequest] = None,
     current_user: dict = Depends(get_current_user),
@@ -482,7 +482,7 @@ async def sync_themes(
     summary="Get sync operation status",
     description="Returns the current status of a sync operation"
 )
-async def get_sync_status(
+def get_sync_status(
     workspace_id: UUID,
     sync_id: UUID,
     current_user: dict = Depends(get_current_user),
@@ -539,7 +539,7 @@ async def get_sync_status(
     summary="Get items synced in a specific sync operation",
     description="Returns the actual items (threads, messages, features) that were synced"
 )
-async def get_synced_items(
+def get_synced_items(
     workspace_id: UUID,
     sync_id: UUID,
     page: int = Query(default=1, ge=1, description="Page number"),
@@ -582,7 +582,7 @@ async def get_synced_items(
     summary="Get AI insights progress for workspace",
     description="Returns progress stats for AI insights processing (for UI progress bar)"
 )
-async def get_ai_insights_progress(
+def get_ai_insights_progress(
     workspace_id: UUID,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -663,7 +663,7 @@ async def get_ai_insights_progress(
     summary="Get AI insights for a specific message",
     description="Returns AI-generated insights for a specific message"
 )
-async def get_message_ai_insights(
+def get_message_ai_insights(
     workspace_id: UUID,
     message_id: UUID,
     current_user: dict = Depends(get_current_user),
@@ -689,7 +689,7 @@ async def get_message_ai_insights(
     summary="Queue message for AI insights processing",
     description="Manually queue a message for AI insights generation"
 )
-async def queue_message_for_ai_insights(
+def queue_message_for_ai_insights(
     workspace_id: UUID,
     message_id: UUID,
     request: Optional[QueueInsightsRequest] = None,
@@ -740,7 +740,7 @@ async def queue_message_for_ai_insights(
     summary="Enable/disable AI insights for workspace",
     description="Toggle AI insights processing for a workspace"
 )
-async def toggle_ai_insights(
+def toggle_ai_insights(
     workspace_id: UUID,
     enabled: bool = Query(default=True, description="Enable or disable AI insights"),
     current_user: dict = Depends(get_current_user),
@@ -10,8 +10,13 @@ from pydantic import BaseModel
 from typing import List, Optional
 from uuid import UUID
 
-from app.core.deps import get_current_user, get_db
-from app.services.theme_service import ThemeService, SubThemeService, CustomerAskService, TranscriptClassificationService
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_async_db, get_current_user, get_db
+from app.services.theme_service import (
+    ThemeService, SubThemeService, CustomerAskService, TranscriptClassificationService,
+    AsyncTranscriptClassificationService,
+)
 from app.schemas.theme import (
     ThemeCreate, ThemeUpdate, ThemeResponse, ThemeWithSubThemes, ThemeHierarchy,
     ThemeListResponse, SubThemeCreate, SubThemeUpdate, SubThemeResponse,
@@ -47,7 +52,7 @@ class ThemeSlackConnectionResponse(BaseModel):
 # === Theme Endpoints (Static paths first) ===
 
 @router.get("", response_model=ThemeListResponse)
-async def list_themes(
+def list_themes(
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
 ):
@@ -69,7 +74,7 @@ async def list_themes(
 
 
 @router.get("/hierarchy", response_model=List[ThemeHierarchy])
-async def get_theme_hierarchy(
+def get_theme_hierarchy(
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
 ):
@@ -88,7 +93,7 @@ async def get_theme_hierarchy(
 
 
 @router.put("/reorder", response_model=List[ThemeResponse])
-async def reorder_themes(
+def reorder_themes(
     theme_ids: List[UUID],
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -108,7 +113,7 @@ async def reorder_themes(
 
 
 @router.post("", response_model=ThemeResponse, status_code=status.HTTP_201_CREATED)
-async def create_theme(
+def create_theme(
     data: ThemeCreate,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -130,7 +135,7 @@ async def create_theme(
 # === SubTheme Endpoints (Static paths - /sub-themes/*) ===
 
 @router.post("/sub-themes", response_model=SubThemeResponse, status_code=status.HTTP_201_CREATED)
-async def create_sub_theme(
+def create_sub_theme(
     data: SubThemeCreate,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -166,7 +171,7 @@ async def create_sub_theme(
 
 
 @router.get("/sub-themes/{sub_theme_id}", response_model=SubThemeWithCustomerAsks)
-async def get_sub_theme(
+def get_sub_theme(
     sub_theme_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -191,7 +196,7 @@ async def get_sub_theme(
 
 
 @router.patch("/sub-themes/{sub_theme_id}", response_model=SubThemeResponse)
-async def update_sub_theme(
+def update_sub_theme(
     sub_theme_id: UUID,
     data: SubThemeUpdate,
     current_user: dict = Depends(get_current_user),
@@ -218,7 +223,7 @@ async def update_sub_theme(
 
 
 @router.delete("/sub-themes/{sub_theme_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_sub_theme(
+def delete_sub_theme(
     sub_theme_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -243,7 +248,7 @@ async def delete_sub_theme(
 
 
 @router.post("/sub-themes/{sub_theme_id}/move", response_model=SubThemeResponse)
-async def move_sub_theme(
+def move_sub_theme(
     sub_theme_id: UUID,
     new_theme_id: UUID,
     current_user: dict = Depends(get_current_user),
@@ -272,7 +277,7 @@ async def move_sub_theme(
 # === CustomerAsk Endpoints (Static paths - /customer-asks/*) ===
 
 @router.get("/customer-asks", response_model=CustomerAskListResponse)
-async def list_customer_asks(
+def list_customer_asks(
     sub_theme_id: Optional[UUID] = None,
     status: Optional[str] = None,
     current_user: dict = Depends(get_current_user),
@@ -299,7 +304,7 @@ async def list_customer_asks(
 
 
 @router.get("/customer-asks/search", response_model=List[CustomerAskResponse])
-async def search_customer_asks(
+def search_customer_asks(
     q: str,
     limit: int = 20,
     current_user: dict = Depends(get_current_user),
@@ -320,7 +325,7 @@ async def search_customer_asks(
 
 
 @router.post("/customer-asks", response_model=CustomerAskResponse, status_code=status.HTTP_201_CREATED)
-async def create_customer_ask(
+def create_customer_ask(
     data: CustomerAskCreate,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -356,7 +361,7 @@ async def create_customer_ask(
 
 
 @router.get("/customer-asks/{customer_ask_id}", response_model=CustomerAskResponse)
-async def get_customer_ask(
+def get_customer_ask(
     customer_ask_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -381,7 +386,7 @@ async def get_customer_ask(
 
 
 @router.patch("/customer-asks/{customer_ask_id}", response_model=CustomerAskResponse)
-async def update_customer_ask(
+def update_customer_ask(
     customer_ask_id: UUID,
     data: CustomerAskUpdate,
     current_user: dict = Depends(get_current_user),
@@ -408,7 +413,7 @@ async def update_customer_ask(
 
 
 @router.delete("/customer-asks/{customer_ask_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_customer_ask(
+def delete_customer_ask(
     customer_ask_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -433,7 +438,7 @@ async def delete_customer_ask(
 
 
 @router.post("/customer-asks/{customer_ask_id}/move", response_model=CustomerAskResponse)
-async def move_customer_ask(
+def move_customer_ask(
     customer_ask_id: UUID,
     new_sub_theme_id: UUID,
     current_user: dict = Depends(get_current_user),
@@ -462,7 +467,7 @@ async def move_customer_ask(
 # === Mentions Endpoints ===
 
 @router.get("/customer-asks/{customer_ask_id}/mentions", response_model=MentionListResponse)
-async def get_mentions_for_customer_ask(
+def get_mentions_for_customer_ask(
     customer_ask_id: UUID,
     limit: int = 50,
     offset: int = 0,
@@ -512,7 +517,7 @@ async def get_mentions_for_customer_ask(
 @router.get("/transcript-classifications/counts")
 async def get_transcript_classification_counts(
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get transcript classification counts grouped by theme and sub-theme (lightweight, no full data)"""
     workspace_id = current_user.get('workspace_id')
@@ -523,8 +528,8 @@ async def get_transcript_classification_counts(
         )
 
     try:
-        service = TranscriptClassificationService(db)
-        counts = service.get_transcript_classification_counts(UUID(workspace_id))
+        service = AsyncTranscriptClassificationService(db)
+        counts = await service.get_transcript_classification_counts(UUID(workspace_id))
         return counts
     except Exception as e:
         import traceback
@@ -540,7 +545,7 @@ async def get_transcript_classification_counts(
 @router.get("/transcript-classifications/insights")
 async def get_transcript_insights(
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get aggregated insights from all transcript classifications
     
@@ -561,8 +566,8 @@ async def get_transcript_insights(
         )
 
     try:
-        service = TranscriptClassificationService(db)
-        insights = service.get_transcript_insights(UUID(workspace_id))
+        service = AsyncTranscriptClassificationService(db)
+        insights = await service.get_transcript_insights(UUID(workspace_id))
         return insights
     except Exception as e:
         import traceback
@@ -576,7 +581,7 @@ async def get_transcript_insights(
 
 
 @router.get("/transcript-classifications/search", response_model=List[TranscriptClassificationResponse])
-async def search_transcript_classifications(
+def search_transcript_classifications(
     q: str,
     limit: int = 20,
     current_user: dict = Depends(get_current_user),
@@ -597,7 +602,7 @@ async def search_transcript_classifications(
 
 
 @router.get("/transcript-classifications", response_model=TranscriptClassificationListResponse)
-async def list_transcript_classifications(
+def list_transcript_classifications(
     theme_id: Optional[UUID] = None,
     sub_theme_id: Optional[UUID] = None,
     source_type: Optional[str] = None,
@@ -639,7 +644,7 @@ async def list_transcript_classifications(
 
 
 @router.get("/transcript-classifications/{classification_id}", response_model=TranscriptClassificationResponse)
-async def get_transcript_classification(
+def get_transcript_classification(
     classification_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -671,7 +676,7 @@ async def get_transcript_classification(
 
 
 @router.get("/transcript-classifications/{classification_id}/transcript")
-async def get_transcript_text(
+def get_transcript_text(
     classification_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -721,7 +726,7 @@ async def get_transcript_text(
 # These MUST come AFTER all static paths to avoid UUID parsing errors
 
 @router.get("/{theme_id}", response_model=ThemeWithSubThemes)
-async def get_theme(
+def get_theme(
     theme_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -746,7 +751,7 @@ async def get_theme(
 
 
 @router.patch("/{theme_id}", response_model=ThemeResponse)
-async def update_theme(
+def update_theme(
     theme_id: UUID,
     data: ThemeUpdate,
     current_user: dict = Depends(get_current_user),
@@ -773,7 +778,7 @@ async def update_theme(
 
 
 @router.delete("/{theme_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_theme(
+def delete_theme(
     theme_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -798,7 +803,7 @@ async def delete_theme(
 
 
 @router.get("/{theme_id}/sub-themes", response_model=SubThemeListResponse)
-async def list_sub_themes(
+def list_sub_themes(
     theme_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -831,7 +836,7 @@ async def list_sub_themes(
 # === Theme Slack Integration Endpoints ===
 
 @router.post("/{theme_id}/slack/connect", response_model=ThemeSlackConnectionResponse)
-async def connect_theme_to_slack(
+def connect_theme_to_slack(
     theme_id: UUID,
     data: ThemeSlackConnectRequest,
     current_user: dict = Depends(get_current_user),
@@ -896,7 +901,7 @@ async def connect_theme_to_slack(
 
 
 @router.delete("/{theme_id}/slack/disconnect", response_model=ThemeSlackConnectionResponse)
-async def disconnect_theme_from_slack(
+def disconnect_theme_from_slack(
     theme_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -946,7 +951,7 @@ async def disconnect_theme_from_slack(
 
 
 @router.get("/{theme_id}/slack/status", response_model=ThemeSlackConnectionResponse)
-async def get_theme_slack_status(
+def get_theme_slack_status(
     theme_id: UUID,
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
@@ -9,6 +9,7 @@ from typing import List, Optional
 
 from app.core.deps import get_current_user, get_db
 from app.services.workspace_service import WorkspaceService
+from app.services.cache_service import bump_taxonomy_version
 from app.schemas.workspace_connector import (
     WorkspaceConnectorResponse,
     GongConnectorCreate,
@@ -33,7 +34,7 @@ router = APIRouter()
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def get_my_workspace(
+def get_my_workspace(
     current_user: dict = Depends(get_current_user),
     db = Depends(get_db)
 ) -> dict:
@@ -83,7 +84,7 @@ async def get_my_workspace(
     response_model=WorkspaceConnectorResponse,
     status_code=status.HTTP_201_CREATED
 )
-async def create_or_update_connector(
+def create_or_update_connector(
     workspace_id: UUID,
     connector_data: WorkspaceConnectorInput,
     current_user: User = Depends(get_current_user),
@@ -152,7 +153,7 @@ async def create_or_update_connector(
     response_model=List[WorkspaceConnectorResponse],
     status_code=status.HTTP_200_OK
 )
-async def get_workspace_connectors(
+def get_workspace_connectors(
     workspace_id: UUID,
     current_user: User = Depends(get_current_user),
     db = Depends(get_db)
@@ -194,7 +195,7 @@ async def get_workspace_connectors(
     response_model=WorkspaceConnectorResponse,
     status_code=status.HTTP_200_OK
 )
-async def get_connector(
+def get_connector(
     workspace_id: UUID,
     connector_id: UUID,
     current_user: User = Depends(get_current_user),
@@ -244,7 +245,7 @@ async def get_connector(
     response_model=WorkspaceConnectorResponse,
     status_code=status.HTTP_200_OK
 )
-async def update_connector(
+def update_connector(
     workspace_id: UUID,
     connector_id: UUID,
     connector_data: WorkspaceConnectorUpdate,
@@ -293,7 +294,7 @@ async def update_connector(
     "/{workspace_id}/connectors/{connector_id}",
     status_code=status.HTTP_200_OK
 )
-async def delete_connector(
+def delete_connector(
     workspace_id: UUID,
     connector_id: UUID,
     current_user: User = Depends(get_current_user),
@@ -342,7 +343,7 @@ async def delete_connector(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def get_company_details(
+def get_company_details(
     workspace_id: UUID,
     current_user: User = Depends(get_current_user),
     db = Depends(get_db)
@@ -411,7 +412,7 @@ async def get_company_details(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def update_company_details(
+def update_company_details(
     workspace_id: UUID,
     company_data: CompanyUpdate,
     current_user: User = Depends(get_current_user),
@@ -493,7 +494,7 @@ class UpdateCompetitorRequest(BaseModel):
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def generate_competitor_suggestions(
+def generate_competitor_suggestions(
     workspace_id: UUID,
     request: GenerateCompetitorSuggestionsRequest,
     current_user: User = Depends(get_current_user),
@@ -542,7 +543,7 @@ async def generate_competitor_suggestions(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def get_competitors(
+def get_competitors(
     workspace_id: UUID,
     current_user: User = Depends(get_current_user),
     db = Depends(get_db)
@@ -588,7 +589,7 @@ async def get_competitors(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def save_competitors(
+def save_competitors(
     workspace_id: UUID,
     request: SaveCompetitorsRequest,
     current_user: User = Depends(get_current_user),
@@ -636,7 +637,7 @@ async def save_competitors(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def update_competitor(
+def update_competitor(
     workspace_id: UUID,
     competitor_id: UUID,
     request: UpdateCompetitorRequest,
@@ -686,7 +687,7 @@ async def update_competitor(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def delete_competitor(
+def delete_competitor(
     workspace_id: UUID,
     competitor_id: UUID,
     current_user: User = Depends(get_current_user),
@@ -734,7 +735,7 @@ async def delete_competitor(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def generate_description(
+def generate_description(
     workspace_id: UUID,
     request: GenerateDescriptionRequest,
     current_user: User = Depends(get_current_user),
@@ -788,7 +789,7 @@ async def generate_description(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def generate_theme_suggestions(
+def generate_theme_suggestions(
     workspace_id: UUID,
     request: GenerateThemeSuggestionsRequest,
     current_user: User = Depends(get_current_user),
@@ -837,7 +838,7 @@ async def generate_theme_suggestions(
     response_model=dict,
     status_code=status.HTTP_200_OK
 )
-async def generate_feature_suggestions(
+def generate_feature_suggestions(
     workspace_id: UUID,
     request: GenerateFeatureSuggestionsRequest,
     current_user: User = Depends(get_current_user),
@@ -939,7 +940,7 @@ def workspace_chat(
     response_model=WorkspaceResponse,
     status_code=status.HTTP_200_OK
 )
-async def get_company_domains(
+def get_company_domains(
     workspace_id: UUID,
     current_user: User = Depends(get_current_user),
     db = Depends(get_db)
@@ -996,7 +997,7 @@ async def get_company_domains(
     response_model=WorkspaceResponse,
     status_code=status.HTTP_200_OK
 )
-async def update_company_domains(
+def update_company_domains(
     workspace_id: UUID,
     domains_data: WorkspaceDomainsUpdate,
     current_user: User = Depends(get_current_user),
@@ -1043,6 +1044,7 @@ async def update_company_domains(
         workspace.company.domains = domains_data.company_domains
         db.commit()
         db.refresh(workspace.company)
+        bump_taxonomy_version(str(workspace_id))
 
         logger.info(f"Company domains updated successfully for workspace {workspace_id}")
 
@@ -35,6 +35,20 @@ class Settings(BaseSettings):
     LANGFUSE_HOST: str = "https://cloud.langfuse.com"
     LANGFUSE_BASE_URL: Optional[str] = None  # Alias for LANGFUSE_HOST
 
+    # Transcript classification engine (concurrent LLM calls)
+    CLASSIFICATION_MAX_IN_FLIGHT: int = 8  # Concurrent OpenAI requests per task run
+    CLASSIFICATION_PER_WORKSPACE_LIMIT: int = 4  # Max in-flight requests for one workspace
+    OPENAI_TOKENS_PER_MINUTE: int = 200000  # gpt-4o-mini TPM budget shared by the engine
+    CLASSIFICATION_CHUNK_TOKENS: int = 12000  # Max transcript tokens per LLM call; longer transcripts are chunked
+    CLASSIFICATION_LEASE_SECONDS: int = 900  # Claimed transcripts are reclaimable after this (> task time_limit)
+    CLASSIFICATION_RUN_TOKEN_MINUTES: int = 5  # Minutes of the TPM budget one run may schedule (soft limit is 9); the rest of the claim is released
+    OPENAI_BATCH_BASE_URL: Optional[str] = None  # Override for Batch API backfills (e.g. local stand-in server)
+    CLASSIFICATION_BATCH_MAX_TRANSCRIPTS: int = 2000  # Transcripts packed into one Batch API job
+
+    # Periodic connector syncs (one Celery subtask per connector)
+    SYNC_MAX_CONCURRENT_PER_WORKSPACE: int = 2  # Connector syncs of one workspace running at once
+    SYNC_SLOT_RETRY_SECONDS: int = 60  # Delay before a connector sync retries when its workspace is busy
+
     # Web Scraping
     FIRECRAWL_API_KEY: Optional[str] = None
     
@@ -60,6 +74,7 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_ID: Optional[str] = None
     GOOGLE_CLIENT_SECRET: Optional[str] = None
     GMAIL_REDIRECT_URI: Optional[str] = None
+    GMAIL_API_BASE_URL: Optional[str] = None  # Override for the Gmail API (e.g. scripts/gmail_api_stub_server.py)
 
     # Environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
@@ -1,4 +1,8 @@
+from typing import AsyncGenerator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -10,7 +14,7 @@ engine = create_engine(
     pool_pre_ping=True,  # Test connections before using - critical for cloud DBs
     pool_recycle=300,  # Recycle connections every 5 minutes (Railway terminates idle connections quickly)
     pool_size=5,  # Smaller pool size to avoid connection limits
-    max_overflow=10,  # Allow overflow connections
+    max_overflow=10,  # Allow overflow connections (sync routes run in FastAPI's ~40-thread pool)
     pool_timeout=30,  # Wait up to 30s for a connection from pool
     connect_args={
         'connect_timeout': 30,  # Increased timeout for cloud DB (can be slow to wake up)
@@ -34,6 +38,10 @@ def get_db():
     """
     Dependency to get database session.
     Use this in FastAPI route dependencies.
+
+    Routes on this (blocking) session are plain `def` so FastAPI runs them in
+    its threadpool; `async def` routes use get_async_db so their queries don't
+    block the event loop.
     """
     db = SessionLocal()
     try:
@@ -42,6 +50,75 @@ def get_db():
         db.close()
 
 
+# Async engine (asyncpg) for `async def` endpoints, so their queries don't block
+# the event loop. Created on first use: Celery workers import this module but
+# only use the sync engine.
+# Only a few dashboard reads use it, so its pool is small and sized on its own;
+# the sync pool keeps its overflow for the threadpool routes (20 per process at most).
+ASYNC_POOL_SIZE = 2
+ASYNC_MAX_OVERFLOW = 3
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[sessionmaker] = None
+
+
+def _async_database_url(url: str) -> tuple[str, dict]:
+    """Rewrite DATABASE_URL for asyncpg; returns (url, extra connect_args)."""
+    parts = urlsplit(url)
+    # asyncpg takes `ssl` rather than libpq's sslmode
+    query = dict(parse_qsl(parts.query))
+    sslmode = query.pop("sslmode", None)
+    connect_args = {"ssl": "require"} if sslmode and sslmode not in ("disable", "allow", "prefer") else {}
+    return urlunsplit(("postgresql+asyncpg", parts.netloc, parts.path, urlencode(query), parts.fragment)), connect_args
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get or create the async engine (sync engine settings, smaller pool)."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        url, ssl_args = _async_database_url(settings.DATABASE_URL)
+        _async_engine = create_async_engine(
+            url,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            pool_size=ASYNC_POOL_SIZE,
+            max_overflow=ASYNC_MAX_OVERFLOW,
+            pool_timeout=30,
+            connect_args={
+                'timeout': 30,  # Connect timeout
+                'command_timeout': 60,  # 60s per statement, like the sync statement_timeout
+                # Supabase/pgbouncer transaction pooling can't keep prepared statements
+                'statement_cache_size': 0,
+                'prepared_statement_cache_size': 0,
+                **ssl_args,
+            },
+            echo=False,
+        )
+        _AsyncSessionLocal = sessionmaker(
+            bind=_async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session.
+    Use this in `async def` routes instead of get_db (see get_db), and keep
+    other blocking calls in those routes (Redis, CacheService) off the event
+    loop with run_in_threadpool.
+    """
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's pooled connections (app shutdown)."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
 def create_all_tables():
     """Create all tables in the database using SQLAlchemy"""
     try:
@@ -7,11 +7,12 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.core.security import verify_token
 from app.models.user import User
 from app.models.workspace import Workspace
 from app.services.auth_service import AuthService
+from app.services.principal_cache import PRINCIPAL, WORKSPACE, principal_cache
 
 # Security scheme for JWT tokens
 security = HTTPBearer()
@@ -57,6 +58,11 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Recently authenticated users come from the principal cache (no DB query)
+    principal = principal_cache.get(PRINCIPAL, user_id)
+    if principal is not None:
+        return principal
+
     # Get user from database
     auth_service = AuthService(db)
     user = auth_service.get_user_by_id(user_id)
@@ -76,7 +82,7 @@ def get_current_user(
         )
     
     # Convert User model to dict for compatibility
-    return {
+    principal = {
         "id": str(user.id),
         "email": user.email,
         "first_name": user.first_name,
@@ -92,6 +98,8 @@ def get_current_user(
         "last_login_at": user.last_login_at.isoformat() if user.last_login_at else None,
         "job_title": user.job_title,
     }
+    principal_cache.set(PRINCIPAL, user_id, principal)
+    return principal
 
 
 def get_current_active_user(
@@ -209,6 +217,11 @@ def get_current_user_with_workspace(
     if current_user.get('workspace_id'):
         return current_user
 
+    # Company workspace resolved by a recent request
+    workspace_id = principal_cache.get(WORKSPACE, current_user['id'])
+    if workspace_id:
+        return {**current_user, 'workspace_id': workspace_id}
+
     # Check if user's company has a workspace
     workspace = db.query(Workspace).filter(
         Workspace.company_id == current_user.get('company_id')
@@ -232,6 +245,9 @@ def get_current_user_with_workspace(
         if user:
             user.workspace_id = workspace.id
             db.commit()
+            principal_cache.invalidate(user.id)
+    else:
+        principal_cache.set(WORKSPACE, current_user['id'], str(workspace.id))
 
     # Add workspace_id to user dict
     current_user_with_workspace = current_user.copy()
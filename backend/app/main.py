@@ -11,7 +11,7 @@ from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 from app.core.config import settings
-from app.core.database import create_all_tables
+from app.core.database import create_all_tables, dispose_async_engine
 
 # Load environment variables
 load_dotenv()
@@ -73,6 +73,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown - flush any pending traces
     shutdown_tracing()
+    # Close pooled async DB connections
+    await dispose_async_engine()
 
 
 app = FastAPI(
@@ -164,11 +166,11 @@ async def root():
 async def health_check():
     """Detailed health check"""
     try:
-        # Test database connection
-        from app.core.database import get_db
-        db = next(get_db())
+        # Test database connection (async engine - doesn't block the event loop)
+        from app.core.database import get_async_engine
         from sqlalchemy import text
-        db.execute(text("SELECT 1"))
+        async with get_async_engine().connect() as connection:
+            await connection.execute(text("SELECT 1"))
         db_status = "connected"
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
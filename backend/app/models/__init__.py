@@ -28,10 +28,14 @@ from app.models.competitor import Competitor
 # Progress tracking
 from app.models.onboarding_progress import OnboardingProgress
 from app.models.sync_history import SyncHistory
+from app.models.sync_watermark import SyncWatermark
 
 # Transcript processing
 from app.models.raw_transcript import RawTranscript
 from app.models.transcript_classification import TranscriptClassification
+from app.models.transcript_insight_rollup import TranscriptInsightRollup
+from app.models.llm_result_cache import LLMResultCache
+from app.models.classification_batch import ClassificationBatch
 
 __all__ = [
     # Core
@@ -53,7 +57,11 @@ __all__ = [
     # Progress tracking
     "OnboardingProgress",
     "SyncHistory",
+    "SyncWatermark",
     # Transcript processing
     "RawTranscript",
     "TranscriptClassification",
+    "TranscriptInsightRollup",
+    "LLMResultCache",
+    "ClassificationBatch",
 ]
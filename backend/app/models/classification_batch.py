@@ -0,0 +1,78 @@
+"""
+Classification Batch model for tracking OpenAI Batch API transcript backfills.
+"""
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Float, Text, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+
+
+class ClassificationBatch(Base):
+    """
+    One OpenAI Batch API job classifying a set of raw transcripts.
+
+    All state needed to resume lives in this row, so a worker restart between
+    submit, poll and apply only delays the batch. Transcripts in the batch
+    point back here via raw_transcripts.classification_batch_id, which keeps
+    them out of the real-time process_raw_transcripts path.
+
+    Status lifecycle:
+        submitting -> submitted -> completed -> applied
+        submitting -> submitted (stuck past SUBMIT_STALE_AFTER, adopted from OpenAI by metadata)
+        submitting -> failed (submit error, or stuck with no OpenAI batch; transcripts released)
+        submitted -> failed / expired / cancelled (transcripts released)
+    """
+
+    __tablename__ = "classification_batches"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+
+    # Optional workspace filter used when the batch was built (None = all workspaces)
+    workspace_id = Column(UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=True)
+
+    # OpenAI identifiers
+    openai_batch_id = Column(String(100), nullable=True, unique=True)
+    input_file_id = Column(String(100), nullable=True)
+    output_file_id = Column(String(100), nullable=True)
+    error_file_id = Column(String(100), nullable=True)
+
+    # Local status plus last status reported by OpenAI
+    status = Column(String(20), nullable=False, default="submitted")
+    openai_status = Column(String(30), nullable=True)
+
+    # What was sent: prompt version and per-request LLM cache key parts
+    # request_meta = {custom_id: {"namespace": ..., "content_hash": ..., ...} | null}
+    model = Column(String(100), nullable=False)
+    prompt_version = Column(String(100), nullable=True)
+    request_meta = Column(JSONB, nullable=False, default=dict)
+
+    # Counters
+    transcript_count = Column(Integer, default=0, nullable=False)
+    request_count = Column(Integer, default=0, nullable=False)
+    completed_request_count = Column(Integer, default=0, nullable=False)
+    failed_request_count = Column(Integer, default=0, nullable=False)
+    applied_count = Column(Integer, default=0, nullable=False)
+
+    # Usage and cost (filled in when results are applied)
+    prompt_tokens = Column(Integer, default=0, nullable=False)
+    completion_tokens = Column(Integer, default=0, nullable=False)
+    cost_usd = Column(Float, nullable=True)
+
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    submitted_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    applied_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
+
+    __table_args__ = (
+        Index('idx_classification_batches_status', 'status'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ClassificationBatch(id={self.id}, openai_batch_id='{self.openai_batch_id}', status='{self.status}')>"
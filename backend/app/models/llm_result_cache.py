@@ -0,0 +1,50 @@
+"""
+LLM Result Cache model for reusing LLM outputs across identical inputs.
+"""
+
+from sqlalchemy import Column, String, DateTime, Integer, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class LLMResultCache(Base):
+    """
+    Content-addressed cache of LLM results.
+
+    The primary key is a hash of (namespace, content hash, prompt version,
+    taxonomy version, model), so a re-synced or re-queued transcript with
+    identical text, prompt and taxonomy reuses the stored result instead of
+    paying for another LLM call.
+
+    Rows are evicted by age of last use and a global row cap
+    (see LLMResultCacheService.evict).
+    """
+
+    __tablename__ = "llm_result_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256 hex of all key parts
+
+    # Key components (kept for debugging and targeted invalidation)
+    namespace = Column(String(50), nullable=False)  # 'transcript_classification', 'signal_extraction'
+    content_hash = Column(String(64), nullable=False)  # sha256 of the formatted input text
+    prompt_version = Column(String(100), nullable=False)  # e.g. 'langfuse-v12'
+    taxonomy_version = Column(String(64), nullable=False, default="")  # fingerprint of themes/company context
+    model = Column(String(100), nullable=False)
+
+    # Cached LLM output (parsed JSON)
+    result = Column(JSONB, nullable=False)
+
+    # Usage tracking for eviction
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('idx_llm_result_cache_last_used', 'last_used_at'),
+        Index('idx_llm_result_cache_namespace_content', 'namespace', 'content_hash'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<LLMResultCache(namespace='{self.namespace}', key='{self.cache_key[:12]}', hits={self.hit_count})>"
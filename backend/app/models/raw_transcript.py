@@ -40,6 +40,10 @@ class RawTranscript(Base):
     processing_completed_at = Column(DateTime(timezone=True), nullable=True)
     processing_error = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0, nullable=False)
+    # Set while the transcript is part of an in-flight OpenAI Batch API job
+    classification_batch_id = Column(
+        UUID(as_uuid=True), ForeignKey("classification_batches.id", ondelete="SET NULL"), nullable=True
+    )
 
     # Metadata extracted during ingestion (for quick access without parsing raw_data)
     title = Column(String(500), nullable=True)
@@ -47,6 +51,11 @@ class RawTranscript(Base):
     transcript_date = Column(DateTime(timezone=True), nullable=True)
     participant_count = Column(Integer, nullable=True)
 
+    # "lower(trim(title))|YYYY-MM-DD" (UTC date) - same meeting name on the same day is one transcript.
+    # "undated|<id>" when ingested without a date (never a title+date duplicate).
+    # NULL only on legacy duplicates that predate the unique index.
+    dedup_key = Column(String(520), nullable=True)
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
@@ -61,6 +70,14 @@ class RawTranscript(Base):
         Index('idx_raw_transcripts_workspace', 'workspace_id'),
         Index('idx_raw_transcripts_source', 'source_type', 'source_id'),
         Index('idx_raw_transcripts_date', 'transcript_date'),
+        Index('idx_raw_transcripts_classification_batch', 'classification_batch_id'),
+        # Title+date dedup enforced by Postgres (ON CONFLICT DO NOTHING on insert)
+        Index(
+            'uq_raw_transcripts_dedup_key',
+            'workspace_id', 'dedup_key',
+            unique=True,
+            postgresql_where=text('dedup_key IS NOT NULL')
+        ),
         # Partial index for unprocessed transcripts (most common query pattern)
         Index(
             'idx_raw_transcripts_unprocessed',
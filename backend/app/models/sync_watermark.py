@@ -0,0 +1,50 @@
+"""
+Sync Watermark model for incremental connector syncs.
+"""
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+
+
+class SyncWatermark(Base):
+    """
+    High-water mark of a connector sync, per connector and optional scope.
+
+    Periodic syncs fetch only what is newer than the watermark and advance it
+    after the fetched data is stored, so a failed run re-reads from the same
+    point instead of skipping data.
+
+    scope is empty for connector-wide marks (Gong, Fathom) and holds the Slack
+    channel ID or Gmail label ID for per-channel/label marks. cursor is the
+    source's own position where it has one (Slack message ts); last_item_at
+    is the time covered so far.
+    """
+
+    __tablename__ = "sync_watermarks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+
+    connector_id = Column(UUID(as_uuid=True), ForeignKey("workspace_connectors.id", ondelete="CASCADE"), nullable=False)
+    scope = Column(String(255), nullable=False, default="")  # "" = whole connector, else channel/label ID
+
+    cursor = Column(String(255), nullable=True)  # Source position, e.g. Slack message ts
+    last_item_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Relationships
+    connector = relationship("WorkspaceConnector", back_populates="sync_watermarks")
+
+    __table_args__ = (
+        UniqueConstraint('connector_id', 'scope', name='uq_sync_watermarks_connector_scope'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SyncWatermark(connector_id={self.connector_id}, scope='{self.scope}', cursor='{self.cursor}')>"
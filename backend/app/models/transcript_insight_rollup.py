@@ -0,0 +1,45 @@
+"""
+Transcript Insight Rollup model - pre-aggregated counters for transcript insights.
+"""
+
+from sqlalchemy import Column, String, Date, DateTime, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+
+
+class TranscriptInsightRollup(Base):
+    """
+    One counter of the transcript insights dashboard, per workspace and day.
+
+    Rows are keyed by (workspace_id, day, dimension, key), e.g.
+    ("sentiment", "positive"), ("company", "Acme") or ("theme", <theme id>);
+    totals use an empty key ("transcripts", ""). day is the transcript date
+    (classification date when unknown).
+
+    Maintained incrementally when a classification is saved; rebuild with
+    scripts/rebuild_transcript_insights.py after bulk edits.
+    """
+
+    __tablename__ = "transcript_insight_rollups"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+
+    workspace_id = Column(UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+    dimension = Column(String(50), nullable=False)  # 'transcripts', 'sentiment', 'company', 'theme', ...
+    key = Column(String(255), nullable=False, default="")  # "" for totals
+
+    count = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('workspace_id', 'day', 'dimension', 'key', name='uq_transcript_insight_rollups_key'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TranscriptInsightRollup(workspace_id={self.workspace_id}, day={self.day}, {self.dimension}:{self.key}={self.count})>"
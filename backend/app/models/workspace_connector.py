@@ -68,6 +68,7 @@ class WorkspaceConnector(Base):
     user = relationship("User")
     messages = relationship("Message", back_populates="connector", cascade="all, delete-orphan")
     connector_labels = relationship("ConnectorLabel", back_populates="connector", cascade="all, delete-orphan")
+    sync_watermarks = relationship("SyncWatermark", back_populates="connector", cascade="all, delete-orphan")
 
     # Indexes and constraints
     __table_args__ = (
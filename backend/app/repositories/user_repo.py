@@ -5,6 +5,7 @@ User repository for database operations
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from app.models.user import User
+from app.services.principal_cache import principal_cache
 
 
 class UserRepository:
@@ -97,6 +98,7 @@ class UserRepository:
                 setattr(user, field, value)
         
         self.db.commit()
+        principal_cache.invalidate(user.id)
         self.db.refresh(user)
         return user
     
@@ -112,6 +114,7 @@ class UserRepository:
         """
         user.is_active = False
         self.db.commit()
+        principal_cache.invalidate(user.id)
         return True
     
     def hard_delete(self, user: User) -> bool:
@@ -124,8 +127,10 @@ class UserRepository:
         Returns:
             True if successful
         """
+        user_id = user.id
         self.db.delete(user)
         self.db.commit()
+        principal_cache.invalidate(user_id)
         return True
     
     def count_total(self) -> int:
@@ -10,6 +10,10 @@ from app.services.cache_service import (
     cache_sync_items,
     get_cached_sync_items,
     invalidate_sync_items_cache,
+    get_taxonomy_version,
+    bump_taxonomy_version,
+    get_classification_version,
+    bump_classification_version,
 )
 from app.services.sync_items_service import (
     SyncItemsService,
@@ -24,6 +28,10 @@ __all__ = [
     "cache_sync_items",
     "get_cached_sync_items",
     "invalidate_sync_items_cache",
+    "get_taxonomy_version",
+    "bump_taxonomy_version",
+    "get_classification_version",
+    "bump_classification_version",
     # Sync items service
     "SyncItemsService",
     "get_sync_items_service",
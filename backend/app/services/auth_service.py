@@ -15,6 +15,7 @@ from app.models.user import User
 from app.models.company import Company
 from app.models.workspace import Workspace
 from app.models.workspace_connector import WorkspaceConnector
+from app.services.principal_cache import principal_cache
 from app.schemas.auth import UserCreate, UserUpdate, LoginRequest
 from app.core.security import (
     verify_password,
@@ -56,6 +57,7 @@ class AuthService:
                 if user.workspace_id != existing_workspace.id:
                     user.workspace_id = existing_workspace.id
                     self.db.commit()
+                    principal_cache.invalidate(user.id)
                 return existing_workspace
 
             # Create new workspace for the company
@@ -70,6 +72,7 @@ class AuthService:
             # Assign user to the workspace
             user.workspace_id = workspace.id
             self.db.commit()
+            principal_cache.invalidate(user.id)
 
             logger.info(f"Workspace '{company.name}' created for company {company.id}")
             return workspace
@@ -208,6 +211,7 @@ class AuthService:
         # Update last login time
         user.last_login_at = datetime.utcnow()
         self.db.commit()
+        principal_cache.invalidate(user.id)
 
         return user
 
@@ -253,6 +257,7 @@ class AuthService:
                 # Update last login time
                 user.last_login_at = datetime.utcnow()
                 self.db.commit()
+                principal_cache.invalidate(user.id)
                 return user
 
             # Create new user from Google token data
@@ -425,6 +430,7 @@ class AuthService:
         user.updated_at = datetime.utcnow()
         
         self.db.commit()
+        principal_cache.invalidate(user.id)
         self.db.refresh(user)
         
         return user
@@ -544,6 +550,7 @@ class AuthService:
                 # Also update user's workspace_id for future logins
                 user.workspace_id = workspace.id
                 self.db.commit()
+                principal_cache.invalidate(user.id)
 
         return tokens
     
@@ -576,6 +583,7 @@ class AuthService:
         user.updated_at = datetime.utcnow()
 
         self.db.commit()
+        principal_cache.invalidate(user.id)
         self.db.refresh(user)
 
         # Trigger initial sync for connected Gong/Fathom sources
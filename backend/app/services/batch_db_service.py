@@ -23,17 +23,46 @@ from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy import and_
 
+from app.core.config import settings
 from app.models.message import Message
 from app.models.raw_transcript import RawTranscript
 from app.models.customer_ask import CustomerAsk
 from app.models.customer import Customer
-from app.services.customer_extraction_service import customer_extraction_service
+from app.services.customer_extraction_service import CustomerResolver, customer_extraction_service
+from app.services.executive_insights_service import executive_insights_service
 
 logger = logging.getLogger(__name__)
 
 # Batch size for bulk operations - balance between memory and performance
 DEFAULT_BATCH_SIZE = 100
 
+# Rows per multi-row INSERT ... ON CONFLICT statement for messages
+# (~20 bind parameters per row, well under Postgres' 65535 parameter limit)
+UPSERT_CHUNK_SIZE = 1000
+
+
+def transcript_dedup_key(
+    title: Optional[str],
+    transcript_date: Optional[datetime],
+    transcript_id: Optional[UUID] = None,
+) -> str:
+    """
+    Build the raw_transcripts.dedup_key for a title and transcript date.
+
+    Must match the expression used to backfill the column:
+    lower(btrim(coalesce(title, ''))) || '|' || UTC date as YYYY-MM-DD, or
+    'undated|' || id when there is no transcript date.
+
+    Transcripts without a date are never title+date duplicates; they get a key
+    of their own rather than NULL, because the message list only shows rows
+    that carry a key.
+    """
+    if transcript_date is None:
+        return f"undated|{transcript_id}"
+    if transcript_date.tzinfo is not None:
+        transcript_date = transcript_date.astimezone(timezone.utc)
+    return f"{(title or '').strip().lower()}|{transcript_date.date().isoformat()}"
+
 
 class BatchDatabaseService:
     """
@@ -53,10 +82,17 @@ class BatchDatabaseService:
         workspace_id: str,
         connector_id: Optional[str] = None,
         source: str = "unknown",
-        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_size: int = UPSERT_CHUNK_SIZE,
+        customer_resolver: Optional[CustomerResolver] = None,
     ) -> Dict[str, Any]:
         """
-        Batch insert messages with duplicate detection.
+        Batch insert messages, skipping duplicates in the database.
+
+        Rows are streamed to Postgres with INSERT ... ON CONFLICT ON CONSTRAINT
+        uq_message_external (workspace_id, connector_id, external_id) DO NOTHING
+        RETURNING id, one round-trip per chunk. There is no pre-select of
+        existing IDs, concurrent syncs cannot double-insert, and inserted_ids
+        are the rows Postgres actually created.
 
         Args:
             db: Database session
@@ -67,7 +103,9 @@ class BatchDatabaseService:
             workspace_id: Workspace UUID string
             connector_id: Optional WorkspaceConnector UUID string
             source: Source type (slack, gong, fathom, gmail)
-            batch_size: Number of records per batch
+            batch_size: Number of rows per INSERT statement
+            customer_resolver: Resolver shared by all batches of a sync (one is
+                created for this call if not given)
 
         Returns:
             Dict with:
@@ -83,40 +121,14 @@ class BatchDatabaseService:
         new_added = 0
         duplicates_skipped = 0
         inserted_ids: List[str] = []
+        customer_resolver = customer_resolver or CustomerResolver(db, UUID(workspace_id))
 
         try:
-            # Get existing external_ids in one query for duplicate detection
-            external_ids = [m.get("external_id") for m in messages if m.get("external_id")]
-
-            existing_ids = self._get_existing_external_ids(
-                db=db,
-                external_ids=external_ids,
-                workspace_id=workspace_id,
-                connector_id=connector_id,
-                source=source
-            )
+            # One INSERT ... ON CONFLICT DO NOTHING RETURNING round-trip per chunk:
+            # Postgres skips rows hitting uq_message_external and reports the IDs it created
+            for i in range(0, len(messages), batch_size):
+                batch = messages[i:i + batch_size]
 
-            # Filter out duplicates
-            new_messages = [
-                m for m in messages
-                if m.get("external_id") and m["external_id"] not in existing_ids
-            ]
-            duplicates_skipped = total_checked - len(new_messages)
-
-            if not new_messages:
-                logger.info(f"All {total_checked} messages already exist, skipping batch insert")
-                return {
-                    "total_checked": total_checked,
-                    "new_added": 0,
-                    "duplicates_skipped": duplicates_skipped,
-                    "inserted_ids": []
-                }
-
-            # Process in batches
-            for i in range(0, len(new_messages), batch_size):
-                batch = new_messages[i:i + batch_size]
-
-                # Prepare message objects for bulk insert
                 message_mappings = []
                 for msg in batch:
                     mapping = self._prepare_message_mapping(
@@ -124,17 +136,27 @@ class BatchDatabaseService:
                         workspace_id=workspace_id,
                         connector_id=connector_id,
                         source=source,
-                        db=db  # Pass db for customer extraction
                     )
                     if mapping:
                         message_mappings.append(mapping)
-                        # Track the generated ID
-                        inserted_ids.append(str(mapping["id"]))
 
-                if message_mappings:
-                    # Bulk insert
-                    db.bulk_insert_mappings(Message, message_mappings)
-                    new_added += len(message_mappings)
+                if not message_mappings:
+                    continue
+
+                stmt = (
+                    pg_insert(Message)
+                    .values(message_mappings)
+                    .on_conflict_do_nothing(constraint="uq_message_external")
+                    .returning(Message.id, Message.external_id)
+                )
+                inserted = db.execute(stmt).fetchall()
+                inserted_ids.extend(str(row[0]) for row in inserted)
+                new_added += len(inserted)
+
+                # Resolve customers only for rows that were actually inserted
+                self._assign_message_customers(db, customer_resolver, batch, inserted)
+
+            duplicates_skipped = total_checked - new_added
 
             # Commit all batches
             db.commit()
@@ -166,9 +188,16 @@ class BatchDatabaseService:
         workspace_id: str,
         source_type: str,
         batch_size: int = DEFAULT_BATCH_SIZE,
+        backfill: bool = False,
     ) -> Dict[str, Any]:
         """
-        Batch insert raw transcripts with duplicate detection.
+        Batch insert raw transcripts, skipping duplicates in the database.
+
+        A transcript is a duplicate when its source_id already exists for the
+        source type, or when the workspace already has a transcript with the
+        same title on the same (UTC) day. Both rules are unique indexes, so
+        inserts use INSERT ... ON CONFLICT DO NOTHING RETURNING id and only the
+        rows Postgres actually inserted are reported.
 
         Args:
             db: Database session
@@ -179,6 +208,8 @@ class BatchDatabaseService:
             workspace_id: Workspace UUID string
             source_type: Source type ('gong', 'fathom')
             batch_size: Number of records per batch
+            backfill: Historical import (initial sync of a new workspace); large
+                backfills are classified through the OpenAI Batch API
 
         Returns:
             Dict with:
@@ -196,64 +227,12 @@ class BatchDatabaseService:
         inserted_ids: List[str] = []
 
         try:
-            # Get existing source_ids in one query for duplicate detection
-            source_ids = [t.get("source_id") for t in transcripts if t.get("source_id")]
-
-            existing_ids = self._get_existing_transcript_source_ids(
-                db=db,
-                source_ids=source_ids,
-                workspace_id=workspace_id,
-                source_type=source_type
-            )
-
-            # Also get existing title+date combinations to prevent same-name duplicates
-            existing_title_dates = self._get_existing_transcript_title_dates(
-                db=db,
-                workspace_id=workspace_id
-            )
+            # Duplicates by source_id (uq_raw_transcript_source) or by title+date
+            # (uq_raw_transcripts_dedup_key) are skipped by Postgres, including
+            # duplicates within the same batch and rows inserted concurrently
+            for i in range(0, len(transcripts), batch_size):
+                batch = transcripts[i:i + batch_size]
 
-            # Filter out duplicates by source_id OR by title+date
-            new_transcripts = []
-            for t in transcripts:
-                if not t.get("source_id"):
-                    continue
-                if t["source_id"] in existing_ids:
-                    continue
-                # Check title+date duplicate
-                title = t.get("title") or ""
-                transcript_date = t.get("transcript_date")
-                if transcript_date:
-                    if isinstance(transcript_date, str):
-                        try:
-                            from datetime import datetime
-                            transcript_date = datetime.fromisoformat(transcript_date.replace("Z", "+00:00"))
-                        except (ValueError, TypeError):
-                            transcript_date = None
-                    if transcript_date:
-                        date_key = (title.lower().strip(), transcript_date.date())
-                        if date_key in existing_title_dates:
-                            logger.debug(f"Skipping duplicate by title+date: {title}")
-                            continue
-                        # Add to set to prevent duplicates within same batch
-                        existing_title_dates.add(date_key)
-                new_transcripts.append(t)
-
-            duplicates_skipped = total_checked - len(new_transcripts)
-
-            if not new_transcripts:
-                logger.info(f"All {total_checked} transcripts already exist, skipping batch insert")
-                return {
-                    "total_checked": total_checked,
-                    "new_added": 0,
-                    "duplicates_skipped": duplicates_skipped,
-                    "inserted_ids": []
-                }
-
-            # Process in batches
-            for i in range(0, len(new_transcripts), batch_size):
-                batch = new_transcripts[i:i + batch_size]
-
-                # Prepare transcript objects for bulk insert
                 transcript_mappings = []
                 for t in batch:
                     mapping = self._prepare_raw_transcript_mapping(
@@ -263,11 +242,19 @@ class BatchDatabaseService:
                     )
                     if mapping:
                         transcript_mappings.append(mapping)
-                        inserted_ids.append(str(mapping["id"]))
 
                 if transcript_mappings:
-                    db.bulk_insert_mappings(RawTranscript, transcript_mappings)
-                    new_added += len(transcript_mappings)
+                    stmt = (
+                        pg_insert(RawTranscript)
+                        .values(transcript_mappings)
+                        .on_conflict_do_nothing()
+                        .returning(RawTranscript.id)
+                    )
+                    batch_ids = [str(row[0]) for row in db.execute(stmt)]
+                    inserted_ids.extend(batch_ids)
+                    new_added += len(batch_ids)
+
+            duplicates_skipped = total_checked - new_added
 
             db.commit()
             logger.info(
@@ -275,6 +262,10 @@ class BatchDatabaseService:
                 f"{duplicates_skipped} duplicates skipped out of {total_checked} total"
             )
 
+            # TRIGGER AI PIPELINE: classify exactly the transcripts just inserted
+            if inserted_ids:
+                self._enqueue_transcript_classification(workspace_id, inserted_ids, backfill=backfill)
+
         except Exception as e:
             logger.error(f"Error in raw transcript batch insert: {e}")
             db.rollback()
@@ -287,7 +278,7 @@ class BatchDatabaseService:
             "inserted_ids": inserted_ids
         }
 
-    def _get_existing_transcript_source_ids(
+    def get_existing_transcript_source_ids(
         self,
         db: Session,
         source_ids: List[str],
@@ -313,55 +304,32 @@ class BatchDatabaseService:
             logger.error(f"Error checking existing transcripts: {e}")
             return set()
 
-    def _get_existing_transcript_title_dates(
-        self,
-        db: Session,
-        workspace_id: str
-    ) -> Set[tuple]:
-        """
-        Get set of (title, date) tuples that already exist in raw_transcripts.
-        Used to prevent duplicate transcripts with same name on same day.
-        """
-        try:
-            from sqlalchemy import func, cast, Date
-
-            query = db.query(
-                func.lower(func.coalesce(RawTranscript.title, '')),
-                cast(func.coalesce(RawTranscript.transcript_date, RawTranscript.created_at), Date)
-            ).filter(
-                RawTranscript.workspace_id == UUID(workspace_id)
-            )
-            existing = query.all()
-            return {(row[0].strip(), row[1]) for row in existing if row[1]}
-
-        except Exception as e:
-            logger.error(f"Error checking existing transcript titles: {e}")
-            return set()
-
     def _prepare_raw_transcript_mapping(
         self,
         transcript: Dict[str, Any],
         workspace_id: str,
         source_type: str
     ) -> Optional[Dict[str, Any]]:
-        """Prepare a raw transcript dictionary for bulk_insert_mappings."""
+        """Prepare a raw transcript row for the ON CONFLICT insert."""
         source_id = transcript.get("source_id")
         if not source_id:
             return None
 
         now = datetime.now(timezone.utc)
 
-        # Parse transcript_date if provided
+        # Parse transcript_date if provided (undated transcripts are stored as of now,
+        # but only dated ones are deduplicated by title+date)
         transcript_date = transcript.get("transcript_date")
         if isinstance(transcript_date, str):
             try:
                 transcript_date = datetime.fromisoformat(transcript_date.replace("Z", "+00:00"))
             except (ValueError, TypeError):
-                transcript_date = now
+                transcript_date = None
         elif not isinstance(transcript_date, datetime):
-            transcript_date = now
+            transcript_date = None
 
         transcript_id = uuid_module.uuid4()
+        dedup_key = transcript_dedup_key(transcript.get("title"), transcript_date, transcript_id)
 
         mapping = {
             "id": transcript_id,
@@ -372,8 +340,9 @@ class BatchDatabaseService:
             "ai_processed": False,
             "retry_count": 0,
             "title": transcript.get("title"),
+            "dedup_key": dedup_key,
             "duration_seconds": transcript.get("duration_seconds"),
-            "transcript_date": transcript_date,
+            "transcript_date": transcript_date or now,
             "participant_count": transcript.get("participant_count"),
             "created_at": now,
         }
@@ -385,44 +354,57 @@ class BatchDatabaseService:
         Legacy method - AI pipeline is now triggered separately via Celery Beat.
         Kept for backward compatibility with messages-based ingestion.
         """
-        # No-op: Raw transcript processing is now handled by Celery Beat schedule
-        # The process_raw_transcripts task runs every 5 minutes
+        # No-op: Raw transcripts are enqueued by _enqueue_transcript_classification
         pass
 
-    def _get_existing_external_ids(
+    def _enqueue_transcript_classification(
         self,
-        db: Session,
-        external_ids: List[str],
         workspace_id: str,
-        connector_id: Optional[str],
-        source: str
-    ) -> Set[str]:
+        transcript_ids: List[str],
+        backfill: bool = False,
+    ) -> None:
         """
-        Get set of external_ids that already exist in database.
-
-        Uses single query for efficient duplicate detection.
+        Enqueue process_raw_transcripts for newly inserted raw transcripts.
+
+        IDs are split into task-sized groups so they classify in parallel across
+        workers (the SKIP LOCKED claim keeps runs from overlapping). Only when
+        the caller marks the import as a backfill, and it has
+        BATCH_BACKFILL_THRESHOLD or more transcripts, are they submitted as
+        Batch API jobs (24h window) for exactly these IDs, if the Batch API is
+        configured; regular syncs always classify in real time. Enqueue
+        failures are logged, not raised - the periodic run picks the
+        transcripts up.
         """
-        if not external_ids:
-            return set()
+        from app.sync_engine.tasks.ai_pipeline.batch_classification import (
+            BATCH_BACKFILL_THRESHOLD,
+            submit_classification_batch,
+        )
+        from app.sync_engine.tasks.ai_pipeline.transcript_processing import BATCH_SIZE, process_raw_transcripts
 
         try:
-            query = db.query(Message.external_id).filter(
-                and_(
-                    Message.workspace_id == UUID(workspace_id),
-                    Message.external_id.in_(external_ids),
-                    Message.source == source
+            if backfill and len(transcript_ids) >= BATCH_BACKFILL_THRESHOLD and (
+                settings.OPENAI_API_KEY or settings.OPENAI_BATCH_BASE_URL
+            ):
+                batch_size = settings.CLASSIFICATION_BATCH_MAX_TRANSCRIPTS
+                for i in range(0, len(transcript_ids), batch_size):
+                    chunk = transcript_ids[i:i + batch_size]
+                    submit_classification_batch.delay(
+                        workspace_id=workspace_id,
+                        max_transcripts=len(chunk),
+                        transcript_ids=chunk,
+                    )
+                logger.info(f"🔗 Submitting {len(transcript_ids)} new transcripts to the Batch API backfill")
+                return
+
+            for i in range(0, len(transcript_ids), BATCH_SIZE):
+                process_raw_transcripts.delay(
+                    workspace_id=workspace_id,
+                    batch_size=BATCH_SIZE,
+                    transcript_ids=transcript_ids[i:i + BATCH_SIZE],
                 )
-            )
-
-            if connector_id:
-                query = query.filter(Message.connector_id == UUID(connector_id))
-
-            existing = query.all()
-            return {row[0] for row in existing}
-
+            logger.info(f"🔗 Triggered transcript classification for {len(transcript_ids)} new transcripts")
         except Exception as e:
-            logger.error(f"Error checking existing messages: {e}")
-            return set()
+            logger.error(f"Failed to enqueue transcript classification (periodic run will pick them up): {e}")
 
     def _prepare_message_mapping(
         self,
@@ -430,13 +412,13 @@ class BatchDatabaseService:
         workspace_id: str,
         connector_id: Optional[str],
         source: str,
-        db: Optional[Session] = None
     ) -> Optional[Dict[str, Any]]:
         """
-        Prepare a message dictionary for bulk_insert_mappings.
+        Prepare a message row for the multi-row ON CONFLICT insert.
 
-        Returns None if required fields are missing.
-        Generates UUID upfront so it can be tracked for sync history.
+        Returns None if required fields are missing. Every row has the same
+        keys (multi-row VALUES requirement); the ID is generated at insert time
+        and read back with RETURNING.
         """
         external_id = msg.get("external_id")
         if not external_id:
@@ -454,15 +436,12 @@ class BatchDatabaseService:
         elif not isinstance(sent_at, datetime):
             sent_at = now
 
-        # Generate UUID upfront so we can track it for sync history
-        message_id = uuid_module.uuid4()
-
-        mapping = {
-            "id": message_id,  # Pre-generate ID for tracking
+        return {
             "external_id": external_id,
             "content": msg.get("content", ""),
             "source": source,
             "workspace_id": UUID(workspace_id),
+            "connector_id": UUID(connector_id) if connector_id else None,
             "channel_id": msg.get("channel_id"),
             "channel_name": msg.get("channel_name"),
             "author_name": msg.get("author_name"),
@@ -476,39 +455,56 @@ class BatchDatabaseService:
             "updated_at": now,
             "tier1_processed": False,  # Mark for Tier 1 AI processing
             "tier2_processed": False,  # Mark for Tier 2 AI processing
+            "customer_id": UUID(msg["customer_id"]) if msg.get("customer_id") else None,
+            "customer_ask_id": UUID(msg["customer_ask_id"]) if msg.get("customer_ask_id") else None,
         }
 
-        if connector_id:
-            mapping["connector_id"] = UUID(connector_id)
+    def _assign_message_customers(
+        self,
+        db: Session,
+        customer_resolver: CustomerResolver,
+        batch: List[Dict[str, Any]],
+        inserted: List[Any],
+    ) -> None:
+        """
+        Link newly inserted messages to customers extracted from their author info.
 
-        # Customer extraction: either use provided customer_id or extract from author info
-        if msg.get("customer_id"):
-            mapping["customer_id"] = UUID(msg["customer_id"])
-        elif db and (msg.get("author_email") or msg.get("author_name")):
-            # Try to extract customer from author info
-            try:
-                email, name, domain = customer_extraction_service.extract_customer_info(
-                    from_email=msg.get("author_email"),
-                    from_name=msg.get("author_name"),
-                )
-                if email or name:
-                    customer_id = customer_extraction_service.find_or_create_customer(
-                        db=db,
-                        workspace_id=UUID(workspace_id),
-                        email=email,
-                        name=name,
-                        domain=domain,
-                    )
-                    if customer_id:
-                        mapping["customer_id"] = customer_id
-            except Exception as e:
-                logger.warning(f"Failed to extract customer for message: {e}")
+        Only rows returned by the insert are considered, so duplicates never
+        trigger customer lookups. The whole chunk is resolved in one
+        CustomerResolver call. Messages that came with a customer_id already
+        have it set.
+        """
+        if not inserted:
+            return
+
+        messages_by_external_id = {m.get("external_id"): m for m in batch}
+        identities = {}
+        for message_id, external_id in inserted:
+            msg = messages_by_external_id.get(external_id) or {}
+            if msg.get("customer_id") or not (msg.get("author_email") or msg.get("author_name")):
+                continue
+            identities[message_id] = customer_extraction_service.extract_customer_info(
+                from_email=msg.get("author_email"),
+                from_name=msg.get("author_name"),
+            )
+        if not identities:
+            return
 
-        # Optional customer_ask_id
-        if msg.get("customer_ask_id"):
-            mapping["customer_ask_id"] = UUID(msg["customer_ask_id"])
+        try:
+            # Savepoint: a failed lookup must not abort the message insert transaction
+            with db.begin_nested():
+                customer_ids = customer_resolver.resolve(identities.values())
+        except Exception as e:
+            logger.warning(f"Failed to resolve customers for message batch: {e}")
+            return
 
-        return mapping
+        updates = [
+            {"id": message_id, "customer_id": customer_ids[identity]}
+            for message_id, identity in identities.items()
+            if identity in customer_ids
+        ]
+        if updates:
+            db.bulk_update_mappings(Message, updates)
 
     def batch_insert_customer_asks(
         self,
@@ -560,6 +556,7 @@ class BatchDatabaseService:
                     new_added += len(batch)
 
                 db.commit()
+                executive_insights_service.invalidate(workspace_id)
 
             duplicates = total - new_added
             logger.info(f"Batch customer_ask insert: {new_added} new, {duplicates} duplicates")
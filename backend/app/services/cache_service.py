@@ -25,6 +25,22 @@ SYNC_ITEMS_TTL = timedelta(hours=24)  # Sync items cached for 24 hours
 SYNC_STATUS_TTL = timedelta(minutes=5)  # Sync status cached briefly
 DEFAULT_TTL = timedelta(hours=1)
 
+# Counting semaphore: prune expired holders, then add this holder if a slot is
+# free (or refresh it if it already holds one). Times come from the Redis clock.
+_ACQUIRE_SLOT_SCRIPT = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local ttl = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if not redis.call('ZSCORE', KEYS[1], ARGV[1])
+        and redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + ttl, ARGV[1])
+redis.call('PEXPIRE', KEYS[1], ttl)
+return 1
+"""
+
 
 class CacheService:
     """Redis-based caching service with graceful degradation."""
@@ -154,6 +170,88 @@ class CacheService:
             logger.warning(f"Cache delete_pattern failed: {e}")
             return 0
 
+    def incr(self, namespace: str, *key_parts: str) -> Optional[int]:
+        """
+        Atomically increment an integer counter (no expiry).
+
+        Returns:
+            New counter value, or None if Redis is unavailable
+        """
+        if not self._ensure_connection():
+            return None
+
+        try:
+            key = self._make_key(namespace, *key_parts)
+            return int(self._client.incr(key))
+        except RedisError as e:
+            logger.warning(f"Cache incr failed for {namespace}: {e}")
+            return None
+
+    def get_counter(self, namespace: str, *key_parts: str) -> Optional[int]:
+        """
+        Read an integer counter written by incr() in a single round trip.
+
+        Unlike get(), this skips the ping before the read, and tells a missing
+        counter (0) apart from a Redis error (None).
+
+        Returns:
+            Counter value (0 if never incremented), or None if Redis is unavailable
+        """
+        if not self._connected or not self._client:
+            self._connect()
+            if not self._connected:
+                return None
+
+        try:
+            key = self._make_key(namespace, *key_parts)
+            value = self._client.get(key)
+            return int(value) if value is not None else 0
+        except RedisError as e:
+            logger.warning(f"Cache get_counter failed for {namespace}: {e}")
+            self._connected = False
+            return None
+
+    def acquire_slot(
+        self, namespace: str, *key_parts: str, holder: str, limit: int, ttl: timedelta
+    ) -> bool:
+        """
+        Take one of `limit` concurrency slots (a counting semaphore).
+
+        Each holder is a sorted-set member scored by its own expiry, and expired
+        members are pruned before counting, so a slot leaked by a crashed worker
+        frees itself after ttl without affecting the others. A rejected attempt
+        changes nothing. Re-acquiring with the same holder (e.g. a redelivered
+        task) refreshes its slot instead of taking another. Without Redis there
+        is no limit and this returns True.
+
+        Returns:
+            True if a slot was taken (release it with release_slot), False if all are in use
+        """
+        if not self._ensure_connection():
+            return True
+
+        try:
+            key = self._make_key(namespace, *key_parts)
+            acquired = self._client.eval(
+                _ACQUIRE_SLOT_SCRIPT, 1, key,
+                holder, limit, int(ttl.total_seconds() * 1000),
+            )
+            return bool(acquired)
+        except RedisError as e:
+            logger.warning(f"Cache acquire_slot failed for {namespace}: {e}")
+            return True
+
+    def release_slot(self, namespace: str, *key_parts: str, holder: str) -> None:
+        """Give back a slot taken with acquire_slot."""
+        if not self._ensure_connection():
+            return
+
+        try:
+            key = self._make_key(namespace, *key_parts)
+            self._client.zrem(key, holder)
+        except RedisError as e:
+            logger.warning(f"Cache release_slot failed for {namespace}: {e}")
+
     def get_list(self, namespace: str, *key_parts: str) -> Optional[List[Any]]:
         """Get a list from cache."""
         return self.get(namespace, *key_parts)
@@ -225,3 +323,49 @@ def invalidate_sync_items_cache(workspace_id: str, sync_id: str) -> bool:
     """Invalidate all cached pages for a sync."""
     cache = get_cache_service()
     return cache.delete_pattern("sync_items", f"{workspace_id}:{sync_id}:*") > 0
+
+
+# Convenience functions for workspace taxonomy versioning
+def get_taxonomy_version(workspace_id: str) -> Optional[int]:
+    """
+    Get the taxonomy version for a workspace.
+
+    The version is bumped whenever themes or sub-themes change, so it can be
+    used as part of cache keys for anything derived from the taxonomy.
+
+    Returns:
+        Current version (0 if never bumped), or None if Redis is unavailable
+    """
+    return get_cache_service().get_counter("taxonomy_version", workspace_id)
+
+
+def bump_taxonomy_version(workspace_id: str) -> Optional[int]:
+    """Bump the taxonomy version for a workspace after a theme/sub-theme change."""
+    cache = get_cache_service()
+    version = cache.incr("taxonomy_version", workspace_id)
+    if version is not None:
+        logger.debug(f"Taxonomy version for workspace {workspace_id} bumped to {version}")
+    return version
+
+
+# Convenience functions for workspace classification versioning
+def get_classification_version(workspace_id: str) -> Optional[int]:
+    """
+    Get the transcript classification version for a workspace.
+
+    The version is bumped after transcript classifications are committed, so
+    it can be used as part of cache keys for anything counted from them.
+
+    Returns:
+        Current version (0 if never bumped), or None if Redis is unavailable
+    """
+    return get_cache_service().get_counter("classification_version", workspace_id)
+
+
+def bump_classification_version(workspace_id: str) -> Optional[int]:
+    """Bump the classification version for a workspace after classifications are committed."""
+    cache = get_cache_service()
+    version = cache.incr("classification_version", workspace_id)
+    if version is not None:
+        logger.debug(f"Classification version for workspace {workspace_id} bumped to {version}")
+    return version
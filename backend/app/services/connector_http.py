@@ -0,0 +1,261 @@
+"""
+Connector HTTP Client - shared async HTTP layer for external connector APIs.
+
+Gong, Fathom and Slack ingestion make their API calls through one client that
+provides:
+- A keep-alive connection pool per host (and per event loop, since an
+  httpx.AsyncClient's connections are bound to the loop that opened them;
+  run_async_task() reuses the worker thread's loop, so this is normally one
+  pool per host per worker)
+- A token-bucket rate limiter per (connector type, credential), so concurrent
+  requests of one tenant stay under the provider's limit without slowing
+  other tenants
+- Retries for 429/5xx responses and transport errors with exponential
+  backoff, waiting for Retry-After when the provider sends it
+- Request metrics per (connector type, host): requests, retries, rate-limited
+  responses, errors, bytes received and time spent
+
+Usage:
+    from app.services.connector_http import connector_http
+
+    response = await connector_http.post(
+        "gong", "https://api.gong.io/v2/calls/transcript",
+        credential=access_key, auth=(access_key, secret_key), json=payload,
+    )
+    data = response.json()
+
+Non-retryable error statuses (and retryable ones once retries are exhausted)
+raise httpx.HTTPStatusError.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing per host
+MAX_CONNECTIONS_PER_HOST = 20
+MAX_KEEPALIVE_CONNECTIONS_PER_HOST = 10
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+# Retries for 429 / 5xx responses and transport errors
+MAX_REQUEST_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# (requests per second, burst) per credential of each connector type
+RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "gong": (3.0, 3),  # Gong allows ~3 requests/second per API key
+    "fathom": (1.0, 5),  # Fathom allows 60 requests/minute per API key
+    "slack": (1.0, 10),  # Slack Tier 3 methods allow ~50 requests/minute per token
+}
+DEFAULT_RATE_LIMIT: Tuple[float, int] = (5.0, 10)
+
+
+class TokenBucket:
+    """Token bucket shared by every coroutine (and thread) using one credential."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> float:
+        """Wait for a token. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+@dataclass
+class RequestMetrics:
+    """Counters for one (connector type, host)."""
+
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    seconds: float = 0.0
+    throttled_seconds: float = 0.0
+
+
+class ConnectorHTTPClient:
+    """Pooled, rate-limited, retrying async HTTP client for connector APIs."""
+
+    def __init__(self):
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._metrics: Dict[Tuple[str, str], RequestMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _pool_for(self, url: str) -> httpx.AsyncClient:
+        """Keep-alive client for the host of url, on the running event loop."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = self._pools.setdefault(loop, {})
+            client = pools.get(origin)
+            if client is None:
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=MAX_CONNECTIONS_PER_HOST,
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS_PER_HOST,
+                    ),
+                    timeout=DEFAULT_TIMEOUT_SECONDS,
+                )
+                pools[origin] = client
+                logger.debug(f"Opened connection pool for {origin}")
+        return client
+
+    def _bucket_for(self, connector_type: str, credential: Optional[str]) -> TokenBucket:
+        # Key on a digest so raw tokens are not kept around as dict keys
+        key = (connector_type, hashlib.sha256((credential or "").encode("utf-8")).hexdigest()[:16])
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, burst = RATE_LIMITS.get(connector_type, DEFAULT_RATE_LIMIT)
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+    def _metrics_for(self, connector_type: str, url: str) -> RequestMetrics:
+        key = (connector_type, urlsplit(url).netloc)
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = RequestMetrics()
+        return metrics
+
+    @staticmethod
+    def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+        """Retry-After (seconds or HTTP date) when present, otherwise exponential backoff."""
+        delay = BACKOFF_BASE_SECONDS * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    pass
+        return min(max(delay, 0.0), BACKOFF_MAX_SECONDS)
+
+    async def request(
+        self,
+        connector_type: str,
+        method: str,
+        url: str,
+        *,
+        credential: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_retries: int = MAX_REQUEST_RETRIES,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request, rate limited per credential and retried on 429/5xx.
+
+        Args:
+            connector_type: Connector type (gong, fathom, slack); picks the rate limit
+            method: HTTP method
+            url: Absolute URL
+            credential: Token/API key identifying the rate-limit bucket
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries for retryable statuses and transport errors
+            **kwargs: Passed to httpx (params, json, data, headers, auth)
+
+        Returns:
+            The successful response
+
+        Raises:
+            httpx.HTTPStatusError: Error status (after retries, if retryable)
+            httpx.TransportError: Connection failures after retries
+        """
+        client = self._pool_for(url)
+        bucket = self._bucket_for(connector_type, credential)
+        metrics = self._metrics_for(connector_type, url)
+
+        for attempt in range(max_retries + 1):
+            metrics.throttled_seconds += await bucket.acquire()
+            started = time.monotonic()
+            metrics.requests += 1
+            try:
+                response = await client.request(method, url, timeout=timeout, **kwargs)
+            except httpx.TransportError as e:
+                metrics.seconds += time.monotonic() - started
+                metrics.errors += 1
+                if attempt == max_retries:
+                    raise
+                delay = self._retry_delay(None, attempt)
+                logger.warning(f"{connector_type} request to {url} failed ({e}), retrying in {delay:.1f}s")
+                metrics.retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            metrics.seconds += time.monotonic() - started
+            metrics.bytes_received += len(response.content)
+            if response.status_code == 429:
+                metrics.rate_limited += 1
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries:
+                delay = self._retry_delay(response, attempt)
+                logger.warning(
+                    f"{connector_type} returned {response.status_code} for {url}, retrying in {delay:.1f}s"
+                )
+                metrics.retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            if response.is_error:
+                metrics.errors += 1
+            response.raise_for_status()
+            return response
+
+    async def get(self, connector_type: str, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request(connector_type, "GET", url, **kwargs)
+
+    async def post(self, connector_type: str, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request(connector_type, "POST", url, **kwargs)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of request metrics keyed by "<connector type>:<host>"."""
+        with self._lock:
+            return {f"{ctype}:{host}": asdict(m) for (ctype, host), m in self._metrics.items()}
+
+    async def aclose(self) -> None:
+        """Close the connection pools opened on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = self._pools.pop(loop, {})
+        for client in pools.values():
+            await client.aclose()
+
+
+# Global client instance
+connector_http = ConnectorHTTPClient()
@@ -7,15 +7,19 @@ This service:
 3. Links messages to customers
 
 Used by ingestion services (Gmail, Slack, etc.) to automatically populate the customers table.
+Ingestion resolves customers a batch at a time through CustomerResolver: one
+query per key type (email, domain, name) for the whole batch, one bulk insert
+for the missing customers, and an in-memory index reused for the rest of the sync.
 """
 
 import logging
 import re
-from typing import Optional, Tuple
+import uuid as uuid_module
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
 
 from app.models.customer import Customer
 from app.models.message import Message
@@ -23,6 +27,208 @@ from app.models.message import Message
 logger = logging.getLogger(__name__)
 
 
+# (email, name, domain) as returned by CustomerExtractionService.extract_customer_info
+CustomerIdentity = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class CustomerResolver:
+    """
+    Per-sync index that resolves customer identities to Customer IDs in bulk.
+
+    Matching follows find_or_create_customer: exact contact_email first, then
+    company domain for business emails, otherwise a new customer is created.
+    Identities with only a name are matched on the customer name. Keys already
+    resolved (or known to be missing) are never queried again, so one resolver
+    should be kept for the duration of a sync and fed batch after batch.
+    """
+
+    def __init__(self, db: Session, workspace_id: UUID):
+        self.db = db
+        self.workspace_id = workspace_id
+        self._by_email: Dict[str, UUID] = {}
+        self._by_domain: Dict[str, UUID] = {}
+        self._by_name: Dict[str, UUID] = {}
+        self._missing_emails: Set[str] = set()
+        self._missing_domains: Set[str] = set()
+        self._missing_names: Set[str] = set()
+        # Domain-matched customers that still have no contact email
+        self._domain_without_contact: Set[UUID] = set()
+        self.created = 0
+
+    def resolve(self, identities: Iterable[CustomerIdentity]) -> Dict[CustomerIdentity, UUID]:
+        """
+        Resolve a batch of (email, name, domain) identities.
+
+        Missing customers are bulk-inserted and flushed (not committed), so the
+        caller's transaction decides whether they persist.
+
+        Returns:
+            Dict mapping each resolvable identity to its customer ID
+        """
+        normalized = {
+            identity: self._normalize(identity)
+            for identity in dict.fromkeys(identities)
+            if identity[0] or identity[1]
+        }
+        pending = list(dict.fromkeys(normalized.values()))
+        if not pending:
+            return {}
+
+        self._load_emails({email for email, _, _ in pending if email})
+        self._load_domains({domain for email, _, domain in pending if domain and email not in self._by_email})
+        self._load_names({name for email, name, domain in pending if name and not email and not domain})
+
+        self._fill_contacts(pending)
+        self._create_missing(pending)
+
+        resolved = {}
+        for identity, key in normalized.items():
+            customer_id = self._lookup(key)
+            if customer_id:
+                resolved[identity] = customer_id
+        return resolved
+
+    @staticmethod
+    def _normalize(identity: CustomerIdentity) -> CustomerIdentity:
+        """Personal email domains never identify a company."""
+        email, name, domain = identity
+        if domain and domain.lower() in CustomerExtractionService.PERSONAL_EMAIL_DOMAINS:
+            domain = None
+        return email, name, domain
+
+    def _lookup(self, identity: CustomerIdentity) -> Optional[UUID]:
+        email, name, domain = identity
+        if email and email in self._by_email:
+            return self._by_email[email]
+        if domain and domain in self._by_domain:
+            return self._by_domain[domain]
+        if not email and not domain and name:
+            return self._by_name.get(name)
+        return None
+
+    def _load_emails(self, emails: Set[str]) -> None:
+        emails = emails - self._by_email.keys() - self._missing_emails
+        if not emails:
+            return
+        rows = self.db.query(Customer.id, Customer.contact_email).filter(
+            Customer.workspace_id == self.workspace_id,
+            Customer.contact_email.in_(emails),
+        ).order_by(Customer.created_at).all()
+        for customer_id, email in rows:
+            self._by_email.setdefault(email, customer_id)
+        self._missing_emails |= emails - self._by_email.keys()
+
+    def _load_domains(self, domains: Set[str]) -> None:
+        domains = domains - self._by_domain.keys() - self._missing_domains
+        if not domains:
+            return
+        rows = self.db.query(Customer.id, Customer.domain, Customer.contact_email).filter(
+            Customer.workspace_id == self.workspace_id,
+            Customer.domain.in_(domains),
+        ).order_by(Customer.created_at).all()
+        for customer_id, domain, contact_email in rows:
+            if domain in self._by_domain:
+                continue
+            self._by_domain[domain] = customer_id
+            if not contact_email:
+                self._domain_without_contact.add(customer_id)
+        self._missing_domains |= domains - self._by_domain.keys()
+
+    def _load_names(self, names: Set[str]) -> None:
+        names = names - self._by_name.keys() - self._missing_names
+        if not names:
+            return
+        rows = self.db.query(Customer.id, Customer.name).filter(
+            Customer.workspace_id == self.workspace_id,
+            Customer.name.in_(names),
+        ).order_by(Customer.created_at).all()
+        for customer_id, name in rows:
+            self._by_name.setdefault(name, customer_id)
+        self._missing_names |= names - self._by_name.keys()
+
+    def _fill_contacts(self, pending: List[CustomerIdentity]) -> None:
+        """Give domain-matched customers without a contact the first email seen for them."""
+        updates = []
+        for email, name, domain in pending:
+            if not email or email in self._by_email or domain not in self._by_domain:
+                continue
+            customer_id = self._by_domain[domain]
+            if customer_id not in self._domain_without_contact:
+                continue
+            self._domain_without_contact.discard(customer_id)
+            self._by_email[email] = customer_id
+            update = {"id": customer_id, "contact_email": email}
+            if name:
+                update["contact_name"] = name
+            updates.append(update)
+
+        for update in updates:
+            # Same as the single-row path: contact_name only fills an empty one
+            self.db.query(Customer).filter(Customer.id == update["id"]).update(
+                {
+                    Customer.contact_email: update["contact_email"],
+                    Customer.contact_name: func.coalesce(Customer.contact_name, update.get("contact_name")),
+                },
+                synchronize_session=False,
+            )
+
+    def _create_missing(self, pending: List[CustomerIdentity]) -> None:
+        """Bulk-insert one customer per unresolved company domain, email or name."""
+        rows: Dict[Tuple[str, str], Dict] = {}
+        emails: Dict[str, UUID] = {}
+        for identity in pending:
+            if self._lookup(identity):
+                continue
+            email, name, domain = identity
+            if domain:
+                key = ("domain", domain)
+            elif email:
+                key = ("email", email)
+            else:
+                key = ("name", name)
+
+            row = rows.get(key)
+            if row is None:
+                customer_name = name
+                if not customer_name and domain:
+                    # Use domain as company name (capitalize it)
+                    customer_name = domain.split('.')[0].capitalize()
+                if not customer_name:
+                    customer_name = email.split('@')[0] if email else "Unknown"
+                row = rows[key] = {
+                    "id": uuid_module.uuid4(),
+                    "workspace_id": self.workspace_id,
+                    "name": customer_name,
+                    "domain": domain,
+                    "contact_email": email,
+                    "contact_name": name,
+                    "external_system": "email",  # Mark as auto-extracted from email
+                    "is_active": True,
+                }
+            if email:
+                emails[email] = row["id"]
+
+        if not rows:
+            return
+
+        self.db.bulk_insert_mappings(Customer, list(rows.values()))
+        self.db.flush()
+
+        # Index only after the insert succeeded, so a failed flush leaves no dangling IDs
+        for (kind, value), row in rows.items():
+            if kind == "domain":
+                self._by_domain[value] = row["id"]
+                self._missing_domains.discard(value)
+            elif kind == "name":
+                self._by_name[value] = row["id"]
+                self._missing_names.discard(value)
+        for email, customer_id in emails.items():
+            self._by_email[email] = customer_id
+            self._missing_emails.discard(email)
+        self.created += len(rows)
+        logger.info(f"Created {len(rows)} new customers for workspace {self.workspace_id}")
+
+
 class CustomerExtractionService:
     """Service for extracting and managing customer records from messages."""
 
@@ -108,10 +314,13 @@ class CustomerExtractionService:
         """
         Find existing customer or create new one.
 
+        Single-identity form of CustomerResolver; ingestion paths should
+        resolve whole batches with a resolver instead.
+
         Priority for matching:
         1. Exact email match (contact_email)
         2. Domain match (for business emails)
-        3. Name match (within workspace)
+        3. Name match (within workspace, for identities with only a name)
 
         Args:
             db: Database session
@@ -127,59 +336,8 @@ class CustomerExtractionService:
             return None
 
         try:
-            # Try to find existing customer
-            customer = None
-
-            # 1. Match by email
-            if email:
-                customer = db.query(Customer).filter(
-                    and_(
-                        Customer.workspace_id == workspace_id,
-                        Customer.contact_email == email
-                    )
-                ).first()
-
-            # 2. Match by domain (for business emails)
-            if not customer and domain and domain not in self.PERSONAL_EMAIL_DOMAINS:
-                customer = db.query(Customer).filter(
-                    and_(
-                        Customer.workspace_id == workspace_id,
-                        Customer.domain == domain
-                    )
-                ).first()
-
-                # Update contact info if we found by domain
-                if customer and email and not customer.contact_email:
-                    customer.contact_email = email
-                    if name and not customer.contact_name:
-                        customer.contact_name = name
-                    db.flush()
-
-            # 3. Create new customer if not found
-            if not customer:
-                # Determine customer name
-                customer_name = name
-                if not customer_name and domain:
-                    # Use domain as company name (capitalize it)
-                    customer_name = domain.split('.')[0].capitalize()
-                if not customer_name:
-                    customer_name = email.split('@')[0] if email else "Unknown"
-
-                customer = Customer(
-                    workspace_id=workspace_id,
-                    name=customer_name,
-                    domain=domain,
-                    contact_email=email,
-                    contact_name=name,
-                    external_system="email",  # Mark as auto-extracted from email
-                    is_active=True,
-                )
-                db.add(customer)
-                db.flush()  # Get the ID without committing
-
-                logger.info(f"Created new customer: {customer_name} ({email}) for workspace {workspace_id}")
-
-            return customer.id
+            identity = (email, name, domain)
+            return CustomerResolver(db, workspace_id).resolve([identity]).get(identity)
 
         except Exception as e:
             logger.error(f"Error finding/creating customer: {e}")
@@ -231,19 +389,25 @@ class CustomerExtractionService:
         db: Session,
         workspace_id: UUID,
         batch_size: int = 100,
+        resolver: Optional[CustomerResolver] = None,
     ) -> dict:
         """
         Process messages without customer links and create/link customers.
 
+        The whole batch is resolved with one CustomerResolver call instead of
+        a find-or-create per message.
+
         Args:
             db: Database session
             workspace_id: Workspace to process
             batch_size: Number of messages to process
+            resolver: Resolver to reuse across batches of the same run
 
         Returns:
             Dict with stats
         """
         stats = {"processed": 0, "linked": 0, "errors": 0}
+        resolver = resolver or CustomerResolver(db, workspace_id)
 
         try:
             # Get messages without customer_id
@@ -259,15 +423,18 @@ class CustomerExtractionService:
                 )
             ).limit(batch_size).all()
 
+            identities = {
+                message.id: self.extract_customer_info(message.from_email or message.author_email, message.author_name)
+                for message in messages
+            }
+            customer_ids = resolver.resolve(identities.values())
+
             for message in messages:
                 stats["processed"] += 1
-                try:
-                    customer_id = self.link_message_to_customer(db, message)
-                    if customer_id:
-                        stats["linked"] += 1
-                except Exception as e:
-                    logger.error(f"Error linking message {message.id} to customer: {e}")
-                    stats["errors"] += 1
+                customer_id = customer_ids.get(identities[message.id])
+                if customer_id:
+                    message.customer_id = customer_id
+                    stats["linked"] += 1
 
             db.commit()
 
@@ -278,6 +445,7 @@ class CustomerExtractionService:
 
         except Exception as e:
             logger.error(f"Error in batch customer extraction: {e}")
+            stats["errors"] += 1
             db.rollback()
 
         return stats
@@ -0,0 +1,321 @@
+"""
+Executive Insights Service - Cached snapshot of the Executive Insights dashboard.
+
+The dashboard used to run a dozen sequential COUNT/SUM/GROUP BY queries per
+load (customer asks, themes, customers, messages), each a round-trip to
+Postgres. It is now computed by one CTE query that returns the whole payload
+as JSON, and stored in Redis (CacheService) as a per-workspace snapshot:
+
+- Key: executive_insights:<workspace_id>:<taxonomy version>, so theme and
+  sub-theme changes start a new snapshot
+- Writes to CustomerAsk call invalidate() after they commit
+- Message and customer activity is picked up when the snapshot expires
+  (SNAPSHOT_TTL), which bounds how stale the time-based metrics get
+
+Responses carry snapshot_generated_at and snapshot_age_seconds. Without Redis
+every load runs the query.
+
+Usage:
+    from app.services.executive_insights_service import executive_insights_service
+
+    insights = executive_insights_service.get(db, workspace_id)
+    ...
+    db.commit()
+    executive_insights_service.invalidate(workspace_id)
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import JSON, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.services.cache_service import get_cache_service, get_taxonomy_version
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAMESPACE = "executive_insights"
+SNAPSHOT_TTL = timedelta(minutes=10)
+
+# Normalize status values to match expected keys
+STATUS_MAPPING = {
+    'new': 'new',
+    'under-review': 'in_progress',
+    'under_review': 'in_progress',
+    'in_progress': 'in_progress',
+    'in-progress': 'in_progress',
+    'planned': 'in_progress',
+    'completed': 'completed',
+    'shipped': 'completed',
+    'on_hold': 'on_hold',
+    'on-hold': 'on_hold',
+    'on hold': 'on_hold',
+}
+
+# One round-trip: every metric is a CTE, the final SELECT returns one row of JSON
+EXECUTIVE_INSIGHTS_SQL = text("""
+WITH asks AS (
+    SELECT id, name, description, urgency, status, mention_count, sub_theme_id,
+           first_mentioned_at, last_mentioned_at, created_at, updated_at
+    FROM customer_asks
+    WHERE workspace_id = :workspace_id
+),
+ask_totals AS (
+    SELECT COUNT(*) AS total_features,
+           COALESCE(SUM(mention_count), 0) AS total_mentions,
+           COUNT(*) FILTER (WHERE created_at >= :one_week_ago) AS features_this_week,
+           COUNT(*) FILTER (WHERE created_at >= :two_weeks_ago AND created_at < :one_week_ago) AS features_last_week
+    FROM asks
+),
+by_status AS (
+    SELECT COALESCE(json_object_agg(status, n), '{}'::json) AS data
+    FROM (SELECT status, COUNT(*) AS n FROM asks WHERE status IS NOT NULL GROUP BY status) s
+),
+by_urgency AS (
+    SELECT COALESCE(json_object_agg(urgency, n), '{}'::json) AS data
+    FROM (SELECT urgency, COUNT(*) AS n FROM asks WHERE urgency IS NOT NULL GROUP BY urgency) u
+),
+theme_totals AS (
+    SELECT COUNT(*) AS total_themes FROM themes WHERE workspace_id = :workspace_id
+),
+top_themes AS (
+    SELECT COALESCE(json_agg(json_build_object('name', name, 'feature_count', feature_count)
+                             ORDER BY feature_count DESC), '[]'::json) AS data
+    FROM (
+        SELECT t.id, t.name, COUNT(a.id) AS feature_count
+        FROM themes t
+        LEFT JOIN sub_themes st ON st.theme_id = t.id
+        LEFT JOIN asks a ON a.sub_theme_id = st.id
+        WHERE t.workspace_id = :workspace_id
+        GROUP BY t.id, t.name
+        ORDER BY feature_count DESC
+        LIMIT 5
+    ) x
+),
+top_features AS (
+    SELECT COALESCE(json_agg(json_build_object(
+               'id', x.id,
+               'name', x.name,
+               'description', x.description,
+               'urgency', x.urgency,
+               'status', x.status,
+               'mention_count', x.mention_count,
+               'theme_id', x.theme_id,
+               'theme', json_build_object('id', x.theme_id, 'name', x.theme_name, 'description', x.theme_description),
+               'first_mentioned', x.first_mentioned_at,
+               'last_mentioned', x.last_mentioned_at,
+               'created_at', x.created_at,
+               'updated_at', x.updated_at
+           ) ORDER BY x.mention_count DESC), '[]'::json) AS data
+    FROM (
+        SELECT a.*, t.id AS theme_id, t.name AS theme_name, t.description AS theme_description
+        FROM asks a
+        JOIN sub_themes st ON st.id = a.sub_theme_id
+        JOIN themes t ON t.id = st.theme_id
+        ORDER BY a.mention_count DESC
+        LIMIT 10
+    ) x
+),
+industries AS (
+    SELECT COALESCE(json_agg(json_build_object('industry', industry, 'count', n) ORDER BY n DESC), '[]'::json) AS data
+    FROM (
+        SELECT COALESCE(industry, 'Unknown') AS industry, COUNT(*) AS n
+        FROM customers
+        WHERE workspace_id = :workspace_id AND is_active = true
+        GROUP BY customers.industry
+        ORDER BY n DESC
+        LIMIT 10
+    ) i
+),
+calls_per_day AS (
+    SELECT COALESCE(json_agg(json_build_object('date', day, 'count', n) ORDER BY day), '[]'::json) AS data
+    FROM (
+        SELECT date(sent_at) AS day, COUNT(*) AS n
+        FROM messages
+        WHERE workspace_id = :workspace_id AND sent_at >= :ninety_days_ago
+        GROUP BY date(sent_at)
+    ) d
+),
+customer_activity AS (
+    SELECT c.id, c.name, COALESCE(c.industry, 'Unknown') AS industry,
+           MAX(m.sent_at) AS last_activity, COUNT(m.id) AS message_count
+    FROM customers c
+    LEFT JOIN messages m ON m.customer_id = c.id
+    WHERE c.workspace_id = :workspace_id AND c.is_active = true
+    GROUP BY c.id, c.name, c.industry
+),
+customer_health AS (
+    SELECT *,
+           CASE
+               WHEN last_activity >= :one_week_ago THEN 'healthy'
+               WHEN last_activity >= :thirty_days_ago THEN 'at_risk'
+               ELSE 'dormant'
+           END AS health_status
+    FROM customer_activity
+),
+health_summary AS (
+    SELECT json_build_object(
+               'healthy', COUNT(*) FILTER (WHERE health_status = 'healthy'),
+               'at_risk', COUNT(*) FILTER (WHERE health_status = 'at_risk'),
+               'dormant', COUNT(*) FILTER (WHERE health_status = 'dormant')
+           ) AS data
+    FROM customer_health
+),
+health_details AS (
+    SELECT COALESCE(json_agg(json_build_object(
+               'customer_id', id,
+               'name', name,
+               'industry', industry,
+               'last_activity', last_activity,
+               'message_count', message_count,
+               'health_status', health_status
+           ) ORDER BY priority, message_count DESC), '[]'::json) AS data
+    FROM (
+        SELECT *,
+               CASE health_status WHEN 'healthy' THEN 0 WHEN 'at_risk' THEN 1 ELSE 2 END AS priority
+        FROM customer_health
+        ORDER BY priority, message_count DESC
+        LIMIT 20
+    ) h
+),
+top_engaged AS (
+    SELECT COALESCE(json_agg(json_build_object(
+               'customer_id', id,
+               'name', name,
+               'industry', industry,
+               'message_count', message_count
+           ) ORDER BY message_count DESC), '[]'::json) AS data
+    FROM (
+        SELECT * FROM customer_activity
+        WHERE message_count > 0
+        ORDER BY message_count DESC
+        LIMIT 10
+    ) e
+)
+SELECT ask_totals.*,
+       theme_totals.total_themes,
+       by_status.data AS by_status,
+       by_urgency.data AS by_urgency,
+       top_themes.data AS top_themes,
+       top_features.data AS top_features,
+       industries.data AS industries,
+       calls_per_day.data AS calls_per_day,
+       health_summary.data AS health_summary,
+       health_details.data AS health_details,
+       top_engaged.data AS top_engaged
+FROM ask_totals, theme_totals, by_status, by_urgency, top_themes, top_features,
+     industries, calls_per_day, health_summary, health_details, top_engaged
+""").columns(
+    # Typed so both psycopg2 and asyncpg hand back decoded JSON
+    **{name: JSON for name in (
+        'by_status', 'by_urgency', 'top_themes', 'top_features', 'industries',
+        'calls_per_day', 'health_summary', 'health_details', 'top_engaged',
+    )}
+)
+
+
+class ExecutiveInsightsService:
+    """Compute and cache the Executive Insights dashboard per workspace."""
+
+    def get(self, db: Session, workspace_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Dashboard payload for a workspace, from the cached snapshot when there is one.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace UUID string
+            refresh: Recompute even if a snapshot is cached
+        """
+        key, snapshot = self._load(workspace_id, refresh)
+        if snapshot is None:
+            row = db.execute(EXECUTIVE_INSIGHTS_SQL, self._params(workspace_id)).mappings().one()
+            snapshot = self._store(key, self._shape(row))
+        return self._response(snapshot)
+
+    async def aget(self, db: AsyncSession, workspace_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """get() on an async session; Redis calls run in the threadpool."""
+        key, snapshot = await run_in_threadpool(self._load, workspace_id, refresh)
+        if snapshot is None:
+            row = (await db.execute(EXECUTIVE_INSIGHTS_SQL, self._params(workspace_id))).mappings().one()
+            snapshot = await run_in_threadpool(self._store, key, self._shape(row))
+        return self._response(snapshot)
+
+    @staticmethod
+    def _load(workspace_id: str, refresh: bool) -> Tuple[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """Cache key and cached snapshot (None on a miss or refresh)."""
+        workspace_id = str(workspace_id)
+        key = (workspace_id, str(get_taxonomy_version(workspace_id) or 0))
+        return key, None if refresh else get_cache_service().get(CACHE_NAMESPACE, *key)
+
+    @staticmethod
+    def _store(key: Tuple[str, str], data: Dict[str, Any]) -> Dict[str, Any]:
+        snapshot = {'generated_at': datetime.now(timezone.utc).isoformat(), 'data': data}
+        get_cache_service().set(CACHE_NAMESPACE, *key, value=snapshot, ttl=SNAPSHOT_TTL)
+        return snapshot
+
+    @staticmethod
+    def _response(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        generated_at = datetime.fromisoformat(snapshot['generated_at'])
+        age = (datetime.now(timezone.utc) - generated_at).total_seconds()
+        return {
+            **snapshot['data'],
+            'snapshot_generated_at': snapshot['generated_at'],
+            'snapshot_age_seconds': round(max(age, 0.0), 1),
+        }
+
+    @staticmethod
+    def _params(workspace_id: str) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        return {
+            'workspace_id': str(workspace_id),
+            'one_week_ago': now - timedelta(days=7),
+            'two_weeks_ago': now - timedelta(days=14),
+            'thirty_days_ago': now - timedelta(days=30),
+            'ninety_days_ago': now - timedelta(days=90),
+        }
+
+    @staticmethod
+    def _shape(row) -> Dict[str, Any]:
+        """Response body from the single row of EXECUTIVE_INSIGHTS_SQL."""
+        status_counts = {'new': 0, 'in_progress': 0, 'completed': 0, 'on_hold': 0}
+        for status, count in (row['by_status'] or {}).items():
+            # Unknown statuses count as 'new'
+            status_counts[STATUS_MAPPING.get(status.lower(), 'new')] += count
+
+        urgency_counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
+        for urgency, count in (row['by_urgency'] or {}).items():
+            if urgency in urgency_counts:
+                urgency_counts[urgency] = count
+
+        # Keep 'features' naming for frontend compatibility
+        return {
+            'metrics': {
+                'total_features': row['total_features'] or 0,
+                'total_themes': row['total_themes'] or 0,
+                'total_mentions': int(row['total_mentions'] or 0),
+                'features_by_status': status_counts,
+                'features_by_urgency': urgency_counts,
+                'top_themes': row['top_themes'],
+                'recent_activity': {
+                    'features_this_week': row['features_this_week'] or 0,
+                    'features_last_week': row['features_last_week'] or 0,
+                },
+                'customers_by_industry': row['industries'],
+                'calls_per_day': row['calls_per_day'],
+                'top_engaged_customers': row['top_engaged'],
+                'customer_health_summary': row['health_summary'],
+            },
+            'customer_health_details': row['health_details'],
+            'top_features': row['top_features'],
+        }
+
+    def invalidate(self, workspace_id: Any) -> None:
+        """Drop a workspace's snapshots; call after committing CustomerAsk changes."""
+        get_cache_service().delete_pattern(CACHE_NAMESPACE, f"{workspace_id}:*")
+
+
+# Global service instance
+executive_insights_service = ExecutiveInsightsService()
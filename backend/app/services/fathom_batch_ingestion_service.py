@@ -3,6 +3,11 @@ Optimized Fathom Batch Ingestion Service - Fast batch data storage for raw trans
 
 This service focuses on:
 1. Fast fetching of Fathom sessions and transcripts
+   - Sessions are filtered server-side with created_after; incremental syncs
+     start at the connector watermark and page until caught up
+   - Meetings are listed without transcripts; transcripts are fetched only for
+     meetings not yet in raw_transcripts, concurrently over the shared connector
+     HTTP client (pooled, rate limited per API key, 429-aware backoff)
 2. Batch insertion into raw_transcripts table
 3. Deferred AI processing (ai_processed=False)
 
@@ -19,22 +24,36 @@ Usage:
     )
 """
 
+import asyncio
 import logging
 import os
-import requests
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 
+import httpx
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 from app.models.workspace import Workspace
 from app.models.workspace_connector import WorkspaceConnector
 from app.services.batch_db_service import batch_db_service
+from app.services.connector_http import RETRYABLE_STATUS_CODES, connector_http
+from app.services.sync_watermark_service import sync_watermark_service
 
 logger = logging.getLogger(__name__)
 
+# Incremental syncs re-read this much before the watermark (recordings are
+# listed once processed, after the meeting); existing sessions are deduplicated
+WATERMARK_OVERLAP = timedelta(hours=6)
+# Meetings per listing page (Fathom maximum)
+PAGE_SIZE = 100
+# Concurrent transcript requests per ingestion run
+MAX_CONCURRENT_TRANSCRIPT_REQUESTS = 5
+# Sessions whose transcript keeps failing with a retryable error are deferred
+# (holding the watermark back) only while they are younger than this
+MAX_TRANSCRIPT_RETRY_AGE = timedelta(days=2)
+
 
 class FathomBatchIngestionService:
     """
@@ -42,6 +61,7 @@ class FathomBatchIngestionService:
 
     Key optimizations:
     - Batch API calls where possible
+    - Transcripts downloaded once, only for meetings not stored yet
     - No inline AI extraction (deferred to batch processing)
     - Batch database inserts to raw_transcripts
     - Minimal memory footprint
@@ -54,29 +74,40 @@ class FathomBatchIngestionService:
         self,
         db: Session,
         workspace_id: str,
-        limit: int = 100,
+        limit: Optional[int] = 100,
         days_back: int = 1,
-        min_duration_seconds: int = 0
-    ) -> Dict[str, int]:
+        min_duration_seconds: int = 0,
+        incremental: bool = False,
+        lazy_transcripts: bool = True,
+        backfill: bool = False,
+    ) -> Dict[str, Any]:
         """
         Ingest Fathom sessions with optimized batch processing.
 
         This method:
-        1. Fetches sessions from Fathom API
-        2. Batch inserts into raw_transcripts table with ai_processed=False
-        3. Returns counts for sync tracking
+        1. Lists sessions in the date window from Fathom API
+        2. Skips sessions already in raw_transcripts
+        3. Fetches transcripts of the new sessions (lazy mode)
+        4. Batch inserts into raw_transcripts table with ai_processed=False
+        5. Returns counts for sync tracking
 
         AI extraction is NOT performed here - it happens in a separate task.
 
         Args:
             db: Database session
             workspace_id: Workspace UUID string
-            limit: Maximum sessions to fetch
-            days_back: How many days back to look
+            limit: Maximum sessions to fetch (None = all sessions in the range)
+            days_back: How many days back to look (when there is no watermark)
             min_duration_seconds: Minimum session duration to include
+            incremental: Start at the connector watermark and advance it on success
+            lazy_transcripts: List meetings without transcripts and fetch transcripts
+                only for new meetings (False: list with include_transcript=true)
+            backfill: Historical import (e.g. a newly connected workspace) - large
+                batches may be classified through the OpenAI Batch API
 
         Returns:
-            Dict with 'total_checked', 'new_added', 'duplicates_skipped', 'inserted_ids'
+            Dict with 'total_checked', 'new_added', 'duplicates_skipped', 'inserted_ids',
+            'bytes_downloaded'
         """
         try:
             # Validate workspace
@@ -107,24 +138,62 @@ class FathomBatchIngestionService:
             # Calculate date range
             to_date = datetime.now(timezone.utc)
             from_date = to_date - timedelta(days=days_back)
+            if incremental:
+                from_date = sync_watermark_service.since(db, connector.id, overlap=WATERMARK_OVERLAP) or from_date
 
             # Fetch sessions from Fathom
-            logger.info(f"Fetching up to {limit} Fathom sessions from last {days_back} days")
-            sessions = self._fetch_sessions(
+            logger.info(f"Fetching {f'up to {limit}' if limit else 'all'} Fathom sessions since {from_date.isoformat()}")
+            sessions, bytes_downloaded = await self._fetch_sessions(
                 credentials=credentials,
                 from_date=from_date,
                 to_date=to_date,
                 limit=limit,
-                min_duration_seconds=min_duration_seconds
+                min_duration_seconds=min_duration_seconds,
+                include_transcript=not lazy_transcripts,
             )
 
             if not sessions:
-                logger.info("No Fathom sessions found in date range")
-                return {"total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "inserted_ids": []}
+                logger.info(f"No Fathom sessions found in date range ({bytes_downloaded} bytes downloaded)")
+                if incremental:
+                    sync_watermark_service.advance(db, connector.id, last_item_at=to_date)
+                    db.commit()
+                return {
+                    "total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "inserted_ids": [],
+                    "bytes_downloaded": bytes_downloaded,
+                }
+
+            # Skip sessions we already stored - no point fetching their transcripts
+            sessions = [s for s in sessions if s.get('recording_id') is not None]
+            existing_ids = batch_db_service.get_existing_transcript_source_ids(
+                db=db,
+                source_ids=[str(s['recording_id']) for s in sessions],
+                workspace_id=workspace_id,
+                source_type="fathom",
+                backfill=backfill,
+            )
+            new_sessions = [s for s in sessions if str(s['recording_id']) not in existing_ids]
+            if existing_ids:
+                logger.info(f"Skipping {len(sessions) - len(new_sessions)} Fathom sessions already ingested")
+
+            # Sessions whose transcript request failed are not stored. Retryable
+            # failures are left for the next sync; permanent ones are skipped
+            watermark_at = to_date
+            if lazy_transcripts and new_sessions:
+                transcript_bytes, failed = await self._fetch_transcripts(credentials, new_sessions)
+                bytes_downloaded += transcript_bytes
+                if failed:
+                    failed_ids = {str(s['recording_id']) for s, _ in failed}
+                    new_sessions = [s for s in new_sessions if str(s['recording_id']) not in failed_ids]
+                    deferred = self._sessions_to_retry(failed, now=to_date)
+                    if deferred:
+                        watermark_at = self._retry_watermark(deferred)
+                        logger.warning(
+                            f"Deferring {len(deferred)} Fathom sessions without a transcript to the next sync"
+                        )
 
             # Prepare raw transcripts for batch insert
             transcripts = []
-            for session_data in sessions:
+            for session_data in new_sessions:
                 try:
                     transcript = self._prepare_raw_transcript(session_data=session_data)
                     if transcript:
@@ -140,15 +209,21 @@ class FathomBatchIngestionService:
                 workspace_id=workspace_id,
                 source_type="fathom"
             )
-
-            # Update connector sync status
+            skipped_existing = len(sessions) - len(new_sessions)
+            result["total_checked"] += skipped_existing
+            result["duplicates_skipped"] += skipped_existing
+            result["bytes_downloaded"] = bytes_downloaded
+
+            # Update connector sync status (and watermark, now that the sessions are stored)
+            if incremental and watermark_at:
+                sync_watermark_service.advance(db, connector.id, last_item_at=watermark_at)
             connector.last_synced_at = datetime.now(timezone.utc)
             connector.sync_status = "success"
             db.commit()
 
             logger.info(
                 f"Fathom ingestion complete: {result['new_added']} new, "
-                f"{result['duplicates_skipped']} skipped"
+                f"{result['duplicates_skipped']} skipped, {bytes_downloaded} bytes downloaded"
             )
 
             return result
@@ -182,72 +257,171 @@ class FathomBatchIngestionService:
             "api_token": api_token
         }
 
-    def _fetch_sessions(
+    async def _get(
+        self,
+        credentials: Dict[str, str],
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """GET from the Fathom API through the shared connector client (raises httpx.HTTPError)."""
+        return await connector_http.get(
+            "fathom",
+            f"{self.base_url}{path}",
+            credential=credentials["api_token"],
+            headers={"X-Api-Key": credentials["api_token"]},
+            params=params,
+            timeout=60,
+        )
+
+    async def _fetch_sessions(
         self,
         credentials: Dict[str, str],
         from_date: datetime,
         to_date: datetime,
-        limit: int,
-        min_duration_seconds: int = 0
-    ) -> List[Dict[str, Any]]:
-        """Fetch sessions from Fathom API with pagination."""
-        try:
-            url = f"{self.base_url}/external/v1/meetings"
-            headers = {
-                "X-Api-Key": credentials["api_token"],
-                "Content-Type": "application/json"
+        limit: Optional[int],
+        min_duration_seconds: int = 0,
+        include_transcript: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch sessions created in [from_date, to_date) from Fathom API with pagination.
+
+        Raises httpx.HTTPError so a failed listing is not mistaken for "no new
+        sessions" (which would move the watermark past them).
+
+        Returns:
+            Tuple of (sessions, response bytes downloaded)
+        """
+        all_sessions = []
+        bytes_downloaded = 0
+        cursor = None
+        page = 0
+
+        while True:
+            page += 1
+
+            params = {
+                "limit": min(PAGE_SIZE, limit) if limit else PAGE_SIZE,
+                "include_transcript": "true" if include_transcript else "false",
+                "created_after": from_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                "created_before": to_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
             }
+            if cursor:
+                params["cursor"] = cursor
 
-            all_sessions = []
-            cursor = None
-            page = 0
+            response = await self._get(credentials, "/external/v1/meetings", params=params)
+            bytes_downloaded += len(response.content)
+            data = response.json()
 
-            while True:
-                page += 1
+            items = data.get('items', [])
+            all_sessions.extend(items)
 
-                params = {
-                    "limit": min(100, limit) if limit > 0 else 100,
-                    "include_transcript": "true"
-                }
-                if cursor:
-                    params["cursor"] = cursor
-
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    timeout=60
-                )
-                response.raise_for_status()
-                data = response.json()
+            logger.debug(f"Page {page}: Fetched {len(items)} sessions (Total: {len(all_sessions)})")
 
-                items = data.get('items', [])
-                all_sessions.extend(items)
+            # Check if we have enough
+            if limit and len(all_sessions) >= limit:
+                all_sessions = all_sessions[:limit]
+                break
 
-                logger.debug(f"Page {page}: Fetched {len(items)} sessions (Total: {len(all_sessions)})")
+            # Get next cursor
+            cursor = data.get('next_cursor')
+            if not cursor:
+                break
 
-                # Check if we have enough
-                if limit > 0 and len(all_sessions) >= limit:
-                    all_sessions = all_sessions[:limit]
-                    break
+        # Filter by minimum duration if specified
+        if min_duration_seconds > 0:
+            all_sessions = [
+                s for s in all_sessions
+                if self._get_duration(s) >= min_duration_seconds
+            ]
 
-                # Get next cursor
-                cursor = data.get('next_cursor')
-                if not cursor:
-                    break
+        return all_sessions, bytes_downloaded
 
-            # Filter by minimum duration if specified
-            if min_duration_seconds > 0:
-                all_sessions = [
-                    s for s in all_sessions
-                    if self._get_duration(s) >= min_duration_seconds
-                ]
+    async def _fetch_transcripts(
+        self,
+        credentials: Dict[str, str],
+        sessions: List[Dict[str, Any]],
+    ) -> Tuple[int, List[Tuple[Dict[str, Any], bool]]]:
+        """
+        Fetch transcripts for sessions listed without them, concurrently.
+
+        Each transcript is stored on its session under 'transcript', the same
+        shape include_transcript=true returns, so raw_data is unchanged.
+
+        Returns:
+            Tuple of (response bytes downloaded, (session, retryable) for each
+            session whose transcript request failed). Failed sessions must not
+            be stored: once in raw_transcripts they are never fetched again.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIPT_REQUESTS)
+        failed: List[Tuple[Dict[str, Any], bool]] = []
+
+        async def fetch_one(session_data: Dict[str, Any]) -> int:
+            recording_id = session_data['recording_id']
+            try:
+                async with semaphore:
+                    response = await self._get(credentials, f"/external/v1/recordings/{recording_id}/transcript")
+                session_data['transcript'] = response.json().get('transcript')
+                return len(response.content)
+            except httpx.HTTPError as e:
+                logger.warning(f"Could not fetch transcript for Fathom recording {recording_id}: {e}")
+                failed.append((session_data, self._is_retryable(e)))
+                return 0
+
+        sizes = await asyncio.gather(*(fetch_one(session_data) for session_data in sessions))
+        logger.info(
+            f"Fetched {len(sessions) - len(failed)}/{len(sessions)} Fathom transcripts ({sum(sizes)} bytes)"
+        )
+        return sum(sizes), failed
+
+    @staticmethod
+    def _is_retryable(error: httpx.HTTPError) -> bool:
+        """Rate limits, server errors and transport errors may succeed later; other 4xx won't."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRYABLE_STATUS_CODES
+        return isinstance(error, httpx.TransportError)
+
+    def _sessions_to_retry(
+        self,
+        failed: List[Tuple[Dict[str, Any], bool]],
+        now: datetime,
+    ) -> List[Dict[str, Any]]:
+        """
+        Failed sessions worth retrying next sync: retryable errors on dated
+        sessions younger than MAX_TRANSCRIPT_RETRY_AGE. The rest are skipped
+        for good (the watermark moves past them), with a log line each.
+        """
+        retry = []
+        for session_data, retryable in failed:
+            recording_id = session_data.get('recording_id')
+            if not retryable:
+                logger.warning(f"Skipping Fathom recording {recording_id}: transcript request failed permanently")
+                continue
+            created_at = self._created_at(session_data)
+            if not created_at:
+                logger.warning(f"Skipping Fathom recording {recording_id}: no created_at to retry it from")
+                continue
+            if now - created_at > MAX_TRANSCRIPT_RETRY_AGE:
+                logger.warning(
+                    f"Skipping Fathom recording {recording_id}: transcript still unavailable "
+                    f"{MAX_TRANSCRIPT_RETRY_AGE.days} days after the meeting"
+                )
+                continue
+            retry.append(session_data)
+        return retry
 
-            return all_sessions
+    @staticmethod
+    def _created_at(session_data: Dict[str, Any]) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(session_data['created_at'].replace('Z', '+00:00'))
+        except (KeyError, AttributeError, ValueError):
+            return None
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching Fathom sessions: {e}")
-            return []
+    def _retry_watermark(self, deferred: List[Dict[str, Any]]) -> datetime:
+        """
+        Watermark that keeps deferred sessions in the next incremental window:
+        the earliest deferred created_at (since() subtracts the overlap).
+        """
+        return min(self._created_at(session_data) for session_data in deferred)
 
     def _get_duration(self, session_data: Dict[str, Any]) -> int:
         """Calculate session duration in seconds."""
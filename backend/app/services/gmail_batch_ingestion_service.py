@@ -3,6 +3,10 @@ Optimized Gmail Batch Ingestion Service - Fast batch data storage without AI ext
 
 This service focuses on:
 1. Fast fetching of Gmail threads from selected labels
+   - Incremental syncs read users.history.list from the connector's stored
+     historyId instead of listing every label
+   - A format="metadata" pre-pass drops threads that are not worth a full fetch
+   - Thread bodies are fetched with batch HTTP requests (up to 100 per round-trip)
 2. Batch insertion into the Messages table
 3. Deferred AI processing (marked as tier1_processed=False, tier2_processed=False)
 
@@ -14,7 +18,8 @@ Usage:
     result = gmail_batch_ingestion_service.ingest_messages_for_connector(
         connector_id="...",
         db=db,
-        max_messages=60
+        max_messages=60,
+        incremental=True,
     )
 """
 
@@ -22,22 +27,36 @@ import logging
 import base64
 import re
 import uuid as uuid_module
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Set
 from email.utils import parsedate_to_datetime
 from uuid import UUID
 
+from googleapiclient.errors import HttpError
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 from app.models.workspace_connector import WorkspaceConnector
 from app.models.connector_label import ConnectorLabel
 from app.models.message import Message
-from app.services.gmail_client import get_gmail_client
-from app.services.customer_extraction_service import customer_extraction_service
+from app.services.gmail_client import batch_get_threads, get_gmail_client
+from app.services.customer_extraction_service import CustomerResolver, customer_extraction_service
+from app.services.sync_watermark_service import sync_watermark_service
 
 logger = logging.getLogger(__name__)
 
+# When history is unavailable, labels are listed from this long before their
+# watermark (Gmail's after: filter is coarse and delivery can lag); stored threads are skipped
+WATERMARK_OVERLAP = timedelta(hours=1)
+# threads.list page size when paging a label to its watermark (Gmail max is 500)
+THREAD_PAGE_SIZE = 100
+# history.list page size (Gmail max is 500)
+HISTORY_PAGE_SIZE = 500
+# Headers requested by the metadata pre-pass
+PREPASS_HEADERS = ["From", "Subject", "Date"]
+# Threads made only of these messages are never ingested
+SKIPPED_SYSTEM_LABELS = {"DRAFT", "SPAM", "TRASH"}
+
 
 class GmailBatchIngestionService:
     """
@@ -45,6 +64,7 @@ class GmailBatchIngestionService:
 
     Key optimizations:
     - Batch check for existing threads before fetching
+    - History API listing and batch HTTP thread fetches
     - Bulk insert new messages
     - No inline AI extraction (deferred to batch processing)
     - Memory-efficient content truncation
@@ -59,23 +79,28 @@ class GmailBatchIngestionService:
         self,
         connector_id: str,
         db: Session,
-        max_messages: int = 60
+        max_messages: int = 60,
+        incremental: bool = False,
     ) -> Dict[str, Any]:
         """
         Ingest messages from all enabled labels for a Gmail connector.
 
         This method:
-        1. Gets enabled labels for the connector
+        1. Lists candidate threads: users.history.list since the stored
+           historyId when incremental, otherwise threads.list per label
         2. Checks existing threads in batch
-        3. Fetches only new threads from Gmail API
-        4. Batch inserts into Messages table with tier1_processed=False
+        3. Drops unwanted threads with a format="metadata" pre-pass
+        4. Fetches the remaining threads in batch HTTP requests
+        5. Batch inserts into Messages table with tier1_processed=False
 
         AI extraction is NOT performed here - it happens in a separate task.
 
         Args:
             connector_id: The WorkspaceConnector ID
             db: Database session
-            max_messages: Maximum threads to fetch per label
+            max_messages: Maximum threads to fetch per label (labels without a watermark)
+            incremental: Read history since the stored historyId (or list labels since
+                their watermarks when history has expired) and advance the marks
 
         Returns:
             Dict with status and counts
@@ -132,40 +157,56 @@ class GmailBatchIngestionService:
             # Get Gmail client
             gmail_client = get_gmail_client(connector, db)
 
-            total_checked = 0
-            total_new = 0
-            total_skipped = 0
-            all_inserted_ids: List[str] = []
             errors = []
-
-            # Process each label
-            for label in labels:
-                try:
-                    logger.info(f"Fetching threads from label: {label.label_name}")
-
-                    result = self._batch_fetch_threads_from_label(
-                        gmail_client=gmail_client,
-                        connector=connector,
-                        label=label,
-                        db=db,
-                        max_threads=max_messages
-                    )
-
-                    total_checked += result.get("total_checked", 0)
-                    total_new += result.get("new_added", 0)
-                    total_skipped += result.get("duplicates_skipped", 0)
-                    all_inserted_ids.extend(result.get("inserted_ids", []))
-
-                    logger.info(
-                        f"Label {label.label_name}: checked {result.get('total_checked', 0)}, "
-                        f"added {result.get('new_added', 0)}, skipped {result.get('duplicates_skipped', 0)}"
-                    )
-
-                except Exception as e:
-                    error_msg = f"Error fetching from label {label.label_name}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    continue
+            sync_started = datetime.now(timezone.utc)
+
+            # Step 1: Find candidate threads, from history when we have a historyId
+            candidates: Optional[Dict[str, ConnectorLabel]] = None
+            history_id = None
+            if incremental:
+                # Read before listing, so changes made during the sync are picked up next time
+                history_id = gmail_client.users().getProfile(userId="me").execute().get("historyId")
+                mark = sync_watermark_service.get(db, connector.id)
+                if mark and mark.cursor:
+                    candidates = self._list_history_threads(gmail_client, mark.cursor, labels)
+
+            if candidates is None:
+                candidates = {}
+                for label in labels:
+                    try:
+                        since = None
+                        if incremental:
+                            since = sync_watermark_service.since(
+                                db, connector.id, scope=label.label_id, overlap=WATERMARK_OVERLAP
+                            )
+                        for thread in self._list_label_threads(gmail_client, label, max_messages, since):
+                            candidates.setdefault(thread["id"], label)
+                    except Exception as e:
+                        error_msg = f"Error listing threads from label {label.label_name}: {str(e)}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+
+            # Steps 2-6: Skip stored threads, pre-pass, batch fetch, insert
+            result = self._ingest_threads(
+                gmail_client=gmail_client,
+                connector=connector,
+                candidates=candidates,
+                labels=labels,
+                db=db,
+            )
+            total_checked = result["total_checked"]
+            total_new = result["new_added"]
+            total_skipped = result["duplicates_skipped"]
+            all_inserted_ids = result["inserted_ids"]
+            if result["fetch_errors"]:
+                errors.append(f"{result['fetch_errors']} threads could not be fetched")
+
+            # Step 7: Advance watermarks only when nothing was missed
+            if incremental and not errors:
+                sync_watermark_service.advance(db, connector.id, cursor=history_id, last_item_at=sync_started)
+                for label in labels:
+                    sync_watermark_service.advance(db, connector.id, scope=label.label_id, last_item_at=sync_started)
+                db.commit()
 
             # Update sync status
             connector.sync_status = "success" if not errors else "partial"
@@ -204,127 +245,255 @@ class GmailBatchIngestionService:
                 "inserted_ids": []
             }
 
-    def _batch_fetch_threads_from_label(
+    def _ingest_threads(
         self,
         gmail_client,
         connector: WorkspaceConnector,
-        label: ConnectorLabel,
+        candidates: Dict[str, ConnectorLabel],
+        labels: List[ConnectorLabel],
         db: Session,
-        max_threads: int = 10
     ) -> Dict[str, Any]:
         """
-        Batch fetch threads from a label with efficient duplicate detection.
+        Store candidate threads that are new and worth keeping.
 
         Args:
             gmail_client: Gmail API client
             connector: WorkspaceConnector model
-            label: ConnectorLabel model
+            candidates: Thread ID -> label it was found in
+            labels: Enabled labels of the connector
             db: Database session
-            max_threads: Maximum threads to fetch
 
         Returns:
-            Dict with counts and inserted_ids
+            Dict with counts, inserted_ids and fetch_errors
         """
-        try:
-            # Step 1: List thread IDs from Gmail
-            results = gmail_client.users().threads().list(
-                userId="me",
-                labelIds=[label.label_id],
-                maxResults=max_threads
-            ).execute()
-
-            threads = results.get("threads", [])
-
-            if not threads:
-                logger.info(f"No threads found in label {label.label_name}")
-                return {"total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "inserted_ids": []}
-
-            total_checked = len(threads)
-            thread_ids = [t["id"] for t in threads]
+        total_checked = len(candidates)
+        if not candidates:
+            return {"total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "fetch_errors": 0, "inserted_ids": []}
 
+        try:
             # Step 2: Batch check for existing threads (using external_id = thread_id)
             existing_thread_ids = self._get_existing_thread_ids(
                 db=db,
                 connector_id=connector.id,
-                thread_ids=thread_ids
+                thread_ids=list(candidates)
             )
-
-            # Step 3: Filter to only new threads
-            new_thread_ids = [tid for tid in thread_ids if tid not in existing_thread_ids]
+            new_thread_ids = [tid for tid in candidates if tid not in existing_thread_ids]
             duplicates_skipped = len(existing_thread_ids)
 
             if not new_thread_ids:
-                logger.info(f"All {total_checked} threads already exist in {label.label_name}")
+                logger.info(f"All {total_checked} candidate threads already exist")
                 return {
                     "total_checked": total_checked,
                     "new_added": 0,
                     "duplicates_skipped": duplicates_skipped,
+                    "fetch_errors": 0,
                     "inserted_ids": []
                 }
 
-            # Step 4: Fetch full details for new threads only
+            # Step 3: Metadata pre-pass - headers and labels only, no bodies
+            metadata, metadata_failed = batch_get_threads(
+                gmail_client, new_thread_ids, thread_format="metadata", metadata_headers=PREPASS_HEADERS
+            )
+            labels_by_id = {label.label_id: label for label in labels}
+            wanted: Dict[str, ConnectorLabel] = {}
+            for thread_id in new_thread_ids:
+                thread_meta = metadata.get(thread_id)
+                if thread_meta is None:
+                    continue
+                label = self._thread_label(thread_meta, labels_by_id, candidates[thread_id])
+                if label:
+                    wanted[thread_id] = label
+            prepass_skipped = len(metadata) - len(wanted)
+
+            # Step 4: Fetch full details for wanted threads in batch requests
+            full_threads, full_failed = batch_get_threads(gmail_client, list(wanted), thread_format="full")
+
             message_records = []
             inserted_ids: List[str] = []
-            for thread_id in new_thread_ids:
-                try:
-                    thread_data = gmail_client.users().threads().get(
-                        userId="me",
-                        id=thread_id,
-                        format="full"
-                    ).execute()
-
-                    record = self._parse_thread_to_message(
-                        thread_data=thread_data,
-                        connector=connector,
-                        label=label
-                    )
-
-                    if record:
-                        # Pre-generate UUID for tracking
-                        record.id = uuid_module.uuid4()
-
-                        # Extract customer from email and link to message
-                        if record.from_email or record.author_name:
-                            email, name, domain = customer_extraction_service.extract_customer_info(
-                                from_email=record.from_email,
-                                from_name=record.author_name,
-                            )
-                            if email or name:
-                                customer_id = customer_extraction_service.find_or_create_customer(
-                                    db=db,
-                                    workspace_id=connector.workspace_id,
-                                    email=email,
-                                    name=name,
-                                    domain=domain,
-                                )
-                                if customer_id:
-                                    record.customer_id = customer_id
-
-                        inserted_ids.append(str(record.id))
-                        message_records.append(record)
-
-                except Exception as e:
-                    logger.error(f"Error fetching thread {thread_id}: {str(e)}")
+            for thread_id, label in wanted.items():
+                thread_data = full_threads.get(thread_id)
+                if thread_data is None:
                     continue
+                record = self._parse_thread_to_message(
+                    thread_data=thread_data,
+                    connector=connector,
+                    label=label
+                )
+                if record:
+                    # Pre-generate UUID for tracking
+                    record.id = uuid_module.uuid4()
+                    inserted_ids.append(str(record.id))
+                    message_records.append(record)
 
-            # Step 5: Batch insert new messages
+            # Step 5: Link all new messages to customers in one resolver pass
+            self._assign_customers(CustomerResolver(db, connector.workspace_id), message_records)
+
+            # Step 6: Batch insert new messages
             if message_records:
                 db.bulk_save_objects(message_records)
                 db.commit()
-                logger.info(f"Batch inserted {len(message_records)} messages for {label.label_name}")
+
+            # Only retryable failures count (they hold the watermarks back);
+            # deleted threads were skipped by batch_get_threads
+            fetch_errors = len(metadata_failed) + len(full_failed)
+            logger.info(
+                f"Gmail threads: {total_checked} candidates, {duplicates_skipped} already stored, "
+                f"{prepass_skipped} skipped by metadata pre-pass, {len(message_records)} inserted, "
+                f"{fetch_errors} fetch errors"
+            )
 
             return {
                 "total_checked": total_checked,
                 "new_added": len(message_records),
                 "duplicates_skipped": duplicates_skipped,
+                "prepass_skipped": prepass_skipped,
+                "fetch_errors": fetch_errors,
                 "inserted_ids": inserted_ids
             }
 
         except Exception as e:
-            logger.error(f"Error in batch fetch for label {label.label_name}: {str(e)}")
+            logger.error(f"Error ingesting Gmail threads: {str(e)}")
             db.rollback()
             raise
 
+    def _thread_label(
+        self,
+        thread_meta: Dict[str, Any],
+        labels_by_id: Dict[str, ConnectorLabel],
+        found_in: ConnectorLabel,
+    ) -> Optional[ConnectorLabel]:
+        """
+        Decide from thread metadata whether a thread is worth a full fetch.
+
+        Skips threads made only of drafts/spam/trash and threads that no longer
+        carry an enabled label (label removed or messages deleted since they
+        were listed). Returns the label to file the thread under.
+        """
+        label_ids: Set[str] = set()
+        for message in thread_meta.get("messages", []):
+            message_labels = set(message.get("labelIds") or [])
+            if message_labels & SKIPPED_SYSTEM_LABELS:
+                continue
+            label_ids |= message_labels
+
+        if found_in.label_id in label_ids:
+            return found_in
+        for label_id in label_ids:
+            if label_id in labels_by_id:
+                return labels_by_id[label_id]
+        return None
+
+    def _list_history_threads(
+        self,
+        gmail_client,
+        start_history_id: str,
+        labels: List[ConnectorLabel],
+    ) -> Optional[Dict[str, ConnectorLabel]]:
+        """
+        List threads that received messages or enabled labels since a historyId.
+
+        One paged users.history.list covers every label of the connector.
+
+        Returns:
+            Thread ID -> label, or None when the historyId is too old (Gmail
+            keeps about a week of history) and labels must be listed instead
+        """
+        labels_by_id = {label.label_id: label for label in labels}
+        candidates: Dict[str, ConnectorLabel] = {}
+        page_token = None
+        while True:
+            try:
+                results = gmail_client.users().history().list(
+                    userId="me",
+                    startHistoryId=start_history_id,
+                    historyTypes=["messageAdded", "labelAdded"],
+                    maxResults=HISTORY_PAGE_SIZE,
+                    pageToken=page_token,
+                ).execute()
+            except HttpError as e:
+                if e.resp.status == 404:
+                    logger.warning(f"Gmail historyId {start_history_id} expired, falling back to label listing")
+                    return None
+                raise
+
+            for record in results.get("history", []):
+                for change in record.get("messagesAdded", []) + record.get("labelsAdded", []):
+                    message = change.get("message") or {}
+                    thread_id = message.get("threadId")
+                    if not thread_id or thread_id in candidates:
+                        continue
+                    for label_id in change.get("labelIds") or message.get("labelIds") or []:
+                        if label_id in labels_by_id:
+                            candidates[thread_id] = labels_by_id[label_id]
+                            break
+
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                logger.info(f"Gmail history since {start_history_id}: {len(candidates)} candidate threads")
+                return candidates
+
+    def _list_label_threads(
+        self,
+        gmail_client,
+        label: ConnectorLabel,
+        max_threads: int,
+        since: Optional[datetime],
+    ) -> List[Dict[str, Any]]:
+        """
+        List threads of a label.
+
+        Without `since` only the newest max_threads are listed. With it, every
+        page of threads after that time is listed, so a busy label is never
+        truncated.
+        """
+        if since is None:
+            results = gmail_client.users().threads().list(
+                userId="me",
+                labelIds=[label.label_id],
+                maxResults=max_threads
+            ).execute()
+            return results.get("threads", [])
+
+        threads: List[Dict[str, Any]] = []
+        page_token = None
+        while True:
+            results = gmail_client.users().threads().list(
+                userId="me",
+                labelIds=[label.label_id],
+                q=f"after:{int(since.timestamp())}",
+                maxResults=THREAD_PAGE_SIZE,
+                pageToken=page_token,
+            ).execute()
+            threads.extend(results.get("threads", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                return threads
+
+    def _assign_customers(self, customer_resolver: CustomerResolver, records: List[Message]) -> None:
+        """Extract customers from the senders of new messages and link them in bulk."""
+        identities = {}
+        for record in records:
+            if record.from_email or record.author_name:
+                identities[record.id] = customer_extraction_service.extract_customer_info(
+                    from_email=record.from_email,
+                    from_name=record.author_name,
+                )
+        if not identities:
+            return
+
+        try:
+            # Savepoint: a failed lookup must not lose the fetched messages
+            with customer_resolver.db.begin_nested():
+                customer_ids = customer_resolver.resolve(identities.values())
+        except Exception as e:
+            logger.error(f"Error resolving customers for Gmail messages: {e}")
+            return
+
+        for record in records:
+            customer_id = customer_ids.get(identities.get(record.id))
+            if customer_id:
+                record.customer_id = customer_id
+
     def _get_existing_thread_ids(
         self,
         db: Session,
@@ -1,10 +1,38 @@
+"""
+Gmail API client helpers.
+
+get_gmail_client() builds an authenticated Gmail API client. batch_get_threads()
+fetches many threads over Gmail batch HTTP requests (up to 100 calls per
+round-trip) instead of one request per thread.
+
+Set GMAIL_API_BASE_URL to run against a local stand-in server
+(see scripts/gmail_api_stub_server.py).
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest
 from app.core.config import settings
 from app.models.workspace_connector import WorkspaceConnector
 from sqlalchemy.orm import Session
 
+logger = logging.getLogger(__name__)
+
+# Gmail accepts at most 100 calls in one batch request
+GMAIL_BATCH_MAX_REQUESTS = 100
+# Rounds of retries for calls that failed with a rate limit or server error
+GMAIL_BATCH_RETRIES = 3
+GMAIL_BATCH_BACKOFF_SECONDS = 1.0
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Thread deleted or purged since it was listed
+GONE_STATUS_CODES = {404, 410}
+
 
 def get_gmail_client(connector: WorkspaceConnector, db: Session):
     """
@@ -36,6 +64,99 @@ def get_gmail_client(connector: WorkspaceConnector, db: Session):
             connector.token_expires_at = creds.expiry
             db.commit()
 
+        if settings.GMAIL_API_BASE_URL:
+            return build(
+                "gmail", "v1",
+                credentials=creds,
+                client_options={"api_endpoint": settings.GMAIL_API_BASE_URL},
+            )
         return build("gmail", "v1", credentials=creds)
     except Exception as e:
         raise Exception(f"Error getting Gmail client: {e}")
+
+
+def new_batch_request(gmail_client, callback: Callable) -> BatchHttpRequest:
+    """Create a batch request against the Gmail batch endpoint (or the GMAIL_API_BASE_URL override)."""
+    if settings.GMAIL_API_BASE_URL:
+        return BatchHttpRequest(
+            callback=callback,
+            batch_uri=f"{settings.GMAIL_API_BASE_URL.rstrip('/')}/batch/gmail/v1",
+        )
+    return gmail_client.new_batch_http_request(callback=callback)
+
+
+def batch_get_threads(
+    gmail_client,
+    thread_ids: List[str],
+    thread_format: str = "full",
+    metadata_headers: Optional[List[str]] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """
+    Fetch threads with batch HTTP requests, GMAIL_BATCH_MAX_REQUESTS per round-trip.
+
+    Calls rejected with 429/5xx (Gmail rate limits individual calls inside a
+    batch) are retried in later rounds with exponential backoff. Threads that
+    no longer exist (404/410) and other permanent errors are logged and
+    skipped: retrying them in a later sync would fail the same way.
+
+    Args:
+        gmail_client: Gmail API client
+        thread_ids: Thread IDs to fetch
+        thread_format: "full", "metadata" or "minimal"
+        metadata_headers: Headers to return with thread_format="metadata"
+
+    Returns:
+        Tuple of (threads by ID, IDs that could not be fetched this time:
+        retryable errors that outlasted the retries, or unexpected errors)
+    """
+    threads: Dict[str, Dict[str, Any]] = {}
+    failed: List[str] = []
+    skipped: set = set()
+    pending = list(dict.fromkeys(thread_ids))
+
+    for attempt in range(GMAIL_BATCH_RETRIES + 1):
+        retry: List[str] = []
+
+        def on_response(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            if exception is None:
+                threads[request_id] = response
+            elif isinstance(exception, HttpError) and exception.resp.status in RETRYABLE_STATUS_CODES:
+                retry.append(request_id)
+            elif isinstance(exception, HttpError) and exception.resp.status in GONE_STATUS_CODES:
+                logger.info(f"Gmail thread {request_id} no longer exists, skipping")
+                skipped.add(request_id)
+            elif isinstance(exception, HttpError):
+                logger.warning(f"Skipping Gmail thread {request_id}, fetch failed permanently: {exception}")
+                skipped.add(request_id)
+            else:
+                logger.warning(f"Could not fetch Gmail thread {request_id}: {exception}")
+                failed.append(request_id)
+
+        for i in range(0, len(pending), GMAIL_BATCH_MAX_REQUESTS):
+            chunk = pending[i:i + GMAIL_BATCH_MAX_REQUESTS]
+            batch = new_batch_request(gmail_client, on_response)
+            for thread_id in chunk:
+                params: Dict[str, Any] = {"userId": "me", "id": thread_id, "format": thread_format}
+                if metadata_headers:
+                    params["metadataHeaders"] = metadata_headers
+                batch.add(gmail_client.users().threads().get(**params), request_id=thread_id)
+            try:
+                batch.execute()
+            except HttpError as e:
+                if e.resp.status not in RETRYABLE_STATUS_CODES:
+                    raise
+                # Callbacks may have run for part of the chunk before the error
+                done = set(threads) | skipped | set(failed) | set(retry)
+                retry.extend(tid for tid in chunk if tid not in done)
+
+        if not retry:
+            break
+        if attempt == GMAIL_BATCH_RETRIES:
+            failed.extend(retry)
+            break
+        delay = GMAIL_BATCH_BACKOFF_SECONDS * (2 ** attempt)
+        logger.info(f"Retrying {len(retry)} rate-limited Gmail thread fetches in {delay:.1f}s")
+        time.sleep(delay)
+        pending = retry
+
+    return threads, failed
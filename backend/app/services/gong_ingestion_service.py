@@ -3,6 +3,12 @@ Optimized Gong Ingestion Service - Fast batch data storage for raw transcripts.
 
 This service focuses on:
 1. Fast fetching of Gong calls and transcripts
+   - Transcripts are fetched with multi-callId requests to /v2/calls/transcript,
+     concurrently over the shared connector HTTP client (pooled, rate limited
+     per API key, 429-aware backoff)
+   - Calls already in raw_transcripts are skipped before any transcript is fetched
+   - Call listing follows Gong's cursor; incremental syncs start at the connector
+     watermark instead of a fixed window
 2. Batch insertion into raw_transcripts table
 3. Deferred AI processing (ai_processed=False)
 
@@ -17,24 +23,39 @@ Usage:
         limit=100,
         days_back=1
     )
+
+    # Periodic sync: everything since the last successful sync, no cap
+    result = await gong_ingestion_service.ingest_calls(db=db, workspace_id="...", limit=None, incremental=True)
 """
 
+import asyncio
 import logging
 import os
-import requests
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 
+import httpx
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 from app.models.workspace import Workspace
 from app.models.workspace_connector import WorkspaceConnector
 from app.services.batch_db_service import batch_db_service
+from app.services.connector_http import connector_http
+from app.services.sync_watermark_service import sync_watermark_service
 
 logger = logging.getLogger(__name__)
 
+# Call IDs per /v2/calls/transcript request (Gong pages results at 100 records)
+TRANSCRIPT_BATCH_SIZE = 50
+# Concurrent transcript requests per ingestion run (the request rate itself is
+# limited per API key by connector_http)
+MAX_CONCURRENT_TRANSCRIPT_REQUESTS = 3
+# Incremental syncs re-read this much before the watermark: Gong publishes calls
+# some time after they start, and already stored calls are skipped cheaply
+WATERMARK_OVERLAP = timedelta(hours=6)
+
 
 class GongIngestionService:
     """
@@ -54,15 +75,17 @@ class GongIngestionService:
         self,
         db: Session,
         workspace_id: str,
-        limit: int = 100,
+        limit: Optional[int] = 100,
         days_back: int = 1,
-        fetch_transcripts: bool = True
+        fetch_transcripts: bool = True,
+        incremental: bool = False,
+        backfill: bool = False,
     ) -> Dict[str, int]:
         """
         Ingest Gong calls with optimized batch processing.
 
         This method:
-        1. Fetches calls from Gong API
+        1. Fetches calls from Gong API, following the cursor until done (or limit)
         2. Fetches transcripts (if enabled)
         3. Batch inserts into raw_transcripts table with ai_processed=False
         4. Returns counts for sync tracking
@@ -72,9 +95,12 @@ class GongIngestionService:
         Args:
             db: Database session
             workspace_id: Workspace UUID string
-            limit: Maximum calls to fetch
-            days_back: How many days back to look
+            limit: Maximum calls to fetch (None = all calls in the range)
+            days_back: How many days back to look (when there is no watermark)
             fetch_transcripts: Whether to fetch full transcripts
+            incremental: Start at the connector watermark and advance it on success
+            backfill: Historical import (e.g. a newly connected workspace) - large
+                batches may be classified through the OpenAI Batch API
 
         Returns:
             Dict with 'total_checked', 'new_added', 'duplicates_skipped', 'inserted_ids'
@@ -108,23 +134,46 @@ class GongIngestionService:
             # Calculate date range
             to_date = datetime.now(timezone.utc)
             from_date = to_date - timedelta(days=days_back)
+            if incremental:
+                from_date = sync_watermark_service.since(db, connector.id, overlap=WATERMARK_OVERLAP) or from_date
 
             # Fetch calls from Gong
-            logger.info(f"Fetching up to {limit} Gong calls from last {days_back} days")
-            calls = self._fetch_calls(credentials, from_date, to_date, limit)
+            logger.info(f"Fetching {f'up to {limit}' if limit else 'all'} Gong calls since {from_date.isoformat()}")
+            calls = await self._fetch_calls(credentials, from_date, to_date, limit)
 
             if not calls:
                 logger.info("No Gong calls found in date range")
+                if incremental:
+                    sync_watermark_service.advance(db, connector.id, last_item_at=to_date)
+                    db.commit()
                 return {"total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "inserted_ids": []}
 
+            # Skip calls we already stored - no point fetching their transcripts
+            calls = [c for c in calls if c.get('metaData', {}).get('id')]
+            existing_ids = batch_db_service.get_existing_transcript_source_ids(
+                db=db,
+                source_ids=[str(c['metaData']['id']) for c in calls],
+                workspace_id=workspace_id,
+                source_type="gong",
+                backfill=backfill,
+            )
+            new_calls = [c for c in calls if str(c['metaData']['id']) not in existing_ids]
+            if existing_ids:
+                logger.info(f"Skipping {len(calls) - len(new_calls)} Gong calls already ingested")
+
+            transcripts_by_call: Dict[str, Dict[str, Any]] = {}
+            if fetch_transcripts and new_calls:
+                transcripts_by_call = await self._fetch_transcripts(
+                    credentials, [str(c['metaData']['id']) for c in new_calls]
+                )
+
             # Prepare raw transcripts for batch insert
             transcripts = []
-            for call_data in calls:
+            for call_data in new_calls:
                 try:
                     transcript = self._prepare_raw_transcript(
                         call_data=call_data,
-                        credentials=credentials,
-                        fetch_transcript=fetch_transcripts
+                        transcript_data=transcripts_by_call.get(str(call_data['metaData']['id'])),
                     )
                     if transcript:
                         transcripts.append(transcript)
@@ -139,8 +188,13 @@ class GongIngestionService:
                 workspace_id=workspace_id,
                 source_type="gong"
             )
+            skipped_existing = len(calls) - len(new_calls)
+            result["total_checked"] += skipped_existing
+            result["duplicates_skipped"] += skipped_existing
 
-            # Update connector sync status
+            # Update connector sync status (and watermark, now that the calls are stored)
+            if incremental:
+                sync_watermark_service.advance(db, connector.id, last_item_at=to_date)
             connector.last_synced_at = datetime.now(timezone.utc)
             connector.sync_status = "success"
             db.commit()
@@ -183,85 +237,133 @@ class GongIngestionService:
             "secret_key": secret_key
         }
 
-    def _fetch_calls(
+    async def _post(
+        self,
+        credentials: Dict[str, str],
+        path: str,
+        payload: Dict[str, Any],
+        timeout: float,
+    ) -> Dict[str, Any]:
+        """
+        POST to the Gong API through the shared connector client.
+
+        Rate limited per access key, with 429/5xx retries honoring Retry-After.
+        Raises httpx.HTTPError once retries are exhausted.
+        """
+        response = await connector_http.post(
+            "gong",
+            f"{self.base_url}{path}",
+            credential=credentials["access_key"],
+            auth=(credentials["access_key"], credentials["secret_key"]),
+            json=payload,
+            timeout=timeout,
+        )
+        return response.json()
+
+    async def _fetch_calls(
         self,
         credentials: Dict[str, str],
         from_date: datetime,
         to_date: datetime,
-        limit: int
+        limit: Optional[int]
     ) -> List[Dict[str, Any]]:
-        """Fetch calls from Gong API."""
-        try:
-            from_datetime = from_date.strftime('%Y-%m-%dT%H:%M:%S-00:00')
-            to_datetime = to_date.strftime('%Y-%m-%dT%H:%M:%S-00:00')
-
-            url = f"{self.base_url}/v2/calls/extensive"
-            auth = (credentials["access_key"], credentials["secret_key"])
-
-            payload = {
-                "filter": {
-                    "fromDateTime": from_datetime,
-                    "toDateTime": to_datetime
-                },
-                "contentSelector": {
-                    "context": "Extended",
-                    "exposedFields": {
-                        "parties": True,
-                        "content": {"structure": True},
-                        "interaction": {"speakers": True}
-                    }
+        """
+        Fetch calls from Gong API, following records.cursor page by page.
+
+        Stops when Gong has no more pages or once limit calls are collected.
+        Raises httpx.HTTPError so a failed listing is not mistaken for "no new
+        calls" (which would move the watermark past them).
+        """
+        from_datetime = from_date.strftime('%Y-%m-%dT%H:%M:%S-00:00')
+        to_datetime = to_date.strftime('%Y-%m-%dT%H:%M:%S-00:00')
+
+        payload: Dict[str, Any] = {
+            "filter": {
+                "fromDateTime": from_datetime,
+                "toDateTime": to_datetime
+            },
+            "contentSelector": {
+                "context": "Extended",
+                "exposedFields": {
+                    "parties": True,
+                    "content": {"structure": True},
+                    "interaction": {"speakers": True}
                 }
             }
+        }
 
-            response = requests.post(
-                url,
-                auth=auth,
-                headers={"Content-Type": "application/json"},
-                json=payload,
-                timeout=60
-            )
-            response.raise_for_status()
-
-            calls = response.json().get('calls', [])
-            return calls[:limit]
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching Gong calls: {e}")
-            return []
-
-    def _fetch_transcript(
+        calls: List[Dict[str, Any]] = []
+        while True:
+            try:
+                data = await self._post(credentials, "/v2/calls/extensive", payload, timeout=60)
+            except httpx.HTTPStatusError as e:
+                # Gong answers 404 when no call matches the filter
+                if e.response.status_code == 404:
+                    return calls
+                raise
+            calls.extend(data.get('calls', []))
+            if limit and len(calls) >= limit:
+                return calls[:limit]
+
+            cursor = (data.get('records') or {}).get('cursor')
+            if not cursor:
+                return calls
+            payload["cursor"] = cursor
+
+    async def _fetch_transcripts(
         self,
         credentials: Dict[str, str],
-        call_id: str
-    ) -> Optional[Dict[str, Any]]:
-        """Fetch transcript for a single call."""
-        try:
-            url = f"{self.base_url}/v2/calls/transcript"
-            auth = (credentials["access_key"], credentials["secret_key"])
-
-            payload = {"filter": {"callIds": [call_id]}}
+        call_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch transcripts for many calls with multi-callId requests.
 
-            response = requests.post(
-                url,
-                auth=auth,
-                headers={"Content-Type": "application/json"},
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
+        Call IDs are split into TRANSCRIPT_BATCH_SIZE groups fetched concurrently
+        (at most MAX_CONCURRENT_TRANSCRIPT_REQUESTS in flight); each group follows
+        Gong's cursor until all its transcripts are in. A group that fails is
+        logged and its calls are stored without a transcript, as before.
 
-            transcripts = response.json().get('callTranscripts', [])
-            return transcripts[0] if transcripts else None
+        Returns:
+            Dict mapping call ID -> callTranscripts entry
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIPT_REQUESTS)
 
-        except Exception as e:
-            logger.warning(f"Could not fetch transcript for call {call_id}: {e}")
-            return None
+        async def fetch_group(group: List[str]) -> List[Dict[str, Any]]:
+            results: List[Dict[str, Any]] = []
+            cursor = None
+            try:
+                while True:
+                    payload: Dict[str, Any] = {"filter": {"callIds": group}}
+                    if cursor:
+                        payload["cursor"] = cursor
+                    async with semaphore:
+                        data = await self._post(credentials, "/v2/calls/transcript", payload, timeout=60)
+                    results.extend(data.get('callTranscripts', []))
+                    cursor = (data.get('records') or {}).get('cursor')
+                    if not cursor:
+                        return results
+            except httpx.HTTPError as e:
+                logger.warning(f"Could not fetch transcripts for {len(group)} calls: {e}")
+                return results
+
+        groups = [call_ids[i:i + TRANSCRIPT_BATCH_SIZE] for i in range(0, len(call_ids), TRANSCRIPT_BATCH_SIZE)]
+        group_results = await asyncio.gather(*(fetch_group(group) for group in groups))
+
+        transcripts = {
+            str(entry.get('callId')): entry
+            for entries in group_results
+            for entry in entries
+            if entry.get('callId')
+        }
+        logger.info(
+            f"Fetched {len(transcripts)}/{len(call_ids)} Gong transcripts in {len(groups)} batched request group(s)"
+        )
+        return transcripts
 
     def _prepare_raw_transcript(
         self,
         call_data: Dict[str, Any],
-        credentials: Dict[str, str],
-        fetch_transcript: bool,
+        transcript_data: Optional[Dict[str, Any]],
     ) -> Optional[Dict[str, Any]]:
         """Prepare a call as a raw transcript dict for batch insert."""
         metadata = call_data.get('metaData', {})
@@ -278,11 +380,6 @@ class GongIngestionService:
         # Get parties
         parties = call_data.get('parties', [])
 
-        # Fetch transcript if requested
-        transcript_data = None
-        if fetch_transcript:
-            transcript_data = self._fetch_transcript(credentials, call_id)
-
         # Parse timestamp
         transcript_date = datetime.now(timezone.utc)
         if started:
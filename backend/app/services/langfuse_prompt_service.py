@@ -9,16 +9,25 @@ This service fetches chat-type prompts from Langfuse, enabling:
 
 Chat-type prompts in Langfuse:
 - transcript_classification_prompt: Classify transcripts into themes/sub-themes
+
+Prompt templates are cached per process (TTL + stale-while-revalidate), so hot
+paths like transcript classification do not pay a Langfuse round-trip per call.
+Compilation with variables is local and still happens on every call.
 """
 
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 import threading
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Prompt template cache timings (seconds)
+PROMPT_CACHE_TTL_SECONDS = 300  # Served without refresh while younger than this
+PROMPT_CACHE_MAX_STALE_SECONDS = 3600  # Served while refreshing in background until this age
+
 # Global Langfuse client (lazy initialized)
 _langfuse_client = None
 _langfuse_lock = threading.Lock()
@@ -61,6 +70,9 @@ class LangfusePromptService:
 
     Features:
     - Fetches chat prompts from Langfuse (returns messages array)
+    - Caches prompt templates with a TTL; stale entries are served while a
+      background thread refreshes them
+    - Hit rate and fetch latency metrics via stats()
     - Thread-safe
     - No local fallback - prompts MUST be in Langfuse
     """
@@ -72,9 +84,157 @@ class LangfusePromptService:
         "signal_final_classification": "signal_final_classification",
     }
 
-    def __init__(self):
+    def __init__(
+        self,
+        ttl_seconds: int = PROMPT_CACHE_TTL_SECONDS,
+        max_stale_seconds: int = PROMPT_CACHE_MAX_STALE_SECONDS,
+    ):
         """Initialize the prompt service."""
         self._cache_lock = threading.Lock()
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        # (name, label, type) -> (fetched_at, prompt client)
+        self._prompt_cache: Dict[Tuple[str, Optional[str], str], Tuple[float, Any]] = {}
+        self._refreshing: set = set()
+        self._metrics = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "fetch_errors": 0,
+            "fetch_count": 0,
+            "fetch_ms_total": 0.0,
+            "fetch_ms_max": 0.0,
+        }
+
+    def _fetch_prompt(self, name: str, label: Optional[str], prompt_type: str) -> Any:
+        """Fetch a prompt template from Langfuse and record fetch latency."""
+        client = get_langfuse_client()
+        if not client:
+            raise ValueError("Langfuse client not available")
+
+        started = time.monotonic()
+        try:
+            if label:
+                prompt = client.get_prompt(name, label=label, type=prompt_type)
+            else:
+                prompt = client.get_prompt(name, type=prompt_type)
+        except Exception:
+            with self._cache_lock:
+                self._metrics["fetch_errors"] += 1
+            raise
+
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with self._cache_lock:
+            self._metrics["fetch_count"] += 1
+            self._metrics["fetch_ms_total"] += elapsed_ms
+            self._metrics["fetch_ms_max"] = max(self._metrics["fetch_ms_max"], elapsed_ms)
+            self._prompt_cache[(name, label, prompt_type)] = (time.monotonic(), prompt)
+
+        logger.debug(f"Fetched prompt '{name}' from Langfuse in {elapsed_ms:.0f}ms (version: {prompt.version})")
+        return prompt
+
+    def _refresh_in_background(self, name: str, label: Optional[str], prompt_type: str) -> None:
+        """Refresh a stale prompt on a daemon thread; at most one refresh per prompt."""
+        key = (name, label, prompt_type)
+        with self._cache_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self._metrics["refreshes"] += 1
+
+        def refresh():
+            try:
+                self._fetch_prompt(name, label, prompt_type)
+            except Exception as e:
+                logger.warning(f"Background refresh of prompt '{name}' failed, keeping cached version: {e}")
+            finally:
+                with self._cache_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"langfuse-refresh-{name}", daemon=True).start()
+
+    def get_prompt(
+        self,
+        prompt_name: str,
+        label: Optional[str] = None,
+        prompt_type: str = "chat",
+    ) -> Any:
+        """
+        Get a Langfuse prompt template, using the process-wide cache.
+
+        Fresh entries are returned directly. Stale entries (older than the TTL
+        but within max_stale_seconds) are returned immediately while a
+        background refresh runs. Missing or expired entries are fetched
+        synchronously; if that fetch fails, an expired entry is still served.
+
+        Args:
+            prompt_name: Langfuse prompt name
+            label: Optional Langfuse label (e.g. "production")
+            prompt_type: "chat" or "text"
+
+        Returns:
+            Langfuse prompt client (call .compile(**variables) on it)
+
+        Raises:
+            ValueError: If Langfuse is unavailable and nothing is cached
+        """
+        key = (prompt_name, label, prompt_type)
+        with self._cache_lock:
+            entry = self._prompt_cache.get(key)
+
+        if entry:
+            fetched_at, prompt = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl_seconds:
+                with self._cache_lock:
+                    self._metrics["hits"] += 1
+                return prompt
+            if age < self.max_stale_seconds:
+                with self._cache_lock:
+                    self._metrics["stale_hits"] += 1
+                self._refresh_in_background(prompt_name, label, prompt_type)
+                return prompt
+
+        with self._cache_lock:
+            self._metrics["misses"] += 1
+        try:
+            return self._fetch_prompt(prompt_name, label, prompt_type)
+        except Exception as e:
+            if entry:
+                logger.warning(f"Langfuse fetch for '{prompt_name}' failed, serving expired cached prompt: {e}")
+                return entry[1]
+            raise
+
+    def invalidate(self, prompt_name: Optional[str] = None) -> None:
+        """Drop cached templates for one prompt name, or all of them."""
+        with self._cache_lock:
+            if prompt_name is None:
+                self._prompt_cache.clear()
+            else:
+                for key in [k for k in self._prompt_cache if k[0] == prompt_name]:
+                    del self._prompt_cache[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache hit rate and Langfuse fetch latency metrics."""
+        with self._cache_lock:
+            metrics = dict(self._metrics)
+            entries = len(self._prompt_cache)
+
+        lookups = metrics["hits"] + metrics["stale_hits"] + metrics["misses"]
+        fetches = metrics["fetch_count"]
+        return {
+            "entries": entries,
+            "hits": metrics["hits"],
+            "stale_hits": metrics["stale_hits"],
+            "misses": metrics["misses"],
+            "hit_rate": round((metrics["hits"] + metrics["stale_hits"]) / lookups, 3) if lookups else 0.0,
+            "refreshes": metrics["refreshes"],
+            "fetch_errors": metrics["fetch_errors"],
+            "fetch_count": fetches,
+            "fetch_ms_avg": round(metrics["fetch_ms_total"] / fetches, 1) if fetches else 0.0,
+            "fetch_ms_max": round(metrics["fetch_ms_max"], 1),
+        }
 
     def get_chat_prompt(
         self,
@@ -97,14 +257,9 @@ class LangfusePromptService:
         """
         prompt_name = self.PROMPT_NAMES.get(prompt_key, prompt_key)
 
-        client = get_langfuse_client()
-        if not client:
-            logger.error(f"Langfuse client not available for prompt '{prompt_name}'")
-            return None
-
         try:
-            # Fetch chat-type prompt from Langfuse
-            prompt = client.get_prompt(prompt_name, type="chat")
+            # Fetch chat-type prompt from Langfuse (cached)
+            prompt = self.get_prompt(prompt_name, prompt_type="chat")
 
             if variables:
                 # Compile with variables - returns list of ChatMessageDict
@@ -133,12 +288,8 @@ class LangfusePromptService:
         """
         prompt_name = self.PROMPT_NAMES.get(prompt_key, prompt_key)
 
-        client = get_langfuse_client()
-        if not client:
-            return None, None
-
         try:
-            prompt = client.get_prompt(prompt_name, type="chat")
+            prompt = self.get_prompt(prompt_name, prompt_type="chat")
             messages = prompt.compile(**variables) if variables else prompt.compile()
             version = f"langfuse-v{prompt.version}"
             return messages, version
@@ -0,0 +1,203 @@
+"""
+LLM Result Cache Service - Content-hash deduplication of LLM calls.
+
+Identical inputs (same formatted text, prompt version, taxonomy and model)
+produce the same result at temperature 0, so the result is stored in the
+llm_result_cache table and reused instead of paying for another call.
+Typical hits: Gong/Fathom re-syncs of the same call, transcripts re-queued
+after a failure, and signal_pipeline re-runs over the same files.
+
+Usage:
+    from app.services.llm_result_cache_service import LLMCacheKey, content_hash, llm_result_cache_service
+
+    key = LLMCacheKey(
+        namespace="transcript_classification",
+        content_hash=content_hash(transcript_text),
+        prompt_version="langfuse-v12",
+        taxonomy_version=context.fingerprint,
+        model="gpt-4o-mini",
+    )
+    result = llm_result_cache_service.get(db, key)
+    if result is None:
+        result = call_llm(...)
+        llm_result_cache_service.put(db, key, result)
+    db.commit()
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.llm_result_cache import LLMResultCache
+
+logger = logging.getLogger(__name__)
+
+# Eviction policy
+LLM_CACHE_MAX_AGE_DAYS = 90  # Drop entries not used for this long
+LLM_CACHE_MAX_ENTRIES = 50000  # Then keep at most this many, most recently used first
+
+
+def content_hash(text: str) -> str:
+    """sha256 hex digest of an LLM input text."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class LLMCacheKey:
+    """All inputs that determine an LLM result."""
+
+    namespace: str
+    content_hash: str
+    prompt_version: str
+    taxonomy_version: str
+    model: str
+
+    @property
+    def key(self) -> str:
+        raw = "|".join([self.namespace, self.content_hash, self.prompt_version, self.taxonomy_version, self.model])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResultCacheService:
+    """
+    Persistent LLM result cache backed by the llm_result_cache table.
+
+    Lookups and writes never raise: a cache failure (e.g. missing table) is
+    logged and treated as a miss, so callers always fall back to the LLM.
+    Writes go through a savepoint and do not commit; the caller's commit
+    persists them together with its own changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.errors = 0
+
+    def get_many(self, db: Session, keys: Iterable[LLMCacheKey]) -> Dict[str, Any]:
+        """
+        Look up several keys in one query.
+
+        Hits have their hit_count and last_used_at bumped (not committed).
+
+        Returns:
+            Dict of cache_key -> cached result for the keys that hit
+        """
+        wanted = {k.key for k in keys}
+        if not wanted:
+            return {}
+
+        try:
+            with db.begin_nested():
+                rows = db.query(LLMResultCache.cache_key, LLMResultCache.result).filter(
+                    LLMResultCache.cache_key.in_(wanted)
+                ).all()
+                found = {row.cache_key: row.result for row in rows}
+                if found:
+                    db.query(LLMResultCache).filter(
+                        LLMResultCache.cache_key.in_(list(found.keys()))
+                    ).update(
+                        {
+                            LLMResultCache.hit_count: LLMResultCache.hit_count + 1,
+                            LLMResultCache.last_used_at: func.now(),
+                        },
+                        synchronize_session=False,
+                    )
+        except Exception as e:
+            logger.warning(f"LLM result cache lookup failed, treating as miss: {e}")
+            with self._lock:
+                self.errors += 1
+                self.misses += len(wanted)
+            return {}
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+        return found
+
+    def get(self, db: Session, key: LLMCacheKey) -> Optional[Any]:
+        """Look up a single key. Returns the cached result or None."""
+        return self.get_many(db, [key]).get(key.key)
+
+    def put(self, db: Session, key: LLMCacheKey, result: Any) -> None:
+        """Store (or overwrite) the result for a key."""
+        stmt = pg_insert(LLMResultCache).values(
+            cache_key=key.key,
+            namespace=key.namespace,
+            content_hash=key.content_hash,
+            prompt_version=key.prompt_version,
+            taxonomy_version=key.taxonomy_version,
+            model=key.model,
+            result=result,
+            hit_count=0,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LLMResultCache.cache_key],
+            set_={"result": stmt.excluded.result, "last_used_at": func.now()},
+        )
+        try:
+            with db.begin_nested():
+                db.execute(stmt)
+        except Exception as e:
+            logger.warning(f"LLM result cache write failed for {key.namespace}: {e}")
+            with self._lock:
+                self.errors += 1
+            return
+
+        with self._lock:
+            self.stores += 1
+
+    def evict(
+        self,
+        db: Session,
+        max_age_days: int = LLM_CACHE_MAX_AGE_DAYS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+    ) -> int:
+        """
+        Delete entries unused for max_age_days, then trim to max_entries
+        least-recently-used first. Commits.
+
+        Returns:
+            Number of rows deleted
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        deleted = db.query(LLMResultCache).filter(
+            LLMResultCache.last_used_at < cutoff
+        ).delete(synchronize_session=False)
+
+        total = db.query(func.count(LLMResultCache.cache_key)).scalar() or 0
+        if total > max_entries:
+            overflow = db.query(LLMResultCache.cache_key).order_by(
+                LLMResultCache.last_used_at.asc()
+            ).limit(total - max_entries).subquery()
+            deleted += db.query(LLMResultCache).filter(
+                LLMResultCache.cache_key.in_(db.query(overflow.c.cache_key))
+            ).delete(synchronize_session=False)
+
+        db.commit()
+        logger.info(f"LLM result cache eviction removed {deleted} entries")
+        return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        """Return process-level hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "stores": self.stores,
+                "errors": self.errors,
+            }
+
+
+# Singleton instance for easy import
+llm_result_cache_service = LLMResultCacheService()
@@ -157,18 +157,16 @@ class OptimizedMessagesService:
         """
         Compute total count of unique transcripts from raw_transcripts table.
         Only supports gong and fathom sources.
-        Deduplicates by title and transcript_date to avoid showing duplicates with same name/date.
+        Deduplicates by title and transcript_date via dedup_key (set on one row per name/date).
         """
         # Only count transcripts from raw_transcripts table
         if source_filter and source_filter in ('gong', 'fathom'):
             query = text("""
                 SELECT COUNT(*)
-                FROM (
-                    SELECT DISTINCT ON (COALESCE(title, ''), DATE(COALESCE(transcript_date, created_at))) id
-                    FROM raw_transcripts
-                    WHERE workspace_id = :workspace_id
-                    AND source_type = :source
-                ) AS unique_transcripts
+                FROM raw_transcripts
+                WHERE workspace_id = :workspace_id
+                AND dedup_key IS NOT NULL
+                AND source_type = :source
             """)
             result = self.db.execute(query, {
                 "workspace_id": workspace_id,
@@ -178,11 +176,9 @@ class OptimizedMessagesService:
             # Count all unique transcripts (both gong and fathom)
             query = text("""
                 SELECT COUNT(*)
-                FROM (
-                    SELECT DISTINCT ON (COALESCE(title, ''), DATE(COALESCE(transcript_date, created_at))) id
-                    FROM raw_transcripts
-                    WHERE workspace_id = :workspace_id
-                ) AS unique_transcripts
+                FROM raw_transcripts
+                WHERE workspace_id = :workspace_id
+                AND dedup_key IS NOT NULL
             """)
             result = self.db.execute(query, {"workspace_id": workspace_id})
 
@@ -238,10 +234,10 @@ class OptimizedMessagesService:
         sort_column = self._get_sort_column(sort_by)
 
         # Build query for raw_transcripts only with deduplication
-        # Use DISTINCT ON to remove duplicates based on title and date (same meeting name on same day)
+        # Only one row per title + date (same meeting name on same day) carries a dedup_key
         query = text(f"""
             SELECT * FROM (
-                SELECT DISTINCT ON (COALESCE(title, ''), DATE(COALESCE(transcript_date, created_at)))
+                SELECT
                     id::text,
                     COALESCE(title,
                         CASE source_type
@@ -265,9 +261,9 @@ class OptimizedMessagesService:
                     ai_processed as tier2_processed
                 FROM raw_transcripts
                 WHERE workspace_id = :workspace_id
+                AND dedup_key IS NOT NULL
                 {source_condition}
                 {cursor_condition}
-                ORDER BY COALESCE(title, ''), DATE(COALESCE(transcript_date, created_at)), created_at DESC
             ) AS unique_transcripts
             ORDER BY {sort_column} {sort_order} NULLS LAST
             LIMIT :limit OFFSET :offset
@@ -345,20 +341,25 @@ class OptimizedMessagesService:
         # Get the sort column based on sort_by parameter
         sort_column = self._get_sort_column(sort_by)
 
-        # Count query - only unique transcripts with classifications (deduplicate by title + date)
+        # Unique transcripts (one dedup_key row per title + date) with a completed classification
+        classified_condition = """
+            AND rt.dedup_key IS NOT NULL
+            AND EXISTS (
+                SELECT 1 FROM transcript_classifications tc
+                WHERE tc.workspace_id = rt.workspace_id
+                AND tc.source_type = rt.source_type
+                AND tc.source_id = rt.source_id
+                AND tc.processing_status = 'completed'
+            )
+        """
+
+        # Count query
         count_query = text(f"""
             SELECT COUNT(*)
-            FROM (
-                SELECT DISTINCT ON (COALESCE(rt.title, ''), DATE(COALESCE(rt.transcript_date, rt.created_at))) rt.id
-                FROM raw_transcripts rt
-                INNER JOIN transcript_classifications tc
-                    ON rt.workspace_id = tc.workspace_id
-                    AND rt.source_type = tc.source_type
-                    AND rt.source_id = tc.source_id
-                WHERE rt.workspace_id = :workspace_id
-                AND tc.processing_status = 'completed'
-                {source_condition}
-            ) AS unique_transcripts
+            FROM raw_transcripts rt
+            WHERE rt.workspace_id = :workspace_id
+            {classified_condition}
+            {source_condition}
         """)
         total = self.db.execute(count_query, params).scalar() or 0
 
@@ -372,7 +373,7 @@ class OptimizedMessagesService:
         # Data query with deduplication by title + date
         data_query = text(f"""
             SELECT * FROM (
-                SELECT DISTINCT ON (COALESCE(rt.title, ''), DATE(COALESCE(rt.transcript_date, rt.created_at)))
+                SELECT
                     rt.id::text,
                     COALESCE(rt.title,
                         CASE rt.source_type
@@ -395,14 +396,9 @@ class OptimizedMessagesService:
                     rt.ai_processed as tier1_processed,
                     rt.ai_processed as tier2_processed
                 FROM raw_transcripts rt
-                INNER JOIN transcript_classifications tc
-                    ON rt.workspace_id = tc.workspace_id
-                    AND rt.source_type = tc.source_type
-                    AND rt.source_id = tc.source_id
                 WHERE rt.workspace_id = :workspace_id
-                AND tc.processing_status = 'completed'
+                {classified_condition}
                 {source_condition}
-                ORDER BY COALESCE(rt.title, ''), DATE(COALESCE(rt.transcript_date, rt.created_at)), rt.created_at DESC
             ) AS unique_transcripts
             ORDER BY {sort_column} {sort_order} NULLS LAST
             LIMIT :limit OFFSET :offset
@@ -0,0 +1,116 @@
+"""
+Pooled OpenAI Clients
+
+Long-lived OpenAI / AsyncOpenAI clients shared by everything in a process, so
+Celery task invocations in the same worker reuse HTTP connections (and their
+TLS sessions) instead of building a new client per call.
+
+- get_openai_client(): one sync client per process (httpx.Client is thread-safe)
+- get_async_openai_client(): one async client per event loop, since an
+  httpx.AsyncClient's connections are bound to the loop that opened them.
+  run_async_task() reuses the worker thread's loop, so this is normally one
+  client per worker as well.
+- get_openai_batch_client(): client for Batch API backfills; honours
+  OPENAI_BATCH_BASE_URL so backfills can run against a local stand-in server.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing for the underlying httpx clients
+OPENAI_MAX_CONNECTIONS = 20
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 10
+
+_sync_client = None
+_batch_client = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def _http_limits():
+    import httpx
+    return httpx.Limits(
+        max_connections=OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def get_openai_client() -> Optional[Any]:
+    """Get or create the process-wide sync OpenAI client (None if not configured)."""
+    global _sync_client
+
+    if _sync_client is not None:
+        return _sync_client
+
+    if not settings.OPENAI_API_KEY:
+        logger.warning("OpenAI API key not configured")
+        return None
+
+    with _clients_lock:
+        if _sync_client is None:
+            import httpx
+            from openai import OpenAI
+            _sync_client = OpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.Client(limits=_http_limits()),
+            )
+            logger.info("OpenAI client initialized")
+    return _sync_client
+
+
+def get_async_openai_client() -> Optional[Any]:
+    """
+    Get or create the AsyncOpenAI client for the running event loop.
+
+    Must be called from inside a coroutine. Returns None if OpenAI is not
+    configured. Callers must not close the returned client.
+    """
+    if not settings.OPENAI_API_KEY:
+        logger.warning("OpenAI API key not configured")
+        return None
+
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            import httpx
+            from openai import AsyncOpenAI
+            client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.AsyncClient(limits=_http_limits()),
+            )
+            _async_clients[loop] = client
+            logger.info("AsyncOpenAI client initialized for worker event loop")
+    return client
+
+
+def get_openai_batch_client() -> Optional[Any]:
+    """
+    Get the client used for OpenAI Batch API jobs (None if not configured).
+
+    Same as get_openai_client() unless OPENAI_BATCH_BASE_URL is set.
+    """
+    global _batch_client
+
+    if not settings.OPENAI_BATCH_BASE_URL:
+        return get_openai_client()
+
+    if _batch_client is not None:
+        return _batch_client
+
+    with _clients_lock:
+        if _batch_client is None:
+            from openai import OpenAI
+            _batch_client = OpenAI(
+                api_key=settings.OPENAI_API_KEY or "local-stand-in",
+                base_url=settings.OPENAI_BATCH_BASE_URL,
+            )
+            logger.info(f"OpenAI batch client initialized (base_url: {settings.OPENAI_BATCH_BASE_URL})")
+    return _batch_client
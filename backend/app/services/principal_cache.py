@@ -0,0 +1,107 @@
+"""
+Principal Cache - short-lived cache of authenticated users for request auth.
+
+get_current_user used to load the User row for every authenticated request,
+and get_current_user_with_workspace added a Workspace lookup (and sometimes a
+second User query) for users without a workspace_id. Principals are now cached
+by token subject (user ID) in two tiers:
+
+- An in-process LRU (LOCAL_TTL) so repeat requests on a worker skip Redis too
+- Redis (CacheService, principal:<kind>:<user_id>, REDIS_TTL) shared by all
+  API workers
+
+Only active users are cached. After committing a change to a user that affects
+authorization (deactivation, role, workspace assignment, onboarding), call
+invalidate(user_id): it drops the Redis entry and this process's entry;
+other processes' local entries expire within LOCAL_TTL. Without Redis only the
+local tier is used.
+
+Usage:
+    from app.services.principal_cache import PRINCIPAL, principal_cache
+
+    principal = principal_cache.get(PRINCIPAL, user_id)
+    ...
+    db.commit()
+    principal_cache.invalidate(user_id)
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Optional, Tuple
+
+from app.services.cache_service import get_cache_service
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAMESPACE = "principal"
+# How long a worker trusts its local copy (bounds cross-process invalidation delay)
+LOCAL_TTL = timedelta(seconds=10)
+REDIS_TTL = timedelta(seconds=60)
+LOCAL_MAX_ENTRIES = 1024
+
+# Entry kinds
+PRINCIPAL = "user"  # get_current_user dict
+WORKSPACE = "workspace"  # Company workspace resolved for users without workspace_id
+KINDS = (PRINCIPAL, WORKSPACE)
+
+
+class PrincipalCache:
+    """In-process LRU in front of Redis, keyed by (kind, user ID)."""
+
+    def __init__(self, max_entries: int = LOCAL_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        # Sync dependencies run on threadpool threads
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, user_id: str) -> Optional[Any]:
+        """Cached value, or None on a miss. Dicts are returned as copies."""
+        key = (kind, str(user_id))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return self._copy(entry[1])
+                del self._entries[key]
+
+        value = get_cache_service().get(CACHE_NAMESPACE, kind, str(user_id))
+        if value is not None:
+            self._remember(key, value)
+        return self._copy(value)
+
+    def set(self, kind: str, user_id: str, value: Any) -> None:
+        """Cache a JSON-serializable value in both tiers."""
+        self._remember((kind, str(user_id)), self._copy(value))
+        get_cache_service().set(CACHE_NAMESPACE, kind, str(user_id), value=value, ttl=REDIS_TTL)
+
+    def invalidate(self, user_id: Any) -> None:
+        """Drop every entry of a user; call after committing changes to the user."""
+        user_id = str(user_id)
+        with self._lock:
+            for kind in KINDS:
+                self._entries.pop((kind, user_id), None)
+        cache = get_cache_service()
+        for kind in KINDS:
+            cache.delete(CACHE_NAMESPACE, kind, user_id)
+        logger.debug(f"Invalidated cached principal for user {user_id}")
+
+    def _remember(self, key: Tuple[str, str], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + LOCAL_TTL.total_seconds(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        # Callers may add keys (e.g. workspace_id) to the principal dict
+        return dict(value) if isinstance(value, dict) else value
+
+
+# Global cache instance
+principal_cache = PrincipalCache()
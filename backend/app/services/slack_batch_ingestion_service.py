@@ -3,7 +3,12 @@ Optimized Slack Batch Ingestion Service - Fast batch data storage without AI ext
 
 This service focuses on:
 1. Fast fetching of Slack messages from selected channels
+   - Channels are fetched concurrently; each pages conversations.history to its
+     watermark and fetches conversations.replies for threads it finds
+   - Pages are stored as they arrive instead of being collected in memory
 2. Batch duplicate detection
+   - Authors come from the shared Slack user directory (slack_user_directory.py),
+     so steady-state syncs make no per-user API calls
 3. Batch insertion into the Message table
 4. Deferred AI processing (marked as tier1_processed=False, tier2_processed=False)
 
@@ -15,11 +20,19 @@ Usage:
     result = await slack_batch_ingestion_service.ingest_messages(
         connector_id="...",
         db=db,
-        hours_back=24
+        hours_back=24,
+        incremental=True,
     )
+
+With incremental=True each channel resumes from its watermark (the newest
+stored message ts) and pages conversations.history until caught up. Replies
+are fetched for threads started after the watermark; replies added later to
+older threads are not picked up.
 """
 
+import asyncio
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Set
 from uuid import UUID
@@ -30,12 +43,29 @@ from sqlalchemy import and_
 from app.models.workspace_connector import WorkspaceConnector
 from app.models.message import Message
 from app.services.slack_service import slack_service
+from app.services.slack_user_directory import SlackUserDirectory
 from app.services.batch_db_service import batch_db_service
+from app.services.customer_extraction_service import CustomerResolver
+from app.services.sync_watermark_service import sync_watermark_service
 
 logger = logging.getLogger(__name__)
 
-# Maximum number of users to cache per connector
-MAX_USER_CACHE_SIZE = 500
+# Channels fetched at once per sync; Slack's per-token rate limit is enforced by connector_http
+MAX_CONCURRENT_CHANNELS = 4
+
+
+@dataclass
+class _ChannelSyncContext:
+    """State shared by the channels of one sync."""
+
+    connector: WorkspaceConnector
+    db: Session
+    user_directory: SlackUserDirectory
+    customer_resolver: CustomerResolver
+    hours_back: int
+    incremental: bool
+    # The session is shared: database work of concurrent channels takes turns
+    db_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
 class SlackBatchIngestionService:
@@ -46,47 +76,22 @@ class SlackBatchIngestionService:
     - Batch check for existing messages before fetching user info
     - Bulk insert new messages
     - No inline AI extraction (deferred to batch processing)
-    - LRU user cache with max size
+    - Authors resolved from a Redis-backed user directory shared by all workers
     """
 
-    def __init__(self):
-        # LRU-style user cache
-        self._user_cache: Dict[str, Dict[str, Any]] = {}
-        self._user_cache_order: List[str] = []
-
-    def _get_cached_user(self, user_key: str) -> Optional[Dict[str, Any]]:
-        """Get user from cache."""
-        return self._user_cache.get(user_key)
-
-    def _set_cached_user(self, user_key: str, user_data: Dict[str, Any]) -> None:
-        """Set user in cache with LRU eviction."""
-        if user_key in self._user_cache:
-            self._user_cache_order.remove(user_key)
-            self._user_cache_order.append(user_key)
-            self._user_cache[user_key] = user_data
-        else:
-            while len(self._user_cache) >= MAX_USER_CACHE_SIZE:
-                oldest_key = self._user_cache_order.pop(0)
-                del self._user_cache[oldest_key]
-            self._user_cache[user_key] = user_data
-            self._user_cache_order.append(user_key)
-
-    def clear_user_cache(self) -> None:
-        """Clear the user cache."""
-        self._user_cache.clear()
-        self._user_cache_order.clear()
-
     async def ingest_messages(
         self,
         connector_id: str,
         db: Session,
-        hours_back: int = 24
+        hours_back: int = 24,
+        incremental: bool = False,
     ) -> Dict[str, int]:
         """
         Ingest Slack messages with optimized batch processing.
 
         This method:
-        1. Fetches messages from selected Slack channels
+        1. Fetches messages from selected Slack channels concurrently, paging until
+           caught up, plus the replies of new threads
         2. Batch checks for duplicates
         3. Batch inserts into Message table with tier1_processed=False
         4. Returns counts for sync tracking
@@ -96,7 +101,8 @@ class SlackBatchIngestionService:
         Args:
             connector_id: WorkspaceConnector UUID string
             db: Database session
-            hours_back: How many hours back to fetch messages
+            hours_back: How many hours back to fetch messages (channels without a watermark)
+            incremental: Resume each channel from its watermark and advance it
 
         Returns:
             Dict with 'total_checked', 'new_added', 'duplicates_skipped'
@@ -125,39 +131,53 @@ class SlackBatchIngestionService:
                 logger.warning(f"No channels selected for connector {connector_id}")
                 return {"total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "inserted_ids": []}
 
-            total_checked = 0
-            total_new = 0
-            total_skipped = 0
-            all_inserted_ids: List[str] = []
-
-            # Process each selected channel
-            for channel_info in selected_channels:
-                channel_id = channel_info["id"]
-                channel_name = channel_info["name"]
-
-                logger.info(f"Ingesting messages from channel #{channel_name}")
+            # Authors of every channel, loaded once (users.list only when stale)
+            user_directory = SlackUserDirectory(connector)
+            await user_directory.load()
+            ctx = _ChannelSyncContext(
+                connector=connector,
+                db=db,
+                user_directory=user_directory,
+                # One customer index for the whole sync, shared by all channels
+                customer_resolver=CustomerResolver(db, connector.workspace_id),
+                hours_back=hours_back,
+                incremental=incremental,
+            )
 
-                try:
-                    result = await self._batch_process_channel(
-                        connector=connector,
-                        channel_id=channel_id,
-                        channel_name=channel_name,
-                        db=db
-                    )
+            # Process selected channels concurrently (requests are rate limited per token)
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANNELS)
 
-                    total_checked += result.get("total_checked", 0)
-                    total_new += result.get("new_added", 0)
-                    total_skipped += result.get("duplicates_skipped", 0)
-                    all_inserted_ids.extend(result.get("inserted_ids", []))
+            async def process(channel_info: Dict[str, Any]) -> Dict[str, Any]:
+                channel_name = channel_info["name"]
+                async with semaphore:
+                    logger.info(f"Ingesting messages from channel #{channel_name}")
+                    try:
+                        result = await self._batch_process_channel(
+                            ctx=ctx,
+                            channel_id=channel_info["id"],
+                            channel_name=channel_name,
+                        )
+                    except Exception as e:
+                        logger.error(f"Error ingesting messages from #{channel_name}: {e}")
+                        async with ctx.db_lock:
+                            db.rollback()
+                            # Customers created in the failed channel's transaction may be gone
+                            ctx.customer_resolver = CustomerResolver(db, connector.workspace_id)
+                        return {}
+
+                logger.info(
+                    f"Channel #{channel_name}: checked {result['total_checked']}, "
+                    f"added {result['new_added']}, skipped {result['duplicates_skipped']}"
+                )
+                return result
 
-                    logger.info(
-                        f"Channel #{channel_name}: checked {result.get('total_checked', 0)}, "
-                        f"added {result.get('new_added', 0)}, skipped {result.get('duplicates_skipped', 0)}"
-                    )
+            results = await asyncio.gather(*(process(channel_info) for channel_info in selected_channels))
+            user_directory.save()
 
-                except Exception as e:
-                    logger.error(f"Error ingesting messages from #{channel_name}: {e}")
-                    continue
+            total_checked = sum(r.get("total_checked", 0) for r in results)
+            total_new = sum(r.get("new_added", 0) for r in results)
+            total_skipped = sum(r.get("duplicates_skipped", 0) for r in results)
+            all_inserted_ids: List[str] = [i for r in results for i in r.get("inserted_ids", [])]
 
             # Update connector sync status
             connector.last_synced_at = datetime.now(timezone.utc)
@@ -167,7 +187,7 @@ class SlackBatchIngestionService:
 
             logger.info(
                 f"Slack ingestion complete: {total_new} new, {total_skipped} skipped "
-                f"out of {total_checked} checked"
+                f"out of {total_checked} checked ({user_directory.api_calls} user directory API calls)"
             )
 
             return {
@@ -187,119 +207,159 @@ class SlackBatchIngestionService:
 
     async def _batch_process_channel(
         self,
-        connector: WorkspaceConnector,
+        ctx: "_ChannelSyncContext",
         channel_id: str,
         channel_name: str,
-        db: Session
-    ) -> Dict[str, int]:
+    ) -> Dict[str, Any]:
         """
-        Batch process messages from a single channel.
+        Batch process all new messages from a single channel.
+
+        Fetches everything newer than the channel watermark (or the last
+        hours_back hours) page by page, storing each page as it arrives,
+        followed by the replies of its threads. The watermark only moves
+        after every page is stored.
 
         Args:
-            connector: WorkspaceConnector instance
+            ctx: Shared state of the sync
             channel_id: Slack channel ID
             channel_name: Slack channel name
-            db: Database session
 
         Returns:
             Dict with counts
         """
+        connector = ctx.connector
         try:
-            # Step 1: Fetch messages from Slack
-            messages = await slack_service.get_channel_messages(
+            async with ctx.db_lock:
+                mark = sync_watermark_service.get(ctx.db, connector.id, scope=channel_id) if ctx.incremental else None
+            if mark and mark.cursor:
+                oldest = mark.cursor
+            else:
+                since = datetime.now(timezone.utc) - timedelta(hours=ctx.hours_back)
+                oldest = f"{since.timestamp():.6f}"
+
+            totals = {"total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "inserted_ids": []}
+            newest_ts: Optional[str] = None
+
+            def add(result: Dict[str, Any]) -> None:
+                totals["total_checked"] += result["total_checked"]
+                totals["new_added"] += result["new_added"]
+                totals["duplicates_skipped"] += result["duplicates_skipped"]
+                totals["inserted_ids"].extend(result["inserted_ids"])
+
+            async for messages in slack_service.iter_channel_history(
                 token=connector.access_token,
                 channel_id=channel_id,
-                limit=60
-            )
+                oldest=oldest,
+            ):
+                for msg in messages:
+                    ts = msg.get("ts")
+                    if ts and (newest_ts is None or float(ts) > float(newest_ts)):
+                        newest_ts = ts
+
+                add(await self._store_channel_page(ctx, channel_id, channel_name, messages))
+
+                # Replies of threads started in this page
+                for msg in messages:
+                    if not msg.get("reply_count") or msg.get("thread_ts") != msg.get("ts"):
+                        continue
+                    async for replies in slack_service.iter_thread_replies(
+                        token=connector.access_token,
+                        channel_id=channel_id,
+                        thread_ts=msg["ts"],
+                    ):
+                        add(await self._store_channel_page(ctx, channel_id, channel_name, replies))
 
-            if not messages:
-                return {"total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "inserted_ids": []}
+            if ctx.incremental:
+                # Nothing newer: keep the lower bound so the next run starts from the same point
+                async with ctx.db_lock:
+                    sync_watermark_service.advance(ctx.db, connector.id, scope=channel_id, cursor=newest_ts or oldest)
+                    ctx.db.commit()
 
-            total_checked = len(messages)
+            return totals
 
-            # Step 2: Filter out system messages
-            valid_messages = [m for m in messages if not self._should_skip_message(m)]
+        except Exception as e:
+            logger.error(f"Error in batch process for channel #{channel_name}: {e}")
+            raise
 
-            # Step 3: Get external IDs and check for existing
-            external_ids = [m.get("ts") for m in valid_messages if m.get("ts")]
+    async def _store_channel_page(
+        self,
+        ctx: "_ChannelSyncContext",
+        channel_id: str,
+        channel_name: str,
+        messages: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Filter, deduplicate and batch insert one page of channel history or thread replies."""
+        if not messages:
+            return {"total_checked": 0, "new_added": 0, "duplicates_skipped": 0, "inserted_ids": []}
+
+        connector = ctx.connector
+        total_checked = len(messages)
+
+        # Step 1: Filter out system messages
+        valid_messages = [m for m in messages if not self._should_skip_message(m)]
+
+        # Step 2: Get external IDs and check for existing
+        external_ids = [m.get("ts") for m in valid_messages if m.get("ts")]
+        async with ctx.db_lock:
             existing_ids = self._get_existing_message_ids(
-                db=db,
+                db=ctx.db,
                 external_ids=external_ids,
                 connector_id=str(connector.id),
                 channel_id=channel_id
             )
 
-            # Step 4: Filter to only new messages
-            new_messages = [m for m in valid_messages if m.get("ts") not in existing_ids]
-            duplicates_skipped = len(valid_messages) - len(new_messages)
-
-            if not new_messages:
-                return {
-                    "total_checked": total_checked,
-                    "new_added": 0,
-                    "duplicates_skipped": duplicates_skipped
-                }
-
-            # Step 5: Prepare messages for batch insert
-            # Collect unique user IDs to fetch in batch
-            user_ids = set()
-            for msg in new_messages:
-                user_id = msg.get("user")
-                if user_id and not self._get_cached_user(user_id):
-                    user_ids.add(user_id)
-
-            # Fetch all unknown users
-            for user_id in user_ids:
-                try:
-                    user_info = await slack_service.get_user_info(connector.access_token, user_id)
-                    profile = user_info.get("profile", {})
-                    author_info = {
-                        "name": profile.get("display_name") or profile.get("real_name") or user_info.get("name", "Unknown User"),
-                        "email": profile.get("email")
-                    }
-                    self._set_cached_user(user_id, author_info)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch user info for {user_id}: {e}")
-                    self._set_cached_user(user_id, {"name": "Unknown User", "email": None})
-
-            # Step 6: Build message dicts for batch insert
-            message_dicts = []
-            for msg in new_messages:
-                message_dict = self._prepare_message(
-                    message_data=msg,
-                    connector=connector,
-                    channel_id=channel_id,
-                    channel_name=channel_name
-                )
-                if message_dict:
-                    message_dicts.append(message_dict)
+        # Step 3: Filter to only new messages
+        new_messages = [m for m in valid_messages if m.get("ts") not in existing_ids]
+        duplicates_skipped = len(valid_messages) - len(new_messages)
+
+        if not new_messages:
+            return {
+                "total_checked": total_checked,
+                "new_added": 0,
+                "duplicates_skipped": duplicates_skipped,
+                "inserted_ids": []
+            }
 
-            # Step 7: Batch insert
-            if message_dicts:
+        # Step 4: Resolve authors (Slack is only called for users missing from the directory)
+        await ctx.user_directory.resolve(msg.get("user") for msg in new_messages)
+
+        # Step 5: Build message dicts for batch insert
+        message_dicts = []
+        for msg in new_messages:
+            message_dict = self._prepare_message(
+                message_data=msg,
+                connector=connector,
+                channel_id=channel_id,
+                channel_name=channel_name,
+                user_directory=ctx.user_directory,
+            )
+            if message_dict:
+                message_dicts.append(message_dict)
+
+        # Step 6: Batch insert (one channel at a time - the session is shared)
+        if message_dicts:
+            async with ctx.db_lock:
                 result = batch_db_service.batch_insert_messages(
-                    db=db,
+                    db=ctx.db,
                     messages=message_dicts,
                     workspace_id=str(connector.workspace_id),
                     connector_id=str(connector.id),
-                    source="slack"
+                    source="slack",
+                    customer_resolver=ctx.customer_resolver,
                 )
-                return {
-                    "total_checked": total_checked,
-                    "new_added": result.get("new_added", 0),
-                    "duplicates_skipped": duplicates_skipped + result.get("duplicates_skipped", 0),
-                    "inserted_ids": result.get("inserted_ids", [])
-                }
-
             return {
                 "total_checked": total_checked,
-                "new_added": 0,
-                "duplicates_skipped": duplicates_skipped,
-                "inserted_ids": []
+                "new_added": result.get("new_added", 0),
+                "duplicates_skipped": duplicates_skipped + result.get("duplicates_skipped", 0),
+                "inserted_ids": result.get("inserted_ids", [])
             }
 
-        except Exception as e:
-            logger.error(f"Error in batch process for channel #{channel_name}: {e}")
-            raise
+        return {
+            "total_checked": total_checked,
+            "new_added": 0,
+            "duplicates_skipped": duplicates_skipped,
+            "inserted_ids": []
+        }
 
     def _get_existing_message_ids(
         self,
@@ -352,16 +412,17 @@ class SlackBatchIngestionService:
         message_data: Dict[str, Any],
         connector: WorkspaceConnector,
         channel_id: str,
-        channel_name: str
+        channel_name: str,
+        user_directory: SlackUserDirectory,
     ) -> Optional[Dict[str, Any]]:
         """Prepare a message dict for batch insert."""
         external_id = message_data.get("ts")
         if not external_id:
             return None
 
-        # Get author info from cache
+        # Get author info from the user directory
         user_id = message_data.get("user")
-        author_info = self._get_cached_user(user_id) or {"name": "Unknown User", "email": None}
+        author_info = user_directory.get(user_id)
 
         # Extract title
         title = self._extract_title(message_data, channel_name)
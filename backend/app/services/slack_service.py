@@ -1,10 +1,11 @@
 import httpx
 import json
-from typing import List, Dict, Any, Tuple, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from fastapi import HTTPException
 import logging
 
 from app.schemas.slack import SlackChannel, SlackAuthTestResponse, SlackConversationsListResponse
+from app.services.connector_http import connector_http
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +15,6 @@ class SlackService:
     
     SLACK_BASE_URL = "https://slack.com/api"
     
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
-    
     async def validate_user_token(self, user_token: str) -> Dict[str, Any]:
         """
         Validate user token by calling Slack's auth.test endpoint
@@ -156,6 +154,9 @@ class SlackService:
         """
         Make authenticated request to Slack API
         
+        Goes through the shared connector client: pooled, rate limited per
+        token, and retried on 429 (honoring Retry-After) and 5xx.
+        
         Args:
             endpoint: Slack API endpoint (e.g., 'auth.test')
             token: Slack OAuth token
@@ -171,17 +172,16 @@ class SlackService:
         }
         
         # Use GET for most endpoints, POST for some
-        if endpoint in ["auth.test", "conversations.list", "conversations.history", "users.info"]:
-            response = await self.client.get(url, headers=headers, params=params or {})
+        if endpoint in ["auth.test", "conversations.list", "conversations.history", "users.info", "users.list", "conversations.replies"]:
+            response = await connector_http.get("slack", url, credential=token, headers=headers, params=params or {})
         else:
             # For POST endpoints, use JSON for chat.postMessage, form data for others
             if endpoint == "chat.postMessage":
                 headers["Content-Type"] = "application/json"
-                response = await self.client.post(url, headers=headers, json=params or {})
+                response = await connector_http.post("slack", url, credential=token, headers=headers, json=params or {})
             else:
-                response = await self.client.post(url, headers=headers, data=params or {})
+                response = await connector_http.post("slack", url, credential=token, headers=headers, data=params or {})
         
-        response.raise_for_status()
         return response.json()
     
     async def get_channel_messages(self, token: str, channel_id: str, limit: int = 100, oldest: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -224,6 +224,111 @@ class SlackService:
             logger.error(f"Error fetching messages from channel {channel_id}: {e}")
             raise HTTPException(status_code=500, detail="Failed to fetch channel messages")
     
+    async def iter_channel_history(
+        self,
+        token: str,
+        channel_id: str,
+        oldest: Optional[str] = None,
+        page_size: int = 200,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield every message of a channel newer than `oldest`, one page at a time.
+
+        Follows conversations.history cursors until Slack reports no more
+        pages, so nothing past a fixed limit is dropped. Pages come newest first.
+
+        Args:
+            token: Slack user OAuth token
+            channel_id: Channel ID to fetch messages from
+            oldest: Exclusive lower bound ts (format: '1234567890.123456')
+            page_size: Messages per request (Slack recommends <= 200)
+        """
+        cursor = None
+        while True:
+            params: Dict[str, Any] = {"channel": channel_id, "limit": min(page_size, 1000)}
+            if oldest:
+                params["oldest"] = oldest
+            if cursor:
+                params["cursor"] = cursor
+
+            response = await self._call_slack_api("conversations.history", token, params=params)
+            if not response.get("ok"):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Failed to fetch messages: {response.get('error', 'Unknown error')}"
+                )
+
+            yield response.get("messages", [])
+
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                return
+
+    async def iter_thread_replies(
+        self,
+        token: str,
+        channel_id: str,
+        thread_ts: str,
+        page_size: int = 200,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the replies of a thread, one conversations.replies page at a time.
+
+        The parent message (which conversations.replies returns first) is
+        left out; pages come oldest first.
+
+        Args:
+            token: Slack user OAuth token
+            channel_id: Channel ID of the thread
+            thread_ts: ts of the thread's parent message
+            page_size: Messages per request (Slack recommends <= 200)
+        """
+        cursor = None
+        while True:
+            params: Dict[str, Any] = {"channel": channel_id, "ts": thread_ts, "limit": min(page_size, 1000)}
+            if cursor:
+                params["cursor"] = cursor
+
+            response = await self._call_slack_api("conversations.replies", token, params=params)
+            if not response.get("ok"):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Failed to fetch thread replies: {response.get('error', 'Unknown error')}"
+                )
+
+            yield [m for m in response.get("messages", []) if m.get("ts") != thread_ts]
+
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                return
+
+    async def iter_users(self, token: str, page_size: int = 200) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield every member of the Slack workspace, one users.list page at a time.
+
+        Args:
+            token: Slack user OAuth token
+            page_size: Users per request (Slack recommends <= 200)
+        """
+        cursor = None
+        while True:
+            params: Dict[str, Any] = {"limit": page_size}
+            if cursor:
+                params["cursor"] = cursor
+
+            response = await self._call_slack_api("users.list", token, params=params)
+            if not response.get("ok"):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Failed to list users: {response.get('error', 'Unknown error')}"
+                )
+
+            yield response.get("members", [])
+
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                return
+
     async def get_user_info(self, token: str, user_id: str) -> Dict[str, Any]:
         """
         Get user information from Slack
@@ -307,8 +412,8 @@ class SlackService:
             raise HTTPException(status_code=500, detail="Failed to post message to Slack")
 
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """Close the shared connector HTTP pools of the running event loop"""
+        await connector_http.aclose()
 
 
 # Global service instance
@@ -0,0 +1,174 @@
+"""
+Slack User Directory - author names and emails for Slack ingestion.
+
+Message authors used to be resolved with one users.info call per unknown user,
+cached per worker process and lost whenever the worker recycled. The directory
+instead holds every member of a connector's Slack workspace:
+
+- Loaded in bulk with paginated users.list and stored in Redis (CacheService)
+  under slack_users:<connector_id>, so all workers share it across syncs
+- Refreshed incrementally: after REFRESH_AFTER the next sync re-lists users and
+  merges only members whose `updated` stamp changed; departed members are kept
+  so their old messages still resolve
+- Users missing from the directory (joined since the last refresh, external
+  members of shared channels) are looked up with users.info and merged in;
+  when many are missing at once a users.list refresh runs first, and whatever
+  it did not cover is still looked up.
+  Failed lookups are remembered for the current sync only and retried next sync
+
+In steady state a sync makes no per-user API calls. The directory is written
+to Redis after a users.list refresh and once at the end of the sync (save()),
+not per lookup. Without Redis the directory lives for one sync only.
+
+Usage:
+    directory = SlackUserDirectory(connector)
+    await directory.load()
+    await directory.resolve(user_ids)
+    author = directory.get(user_id)
+    ...
+    directory.save()
+"""
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from app.models.workspace_connector import WorkspaceConnector
+from app.services.cache_service import get_cache_service
+from app.services.slack_service import slack_service
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAMESPACE = "slack_users"
+# Redis expiry of a directory nobody has synced for a while
+DIRECTORY_TTL = timedelta(hours=24)
+# Age after which the next sync re-lists users and merges changes
+REFRESH_AFTER = timedelta(hours=6)
+# More missing users than this triggers one users.list refresh before the
+# remaining misses are looked up one by one
+MAX_DIRECT_LOOKUPS = 20
+
+UNKNOWN_USER = {"name": "Unknown User", "email": None}
+
+
+class SlackUserDirectory:
+    """
+    Members of one Slack connector's workspace, shared through Redis.
+
+    Create one per sync. Channel coroutines of that sync may share it: a
+    users.list refresh runs at most once however many of them need it. It is
+    not safe to share across event loops.
+    """
+
+    def __init__(self, connector: WorkspaceConnector):
+        self.connector_id = str(connector.id)
+        self.token = connector.access_token
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.refreshed_at = 0.0
+        self.api_calls = 0
+        self._refreshed_this_sync = False
+        # Channels resolving concurrently wait for one refresh instead of starting their own
+        self._refresh_lock = asyncio.Lock()
+        # Users added by resolve() since the last save
+        self._unsaved = False
+        # users.info failures this sync: not retried now, never saved to Redis
+        self._failed_lookups: set = set()
+
+    async def load(self) -> None:
+        """Load the directory from Redis, refreshing it from users.list when stale or missing."""
+        cached = get_cache_service().get(CACHE_NAMESPACE, self.connector_id)
+        if cached:
+            self.users = cached.get("users", {})
+            self.refreshed_at = cached.get("refreshed_at", 0.0)
+
+        if time.time() - self.refreshed_at < REFRESH_AFTER.total_seconds():
+            return
+
+        try:
+            await self._refresh()
+        except Exception as e:
+            # Keep whatever was cached; misses fall back to users.info lookups
+            logger.warning(f"Could not refresh Slack user directory for connector {self.connector_id}: {e}")
+
+    async def resolve(self, user_ids: Iterable[str]) -> None:
+        """Make sure the given users are in the directory, calling Slack only for misses."""
+        missing = {
+            user_id for user_id in user_ids
+            if user_id and user_id not in self.users and user_id not in self._failed_lookups
+        }
+        if not missing:
+            return
+
+        if len(missing) > MAX_DIRECT_LOOKUPS and not self._refreshed_this_sync:
+            async with self._refresh_lock:
+                # Another channel may have refreshed while this one waited
+                if not self._refreshed_this_sync:
+                    try:
+                        await self._refresh()
+                    except Exception as e:
+                        logger.warning(f"Could not refresh Slack user directory for connector {self.connector_id}: {e}")
+                        # Don't retry a failing users.list for every channel; look users up instead
+                        self._refreshed_this_sync = True
+            missing = {user_id for user_id in missing if user_id not in self.users}
+
+        # Every remaining miss is looked up (slack_service rate-limits the calls);
+        # an unresolved author would be stored as Unknown User for good
+        for user_id in missing:
+            try:
+                self.api_calls += 1
+                self.users[user_id] = self._entry(await slack_service.get_user_info(self.token, user_id))
+                self._unsaved = True
+            except Exception as e:
+                logger.warning(f"Failed to fetch user info for {user_id}: {e}")
+                self._failed_lookups.add(user_id)
+
+    def save(self) -> None:
+        """Write users resolved this sync to Redis; call once at the end of the sync."""
+        if self._unsaved:
+            self._save()
+
+    def get(self, user_id: Optional[str]) -> Dict[str, Any]:
+        """Author name/email for a user ID (Unknown User if not resolved)."""
+        return self.users.get(user_id) or UNKNOWN_USER
+
+    async def _refresh(self) -> None:
+        """Page users.list and merge members that changed since they were stored."""
+        changed = 0
+        async for members in slack_service.iter_users(self.token):
+            self.api_calls += 1
+            for member in members:
+                user_id = member.get("id")
+                if not user_id:
+                    continue
+                known = self.users.get(user_id)
+                if known and known.get("updated", 0) >= member.get("updated", 0):
+                    continue
+                self.users[user_id] = self._entry(member)
+                changed += 1
+
+        self.refreshed_at = time.time()
+        self._refreshed_this_sync = True
+        self._save()
+        logger.info(
+            f"Slack user directory for connector {self.connector_id}: "
+            f"{len(self.users)} users, {changed} changed"
+        )
+
+    def _save(self) -> None:
+        self._unsaved = False
+        get_cache_service().set(
+            CACHE_NAMESPACE, self.connector_id,
+            value={"users": self.users, "refreshed_at": self.refreshed_at},
+            ttl=DIRECTORY_TTL,
+        )
+
+    @staticmethod
+    def _entry(user: Dict[str, Any]) -> Dict[str, Any]:
+        profile = user.get("profile", {})
+        return {
+            "name": profile.get("display_name") or profile.get("real_name") or user.get("name", "Unknown User"),
+            "email": profile.get("email"),
+            "updated": user.get("updated", 0),
+        }
@@ -30,6 +30,7 @@ from app.schemas.sources import (
     DataSourcesStatusResponse,
     SyncOperationResponse,
 )
+from app.utils.transcript_renderer import STYLE_INLINE, format_transcript
 
 logger = logging.getLogger(__name__)
 
@@ -355,7 +356,7 @@ class SourcesService:
                             })
 
         # Format transcript content for display
-        transcript_text = self._format_transcript_text(raw_data)
+        transcript_text = format_transcript(raw_data, style=STYLE_INLINE)
 
         # Get AI classification with Key Insights
         ai_insights = {
@@ -470,105 +471,6 @@ class SourcesService:
             'related_customer_asks': [],
         }
 
-    def _format_transcript_text(self, raw_data: Dict[str, Any]) -> str:
-        """Format raw transcript data as readable text.
-
-        Handles both Gong and Fathom transcript formats:
-        - Gong: Uses 'parties' array with speakerId mapping to transcript segments
-        - Fathom: Has 'speaker.display_name' directly in each transcript entry
-
-        Also handles nested structure from gong_ingestion_service:
-        - raw_data = {"call_data": {..., parties: [...]}, "transcript": {...}}
-        """
-        if not raw_data:
-            return "No transcript available."
-
-        # Handle nested structure from gong_ingestion_service
-        call_data = raw_data.get('call_data', {})
-
-        # Build speaker mapping from parties (Gong format)
-        # Try nested location first (call_data.parties), then root level (parties)
-        parties = call_data.get('parties', []) if call_data else []
-        if not parties:
-            parties = raw_data.get('parties', [])
-
-        speaker_map = {}
-        for party in parties:
-            speaker_id = party.get('speakerId')
-            if speaker_id:
-                name = party.get('name', 'Unknown')
-                email = party.get('emailAddress', '')
-                speaker_map[str(speaker_id)] = {'name': name, 'email': email}
-
-        # Get transcript segments
-        # Try nested location first (raw_data.transcript.transcript), then root transcript
-        transcript_data = raw_data.get('transcript', {})
-        if isinstance(transcript_data, dict):
-            transcript_segments = transcript_data.get('transcript', [])
-        elif isinstance(transcript_data, list):
-            transcript_segments = transcript_data
-        else:
-            transcript_segments = []
-
-        if not isinstance(transcript_segments, list):
-            return "Transcript format not recognized."
-
-        lines = []
-        for segment in transcript_segments:
-            if not isinstance(segment, dict):
-                continue
-
-            # Check for Fathom format first (speaker object with display_name)
-            speaker_obj = segment.get('speaker')
-            if speaker_obj and isinstance(speaker_obj, dict):
-                # Fathom format: speaker info is directly in the segment
-                name = speaker_obj.get('display_name', 'Unknown Speaker')
-                email = speaker_obj.get('matched_calendar_invitee_email', '') or speaker_obj.get('email', '')
-                text = segment.get('text', '').strip()
-
-                if text:
-                    if email:
-                        lines.append(f"{name} ({email}): {text}")
-                    else:
-                        lines.append(f"{name}: {text}")
-                continue
-
-            # Gong format: use speakerId to lookup in speaker_map
-            speaker_id = str(segment.get('speakerId', ''))
-            speaker_info = speaker_map.get(speaker_id, {'name': 'Unknown Speaker', 'email': ''})
-
-            name = speaker_info['name']
-            email = speaker_info['email']
-
-            sentences = segment.get('sentences', [])
-            if not sentences:
-                text = segment.get('text', '')
-                if text:
-                    sentences = [{'text': text}]
-                else:
-                    continue
-
-            text_parts = []
-            for sentence in sentences:
-                if isinstance(sentence, dict):
-                    text = sentence.get('text', '').strip()
-                    if text:
-                        text_parts.append(text)
-                elif isinstance(sentence, str):
-                    text_parts.append(sentence.strip())
-
-            if not text_parts:
-                continue
-
-            full_text = ' '.join(text_parts)
-
-            if email:
-                lines.append(f"{name} ({email}): {full_text}")
-            else:
-                lines.append(f"{name}: {full_text}")
-
-        return "\n\n".join(lines) if lines else "No transcript content found."
-
     # ============ Sync History Operations ============
 
     def get_sync_history_paginated(
@@ -0,0 +1,103 @@
+"""
+Sync Watermark Service - Persistent high-water marks for incremental syncs.
+
+Periodic syncs used fixed windows (last 24h, first N items), which re-read data
+already stored and silently dropped anything past the cap when volume spiked.
+With a watermark each sync asks the source only for what is newer and pages
+until it is caught up:
+
+    Slack   per channel    conversations.history oldest=<newest stored ts>
+    Gong    per connector  /v2/calls/extensive fromDateTime=<last sync> with cursor paging
+    Fathom  per connector  /external/v1/meetings created_after=<last sync>
+    Gmail   per label      threads.list q="after:<last sync>" with page tokens
+
+Time-based marks are read back with a small overlap (see since()) because
+sources publish items late (Gong processes calls after they end); the stores
+deduplicate whatever the overlap re-reads.
+
+Advance a watermark only after the data it covers is committed, so a failed
+run starts again from the old mark.
+
+Usage:
+    from app.services.sync_watermark_service import sync_watermark_service
+
+    mark = sync_watermark_service.get(db, connector.id, scope=channel_id)
+    ... fetch newer than mark, store ...
+    sync_watermark_service.advance(db, connector.id, scope=channel_id, cursor=newest_ts)
+    db.commit()
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.sync_watermark import SyncWatermark
+
+logger = logging.getLogger(__name__)
+
+CONNECTOR_SCOPE = ""
+
+
+class SyncWatermarkService:
+    """Read and advance sync_watermarks rows."""
+
+    def get(self, db: Session, connector_id: UUID, scope: str = CONNECTOR_SCOPE) -> Optional[SyncWatermark]:
+        """Return the watermark for a connector scope, or None before the first incremental sync."""
+        return db.query(SyncWatermark).filter(
+            SyncWatermark.connector_id == connector_id,
+            SyncWatermark.scope == scope,
+        ).first()
+
+    def since(
+        self,
+        db: Session,
+        connector_id: UUID,
+        scope: str = CONNECTOR_SCOPE,
+        overlap: timedelta = timedelta(0),
+    ) -> Optional[datetime]:
+        """Start of the next time-based fetch (last_item_at minus overlap), or None if there is no mark."""
+        mark = self.get(db, connector_id, scope)
+        if not mark or not mark.last_item_at:
+            return None
+        return mark.last_item_at - overlap
+
+    def advance(
+        self,
+        db: Session,
+        connector_id: UUID,
+        scope: str = CONNECTOR_SCOPE,
+        cursor: Optional[str] = None,
+        last_item_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Create or move a watermark. Does not commit.
+
+        A None cursor keeps the stored one (a sync that saw nothing new still
+        records that it ran); last_item_at defaults to now.
+        """
+        last_item_at = last_item_at or datetime.now(timezone.utc)
+        stmt = pg_insert(SyncWatermark).values(
+            connector_id=connector_id,
+            scope=scope,
+            cursor=cursor,
+            last_item_at=last_item_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_sync_watermarks_connector_scope",
+            set_={
+                "cursor": func.coalesce(stmt.excluded.cursor, SyncWatermark.cursor),
+                "last_item_at": stmt.excluded.last_item_at,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+        logger.debug(f"Advanced sync watermark {connector_id}/{scope or '*'} to cursor={cursor} at={last_item_at}")
+
+
+# Global service instance
+sync_watermark_service = SyncWatermarkService()
@@ -5,6 +5,8 @@ from typing import Optional, List, Dict, Any
 from sqlalchemy import func
 from uuid import UUID
 from datetime import datetime, timezone
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, func, or_, text
 
@@ -13,12 +15,15 @@ from app.models.sub_theme import SubTheme
 from app.models.customer_ask import CustomerAsk
 from app.models.message import Message
 from app.models.message_customer_ask import MessageCustomerAsk
+from app.services.cache_service import bump_taxonomy_version, get_cache_service, get_classification_version
+from app.services.executive_insights_service import executive_insights_service
 from app.schemas.theme import (
     ThemeCreate, ThemeUpdate, ThemeResponse, ThemeWithSubThemes, ThemeHierarchy,
     SubThemeCreate, SubThemeUpdate, SubThemeResponse, SubThemeWithCustomerAsks,
     CustomerAskCreate, CustomerAskUpdate, CustomerAskResponse
 )
 from app.schemas.mention import MentionResponse, AIInsightResponse, LinkedCustomerAsk
+from app.utils.transcript_renderer import format_transcript
 
 
 class ThemeService:
@@ -45,6 +50,7 @@ class ThemeService:
         self.db.add(theme)
         self.db.commit()
         self.db.refresh(theme)
+        bump_taxonomy_version(str(workspace_id))
         return theme
 
     def get_theme(self, theme_id: UUID) -> Optional[Theme]:
@@ -126,6 +132,7 @@ class ThemeService:
         theme.updated_at = datetime.now(timezone.utc)
         self.db.commit()
         self.db.refresh(theme)
+        bump_taxonomy_version(str(theme.workspace_id))
         return theme
 
     def delete_theme(self, theme_id: UUID) -> bool:
@@ -134,8 +141,10 @@ class ThemeService:
         if not theme:
             return False
 
+        workspace_id = theme.workspace_id
         self.db.delete(theme)
         self.db.commit()
+        bump_taxonomy_version(str(workspace_id))
         return True
 
     def reorder_themes(self, workspace_id: UUID, theme_ids: List[UUID]) -> List[Theme]:
@@ -151,6 +160,7 @@ class ThemeService:
                 theme_map[theme_id].sort_order = index
 
         self.db.commit()
+        bump_taxonomy_version(str(workspace_id))
         return self.list_themes(workspace_id)
 
 
@@ -179,6 +189,7 @@ class SubThemeService:
         self.db.add(sub_theme)
         self.db.commit()
         self.db.refresh(sub_theme)
+        bump_taxonomy_version(str(workspace_id))
         return sub_theme
 
     def get_sub_theme(self, sub_theme_id: UUID) -> Optional[SubTheme]:
@@ -244,6 +255,7 @@ class SubThemeService:
         sub_theme.updated_at = datetime.now(timezone.utc)
         self.db.commit()
         self.db.refresh(sub_theme)
+        bump_taxonomy_version(str(sub_theme.workspace_id))
         return sub_theme
 
     def delete_sub_theme(self, sub_theme_id: UUID) -> bool:
@@ -252,8 +264,10 @@ class SubThemeService:
         if not sub_theme:
             return False
 
+        workspace_id = sub_theme.workspace_id
         self.db.delete(sub_theme)
         self.db.commit()
+        bump_taxonomy_version(str(workspace_id))
         return True
 
     def move_sub_theme(self, sub_theme_id: UUID, new_theme_id: UUID) -> Optional[SubTheme]:
@@ -266,6 +280,7 @@ class SubThemeService:
         sub_theme.updated_at = datetime.now(timezone.utc)
         self.db.commit()
         self.db.refresh(sub_theme)
+        bump_taxonomy_version(str(sub_theme.workspace_id))
         return sub_theme
 
 
@@ -289,6 +304,7 @@ class CustomerAskService:
         )
         self.db.add(customer_ask)
         self.db.commit()
+        executive_insights_service.invalidate(workspace_id)
         self.db.refresh(customer_ask)
         return customer_ask
 
@@ -394,6 +410,7 @@ class CustomerAskService:
 
         customer_ask.updated_at = datetime.now(timezone.utc)
         self.db.commit()
+        executive_insights_service.invalidate(customer_ask.workspace_id)
         self.db.refresh(customer_ask)
         return customer_ask
 
@@ -403,8 +420,10 @@ class CustomerAskService:
         if not customer_ask:
             return False
 
+        workspace_id = customer_ask.workspace_id
         self.db.delete(customer_ask)
         self.db.commit()
+        executive_insights_service.invalidate(workspace_id)
         return True
 
     def increment_mention_count(
@@ -427,6 +446,7 @@ class CustomerAskService:
         customer_ask.updated_at = datetime.now(timezone.utc)
 
         self.db.commit()
+        executive_insights_service.invalidate(customer_ask.workspace_id)
         self.db.refresh(customer_ask)
         return customer_ask
 
@@ -443,6 +463,7 @@ class CustomerAskService:
         customer_ask.sub_theme_id = new_sub_theme_id
         customer_ask.updated_at = datetime.now(timezone.utc)
         self.db.commit()
+        executive_insights_service.invalidate(customer_ask.workspace_id)
         self.db.refresh(customer_ask)
         return customer_ask
 
@@ -614,6 +635,48 @@ class CustomerAskService:
         }
 
 
+# One transcript counts once per theme/sub-theme, whether mapped through the
+# top-level id or the id arrays
+TRANSCRIPT_COUNTS_SQL = text("""
+    SELECT 'theme' AS kind, t.id, COUNT(DISTINCT tc.id) AS count
+    FROM transcript_classifications tc
+    CROSS JOIN LATERAL unnest(array_append(COALESCE(tc.theme_ids, '{}'), tc.theme_id)) AS t(id)
+    WHERE tc.workspace_id = :workspace_id AND t.id IS NOT NULL
+    GROUP BY t.id
+    UNION ALL
+    SELECT 'sub_theme' AS kind, s.id, COUNT(DISTINCT tc.id) AS count
+    FROM transcript_classifications tc
+    CROSS JOIN LATERAL unnest(array_append(COALESCE(tc.sub_theme_ids, '{}'), tc.sub_theme_id)) AS s(id)
+    WHERE tc.workspace_id = :workspace_id AND s.id IS NOT NULL
+    GROUP BY s.id
+""")
+
+
+def _cached_transcript_counts(workspace_id: UUID) -> tuple:
+    """(classification version, cached counts or None)."""
+    version = get_classification_version(str(workspace_id))
+    if version is None:
+        return None, None
+    return version, get_cache_service().get("transcript_counts", str(workspace_id), str(version))
+
+
+def _store_transcript_counts(workspace_id: UUID, version: Optional[int], rows) -> Dict[str, Dict[str, int]]:
+    """Shape TRANSCRIPT_COUNTS_SQL rows and cache them under the classification version."""
+    theme_counts: Dict[str, int] = {}
+    sub_theme_counts: Dict[str, int] = {}
+    for kind, item_id, count in rows:
+        target = theme_counts if kind == 'theme' else sub_theme_counts
+        target[str(item_id)] = int(count)
+
+    counts = {
+        "theme_counts": theme_counts,
+        "sub_theme_counts": sub_theme_counts
+    }
+    if version is not None:
+        get_cache_service().set("transcript_counts", str(workspace_id), str(version), value=counts)
+    return counts
+
+
 class TranscriptClassificationService:
     """Service for managing transcript classifications"""
 
@@ -691,64 +754,16 @@ class TranscriptClassificationService:
                 "sub_theme_counts": { "sub_theme_id": count, ... }
             }
         
-        This is a lightweight query that only counts, doesn't fetch full transcript data.
-        Uses array columns for efficient counting.
+        Each transcript counts once per theme/sub-theme it is mapped to, via the
+        top-level id or the id arrays. Counted in SQL (unnest + COUNT(DISTINCT))
+        and cached per workspace classification version, which is bumped after
+        classifications are committed.
         """
-        from app.models.transcript_classification import TranscriptClassification
-        from sqlalchemy import func, text
-        
-        # Get all transcript classifications (lightweight - only IDs and array columns)
-        # This is still much faster than fetching full extracted_data
-        classifications = self.db.query(
-            TranscriptClassification.id,
-            TranscriptClassification.theme_id,
-            TranscriptClassification.sub_theme_id,
-            TranscriptClassification.theme_ids,
-            TranscriptClassification.sub_theme_ids
-        ).filter(
-            TranscriptClassification.workspace_id == workspace_id
-        ).all()
-        
-        # Count unique transcripts per theme and sub-theme
-        theme_counts: Dict[str, int] = {}
-        sub_theme_counts: Dict[str, int] = {}
-        
-        for tc in classifications:
-            # Track which themes/sub-themes this transcript is mapped to
-            transcript_themes = set()
-            transcript_sub_themes = set()
-            
-            # Add from theme_ids array
-            if tc.theme_ids:
-                for theme_id in tc.theme_ids:
-                    if theme_id:
-                        transcript_themes.add(str(theme_id))
-            
-            # Add from top-level theme_id
-            if tc.theme_id:
-                transcript_themes.add(str(tc.theme_id))
-            
-            # Add from sub_theme_ids array
-            if tc.sub_theme_ids:
-                for sub_theme_id in tc.sub_theme_ids:
-                    if sub_theme_id:
-                        transcript_sub_themes.add(str(sub_theme_id))
-            
-            # Add from top-level sub_theme_id
-            if tc.sub_theme_id:
-                transcript_sub_themes.add(str(tc.sub_theme_id))
-            
-            # Count this transcript once for each theme/sub-theme it's mapped to
-            for theme_id in transcript_themes:
-                theme_counts[theme_id] = theme_counts.get(theme_id, 0) + 1
-            
-            for sub_theme_id in transcript_sub_themes:
-                sub_theme_counts[sub_theme_id] = sub_theme_counts.get(sub_theme_id, 0) + 1
-        
-        return {
-            "theme_counts": theme_counts,
-            "sub_theme_counts": sub_theme_counts
-        }
+        version, counts = _cached_transcript_counts(workspace_id)
+        if counts is None:
+            rows = self.db.execute(TRANSCRIPT_COUNTS_SQL, {"workspace_id": workspace_id}).all()
+            counts = _store_transcript_counts(workspace_id, version, rows)
+        return counts
 
     def search_transcript_classifications(
         self,
@@ -783,175 +798,13 @@ class TranscriptClassificationService:
         - Timeline trends
         - Health signals
         - Feature request frequency
-        """
-        from app.models.transcript_classification import TranscriptClassification
-        from app.models.theme import Theme
-        from sqlalchemy import func, case
-        from datetime import datetime, timedelta
-        from collections import defaultdict
-        import json
-        
-        # Get all completed transcript classifications
-        classifications = self.db.query(
-            TranscriptClassification.id,
-            TranscriptClassification.source_type,
-            TranscriptClassification.source_title,
-            TranscriptClassification.extracted_data,
-            TranscriptClassification.transcript_date,
-            TranscriptClassification.created_at,
-            TranscriptClassification.theme_ids,
-            TranscriptClassification.sub_theme_ids,
-        ).filter(
-            TranscriptClassification.workspace_id == workspace_id,
-            TranscriptClassification.processing_status == 'completed'
-        ).all()
-        
-        total_transcripts = len(classifications)
-        
-        # Initialize aggregation structures
-        sentiment_distribution = {'positive': 0, 'neutral': 0, 'negative': 0}
-        deal_risk_distribution = defaultdict(int)
-        churn_risk_distribution = defaultdict(int)
-        expansion_signal_distribution = defaultdict(int)
-        source_type_distribution = defaultdict(int)
-        theme_mentions = defaultdict(int)
-        company_mentions = defaultdict(int)
-        health_signals = {'positive': 0, 'negative': 0}
-        feature_mappings_count = 0
-        total_speakers = 0
-        transcripts_by_date = defaultdict(int)
-        call_types = defaultdict(int)
-        top_themes = []
-        top_companies = []
-        
-        # Process each classification
-        for tc in classifications:
-            extracted_data = tc.extracted_data or {}
-            
-            # Source type
-            source_type_distribution[tc.source_type or 'unknown'] += 1
-            
-            # Date tracking
-            if tc.transcript_date:
-                date_key = tc.transcript_date.date().isoformat()
-                transcripts_by_date[date_key] += 1
-            elif tc.created_at:
-                date_key = tc.created_at.date().isoformat()
-                transcripts_by_date[date_key] += 1
-            
-            # Sentiment from call_metadata
-            call_metadata = extracted_data.get('call_metadata', {})
-            overall_sentiment = call_metadata.get('overall_sentiment')
-            if overall_sentiment is not None:
-                if overall_sentiment > 0.1:
-                    sentiment_distribution['positive'] += 1
-                elif overall_sentiment < -0.1:
-                    sentiment_distribution['negative'] += 1
-                else:
-                    sentiment_distribution['neutral'] += 1
-            
-            # Call type
-            call_type = call_metadata.get('call_type')
-            if call_type:
-                call_types[call_type.replace('_', ' ').title()] += 1
-            
-            # Risk assessment
-            risk_assessment = extracted_data.get('risk_assessment', {})
-            if risk_assessment.get('deal_risk'):
-                deal_risk_distribution[risk_assessment['deal_risk'].lower()] += 1
-            if risk_assessment.get('churn_risk') and risk_assessment.get('churn_risk') != 'n/a':
-                churn_risk_distribution[risk_assessment['churn_risk'].lower()] += 1
-            if risk_assessment.get('expansion_signal'):
-                expansion_signal_distribution[risk_assessment['expansion_signal'].lower()] += 1
-            
-            # Customer metadata
-            customer_metadata = extracted_data.get('customer_metadata', {})
-            company_name = customer_metadata.get('company_name')
-            if company_name:
-                company_mentions[company_name] += 1
-            
-            # Health signals
-            key_insights = extracted_data.get('key_insights', {})
-            health_signals_data = key_insights.get('health_signals', {})
-            if health_signals_data:
-                if health_signals_data.get('positive'):
-                    health_signals['positive'] += len(health_signals_data.get('positive', []))
-                if health_signals_data.get('negative'):
-                    health_signals['negative'] += len(health_signals_data.get('negative', []))
-            
-            # Feature mappings
-            mappings = extracted_data.get('mappings', [])
-            feature_mappings_count += len(mappings)
-            
-            # Speakers
-            speakers = extracted_data.get('speakers', [])
-            total_speakers += len(speakers)
-            
-            # Theme mentions (from theme_ids array)
-            if tc.theme_ids:
-                for theme_id in tc.theme_ids:
-                    theme_mentions[str(theme_id)] += 1
-        
-        # Get theme names for top themes
-        theme_ids_list = list(theme_mentions.keys())
-        if theme_ids_list:
-            themes = self.db.query(Theme).filter(
-                Theme.id.in_([UUID(tid) for tid in theme_ids_list if tid]),
-                Theme.workspace_id == workspace_id
-            ).all()
-            theme_map = {str(t.id): t.name for t in themes}
-            
-            # Build top themes list
-            top_themes_data = [
-                {'theme_id': tid, 'name': theme_map.get(tid, tid), 'count': count}
-                for tid, count in sorted(theme_mentions.items(), key=lambda x: x[1], reverse=True)[:10]
-            ]
-            top_themes = top_themes_data
         
-        # Top companies
-        top_companies = [
-            {'name': name, 'count': count}
-            for name, count in sorted(company_mentions.items(), key=lambda x: x[1], reverse=True)[:10]
-        ]
-        
-        # Timeline data (last 30 days)
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=30)
-        timeline_data = []
-        current_date = start_date
-        while current_date <= end_date:
-            date_key = current_date.isoformat()
-            timeline_data.append({
-                'date': date_key,
-                'count': transcripts_by_date.get(date_key, 0)
-            })
-            current_date += timedelta(days=1)
-        
-        # Calculate averages
-        avg_feature_mappings = feature_mappings_count / total_transcripts if total_transcripts > 0 else 0
-        avg_speakers = total_speakers / total_transcripts if total_transcripts > 0 else 0
+        Read from the per-day transcript_insight_rollups counters maintained as
+        classifications are saved (see transcript_insights_service).
+        """
+        from app.services.transcript_insights_service import transcript_insights_service
         
-        return {
-            'summary': {
-                'total_transcripts': total_transcripts,
-                'total_feature_mappings': feature_mappings_count,
-                'total_speakers': total_speakers,
-                'avg_feature_mappings_per_transcript': round(avg_feature_mappings, 2),
-                'avg_speakers_per_transcript': round(avg_speakers, 2),
-            },
-            'sentiment_distribution': sentiment_distribution,
-            'risk_assessment': {
-                'deal_risk': dict(deal_risk_distribution),
-                'churn_risk': dict(churn_risk_distribution),
-                'expansion_signal': dict(expansion_signal_distribution),
-            },
-            'source_type_distribution': dict(source_type_distribution),
-            'call_types': dict(call_types),
-            'top_themes': top_themes,
-            'top_companies': top_companies,
-            'health_signals': health_signals,
-            'timeline': timeline_data,
-        }
+        return transcript_insights_service.get_insights(self.db, workspace_id)
 
     def get_raw_transcript(
         self,
@@ -987,128 +840,32 @@ class TranscriptClassificationService:
             return None
 
         # Format the transcript
-        return self._format_transcript_as_text(raw_transcript.raw_data)
-
-    def _format_transcript_as_text(self, raw_data: Dict) -> str:
-        """Format raw transcript data as readable text with speaker names and dialogue.
-
-        Handles multiple raw_data formats:
-        1. Nested format from gong_ingestion_service: {call_data: {..., parties: [...]}, transcript: {...}}
-        2. Direct format: {parties: [...], transcript: [...], metaData: {...}}
-        """
-        if not raw_data:
-            return "No transcript available."
-
-        # Handle nested structure from gong_ingestion_service
-        # raw_data = {"call_data": {...}, "transcript": {...}}
-        call_data = raw_data.get('call_data', {})
-
-        # Build speaker mapping from parties
-        # Try nested location first (call_data.parties), then root level (parties)
-        parties = call_data.get('parties', []) if call_data else []
-        if not parties:
-            parties = raw_data.get('parties', [])
-
-        speaker_map = {}
-        for party in parties:
-            speaker_id = party.get('speakerId')
-            if speaker_id:
-                name = party.get('name', 'Unknown')
-                email = party.get('emailAddress', '')
-                speaker_map[str(speaker_id)] = {
-                    'name': name,
-                    'email': email
-                }
-
-        # Get transcript data - handle nested structure
-        # In nested format: raw_data['transcript'] contains the transcript API response
-        transcript_data = raw_data.get('transcript', {})
-        if isinstance(transcript_data, dict):
-            transcript_segments = transcript_data.get('transcript', [])
-        elif isinstance(transcript_data, list):
-            transcript_segments = transcript_data
-        else:
-            transcript_segments = []
-
-        if not isinstance(transcript_segments, list):
-            if 'content' in raw_data:
-                return str(raw_data['content'])
-            return "Transcript format not recognized."
-
-        lines = []
-
-        # Add header - try nested location first (call_data.metaData), then root level
-        call_metadata = call_data.get('metaData', {}) if call_data else {}
-        if not call_metadata:
-            call_metadata = raw_data.get('call_metadata', raw_data.get('metaData', {}))
-        title = call_metadata.get('title', 'Untitled Call')
-        started = call_metadata.get('started', '')
-
-        lines.append("=" * 80)
-        lines.append(f"Call: {title}")
-        if started:
-            lines.append(f"Date: {started}")
-        lines.append("=" * 80)
-        lines.append("")
-
-        for segment in transcript_segments:
-            if not isinstance(segment, dict):
-                continue
+        return format_transcript(raw_transcript.raw_data)
 
-            # Check for Fathom format first (speaker object with display_name)
-            speaker_obj = segment.get('speaker')
-            if speaker_obj and isinstance(speaker_obj, dict):
-                # Fathom format: speaker info is directly in the segment
-                name = speaker_obj.get('display_name', 'Unknown Speaker')
-                email = speaker_obj.get('matched_calendar_invitee_email', '') or speaker_obj.get('email', '')
-                text = segment.get('text', '').strip()
-
-                if text:
-                    if email:
-                        lines.append(f"{name} ({email}):")
-                    else:
-                        lines.append(f"{name}:")
-                    lines.append(f"  {text}")
-                    lines.append("")
-                continue
-
-            # Gong format: use speakerId to lookup in speaker_map
-            speaker_id = str(segment.get('speakerId', ''))
-            speaker_info = speaker_map.get(speaker_id, {'name': 'Unknown Speaker', 'email': ''})
-
-            name = speaker_info['name']
-            email = speaker_info['email']
-
-            # Extract sentences
-            sentences = segment.get('sentences', [])
-            if not sentences:
-                text = segment.get('text', '')
-                if text:
-                    sentences = [{'text': text}]
-                else:
-                    continue
-
-            # Combine all sentences for this speaker segment
-            text_parts = []
-            for sentence in sentences:
-                if isinstance(sentence, dict):
-                    text = sentence.get('text', '').strip()
-                    if text:
-                        text_parts.append(text)
-                elif isinstance(sentence, str):
-                    text_parts.append(sentence.strip())
-
-            if not text_parts:
-                continue
 
-            full_text = ' '.join(text_parts)
+class AsyncTranscriptClassificationService:
+    """Read-only transcript classification queries for `async def` routes (AsyncSession)"""
 
-            # Format: Name (email): what they said
-            if email:
-                lines.append(f"{name} ({email}):")
-            else:
-                lines.append(f"{name}:")
-            lines.append(f"  {full_text}")
-            lines.append("")
+    def __init__(self, db: AsyncSession):
+        self.db = db
 
-        return "\n".join(lines) if lines else "No transcript content found."
+    async def get_transcript_classification_counts(
+        self,
+        workspace_id: UUID
+    ) -> Dict[str, Dict[str, int]]:
+        """See TranscriptClassificationService.get_transcript_classification_counts"""
+        # CacheService is a blocking Redis client; keep it off the event loop
+        version, counts = await run_in_threadpool(_cached_transcript_counts, workspace_id)
+        if counts is None:
+            rows = (await self.db.execute(TRANSCRIPT_COUNTS_SQL, {"workspace_id": workspace_id})).all()
+            counts = await run_in_threadpool(_store_transcript_counts, workspace_id, version, rows)
+        return counts
+
+    async def get_transcript_insights(
+        self,
+        workspace_id: UUID
+    ) -> Dict:
+        """See TranscriptClassificationService.get_transcript_insights"""
+        from app.services.transcript_insights_service import transcript_insights_service
+        
+        return await transcript_insights_service.aget_insights(self.db, workspace_id)
@@ -0,0 +1,357 @@
+"""
+Transcript Insights Service - Rollup-backed transcript insights dashboard.
+
+The insights endpoint used to load every completed classification with its
+full extracted_data and walk sentiment, risk, call types, companies and
+health signals in Python on each request, so it slowed down linearly with
+history. Those counters are now kept in transcript_insight_rollups, one row
+per (workspace, day, dimension, key):
+
+    transcripts       ""                         transcripts classified
+    feature_mappings  ""                         sum of len(mappings)
+    speakers          ""                         sum of len(speakers)
+    sentiment         positive/neutral/negative  call_metadata.overall_sentiment
+    deal_risk / churn_risk / expansion_signal    risk_assessment values
+    source_type       gong/fathom/...
+    call_type         "Discovery Call", ...
+    company           customer_metadata.company_name
+    theme             theme id (from theme_ids)
+    health_signal     positive/negative          sum of key_insights.health_signals lengths
+
+_save_classification() calls record_classification() in its transaction, which
+adds the new classification's counters and subtracts the ones it replaces, so
+reading the dashboard is two grouped queries over O(days + keys) rows.
+
+Backfill scripts that edit classifications do the same. Anything else (manual
+SQL, restored data) leaves the rollup stale; rebuild() recomputes a workspace
+from scratch. The migration that adds the table doesn't count history, so
+deploying it is followed by a rebuild of every workspace:
+
+    python scripts/rebuild_transcript_insights.py --all
+    python scripts/rebuild_transcript_insights.py --workspace-id <uuid>
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.transcript_classification import TranscriptClassification
+from app.models.transcript_insight_rollup import TranscriptInsightRollup
+
+logger = logging.getLogger(__name__)
+
+# (dimension, key) -> count
+InsightCounts = Dict[Tuple[str, str], int]
+
+MAX_KEY_LENGTH = 255
+TOP_N = 10
+TIMELINE_DAYS = 30
+REBUILD_BATCH_SIZE = 500
+
+
+def _add(counts: InsightCounts, dimension: str, key: Any = "", amount: int = 1) -> None:
+    if amount:
+        k = (dimension, str(key)[:MAX_KEY_LENGTH])
+        counts[k] = counts.get(k, 0) + amount
+
+
+class TranscriptInsightsService:
+    """Maintain and read transcript_insight_rollups."""
+
+    @staticmethod
+    def classification_day(transcript_date: Optional[datetime], created_at: Optional[datetime] = None) -> date:
+        """Day a classification is counted on: transcript date, else classification date."""
+        when = transcript_date or created_at or datetime.now(timezone.utc)
+        return when.date()
+
+    @staticmethod
+    def classification_counts(
+        extracted_data: Optional[Dict[str, Any]],
+        source_type: Optional[str],
+        theme_ids: Optional[Iterable[Any]],
+    ) -> InsightCounts:
+        """Counters one completed classification contributes to its day."""
+        extracted_data = extracted_data or {}
+        counts: InsightCounts = {}
+
+        _add(counts, "transcripts")
+        _add(counts, "source_type", source_type or "unknown")
+
+        call_metadata = extracted_data.get("call_metadata") or {}
+        overall_sentiment = call_metadata.get("overall_sentiment")
+        if overall_sentiment is not None:
+            try:
+                overall_sentiment = float(overall_sentiment)
+            except (TypeError, ValueError):
+                overall_sentiment = None
+        if overall_sentiment is not None:
+            if overall_sentiment > 0.1:
+                _add(counts, "sentiment", "positive")
+            elif overall_sentiment < -0.1:
+                _add(counts, "sentiment", "negative")
+            else:
+                _add(counts, "sentiment", "neutral")
+
+        call_type = call_metadata.get("call_type")
+        if call_type:
+            _add(counts, "call_type", str(call_type).replace("_", " ").title())
+
+        risk_assessment = extracted_data.get("risk_assessment") or {}
+        if risk_assessment.get("deal_risk"):
+            _add(counts, "deal_risk", str(risk_assessment["deal_risk"]).lower())
+        if risk_assessment.get("churn_risk") and risk_assessment.get("churn_risk") != "n/a":
+            _add(counts, "churn_risk", str(risk_assessment["churn_risk"]).lower())
+        if risk_assessment.get("expansion_signal"):
+            _add(counts, "expansion_signal", str(risk_assessment["expansion_signal"]).lower())
+
+        company_name = (extracted_data.get("customer_metadata") or {}).get("company_name")
+        if company_name:
+            _add(counts, "company", company_name)
+
+        health_signals = (extracted_data.get("key_insights") or {}).get("health_signals") or {}
+        _add(counts, "health_signal", "positive", len(health_signals.get("positive") or []))
+        _add(counts, "health_signal", "negative", len(health_signals.get("negative") or []))
+
+        _add(counts, "feature_mappings", amount=len(extracted_data.get("mappings") or []))
+        _add(counts, "speakers", amount=len(extracted_data.get("speakers") or []))
+
+        for theme_id in theme_ids or []:
+            if theme_id:
+                _add(counts, "theme", theme_id)
+
+        return counts
+
+    def apply(self, db: Session, workspace_id: UUID, day: date, counts: InsightCounts) -> None:
+        """Add counts (negative to subtract) to a workspace day. Does not commit."""
+        rows = [
+            {"workspace_id": workspace_id, "day": day, "dimension": dimension, "key": key, "count": count}
+            # Sorted so concurrent writers lock rows in the same order
+            for (dimension, key), count in sorted(counts.items())
+            if count
+        ]
+        if not rows:
+            return
+        stmt = pg_insert(TranscriptInsightRollup).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_transcript_insight_rollups_key",
+            set_={
+                "count": TranscriptInsightRollup.count + stmt.excluded.count,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    def snapshot(self, classification: TranscriptClassification) -> Optional[Tuple[date, InsightCounts]]:
+        """Day and counters a classification currently contributes (None unless completed)."""
+        if classification.processing_status != "completed":
+            return None
+        return (
+            self.classification_day(classification.transcript_date, classification.created_at),
+            self.classification_counts(
+                classification.extracted_data, classification.source_type, classification.theme_ids
+            ),
+        )
+
+    def record_classification(
+        self,
+        db: Session,
+        classification: TranscriptClassification,
+        previous: Optional[Tuple[date, InsightCounts]] = None,
+    ) -> None:
+        """
+        Update the rollup for a saved classification. Does not commit.
+
+        Args:
+            db: Session holding the classification's transaction
+            classification: The classification as saved
+            previous: snapshot() taken before it was overwritten, for re-classifications
+        """
+        current = self.snapshot(classification)
+        deltas: Dict[date, InsightCounts] = {}
+        if previous:
+            day, counts = previous
+            for k, count in counts.items():
+                _add(deltas.setdefault(day, {}), k[0], k[1], -count)
+        if current:
+            day, counts = current
+            for k, count in counts.items():
+                _add(deltas.setdefault(day, {}), k[0], k[1], count)
+
+        for day in sorted(deltas):
+            self.apply(db, classification.workspace_id, day, deltas[day])
+
+    def rebuild(self, db: Session, workspace_id: UUID) -> int:
+        """
+        Recompute a workspace's rollup from its classifications. Does not commit.
+
+        Returns:
+            Number of classifications counted
+        """
+        db.query(TranscriptInsightRollup).filter(
+            TranscriptInsightRollup.workspace_id == workspace_id
+        ).delete(synchronize_session=False)
+
+        by_day: Dict[date, InsightCounts] = {}
+        counted = 0
+        rows = db.query(
+            TranscriptClassification.source_type,
+            TranscriptClassification.extracted_data,
+            TranscriptClassification.theme_ids,
+            TranscriptClassification.transcript_date,
+            TranscriptClassification.created_at,
+        ).filter(
+            TranscriptClassification.workspace_id == workspace_id,
+            TranscriptClassification.processing_status == "completed",
+        ).yield_per(REBUILD_BATCH_SIZE)
+
+        for tc in rows:
+            day_counts = by_day.setdefault(self.classification_day(tc.transcript_date, tc.created_at), {})
+            for (dimension, key), count in self.classification_counts(
+                tc.extracted_data, tc.source_type, tc.theme_ids
+            ).items():
+                _add(day_counts, dimension, key, count)
+            counted += 1
+
+        for day in sorted(by_day):
+            self.apply(db, workspace_id, day, by_day[day])
+
+        logger.info(f"Rebuilt transcript insights for workspace {workspace_id}: {counted} classifications, {len(by_day)} days")
+        return counted
+
+    def get_insights(self, db: Session, workspace_id: UUID) -> Dict[str, Any]:
+        """Transcript insights dashboard for a workspace, read from the rollup."""
+        totals = self._collect_totals(db.execute(self._totals_query(workspace_id)).all())
+        top_themes = self._top(totals, "theme")
+        theme_names = db.execute(self._theme_names_query(workspace_id, top_themes)).all() if top_themes else []
+        start_date, end_date = self._timeline_range()
+        timeline = db.execute(self._timeline_query(workspace_id, start_date, end_date)).all()
+        return self._build(totals, top_themes, theme_names, timeline, start_date)
+
+    async def aget_insights(self, db: AsyncSession, workspace_id: UUID) -> Dict[str, Any]:
+        """get_insights() on an async session."""
+        totals = self._collect_totals((await db.execute(self._totals_query(workspace_id))).all())
+        top_themes = self._top(totals, "theme")
+        theme_names = (await db.execute(self._theme_names_query(workspace_id, top_themes))).all() if top_themes else []
+        start_date, end_date = self._timeline_range()
+        timeline = (await db.execute(self._timeline_query(workspace_id, start_date, end_date))).all()
+        return self._build(totals, top_themes, theme_names, timeline, start_date)
+
+    # Queries and response shaping shared by get_insights() and aget_insights()
+
+    @staticmethod
+    def _totals_query(workspace_id: UUID):
+        return select(
+            TranscriptInsightRollup.dimension,
+            TranscriptInsightRollup.key,
+            func.sum(TranscriptInsightRollup.count),
+        ).where(
+            TranscriptInsightRollup.workspace_id == workspace_id
+        ).group_by(
+            TranscriptInsightRollup.dimension,
+            TranscriptInsightRollup.key,
+        )
+
+    @staticmethod
+    def _theme_names_query(workspace_id: UUID, top_themes):
+        from app.models.theme import Theme
+
+        theme_uuids = []
+        for tid, _ in top_themes:
+            try:
+                theme_uuids.append(UUID(tid))
+            except ValueError:
+                pass
+        return select(Theme.id, Theme.name).where(
+            Theme.id.in_(theme_uuids),
+            Theme.workspace_id == workspace_id,
+        )
+
+    @staticmethod
+    def _timeline_range() -> Tuple[date, date]:
+        # Timeline data (last 30 days)
+        end_date = datetime.now().date()
+        return end_date - timedelta(days=TIMELINE_DAYS), end_date
+
+    @staticmethod
+    def _timeline_query(workspace_id: UUID, start_date: date, end_date: date):
+        return select(
+            TranscriptInsightRollup.day,
+            TranscriptInsightRollup.count,
+        ).where(
+            TranscriptInsightRollup.workspace_id == workspace_id,
+            TranscriptInsightRollup.dimension == "transcripts",
+            TranscriptInsightRollup.day >= start_date,
+            TranscriptInsightRollup.day <= end_date,
+        )
+
+    @staticmethod
+    def _collect_totals(rows) -> Dict[str, Dict[str, int]]:
+        totals: Dict[str, Dict[str, int]] = {}
+        for dimension, key, count in rows:
+            if count:
+                totals.setdefault(dimension, {})[key] = int(count)
+        return totals
+
+    @staticmethod
+    def _top(totals: Dict[str, Dict[str, int]], dimension: str):
+        return sorted(totals.get(dimension, {}).items(), key=lambda x: x[1], reverse=True)[:TOP_N]
+
+    def _build(self, totals, top_themes, theme_names, timeline, start_date: date) -> Dict[str, Any]:
+        theme_map = {str(theme_id): name for theme_id, name in theme_names}
+        transcripts_by_date = {day: int(count or 0) for day, count in timeline}
+        timeline_data = [
+            {'date': (start_date + timedelta(days=i)).isoformat(),
+             'count': transcripts_by_date.get(start_date + timedelta(days=i), 0)}
+            for i in range(TIMELINE_DAYS + 1)
+        ]
+
+        total_transcripts = totals.get("transcripts", {}).get("", 0)
+        feature_mappings_count = totals.get("feature_mappings", {}).get("", 0)
+        total_speakers = totals.get("speakers", {}).get("", 0)
+        avg_feature_mappings = feature_mappings_count / total_transcripts if total_transcripts > 0 else 0
+        avg_speakers = total_speakers / total_transcripts if total_transcripts > 0 else 0
+
+        sentiment = totals.get("sentiment", {})
+        health = totals.get("health_signal", {})
+
+        return {
+            'summary': {
+                'total_transcripts': total_transcripts,
+                'total_feature_mappings': feature_mappings_count,
+                'total_speakers': total_speakers,
+                'avg_feature_mappings_per_transcript': round(avg_feature_mappings, 2),
+                'avg_speakers_per_transcript': round(avg_speakers, 2),
+            },
+            'sentiment_distribution': {
+                'positive': sentiment.get('positive', 0),
+                'neutral': sentiment.get('neutral', 0),
+                'negative': sentiment.get('negative', 0),
+            },
+            'risk_assessment': {
+                'deal_risk': totals.get("deal_risk", {}),
+                'churn_risk': totals.get("churn_risk", {}),
+                'expansion_signal': totals.get("expansion_signal", {}),
+            },
+            'source_type_distribution': totals.get("source_type", {}),
+            'call_types': totals.get("call_type", {}),
+            'top_themes': [
+                {'theme_id': tid, 'name': theme_map.get(tid, tid), 'count': count}
+                for tid, count in top_themes
+            ],
+            'top_companies': [{'name': name, 'count': count} for name, count in self._top(totals, "company")],
+            'health_signals': {
+                'positive': health.get('positive', 0),
+                'negative': health.get('negative', 0),
+            },
+            'timeline': timeline_data,
+        }
+
+
+# Global service instance
+transcript_insights_service = TranscriptInsightsService()
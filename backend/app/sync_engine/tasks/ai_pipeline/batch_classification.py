@@ -0,0 +1,527 @@
+"""
+Batch Classification Tasks (OpenAI Batch API backfills)
+
+When a workspace connects a source with months of history, classifying the
+backlog through process_raw_transcripts pays real-time latency and full price
+for every call. This module classifies large backlogs with the OpenAI Batch
+API instead (half price, 24h completion window):
+
+1. submit_classification_batch: packs pending transcripts (chunked exactly
+   like the real-time path) into a JSONL file, uploads it and creates a batch.
+   Transcripts are linked to the ClassificationBatch row so the real-time
+   task skips them.
+2. poll_classification_batches (beat, every 5 min): refreshes batch status,
+   applies completed output through _save_classification, releases
+   transcripts of failed/expired batches, and submits a new batch when the
+   pending backlog is large enough.
+
+All state lives in classification_batches, so a worker restart at any point
+only delays the batch. Set OPENAI_BATCH_BASE_URL to run against a local
+stand-in server (see scripts/openai_batch_stub_server.py).
+"""
+
+import json
+import logging
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from celery import shared_task
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.classification_batch import ClassificationBatch
+from app.models.raw_transcript import RawTranscript
+from app.services.cache_service import bump_classification_version
+from app.services.llm_result_cache_service import LLMCacheKey
+from app.services.openai_clients import get_openai_batch_client
+from app.sync_engine.tasks.ai_pipeline.transcript_processing import (
+    CLASSIFICATION_MAX_OUTPUT_TOKENS,
+    CLASSIFICATION_MODEL,
+    MAX_RETRIES,
+    _apply_chunk_results,
+    _build_classification_messages,
+    _claim_pending_transcripts,
+    _classification_cache_key,
+    _enqueue_theme_slack_notifications,
+    _get_classification_prompt,
+    _load_prompt_variable_chunks,
+    _parse_ai_response,
+    _release_transcript_leases,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+# gpt-4o-mini Batch API pricing in USD per 1M tokens (50% of real-time pricing)
+BATCH_INPUT_PRICE_PER_MTOK = 0.075
+BATCH_OUTPUT_PRICE_PER_MTOK = 0.30
+
+# Pending transcripts needed before the poller starts a backfill batch on its own
+BATCH_BACKFILL_THRESHOLD = 200
+
+# A batch stuck in "submitting" this long (worker died mid-submit) is adopted from
+# OpenAI if the create call got through, otherwise released
+SUBMIT_STALE_AFTER = timedelta(minutes=30)
+
+OPENAI_FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+
+def _custom_id(transcript_id: UUID, chunk_index: int, chunk_count: int) -> str:
+    return f"{transcript_id}:{chunk_index}:{chunk_count}"
+
+
+def _parse_custom_id(custom_id: str) -> Tuple[UUID, int, int]:
+    transcript_id, chunk_index, chunk_count = custom_id.split(":")
+    return UUID(transcript_id), int(chunk_index), int(chunk_count)
+
+
+def _batch_cost_usd(prompt_tokens: int, completion_tokens: int) -> float:
+    return round(
+        prompt_tokens / 1_000_000 * BATCH_INPUT_PRICE_PER_MTOK
+        + completion_tokens / 1_000_000 * BATCH_OUTPUT_PRICE_PER_MTOK,
+        4,
+    )
+
+
+def _build_batch_requests(
+    db: Session,
+    transcripts: List[RawTranscript],
+    prompt: Any,
+    prompt_version: str,
+) -> Tuple[List[str], Dict[str, Any], List[UUID]]:
+    """
+    Build JSONL request lines for a set of transcripts (one line per chunk).
+
+    Returns:
+        Tuple of (jsonl lines, request_meta by custom_id, included transcript ids)
+    """
+    lines: List[str] = []
+    request_meta: Dict[str, Any] = {}
+    included: List[UUID] = []
+
+    for transcript in transcripts:
+        try:
+            variable_chunks = _load_prompt_variable_chunks(db, transcript)
+            chunk_lines = []
+            for chunk_index, variables in enumerate(variable_chunks):
+                custom_id = _custom_id(transcript.id, chunk_index, len(variable_chunks))
+                chunk_lines.append(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": {
+                        "model": CLASSIFICATION_MODEL,
+                        "messages": _build_classification_messages(variables, prompt),
+                        "temperature": 0,
+                        "response_format": {"type": "json_object"},
+                        "max_tokens": CLASSIFICATION_MAX_OUTPUT_TOKENS,
+                    },
+                }))
+                request_meta[custom_id] = asdict(_classification_cache_key(variables, prompt_version))
+        except Exception as e:
+            logger.error(f"Skipping transcript {transcript.id} in batch build: {e}")
+            continue
+
+        lines.extend(chunk_lines)
+        included.append(transcript.id)
+
+    return lines, request_meta, included
+
+
+def _release_transcripts(db: Session, batch: ClassificationBatch, error: Optional[str] = None) -> int:
+    """Unlink all transcripts still attached to a batch so the real-time path picks them up."""
+    values: Dict[Any, Any] = {
+        RawTranscript.classification_batch_id: None,
+        RawTranscript.processing_started_at: None,
+    }
+    if error:
+        values[RawTranscript.processing_error] = error[:1000]
+    return db.query(RawTranscript).filter(
+        RawTranscript.classification_batch_id == batch.id
+    ).update(values, synchronize_session=False)
+
+
+def _fail_batch_transcript(db: Session, transcript_id: UUID, error: str) -> None:
+    """Roll back, then record a failure and release one transcript from its batch."""
+    db.rollback()
+    try:
+        transcript = db.query(RawTranscript).filter(RawTranscript.id == transcript_id).first()
+        if transcript:
+            transcript.processing_error = error[:1000]
+            transcript.retry_count += 1
+            transcript.classification_batch_id = None
+            transcript.processing_started_at = None
+            db.commit()
+    except Exception as update_err:
+        logger.error(f"Failed to release transcript {transcript_id} from batch: {update_err}")
+        db.rollback()
+
+
+def submit_batch(
+    db: Session,
+    workspace_id: Optional[str] = None,
+    max_transcripts: Optional[int] = None,
+    transcript_ids: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Pack pending transcripts into one OpenAI Batch API job and submit it.
+
+    transcript_ids restricts the claim to those transcripts (large ingestions).
+
+    Returns:
+        Dict with batch id and counts, or a skip reason
+    """
+    client = get_openai_batch_client()
+    if not client:
+        return {"status": "skipped", "reason": "OpenAI not configured"}
+
+    prompt = _get_classification_prompt()
+    prompt_version = f"langfuse-v{prompt.version}"
+
+    # Same lease-based claim as the real-time path, so the two never overlap
+    max_transcripts = max_transcripts or settings.CLASSIFICATION_BATCH_MAX_TRANSCRIPTS
+    transcripts = _claim_pending_transcripts(db, workspace_id, max_transcripts, transcript_ids)
+    if not transcripts:
+        return {"status": "skipped", "reason": "no pending transcripts"}
+
+    lines, request_meta, transcript_ids = _build_batch_requests(db, transcripts, prompt, prompt_version)
+    included = set(transcript_ids)
+    _release_transcript_leases(db, [t.id for t in transcripts if t.id not in included])
+    if not lines:
+        return {"status": "skipped", "reason": "no transcripts could be prepared"}
+
+    # Record the batch and claim its transcripts before talking to OpenAI
+    batch = ClassificationBatch(
+        workspace_id=UUID(workspace_id) if workspace_id else None,
+        status="submitting",
+        model=CLASSIFICATION_MODEL,
+        prompt_version=prompt_version,
+        request_meta=request_meta,
+        transcript_count=len(transcript_ids),
+        request_count=len(lines),
+    )
+    db.add(batch)
+    db.flush()
+    db.query(RawTranscript).filter(RawTranscript.id.in_(transcript_ids)).update(
+        {RawTranscript.classification_batch_id: batch.id}, synchronize_session=False
+    )
+    db.commit()
+
+    try:
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        input_file = client.files.create(file=(f"classification_batch_{batch.id}.jsonl", payload), purpose="batch")
+        remote = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+            metadata={"classification_batch_id": str(batch.id)},
+        )
+    except Exception as e:
+        logger.error(f"Failed to submit classification batch {batch.id}: {e}", exc_info=True)
+        db.rollback()
+        batch.status = "failed"
+        batch.error = str(e)[:1000]
+        _release_transcripts(db, batch)
+        db.commit()
+        return {"status": "failed", "batch_id": str(batch.id), "error": str(e)}
+
+    batch.input_file_id = input_file.id
+    batch.openai_batch_id = remote.id
+    batch.openai_status = remote.status
+    batch.status = "submitted"
+    batch.submitted_at = datetime.now(timezone.utc)
+    db.commit()
+
+    logger.info(
+        f"Submitted classification batch {batch.id} ({remote.id}): "
+        f"{len(transcript_ids)} transcripts, {len(lines)} requests, {len(payload)} bytes"
+    )
+    return {
+        "status": "submitted",
+        "batch_id": str(batch.id),
+        "openai_batch_id": remote.id,
+        "transcripts": len(transcript_ids),
+        "requests": len(lines),
+    }
+
+
+def _find_remote_batch(client: Any, batch: ClassificationBatch) -> Optional[Any]:
+    """
+    Find the OpenAI batch created for a row stuck in "submitting".
+
+    Matches on the classification_batch_id metadata sent with batches.create. The
+    list is newest first, so the scan stops at batches created before the row
+    (less a few minutes for clock skew between us and OpenAI).
+    """
+    created_after = (batch.created_at - timedelta(minutes=5)).timestamp()
+    for remote in client.batches.list(limit=100):
+        if remote.created_at < created_after:
+            break
+        if (remote.metadata or {}).get("classification_batch_id") == str(batch.id):
+            return remote
+    return None
+
+
+def _read_batch_output(client: Any, file_id: Optional[str]) -> List[Dict[str, Any]]:
+    """Download and parse a batch output/error JSONL file."""
+    if not file_id:
+        return []
+    content = client.files.content(file_id).text
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+
+def apply_batch(db: Session, client: Any, batch: ClassificationBatch) -> Dict[str, Any]:
+    """
+    Apply a completed batch's output and report throughput and cost.
+
+    Transcripts whose chunks all succeeded are saved through
+    _save_classification; any other transcript in the batch is released back
+    to the real-time path with a failure recorded. Safe to re-run after a
+    crash: already processed transcripts are skipped.
+    """
+    chunk_results: Dict[UUID, Dict[int, Tuple[Optional[LLMCacheKey], Dict[str, Any]]]] = {}
+    chunk_counts: Dict[UUID, int] = {}
+    prompt_tokens = completion_tokens = 0
+
+    for record in _read_batch_output(client, batch.output_file_id):
+        try:
+            transcript_id, chunk_index, chunk_count = _parse_custom_id(record["custom_id"])
+        except (KeyError, ValueError):
+            logger.warning(f"Ignoring batch output line with bad custom_id: {str(record)[:200]}")
+            continue
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        if record.get("error") or response.get("status_code") != 200 or not body.get("choices"):
+            continue
+
+        usage = body.get("usage") or {}
+        prompt_tokens += usage.get("prompt_tokens", 0)
+        completion_tokens += usage.get("completion_tokens", 0)
+
+        ai_result = _parse_ai_response(body["choices"][0]["message"]["content"] or "")
+        if "error" in ai_result and not ai_result.get("mappings"):
+            continue
+
+        meta = (batch.request_meta or {}).get(record["custom_id"])
+        cache_key = LLMCacheKey(**meta) if meta else None
+        chunk_results.setdefault(transcript_id, {})[chunk_index] = (cache_key, ai_result)
+        chunk_counts[transcript_id] = chunk_count
+
+    applied = failed = skipped = 0
+    transcripts = db.query(RawTranscript).filter(RawTranscript.classification_batch_id == batch.id).all()
+    for transcript in transcripts:
+        transcript_id = transcript.id
+        if transcript.ai_processed:
+            transcript.classification_batch_id = None
+            db.commit()
+            skipped += 1
+            continue
+
+        parts = chunk_results.get(transcript_id, {})
+        expected = chunk_counts.get(transcript_id)
+        if not expected or len(parts) < expected:
+            _fail_batch_transcript(db, transcript_id, "Batch request failed or missing from batch output")
+            failed += 1
+            continue
+
+        try:
+            classification, theme_ids = _apply_chunk_results(db, transcript, [parts[i] for i in range(expected)])
+            transcript.classification_batch_id = None
+            db.commit()
+            bump_classification_version(str(transcript.workspace_id))
+            applied += 1
+        except Exception as e:
+            logger.error(f"Error applying batch result for transcript {transcript_id}: {e}", exc_info=True)
+            _fail_batch_transcript(db, transcript_id, str(e))
+            failed += 1
+            continue
+
+        if classification and theme_ids:
+            _enqueue_theme_slack_notifications(classification, theme_ids)
+
+    batch.status = "applied"
+    batch.applied_at = datetime.now(timezone.utc)
+    batch.applied_count = (batch.applied_count or 0) + applied
+    batch.prompt_tokens = prompt_tokens
+    batch.completion_tokens = completion_tokens
+    batch.cost_usd = _batch_cost_usd(prompt_tokens, completion_tokens)
+    db.commit()
+
+    report = _batch_report(batch)
+    report.update({"applied": applied, "failed": failed, "skipped": skipped})
+    logger.info(f"Applied classification batch {batch.id}: {report}")
+    return report
+
+
+def _batch_report(batch: ClassificationBatch) -> Dict[str, Any]:
+    """Throughput and cost summary for a batch."""
+    elapsed = None
+    if batch.submitted_at and batch.completed_at:
+        elapsed = (batch.completed_at - batch.submitted_at).total_seconds()
+    minutes = elapsed / 60 if elapsed else None
+    return {
+        "batch_id": str(batch.id),
+        "openai_batch_id": batch.openai_batch_id,
+        "status": batch.status,
+        "transcripts": batch.transcript_count,
+        "requests": batch.request_count,
+        "prompt_tokens": batch.prompt_tokens,
+        "completion_tokens": batch.completion_tokens,
+        "cost_usd": batch.cost_usd,
+        "turnaround_seconds": round(elapsed, 1) if elapsed is not None else None,
+        "transcripts_per_minute": round(batch.applied_count / minutes, 2) if minutes else None,
+    }
+
+
+def poll_batches(db: Session) -> Dict[str, Any]:
+    """Refresh every open batch and apply or release it when OpenAI is done."""
+    client = get_openai_batch_client()
+    if not client:
+        return {"status": "skipped", "reason": "OpenAI not configured"}
+
+    summary = {"polled": 0, "applied": 0, "released": 0, "reports": []}
+    open_batches = db.query(ClassificationBatch).filter(
+        ClassificationBatch.status.in_(["submitting", "submitted", "completed"])
+    ).order_by(ClassificationBatch.created_at).all()
+
+    for batch in open_batches:
+        summary["polled"] += 1
+        try:
+            if batch.status == "submitting":
+                if datetime.now(timezone.utc) - batch.created_at > SUBMIT_STALE_AFTER:
+                    # The worker may have died after batches.create went through
+                    remote = _find_remote_batch(client, batch)
+                    if remote:
+                        batch.input_file_id = remote.input_file_id
+                        batch.openai_batch_id = remote.id
+                        batch.openai_status = remote.status
+                        batch.status = "submitted"
+                        batch.submitted_at = datetime.fromtimestamp(remote.created_at, timezone.utc)
+                        db.commit()
+                        logger.info(f"Adopted classification batch {batch.id} ({remote.id}) left in submitting")
+                        continue
+                    batch.status = "failed"
+                    batch.error = "Submission did not complete"
+                    summary["released"] += _release_transcripts(db, batch)
+                    db.commit()
+                continue
+
+            if batch.status == "submitted":
+                remote = client.batches.retrieve(batch.openai_batch_id)
+                batch.openai_status = remote.status
+                counts = getattr(remote, "request_counts", None)
+                if counts:
+                    batch.completed_request_count = counts.completed or 0
+                    batch.failed_request_count = counts.failed or 0
+                batch.output_file_id = remote.output_file_id
+                batch.error_file_id = remote.error_file_id
+
+                if remote.status in OPENAI_FAILED_STATUSES:
+                    batch.status = remote.status
+                    batch.error = str(getattr(remote, "errors", None) or remote.status)[:1000]
+                    summary["released"] += _release_transcripts(db, batch, f"Classification batch {remote.status}")
+                    db.commit()
+                    continue
+
+                if remote.status != "completed":
+                    db.commit()
+                    continue
+
+                batch.status = "completed"
+                batch.completed_at = datetime.now(timezone.utc)
+                db.commit()
+
+            # status == "completed" (fresh, or left over from a crash mid-apply)
+            summary["reports"].append(apply_batch(db, client, batch))
+            summary["applied"] += 1
+
+        except Exception as e:
+            logger.error(f"Error polling classification batch {batch.id}: {e}", exc_info=True)
+            db.rollback()
+
+    return summary
+
+
+def _should_start_backfill(db: Session) -> bool:
+    """True when no batch is open and the pending backlog is large enough."""
+    open_batch = db.query(ClassificationBatch.id).filter(
+        ClassificationBatch.status.in_(["submitting", "submitted", "completed"])
+    ).first()
+    if open_batch:
+        return False
+
+    pending = db.query(func.count(RawTranscript.id)).filter(
+        RawTranscript.ai_processed == False,
+        RawTranscript.retry_count < MAX_RETRIES,
+        RawTranscript.classification_batch_id.is_(None),
+    ).scalar() or 0
+    return pending >= BATCH_BACKFILL_THRESHOLD
+
+
+@shared_task(
+    name="app.sync_engine.tasks.ai_pipeline.batch_classification.submit_classification_batch",
+    bind=True,
+    max_retries=1,
+    time_limit=900,
+    soft_time_limit=840,
+)
+def submit_classification_batch(
+    self,
+    workspace_id: Optional[str] = None,
+    max_transcripts: Optional[int] = None,
+    transcript_ids: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Submit pending transcripts as an OpenAI Batch API backfill job.
+
+    Args:
+        workspace_id: Optional workspace filter (all workspaces if not specified)
+        max_transcripts: Cap on transcripts in the batch
+        transcript_ids: Only these transcripts (enqueued by ingestion)
+
+    Returns:
+        Dict with batch id and counts
+    """
+    db = SessionLocal()
+    try:
+        return submit_batch(db, workspace_id, max_transcripts, transcript_ids)
+    except Exception as e:
+        logger.error(f"Error in submit_classification_batch: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+
+@shared_task(
+    name="app.sync_engine.tasks.ai_pipeline.batch_classification.poll_classification_batches",
+    bind=True,
+    max_retries=0,
+    time_limit=1800,
+    soft_time_limit=1740,
+)
+def poll_classification_batches(self) -> Dict[str, Any]:
+    """
+    Poll open Batch API jobs, apply completed ones, and start a backfill
+    batch when the pending backlog exceeds BATCH_BACKFILL_THRESHOLD.
+
+    Returns:
+        Dict with poll summary and per-batch throughput/cost reports
+    """
+    db = SessionLocal()
+    try:
+        summary = poll_batches(db)
+        if settings.OPENAI_API_KEY or settings.OPENAI_BATCH_BASE_URL:
+            if _should_start_backfill(db):
+                summary["submitted"] = submit_batch(db)
+        return summary
+    except Exception as e:
+        logger.error(f"Error in poll_classification_batches: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
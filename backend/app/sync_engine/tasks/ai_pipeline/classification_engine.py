@@ -0,0 +1,221 @@
+"""
+Concurrent Classification Engine
+
+Runs transcript classification LLM calls concurrently instead of one at a time:
+1. Bounded number of in-flight LLM requests (global semaphore)
+2. Per-workspace cap so one large backfill cannot starve other workspaces
+3. Round-robin job ordering across workspaces
+4. Token-per-minute budget shared by all requests (rolling 60s window)
+5. Throughput reporting (LLM jobs/min, tokens/min)
+
+The engine only schedules work - it does not touch the database. Each finished
+job is handed to an `on_result` callback, which is expected to persist and
+commit that single transcript, so one slow call never holds back the others.
+
+Usage:
+    engine = ClassificationEngine(classify_fn=classify, max_in_flight=8)
+    stats = await engine.run(jobs, on_result=apply_result)
+    stats.as_dict()
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.utils.transcript_renderer import CHARS_PER_TOKEN, estimate_tokens  # noqa: F401 (re-exported)
+
+logger = logging.getLogger(__name__)
+
+# Length of the rate limiter window in seconds
+RATE_WINDOW_SECONDS = 60.0
+
+
+@dataclass
+class ClassificationJob:
+    """A single transcript (or one chunk of it) waiting for an LLM classification call."""
+
+    transcript_id: UUID
+    workspace_id: UUID
+    variables: Dict[str, Any]
+    estimated_tokens: int
+    # Position of this job's chunk within its transcript (map-reduce)
+    chunk_index: int = 0
+    chunk_count: int = 1
+    # Optional result-cache key (opaque to the engine)
+    cache_key: Optional[Any] = None
+
+
+@dataclass
+class EngineStats:
+    """Throughput counters collected during an engine run (one job = one chunk LLM call)."""
+
+    completed: int = 0
+    errored: int = 0
+    tokens_used: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        end = self.finished_at or time.monotonic()
+        return max(end - self.started_at, 1e-6)
+
+    def as_dict(self) -> Dict[str, Any]:
+        minutes = self.elapsed_seconds / 60
+        return {
+            "completed": self.completed,
+            "errored": self.errored,
+            "tokens_used": self.tokens_used,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "jobs_per_minute": round(self.completed / minutes, 2),
+            "tokens_per_minute": round(self.tokens_used / minutes, 2),
+        }
+
+
+class TokenRateLimiter:
+    """
+    Async token-per-minute limiter using a rolling 60 second window.
+
+    Callers reserve an estimated token count before the request and settle
+    the reservation with the real usage afterwards.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.tokens_per_minute = tokens_per_minute
+        self._window: Deque[List[float]] = deque()
+        self._lock = asyncio.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= RATE_WINDOW_SECONDS:
+            self._window.popleft()
+
+    def _used(self) -> float:
+        return sum(entry[1] for entry in self._window)
+
+    async def acquire(self, tokens: int) -> List[float]:
+        """
+        Wait until `tokens` fit in the current window and reserve them.
+
+        A single request larger than the whole budget is let through once
+        the window is empty, so it cannot block forever.
+
+        Returns:
+            Reservation handle to pass to settle()
+        """
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._prune(now)
+                if not self._window or self._used() + tokens <= self.tokens_per_minute:
+                    entry = [now, float(tokens)]
+                    self._window.append(entry)
+                    return entry
+                wait = RATE_WINDOW_SECONDS - (now - self._window[0][0])
+            await asyncio.sleep(max(wait, 0.05))
+
+    def settle(self, reservation: List[float], actual_tokens: Optional[int]) -> None:
+        """Replace a reservation's estimate with the real token usage."""
+        if actual_tokens is not None:
+            reservation[1] = float(actual_tokens)
+
+
+# classify_fn(job) -> (ai_result, tokens_used)
+ClassifyFn = Callable[[ClassificationJob], Awaitable[Tuple[Dict[str, Any], Optional[int]]]]
+# on_result(job, ai_result, error) - exactly one of ai_result / error is set
+ResultFn = Callable[[ClassificationJob, Optional[Dict[str, Any]], Optional[Exception]], Awaitable[None]]
+
+
+def interleave_by_workspace(jobs: List[ClassificationJob]) -> List[ClassificationJob]:
+    """Order jobs round-robin across workspaces, keeping per-workspace order."""
+    queues: Dict[UUID, Deque[ClassificationJob]] = defaultdict(deque)
+    for job in jobs:
+        queues[job.workspace_id].append(job)
+
+    ordered = []
+    while queues:
+        for workspace_id in list(queues.keys()):
+            ordered.append(queues[workspace_id].popleft())
+            if not queues[workspace_id]:
+                del queues[workspace_id]
+    return ordered
+
+
+class ClassificationEngine:
+    """
+    Schedules classification jobs with bounded concurrency, per-workspace
+    fairness and token-per-minute rate limiting.
+    """
+
+    def __init__(
+        self,
+        classify_fn: ClassifyFn,
+        max_in_flight: int = 8,
+        per_workspace_limit: int = 4,
+        tokens_per_minute: int = 200_000,
+    ):
+        self.classify_fn = classify_fn
+        self.max_in_flight = max(1, max_in_flight)
+        self.per_workspace_limit = max(1, per_workspace_limit)
+        self.rate_limiter = TokenRateLimiter(tokens_per_minute)
+
+    async def run(self, jobs: List[ClassificationJob], on_result: ResultFn) -> EngineStats:
+        """
+        Classify all jobs and hand each result to `on_result` as soon as it lands.
+
+        Args:
+            jobs: Jobs to classify
+            on_result: Async callback invoked once per job
+
+        Returns:
+            EngineStats with throughput counters
+        """
+        stats = EngineStats()
+        if not jobs:
+            stats.finished_at = time.monotonic()
+            return stats
+
+        global_slots = asyncio.Semaphore(self.max_in_flight)
+        workspace_slots: Dict[UUID, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_workspace_limit)
+        )
+
+        async def worker(job: ClassificationJob) -> None:
+            ai_result, tokens_used, error = None, None, None
+            async with workspace_slots[job.workspace_id]:
+                async with global_slots:
+                    reservation = await self.rate_limiter.acquire(job.estimated_tokens)
+                    try:
+                        ai_result, tokens_used = await self.classify_fn(job)
+                    except Exception as e:
+                        logger.error(f"Classification call failed for transcript {job.transcript_id}: {e}")
+                        error = e
+                    # A failed request may still have been billed: keep the estimate
+                    self.rate_limiter.settle(reservation, tokens_used if error is None else None)
+
+            if error is not None:
+                stats.errored += 1
+            else:
+                stats.tokens_used += tokens_used or 0
+                stats.completed += 1
+            # Release LLM slots before persisting so the next call can start
+            await on_result(job, ai_result, error)
+
+        ordered = interleave_by_workspace(jobs)
+        logger.info(
+            f"Classification engine starting: {len(ordered)} jobs, "
+            f"max_in_flight={self.max_in_flight}, per_workspace={self.per_workspace_limit}, "
+            f"tpm={self.rate_limiter.tokens_per_minute}"
+        )
+
+        results = await asyncio.gather(*(worker(job) for job in ordered), return_exceptions=True)
+        for job, result in zip(ordered, results):
+            if isinstance(result, Exception):
+                logger.error(f"Result handler failed for transcript {job.transcript_id}: {result}")
+
+        stats.finished_at = time.monotonic()
+        logger.info(f"Classification engine finished: {stats.as_dict()}")
+        return stats
@@ -0,0 +1,116 @@
+"""
+Workspace Prompt Context Cache
+
+Process-local cache for the workspace-level parts of the classification prompt
+(THEMES_JSON text, company name, company domains). A batch of transcripts from
+the same workspace builds them once instead of once per transcript.
+
+Entries are keyed on (workspace_id, taxonomy_version). ThemeService and
+SubThemeService bump the version in Redis on every create/update/delete/move,
+which makes older entries unreachable. The TTL bounds staleness for writes
+that bypass those services, or when Redis is unavailable.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+PROMPT_CONTEXT_TTL_SECONDS = 600
+PROMPT_CONTEXT_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class WorkspacePromptContext:
+    """Workspace-scoped prompt variables shared by all of its transcripts."""
+
+    themes_text: str
+    theme_count: int
+    company_name: str
+    company_domains: str
+    taxonomy_version: Optional[int]
+
+
+class PromptContextCache:
+    """
+    Thread-safe LRU cache of WorkspacePromptContext, one entry per workspace.
+
+    An entry is only returned when its taxonomy version matches the caller's
+    version and it is younger than the TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = PROMPT_CONTEXT_TTL_SECONDS,
+        max_entries: int = PROMPT_CONTEXT_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[UUID, Tuple[float, WorkspacePromptContext]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, workspace_id: UUID, version: Optional[int]) -> Optional[WorkspacePromptContext]:
+        """Get the cached context for a workspace at the given taxonomy version."""
+        with self._lock:
+            entry = self._entries.get(workspace_id)
+            if entry:
+                stored_at, context = entry
+                fresh = time.monotonic() - stored_at < self.ttl_seconds
+                if fresh and context.taxonomy_version == version:
+                    self._entries.move_to_end(workspace_id)
+                    self.hits += 1
+                    return context
+                del self._entries[workspace_id]
+            self.misses += 1
+            return None
+
+    def set(self, workspace_id: UUID, context: WorkspacePromptContext) -> None:
+        """Store the context for a workspace, replacing any older version."""
+        with self._lock:
+            self._entries[workspace_id] = (time.monotonic(), context)
+            self._entries.move_to_end(workspace_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, workspace_id: Optional[UUID] = None) -> None:
+        """Drop one workspace's entry, or everything if no workspace is given."""
+        with self._lock:
+            if workspace_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(workspace_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for logging."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+# Singleton instance (one per worker process)
+_prompt_context_cache: Optional[PromptContextCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_prompt_context_cache() -> PromptContextCache:
+    """Get or create the prompt context cache singleton."""
+    global _prompt_context_cache
+
+    if _prompt_context_cache is None:
+        with _cache_lock:
+            if _prompt_context_cache is None:
+                _prompt_context_cache = PromptContextCache()
+
+    return _prompt_context_cache
@@ -0,0 +1,170 @@
+"""
+Transcript Chunking (map-reduce classification)
+
+Long transcripts used to be cut to their first and last 40K characters, which
+dropped the middle of long calls. Instead, a transcript is split on speaker
+turn boundaries into chunks that each fit a token budget; every chunk is
+classified as its own LLM call and the per-chunk results are merged back into
+one classification.
+
+- chunk_transcript(): header + speaker turns -> list of chunk texts
+- merge_chunk_results(): list of per-chunk AI results -> one AI result
+
+A transcript that fits the budget produces exactly one chunk whose text is
+identical to the unchunked transcript.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.utils.transcript_renderer import CHARS_PER_TOKEN, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Keys whose first non-empty string value identifies a mapping/signal for dedup
+_MAPPING_TEXT_KEYS = ("feature_request", "title", "ask", "name", "summary", "description", "quote", "text")
+# Per-chunk scores, averaged across chunks
+_SCORE_KEYS = frozenset({
+    "overall_sentiment", "sentiment", "sentiment_score",
+    "confidence", "confidence_score", "score", "impact_score",
+})
+# Occurrences counted per chunk, summed across chunks (also any "*_count" key)
+_COUNT_KEYS = frozenset({"count", "mentions", "mention_count"})
+
+
+def _split_long_turn(turn: str, max_chars: int) -> List[str]:
+    """Split a single oversized speaker turn on whitespace, repeating the speaker line."""
+    speaker, _, body = turn.partition("\n")
+    pieces = []
+    words = body.split()
+    current: List[str] = []
+    size = 0
+    for word in words:
+        if current and size + len(word) + 1 > max_chars:
+            pieces.append(f"{speaker}\n  {' '.join(current)}\n")
+            current, size = [], 0
+        current.append(word)
+        size += len(word) + 1
+    if current:
+        pieces.append(f"{speaker}\n  {' '.join(current)}\n")
+    return pieces or [turn]
+
+
+def chunk_transcript(header: str, turns: Iterable[str], max_tokens: int) -> List[str]:
+    """
+    Split a transcript into chunks of whole speaker turns within a token budget.
+
+    Every chunk repeats the call header. When there is more than one chunk, a
+    "[Transcript part i of n]" line follows the header so the model knows it
+    is seeing an excerpt.
+
+    Args:
+        header: Call header block (title/date), may be empty
+        turns: Speaker turn blocks in order (consumed once, may be a generator)
+        max_tokens: Token budget for the transcript text of one chunk
+
+    Returns:
+        List of chunk texts (at least one)
+    """
+    # Reserve room for the header and the "part i of n" marker line
+    header_tokens = estimate_tokens(header, "[Transcript part 00 of 00]\n")
+    budget = max(max_tokens - header_tokens, 256)
+
+    groups: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for turn in turns:
+        turn_tokens = estimate_tokens(turn)
+        parts = [turn] if turn_tokens <= budget else _split_long_turn(turn, budget * CHARS_PER_TOKEN)
+        for part in parts:
+            part_tokens = estimate_tokens(part)
+            if current and current_tokens + part_tokens > budget:
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(part)
+            current_tokens += part_tokens
+    if current or not groups:
+        groups.append(current)
+
+    if len(groups) == 1:
+        return ["\n".join(([header] if header else []) + groups[0])]
+
+    chunks = []
+    for index, group in enumerate(groups, start=1):
+        marker = f"[Transcript part {index} of {len(groups)}]\n"
+        chunks.append("\n".join(([header] if header else []) + [marker] + group))
+    logger.info(f"Split transcript into {len(chunks)} chunks (budget {max_tokens} tokens)")
+    return chunks
+
+
+def _item_key(item: Any) -> str:
+    """Dedup key for a list item in an AI result."""
+    if isinstance(item, dict):
+        theme = item.get("theme_id") or item.get("themeId")
+        sub_theme = item.get("sub_theme_id") or item.get("subThemeId")
+        if theme or sub_theme:
+            text = next(
+                (str(item[k]).strip().lower() for k in _MAPPING_TEXT_KEYS if isinstance(item.get(k), str) and item[k].strip()),
+                "",
+            )
+            return f"mapping:{theme}:{sub_theme}:{text}"
+        if isinstance(item.get("name"), str) and len(item) <= 4:
+            # Speakers / participants
+            return f"name:{item['name'].strip().lower()}:{str(item.get('email', '')).lower()}"
+    try:
+        return json.dumps(item, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return repr(item)
+
+
+def _is_count_key(key: Optional[str]) -> bool:
+    return key is not None and (key in _COUNT_KEYS or key.endswith("_count"))
+
+
+def _merge_values(values: List[Any], key: Optional[str] = None) -> Any:
+    """Merge the values of one key across chunk results."""
+    present = [v for v in values if v is not None and v != "" and v != [] and v != {}]
+    if not present:
+        return values[0] if values else None
+
+    if all(isinstance(v, list) for v in present):
+        merged, seen = [], set()
+        for value in present:
+            for item in value:
+                item_key = _item_key(item)
+                if item_key not in seen:
+                    seen.add(item_key)
+                    merged.append(item)
+        return merged
+
+    if all(isinstance(v, dict) for v in present):
+        keys = list(dict.fromkeys(k for v in present for k in v))
+        return {k: _merge_values([v.get(k) for v in present], k) for k in keys}
+
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        if key in _SCORE_KEYS:
+            return round(sum(present) / len(present), 3)
+        if _is_count_key(key):
+            return sum(present)
+
+    # Strings and other numbers (durations and call metadata come from the
+    # header every chunk repeats): the first chunk (call opening) wins
+    return present[0]
+
+
+def merge_chunk_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-chunk classification results into one result.
+
+    Lists (mappings, feature_signals, speakers, ...) are concatenated and
+    deduplicated; nested objects are merged key by key; scores (_SCORE_KEYS)
+    are averaged and counts summed; other scalars keep the first non-empty
+    value.
+    """
+    if len(results) == 1:
+        return results[0]
+
+    merged = _merge_values(results)
+    merged["chunk_count"] = len(results)
+    return merged
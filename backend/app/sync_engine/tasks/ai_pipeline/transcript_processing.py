@@ -2,348 +2,65 @@
 Transcript Processing Task
 
 Processes raw transcripts from the raw_transcripts table:
-1. Fetches unprocessed transcripts (ai_processed = false)
+1. Claims unprocessed transcripts (ai_processed = false) with a SKIP LOCKED lease, round-robin across workspaces
 2. Loads themes, company name, and company domains for prompt
-3. Calls Claude API via Langfuse prompt
-4. Stores results in transcript_classifications table
-5. Marks raw transcript as ai_processed = true
-6. Sends Slack notifications to themes with connected channels
+3. Splits long transcripts into token-bounded chunks on speaker turns
+4. Calls OpenAI via Langfuse prompt per chunk - concurrently through the ClassificationEngine
+5. Merges chunk results and stores them in transcript_classifications (one commit per transcript)
+6. Marks raw transcript as ai_processed = true
+7. Queues Slack notifications to themes with connected channels
 """
 
 import asyncio
+import copy
 import json
 import logging
-from datetime import datetime, timezone
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from celery import shared_task
-from sqlalchemy.orm import Session
+from celery.exceptions import SoftTimeLimitExceeded
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.core.config import settings
 from app.core.database import SessionLocal
 from app.models.raw_transcript import RawTranscript
 from app.models.transcript_classification import TranscriptClassification
 from app.models.theme import Theme
 from app.models.user import User
-from app.services.langfuse_prompt_service import get_langfuse_client
+from app.models.workspace import Workspace
+from app.services.cache_service import bump_classification_version, get_taxonomy_version
+from app.services.langfuse_prompt_service import get_langfuse_prompt_service
+from app.services.llm_result_cache_service import LLMCacheKey, content_hash, llm_result_cache_service
+from app.services.openai_clients import get_async_openai_client, get_openai_client
 from app.services.theme_slack_notification_service import ThemeSlackNotificationService
+from app.services.transcript_insights_service import transcript_insights_service
+from app.sync_engine.tasks.ai_pipeline.classification_engine import (
+    ClassificationEngine,
+    ClassificationJob,
+    estimate_tokens,
+)
+from app.sync_engine.tasks.ai_pipeline.prompt_context_cache import (
+    WorkspacePromptContext,
+    get_prompt_context_cache,
+)
+from app.sync_engine.tasks.ai_pipeline.transcript_chunking import chunk_transcript, merge_chunk_results
+from app.sync_engine.tasks.base import run_async_task
+from app.utils.transcript_renderer import transcript_sections
 
 logger = logging.getLogger(__name__)
 
 
-def _truncate_transcript(transcript_data: Any, max_chars: int = 80000) -> tuple[Any, bool]:
-    """
-    Truncate transcript data to fit within token limits.
-
-    Args:
-        transcript_data: Raw transcript data (dict or string)
-        max_chars: Maximum characters allowed
-
-    Returns:
-        Tuple of (truncated_data, was_truncated)
-    """
-    # Convert to string for size check
-    if isinstance(transcript_data, dict):
-        transcript_str = json.dumps(transcript_data)
-    else:
-        transcript_str = str(transcript_data)
-
-    if len(transcript_str) <= max_chars:
-        return transcript_data, False
-
-    logger.warning(f"Transcript too large ({len(transcript_str)} chars), truncating to {max_chars} chars")
-
-    # If it's a dict, try to truncate intelligently
-    if isinstance(transcript_data, dict):
-        # Look for common transcript content fields
-        content_fields = ['transcript', 'content', 'text', 'segments', 'utterances', 'monologues']
-        truncated_data = transcript_data.copy()
-
-        for field in content_fields:
-            if field in truncated_data:
-                content = truncated_data[field]
-
-                # If it's a list (like segments/utterances), truncate the list
-                if isinstance(content, list) and len(content) > 0:
-                    # Keep first and last portions
-                    total_items = len(content)
-                    if total_items > 20:
-                        # Keep first 10 and last 10 items
-                        truncated_data[field] = content[:10] + [
-                            {"note": f"... {total_items - 20} items truncated ..."}
-                        ] + content[-10:]
-                        logger.info(f"Truncated {field} list from {total_items} to 21 items")
-
-                # If it's a string, truncate with ellipsis
-                elif isinstance(content, str) and len(content) > max_chars // 2:
-                    half = max_chars // 4
-                    truncated_data[field] = (
-                        content[:half] +
-                        f"\n\n... [TRUNCATED - {len(content) - max_chars // 2} chars removed] ...\n\n" +
-                        content[-half:]
-                    )
-                    logger.info(f"Truncated {field} string from {len(content)} to ~{max_chars // 2} chars")
-
-        # Final check - if still too large, do a hard truncate on the JSON
-        result_str = json.dumps(truncated_data)
-        if len(result_str) > max_chars:
-            # Hard truncate: keep first and last portions
-            half = max_chars // 2 - 50
-            result_str = result_str[:half] + '..."truncated_middle": true,...' + result_str[-half:]
-            try:
-                truncated_data = json.loads(result_str)
-            except json.JSONDecodeError:
-                # If JSON is broken, just return a simple truncated version
-                truncated_data = {
-                    "truncated": True,
-                    "original_size": len(transcript_str),
-                    "content_preview": transcript_str[:max_chars - 100]
-                }
-
-        return truncated_data, True
-
-    # For string data, simple truncation with middle cut
-    half = max_chars // 2 - 50
-    truncated_str = (
-        transcript_str[:half] +
-        f"\n\n... [TRUNCATED - {len(transcript_str) - max_chars} chars removed] ...\n\n" +
-        transcript_str[-half:]
-    )
-    return truncated_str, True
-
-
 # Configuration
-BATCH_SIZE = 10
+# Transcripts claimed per run - classified concurrently by the ClassificationEngine
+BATCH_SIZE = 40
 MAX_RETRIES = 3
-# Max characters for transcript (gpt-4o-mini has 128K token limit, ~4 chars per token)
-# Leave room for system prompt, themes, and response - use ~80K chars for transcript
-MAX_TRANSCRIPT_CHARS = 80000
-
-
-def _format_transcript_as_text(raw_data: Dict[str, Any]) -> str:
-    """
-    Format raw transcript data as readable text with speaker names, emails, and dialogue.
-
-    Handles multiple raw_data formats:
-    1. Nested format from gong_ingestion_service: {call_data: {..., parties: [...]}, transcript: {...}}
-    2. Direct Gong format: {parties: [...], transcript: [...], metaData: {...}}
-    3. Fathom format: {title, transcript: [{text, speaker: {display_name, ...}, timestamp}], calendar_invitees, ...}
-    """
-    if not raw_data:
-        return "No transcript available."
-
-    # Detect Fathom format by checking for Fathom-specific fields
-    is_fathom = (
-        'recorded_by' in raw_data or
-        'calendar_invitees' in raw_data or
-        'share_url' in raw_data or
-        'recording_id' in raw_data
-    )
-
-    if is_fathom:
-        return _format_fathom_transcript(raw_data)
-    else:
-        return _format_gong_transcript(raw_data)
-
-
-def _format_fathom_transcript(raw_data: Dict[str, Any]) -> str:
-    """
-    Format Fathom transcript data as readable text.
-
-    Fathom format:
-    {
-        "title": "Meeting Title",
-        "meeting_title": "Meeting Title",
-        "created_at": "2026-01-22T20:21:28Z",
-        "recording_start_time": "2026-01-22T20:14:49Z",
-        "transcript": [
-            {
-                "text": "Hello",
-                "speaker": {"display_name": "John Doe", "matched_calendar_invitee_email": "john@example.com"},
-                "timestamp": "00:00:35"
-            }
-        ],
-        "calendar_invitees": [{"name": "...", "email": "..."}],
-        "recorded_by": {"name": "...", "email": "..."}
-    }
-    """
-    lines = []
-
-    # Extract title (try both field names)
-    title = raw_data.get('title') or raw_data.get('meeting_title', 'Untitled Call')
-
-    # Extract date (prefer recording_start_time, fallback to created_at)
-    started = raw_data.get('recording_start_time') or raw_data.get('created_at', '')
-
-    # Build header
-    lines.append("=" * 80)
-    lines.append(f"Call: {title}")
-    if started:
-        lines.append(f"Date: {started}")
-    lines.append("=" * 80)
-    lines.append("")
-
-    # Build speaker email mapping from calendar_invitees
-    # Map display_name -> email for lookup
-    invitee_map = {}
-    calendar_invitees = raw_data.get('calendar_invitees', [])
-    for invitee in calendar_invitees:
-        name = invitee.get('name', '')
-        email = invitee.get('email', '')
-        matched_speaker = invitee.get('matched_speaker_display_name')
-        if matched_speaker:
-            invitee_map[matched_speaker] = {'name': name, 'email': email}
-        if name:
-            invitee_map[name] = {'name': name, 'email': email}
-
-    # Also add recorded_by to the map
-    recorded_by = raw_data.get('recorded_by', {})
-    if recorded_by:
-        name = recorded_by.get('name', '')
-        email = recorded_by.get('email', '')
-        if name:
-            invitee_map[name] = {'name': name, 'email': email}
-
-    # Get transcript segments
-    transcript_segments = raw_data.get('transcript', [])
-    if not isinstance(transcript_segments, list):
-        return "No transcript content found."
-
-    for segment in transcript_segments:
-        if not isinstance(segment, dict):
-            continue
-
-        # Extract speaker info from Fathom format
-        speaker_data = segment.get('speaker', {})
-        display_name = speaker_data.get('display_name', 'Unknown Speaker')
-        matched_email = speaker_data.get('matched_calendar_invitee_email', '')
-
-        # Try to find email from invitee map if not directly available
-        email = matched_email
-        if not email and display_name in invitee_map:
-            email = invitee_map[display_name].get('email', '')
-
-        # Extract text
-        text = segment.get('text', '').strip()
-        if not text:
-            continue
-
-        # Format: Name (email): what they said
-        if email:
-            lines.append(f"{display_name} ({email}):")
-        else:
-            lines.append(f"{display_name}:")
-        lines.append(f"  {text}")
-        lines.append("")
-
-    return "\n".join(lines) if lines else "No transcript content found."
-
-
-def _format_gong_transcript(raw_data: Dict[str, Any]) -> str:
-    """
-    Format Gong transcript data as readable text.
-
-    Handles:
-    1. Nested format from gong_ingestion_service: {call_data: {..., parties: [...]}, transcript: {...}}
-    2. Direct format: {parties: [...], transcript: [...], metaData: {...}}
-    """
-    # Handle nested structure from gong_ingestion_service
-    # raw_data = {"call_data": {...}, "transcript": {...}}
-    call_data = raw_data.get('call_data', {})
-
-    # Build speaker mapping from parties
-    # Try nested location first (call_data.parties), then root level (parties)
-    parties = call_data.get('parties', []) if call_data else []
-    if not parties:
-        parties = raw_data.get('parties', [])
-
-    speaker_map = {}
-    for party in parties:
-        speaker_id = party.get('speakerId')
-        if speaker_id:
-            name = party.get('name', 'Unknown')
-            email = party.get('emailAddress', '')
-            speaker_map[str(speaker_id)] = {
-                'name': name,
-                'email': email
-            }
-
-    # Get transcript data - handle nested structure
-    # In nested format: raw_data['transcript'] contains the transcript API response
-    transcript_data = raw_data.get('transcript', {})
-    if isinstance(transcript_data, dict):
-        transcript_segments = transcript_data.get('transcript', [])
-    elif isinstance(transcript_data, list):
-        transcript_segments = transcript_data
-    else:
-        transcript_segments = []
-
-    if not isinstance(transcript_segments, list):
-        # If still not a list, try to extract text from raw_data
-        if 'content' in raw_data:
-            return str(raw_data['content'])
-        return "Transcript format not recognized."
-
-    lines = []
-
-    # Add header - try nested location first (call_data.metaData), then root level
-    call_metadata = call_data.get('metaData', {}) if call_data else {}
-    if not call_metadata:
-        call_metadata = raw_data.get('call_metadata', raw_data.get('metaData', {}))
-    title = call_metadata.get('title', 'Untitled Call')
-    started = call_metadata.get('started', '')
-
-    lines.append("=" * 80)
-    lines.append(f"Call: {title}")
-    if started:
-        lines.append(f"Date: {started}")
-    lines.append("=" * 80)
-    lines.append("")
-
-    for segment in transcript_segments:
-        if not isinstance(segment, dict):
-            continue
-
-        speaker_id = str(segment.get('speakerId', ''))
-        speaker_info = speaker_map.get(speaker_id, {'name': 'Unknown Speaker', 'email': ''})
-
-        name = speaker_info['name']
-        email = speaker_info['email']
-
-        # Extract sentences
-        sentences = segment.get('sentences', [])
-        if not sentences:
-            # Try 'text' field directly
-            text = segment.get('text', '')
-            if text:
-                sentences = [{'text': text}]
-            else:
-                continue
-
-        # Combine all sentences for this speaker segment
-        text_parts = []
-        for sentence in sentences:
-            if isinstance(sentence, dict):
-                text = sentence.get('text', '').strip()
-                if text:
-                    text_parts.append(text)
-            elif isinstance(sentence, str):
-                text_parts.append(sentence.strip())
-
-        if not text_parts:
-            continue
-
-        full_text = ' '.join(text_parts)
-
-        # Format: Name (email): what they said
-        if email:
-            lines.append(f"{name} ({email}):")
-        else:
-            lines.append(f"{name}:")
-        lines.append(f"  {full_text}")
-        lines.append("")
-
-    return "\n".join(lines) if lines else "No transcript content found."
+CLASSIFICATION_MODEL = "gpt-4o-mini"
+CLASSIFICATION_MAX_OUTPUT_TOKENS = 4000
+CLASSIFICATION_CACHE_NAMESPACE = "transcript_classification"
 
 
 def _format_themes_as_text(themes: List[Theme]) -> str:
@@ -374,206 +91,306 @@ def _format_themes_as_text(themes: List[Theme]) -> str:
     return "\n".join(lines) if lines else "No themes defined."
 
 
-def _load_prompt_variables(db: Session, raw_transcript: RawTranscript) -> Dict[str, Any]:
-    """Load all variables needed for Langfuse prompt."""
+def _get_workspace_prompt_context(db: Session, workspace_id: UUID) -> WorkspacePromptContext:
+    """
+    Get the workspace-level prompt variables (themes text, company name/domains).
 
-    workspace = raw_transcript.workspace
-    company = workspace.company
+    Served from the process-local PromptContextCache when the workspace's
+    taxonomy version is unchanged; otherwise rebuilt with one themes query
+    (sub-themes eager-loaded) and cached.
+    """
+    version = get_taxonomy_version(str(workspace_id))
+    cache = get_prompt_context_cache()
+    context = cache.get(workspace_id, version)
+    if context:
+        return context
+
+    workspace = db.query(Workspace).options(
+        joinedload(Workspace.company)
+    ).filter(Workspace.id == workspace_id).first()
+    company = workspace.company if workspace else None
 
     # 1. THEMES - Load themes + sub-themes and format as readable text
     # Using text format instead of JSON for better AI comprehension
-    themes = db.query(Theme).filter(Theme.workspace_id == workspace.id).all()
+    themes = db.query(Theme).options(
+        selectinload(Theme.sub_themes)
+    ).filter(Theme.workspace_id == workspace_id).order_by(Theme.sort_order).all()
     themes_text = _format_themes_as_text(themes)
     logger.info(f"Formatted themes text: {len(themes_text)} chars, {len(themes)} themes")
 
-    # 2. TRANSCRIPT - Format as readable text (like fetch_gong_transcripts.py does)
-    # This ensures Langfuse prompt doesn't split into 64K+ messages
-    transcript_text = _format_transcript_as_text(raw_transcript.raw_data)
-    logger.info(f"Formatted transcript text: {len(transcript_text)} chars")
-
-    # Truncate if too large to fit in context window
-    if len(transcript_text) > MAX_TRANSCRIPT_CHARS:
-        half = MAX_TRANSCRIPT_CHARS // 2
-        transcript_text = (
-            transcript_text[:half] +
-            "\n\n... [TRANSCRIPT TRUNCATED] ...\n\n" +
-            transcript_text[-half:]
-        )
-        logger.info(f"Transcript {raw_transcript.id} was truncated to {len(transcript_text)} chars")
-
-    # 3. COMPANY_NAME - From Company table via workspace
+    # 2. COMPANY_NAME - From Company table via workspace
     company_name = company.name if company else "Unknown Company"
 
-    # 4. COMPANY_DOMAINS - From Company.domains or fallback to user email domain
+    # 3. COMPANY_DOMAINS - From Company.domains or fallback to user email domain
     company_domains = company.domains if company and company.domains else []
     if not company_domains:
         # Fallback: extract domain from workspace owner's email
         owner = db.query(User).filter(
-            User.workspace_id == workspace.id,
+            User.workspace_id == workspace_id,
             User.role == "owner"
         ).first()
         if owner and owner.email:
             domain = owner.email.split("@")[1] if "@" in owner.email else None
             company_domains = [domain] if domain else []
 
-    return {
-        "THEMES_JSON": themes_text,
-        "TRANSCRIPT": transcript_text,
-        "Company_Name": company_name,
-        "Company_Domains": ", ".join(company_domains) if company_domains else "Not specified",
-    }
+    context = WorkspacePromptContext(
+        themes_text=themes_text,
+        theme_count=len(themes),
+        company_name=company_name,
+        company_domains=", ".join(company_domains) if company_domains else "Not specified",
+        taxonomy_version=version,
+    )
+    cache.set(workspace_id, context)
+    return context
 
 
-def _call_ai_for_classification(variables: Dict[str, Any]) -> Dict[str, Any]:
+def _load_prompt_variable_chunks(db: Session, raw_transcript: RawTranscript) -> List[Dict[str, Any]]:
     """
-    Fetch Langfuse prompt and call OpenAI API for transcript classification.
+    Load the Langfuse prompt variables for a transcript, one set per chunk.
+
+    Long transcripts are split on speaker turns into chunks of at most
+    CLASSIFICATION_CHUNK_TOKENS instead of being truncated; short ones yield
+    a single chunk with the full transcript text.
+    """
+
+    # THEMES_JSON, Company_Name, Company_Domains - shared by the whole workspace
+    context = _get_workspace_prompt_context(db, raw_transcript.workspace_id)
+
+    # TRANSCRIPT - Format as readable text (like fetch_gong_transcripts.py does)
+    # This ensures Langfuse prompt doesn't split into 64K+ messages
+    header, turns = transcript_sections(raw_transcript.raw_data)
+    chunks = chunk_transcript(header, turns, settings.CLASSIFICATION_CHUNK_TOKENS)
+    logger.info(f"Formatted transcript {raw_transcript.id}: {len(chunks)} chunk(s)")
+
+    return [
+        {
+            "THEMES_JSON": context.themes_text,
+            "TRANSCRIPT": chunk_text,
+            "Company_Name": context.company_name,
+            "Company_Domains": context.company_domains,
+        }
+        for chunk_text in chunks
+    ]
+
+
+def _get_classification_prompt() -> Any:
+    """
+    Get the Langfuse classification prompt (production label).
+
+    Served from the process-wide prompt cache, refreshed in the background
+    when stale.
+    """
+    return get_langfuse_prompt_service().get_prompt(
+        "classification prompt", label="production", prompt_type="chat"
+    )
+
+
+def _classification_cache_key(variables: Dict[str, Any], prompt_version: str) -> LLMCacheKey:
+    """
+    Build the LLM result cache key for a classification call.
+
+    The taxonomy part hashes the workspace-level prompt variables (themes with
+    IDs, company name and domains), so any theme change produces a new key.
+    """
+    taxonomy_text = "\n".join([
+        variables["THEMES_JSON"], variables["Company_Name"], variables["Company_Domains"]
+    ])
+    return LLMCacheKey(
+        namespace=CLASSIFICATION_CACHE_NAMESPACE,
+        content_hash=content_hash(variables["TRANSCRIPT"]),
+        prompt_version=prompt_version,
+        taxonomy_version=content_hash(taxonomy_text),
+        model=CLASSIFICATION_MODEL,
+    )
+
+
+def _build_classification_messages(
+    variables: Dict[str, Any],
+    prompt: Optional[Any] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Compile the Langfuse classification prompt into OpenAI messages.
 
     Uses Langfuse prompt directly without any modification - exactly like
     fetch_gong_transcripts.py does.
 
-    Returns the AI response as a dictionary.
+    Args:
+        variables: Prompt variables
+        prompt: Already-fetched Langfuse prompt (fetched from cache if omitted)
+
+    Raises:
+        ValueError: If Langfuse is unavailable or the prompt cannot be compiled
     """
+    if prompt is None:
+        prompt = _get_classification_prompt()
+
+    # Compile prompt with variables
+    compiled = prompt.compile(**variables)
+
+    # Handle different return types from Langfuse (same as fetch_gong_transcripts.py)
+    # Chat prompts should return a list of message dicts, but might return string
+    if isinstance(compiled, str):
+        # If it's a string, the prompt might be a text prompt, not chat
+        logger.warning("Prompt returned string instead of messages array. Wrapping as user message.")
+        messages = [{"role": "user", "content": compiled}]
+    elif isinstance(compiled, list):
+        messages = compiled
+    else:
+        # Try to convert to list if it's some other iterable
+        try:
+            messages = list(compiled)
+        except Exception:
+            logger.error(f"Unexpected prompt compile result type: {type(compiled)}")
+            raise ValueError(f"Unexpected prompt result type: {type(compiled)}")
+
+    # Log message info
+    logger.info(f"Langfuse returned {len(messages)} messages")
+
+    # Sanity check: if we have way too many messages, something went wrong
+    # (e.g., Langfuse split a string into characters)
+    if len(messages) > 100:
+        logger.warning(f"Too many messages ({len(messages)}), likely a Langfuse issue. Consolidating...")
+        # Check if messages are individual characters (common Langfuse bug)
+        if messages and isinstance(messages[0], str) and len(messages[0]) == 1:
+            # Messages are individual characters - join them back
+            full_content = "".join(str(m) for m in messages)
+            messages = [{"role": "user", "content": full_content}]
+            logger.info(f"Consolidated {len(messages)} character messages into 1 message")
+        else:
+            # Messages are proper dicts but too many - consolidate by role
+            system_parts = []
+            user_parts = []
+            for msg in messages:
+                if isinstance(msg, dict):
+                    role = msg.get("role", "user")
+                    content = msg.get("content", "")
+                elif hasattr(msg, "role"):
+                    role = getattr(msg, "role", "user")
+                    content = getattr(msg, "content", "")
+                else:
+                    role = "user"
+                    content = str(msg)
+
+                if role == "system":
+                    system_parts.append(content)
+                else:
+                    user_parts.append(content)
+
+            messages = []
+            if system_parts:
+                messages.append({"role": "system", "content": "\n".join(system_parts)})
+            if user_parts:
+                messages.append({"role": "user", "content": "\n".join(user_parts)})
+
+            logger.info(f"Consolidated to {len(messages)} messages")
+
+    # Convert messages to OpenAI format if needed
+    # Langfuse chat prompts return list of dicts with 'role' and 'content'
+    openai_messages = []
+    for msg in messages:
+        if isinstance(msg, dict) and "role" in msg and "content" in msg:
+            openai_messages.append(msg)
+        elif hasattr(msg, "role") and hasattr(msg, "content"):
+            openai_messages.append({
+                "role": getattr(msg, "role"),
+                "content": getattr(msg, "content")
+            })
+        else:
+            # Fallback: treat as user message
+            openai_messages.append({
+                "role": "user",
+                "content": str(msg)
+            })
+
+    return openai_messages
+
+
+def _parse_ai_response(response_text: str) -> Dict[str, Any]:
+    """Extract the JSON object from an OpenAI classification response."""
     try:
-        client = get_langfuse_client()
-        if not client:
-            logger.warning("Langfuse client not available, skipping AI processing")
-            return {"error": "Langfuse client not available"}
-
-        # Get prompt from Langfuse (with production label)
-        prompt = client.get_prompt("classification prompt", label="production", type="chat")
-
-        # Compile prompt with variables
-        compiled = prompt.compile(**variables)
-
-        # Handle different return types from Langfuse (same as fetch_gong_transcripts.py)
-        # Chat prompts should return a list of message dicts, but might return string
-        if isinstance(compiled, str):
-            # If it's a string, the prompt might be a text prompt, not chat
-            logger.warning("Prompt returned string instead of messages array. Wrapping as user message.")
-            messages = [{"role": "user", "content": compiled}]
-        elif isinstance(compiled, list):
-            messages = compiled
+        # Look for JSON in the response
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            json_str = response_text[json_start:json_end].strip()
+        elif "{" in response_text:
+            # Find the first { and last }
+            json_start = response_text.find("{")
+            json_end = response_text.rfind("}") + 1
+            json_str = response_text[json_start:json_end]
         else:
-            # Try to convert to list if it's some other iterable
-            try:
-                messages = list(compiled)
-            except Exception:
-                logger.error(f"Unexpected prompt compile result type: {type(compiled)}")
-                return {"error": f"Unexpected prompt result type: {type(compiled)}"}
-
-        # Log message info
-        logger.info(f"Langfuse returned {len(messages)} messages")
-
-        # Sanity check: if we have way too many messages, something went wrong
-        # (e.g., Langfuse split a string into characters)
-        if len(messages) > 100:
-            logger.warning(f"Too many messages ({len(messages)}), likely a Langfuse issue. Consolidating...")
-            # Check if messages are individual characters (common Langfuse bug)
-            if messages and isinstance(messages[0], str) and len(messages[0]) == 1:
-                # Messages are individual characters - join them back
-                full_content = "".join(str(m) for m in messages)
-                messages = [{"role": "user", "content": full_content}]
-                logger.info(f"Consolidated {len(messages)} character messages into 1 message")
-            else:
-                # Messages are proper dicts but too many - consolidate by role
-                system_parts = []
-                user_parts = []
-                for msg in messages:
-                    if isinstance(msg, dict):
-                        role = msg.get("role", "user")
-                        content = msg.get("content", "")
-                    elif hasattr(msg, "role"):
-                        role = getattr(msg, "role", "user")
-                        content = getattr(msg, "content", "")
-                    else:
-                        role = "user"
-                        content = str(msg)
-
-                    if role == "system":
-                        system_parts.append(content)
-                    else:
-                        user_parts.append(content)
-
-                messages = []
-                if system_parts:
-                    messages.append({"role": "system", "content": "\n".join(system_parts)})
-                if user_parts:
-                    messages.append({"role": "user", "content": "\n".join(user_parts)})
-
-                logger.info(f"Consolidated to {len(messages)} messages")
-
-        # Call OpenAI API
-        from openai import OpenAI
-
-        from app.core.config import Settings
-        settings = Settings()
-
-        if not settings.OPENAI_API_KEY:
-            logger.warning("OpenAI API key not configured")
-            return {"error": "OpenAI API key not configured"}
+            json_str = response_text
+
+        return json.loads(json_str)
 
-        openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-
-        # Convert messages to OpenAI format if needed
-        # Langfuse chat prompts return list of dicts with 'role' and 'content'
-        openai_messages = []
-        for msg in messages:
-            if isinstance(msg, dict) and "role" in msg and "content" in msg:
-                openai_messages.append(msg)
-            elif hasattr(msg, "role") and hasattr(msg, "content"):
-                openai_messages.append({
-                    "role": getattr(msg, "role"),
-                    "content": getattr(msg, "content")
-                })
-            else:
-                # Fallback: treat as user message
-                openai_messages.append({
-                    "role": "user",
-                    "content": str(msg)
-                })
+    except json.JSONDecodeError:
+        logger.warning(f"Failed to parse AI response as JSON: {response_text[:200]}")
+        return {
+            "raw_response": response_text,
+            "error": "Failed to parse response as JSON"
+        }
+
+
+def _call_ai_for_classification(variables: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fetch Langfuse prompt and call OpenAI API for transcript classification.
+
+    Synchronous single-transcript variant, kept for scripts and debugging.
+    process_raw_transcripts uses _call_ai_for_classification_async.
+
+    Returns the AI response as a dictionary.
+    """
+    try:
+        openai_messages = _build_classification_messages(variables)
+
+        # Call OpenAI API (pooled, long-lived client)
+        openai_client = get_openai_client()
+        if not openai_client:
+            return {"error": "OpenAI API key not configured"}
 
         # Call OpenAI - use Langfuse prompt directly, no modifications
         response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=CLASSIFICATION_MODEL,
             messages=openai_messages,
             temperature=0,
             response_format={"type": "json_object"},
-            max_tokens=4000
+            max_tokens=CLASSIFICATION_MAX_OUTPUT_TOKENS
         )
 
-        # Parse response
-        response_text = response.choices[0].message.content
-
-        # Try to extract JSON from response
-        try:
-            # Look for JSON in the response
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "{" in response_text:
-                # Find the first { and last }
-                json_start = response_text.find("{")
-                json_end = response_text.rfind("}") + 1
-                json_str = response_text[json_start:json_end]
-            else:
-                json_str = response_text
-
-            result = json.loads(json_str)
-            return result
-
-        except json.JSONDecodeError:
-            logger.warning(f"Failed to parse AI response as JSON: {response_text[:200]}")
-            return {
-                "raw_response": response_text,
-                "error": "Failed to parse response as JSON"
-            }
+        return _parse_ai_response(response.choices[0].message.content)
 
     except Exception as e:
         logger.error(f"Error calling AI for classification: {e}")
         return {"error": str(e)}
 
 
+async def _call_ai_for_classification_async(
+    variables: Dict[str, Any],
+    openai_client: Any,
+    prompt: Optional[Any] = None,
+) -> tuple[Dict[str, Any], Optional[int]]:
+    """
+    Async variant of _call_ai_for_classification used by the classification engine.
+
+    Returns:
+        Tuple of (AI response dict, total tokens used or None)
+    """
+    # Langfuse SDK is synchronous - keep a possible cache-miss fetch off the event loop
+    openai_messages = await asyncio.to_thread(_build_classification_messages, variables, prompt)
+
+    response = await openai_client.chat.completions.create(
+        model=CLASSIFICATION_MODEL,
+        messages=openai_messages,
+        temperature=0,
+        response_format={"type": "json_object"},
+        max_tokens=CLASSIFICATION_MAX_OUTPUT_TOKENS
+    )
+
+    usage = getattr(response, "usage", None)
+    tokens_used = getattr(usage, "total_tokens", None) if usage else None
+    return _parse_ai_response(response.choices[0].message.content), tokens_used
+
+
 def _extract_theme_ids_from_response(ai_result: Dict[str, Any]) -> tuple[list, list]:
     """
     Extract theme_ids and sub_theme_ids from AI response.
@@ -695,22 +512,14 @@ def _extract_theme_ids_from_response(ai_result: Dict[str, Any]) -> tuple[list, l
     return theme_ids, sub_theme_ids
 
 
-def _save_classification(
-    db: Session,
-    raw_transcript: RawTranscript,
-    ai_result: Dict[str, Any]
-) -> tuple[TranscriptClassification, List[UUID]]:
-    """Save AI classification result to transcript_classifications table.
-
-    Returns:
-        Tuple of (TranscriptClassification, List of theme_ids for notifications)
+def _enrich_ai_result(ai_result: Dict[str, Any], raw_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    from app.models.sub_theme import SubTheme
-
-    workspace_id = raw_transcript.workspace_id
+    Add the transcript's participants and company to an AI result.
 
+    Returns a copy: the same result object can be shared by several
+    transcripts (LLM result cache hits) and is what gets cached.
+    """
     # Extract participants from raw transcript data (parties array from Gong/Fathom)
-    raw_data = raw_transcript.raw_data or {}
     parties = raw_data.get('parties', [])
     participants = []
     for party in parties:
@@ -731,7 +540,8 @@ def _save_classification(
     call_metadata = raw_data.get('call_metadata', {}) or raw_data.get('metaData', {})
     company_from_transcript = call_metadata.get('company', '') or call_metadata.get('companyName', '')
 
-    # Enrich AI result with transcript metadata
+    # Enrich a copy of the AI result with transcript metadata
+    ai_result = copy.deepcopy(ai_result)
     if participants:
         ai_result['participants'] = participants
     if company_from_transcript and company_from_transcript.lower() not in ['unknown', '']:
@@ -740,6 +550,25 @@ def _save_classification(
         if not ai_result['customer_metadata'].get('company_name'):
             ai_result['customer_metadata']['company_name'] = company_from_transcript
 
+    return ai_result
+
+
+def _save_classification(
+    db: Session,
+    raw_transcript: RawTranscript,
+    ai_result: Dict[str, Any]
+) -> tuple[TranscriptClassification, List[UUID]]:
+    """Save AI classification result to transcript_classifications table.
+
+    Returns:
+        Tuple of (TranscriptClassification, List of theme_ids for notifications)
+    """
+    from app.models.sub_theme import SubTheme
+
+    workspace_id = raw_transcript.workspace_id
+
+    ai_result = _enrich_ai_result(ai_result, raw_transcript.raw_data or {})
+
     # Extract theme/sub-theme IDs from AI response
     theme_ids, sub_theme_ids = _extract_theme_ids_from_response(ai_result)
 
@@ -778,7 +607,11 @@ def _save_classification(
         TranscriptClassification.source_id == raw_transcript.source_id,
     ).first()
 
+    previous_insights = None
     if existing:
+        # Counters the old classification contributed, subtracted from the insights rollup
+        previous_insights = transcript_insights_service.snapshot(existing)
+
         # Update existing
         existing.theme_id = theme_id
         existing.sub_theme_id = sub_theme_id
@@ -809,6 +642,9 @@ def _save_classification(
         )
         db.add(classification)
 
+    # Keep the insights rollup in step, committed with the classification
+    transcript_insights_service.record_classification(db, classification, previous_insights)
+
     logger.info(
         f"Saving classification: theme_id={theme_id}, sub_theme_id={sub_theme_id}, "
         f"theme_ids={theme_ids}, sub_theme_ids={sub_theme_ids}"
@@ -817,41 +653,338 @@ def _save_classification(
     return classification, theme_ids
 
 
-def _send_theme_slack_notifications(
+def _apply_chunk_results(
     db: Session,
+    transcript: RawTranscript,
+    parts: List[tuple],
+) -> tuple[TranscriptClassification, List[UUID]]:
+    """
+    Merge a transcript's chunk results, save the classification and mark the
+    transcript processed. Used by both the real-time and the Batch API path.
+
+    Args:
+        db: Database session (not committed here)
+        transcript: Raw transcript being classified
+        parts: (cache_key or None, ai_result) per chunk, in chunk order.
+            Results with a cache key are stored in the LLM result cache.
+
+    Returns:
+        Tuple of (TranscriptClassification, theme_ids for notifications)
+    """
+    # Remember fresh LLM results for identical future inputs
+    for cache_key, ai_result in parts:
+        if cache_key:
+            llm_result_cache_service.put(db, cache_key, ai_result)
+
+    # Save classification (chunk results merged into one)
+    ai_result = merge_chunk_results([ai_result for _, ai_result in parts])
+    classification, theme_ids = _save_classification(db, transcript, ai_result)
+
+    # Mark as processed
+    transcript.ai_processed = True
+    transcript.processing_completed_at = datetime.now(timezone.utc)
+    transcript.processing_error = None
+    return classification, theme_ids
+
+
+def _enqueue_theme_slack_notifications(
     classification: TranscriptClassification,
     theme_ids: List[UUID]
 ) -> None:
     """
-    Send Slack notifications to themes with connected channels.
+    Queue Slack notifications to themes with connected channels.
 
-    This is a fire-and-forget operation that should not block transcript processing.
+    The theme/connector lookups and Slack posts run in the
+    send_theme_slack_notifications task, so they never hold up classification.
     Errors are logged but not raised.
     """
     if not theme_ids:
         return
 
     try:
-        # Run the async notification service in a sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(
-                ThemeSlackNotificationService.send_notifications_for_classification(
-                    db=db,
-                    classification=classification,
-                    theme_ids=theme_ids
-                )
-            )
-            if result.get("sent", 0) > 0:
-                logger.info(f"Sent {result['sent']} Slack notification(s) for classification {classification.id}")
-            if result.get("failed", 0) > 0:
-                logger.warning(f"Failed to send {result['failed']} Slack notification(s) for classification {classification.id}")
-        finally:
-            loop.close()
+        send_theme_slack_notifications.delay(
+            classification_id=str(classification.id),
+            theme_ids=[str(theme_id) for theme_id in theme_ids],
+        )
     except Exception as e:
         # Log but don't fail the transcript processing
-        logger.error(f"Error sending Slack notifications for classification {classification.id}: {e}")
+        logger.error(f"Failed to enqueue Slack notifications for classification {classification.id}: {e}")
+
+
+def _claim_pending_transcripts(
+    db: Session,
+    workspace_id: Optional[str],
+    batch_size: int,
+    transcript_ids: Optional[List[str]] = None,
+) -> List[RawTranscript]:
+    """
+    Claim unprocessed transcripts for this worker, oldest first, interleaved across workspaces.
+
+    Ranks each workspace's backlog with ROW_NUMBER() so a single workspace's
+    backfill cannot take the whole batch while other workspaces wait.
+
+    Rows are locked with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent
+    workers (or an on-demand run overlapping the beat) each get a disjoint
+    set, then leased by stamping processing_started_at and committing. A
+    transcript whose lease is older than CLASSIFICATION_LEASE_SECONDS belonged
+    to a worker that died mid-run and is reclaimed automatically.
+
+    When transcript_ids is given (ingestion-triggered runs) only those
+    transcripts are considered.
+
+    Returns:
+        The claimed transcripts (lease committed)
+    """
+    now = datetime.now(timezone.utc)
+    lease_cutoff = now - timedelta(seconds=settings.CLASSIFICATION_LEASE_SECONDS)
+    filters = [
+        RawTranscript.ai_processed == False,
+        RawTranscript.retry_count < MAX_RETRIES,
+        # Transcripts handed to an OpenAI Batch API job are applied by batch_classification
+        RawTranscript.classification_batch_id.is_(None),
+        or_(
+            RawTranscript.processing_started_at.is_(None),
+            RawTranscript.processing_started_at < lease_cutoff,
+        ),
+    ]
+    if workspace_id:
+        filters.append(RawTranscript.workspace_id == UUID(workspace_id))
+    if transcript_ids:
+        filters.append(RawTranscript.id.in_([UUID(str(t)) for t in transcript_ids]))
+
+    ranked = db.query(
+        RawTranscript.id.label("id"),
+        RawTranscript.created_at.label("created_at"),
+        func.row_number().over(
+            partition_by=RawTranscript.workspace_id,
+            order_by=RawTranscript.created_at,
+        ).label("workspace_rank"),
+    ).filter(*filters).subquery()
+
+    # Filters are repeated on the locked rows: after waiting on a row another
+    # worker just leased, Postgres re-checks these against the committed version
+    transcripts = (
+        db.query(RawTranscript)
+        .join(ranked, RawTranscript.id == ranked.c.id)
+        .filter(*filters)
+        .order_by(ranked.c.workspace_rank, ranked.c.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True, of=RawTranscript)
+        .all()
+    )
+
+    reclaimed = sum(1 for t in transcripts if t.processing_started_at is not None)
+    if reclaimed:
+        logger.warning(f"Reclaimed {reclaimed} transcript(s) with expired processing leases")
+
+    for transcript in transcripts:
+        transcript.processing_started_at = now
+    db.commit()
+    return transcripts
+
+
+def _release_transcript_leases(db: Session, transcript_ids: List[UUID]) -> None:
+    """Clear the processing lease so the transcripts can be claimed again right away."""
+    if not transcript_ids:
+        return
+    db.query(RawTranscript).filter(
+        RawTranscript.id.in_(transcript_ids),
+        RawTranscript.ai_processed == False,
+    ).update({RawTranscript.processing_started_at: None}, synchronize_session=False)
+    db.commit()
+
+
+def _release_leases_after_timeout(transcript_ids: List[UUID]) -> None:
+    """
+    Release the leases of a run that was interrupted mid-batch.
+
+    Uses a fresh session: the run's own session may still be in use by a
+    result handler thread. Processed transcripts are left untouched.
+    """
+    db = SessionLocal()
+    try:
+        _release_transcript_leases(db, transcript_ids)
+    except Exception as e:
+        logger.error(f"Failed to release transcript leases after timeout: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _record_transcript_failure(db: Session, transcript_id: UUID, error: str) -> None:
+    """Roll back, then store the error and bump retry_count for a transcript."""
+    db.rollback()
+    try:
+        # Re-fetch the transcript after rollback to update error info
+        transcript = db.query(RawTranscript).filter(RawTranscript.id == transcript_id).first()
+        if transcript:
+            transcript.processing_error = error[:1000]  # Truncate error message
+            transcript.retry_count += 1
+            # Release the lease so the next run can retry it
+            transcript.processing_started_at = None
+            db.commit()
+    except Exception as update_err:
+        logger.error(f"Failed to update transcript error info: {update_err}")
+        db.rollback()
+
+
+def _limit_jobs_to_run_budget(
+    jobs: List[ClassificationJob],
+    cached_results: Dict[str, Any],
+) -> tuple[List[ClassificationJob], List[UUID]]:
+    """
+    Keep whole transcripts, in claim order, until their uncached chunk jobs
+    would exceed the run's token budget.
+
+    The ClassificationEngine waits on the tokens-per-minute limiter, so a run
+    of long chunked transcripts can take many minutes; the budget keeps it
+    well inside the task's soft time limit. The first transcript is always
+    kept so an oversized transcript still makes progress.
+
+    Returns:
+        Tuple of (jobs to run, IDs of transcripts deferred to the next run)
+    """
+    budget = settings.OPENAI_TOKENS_PER_MINUTE * settings.CLASSIFICATION_RUN_TOKEN_MINUTES
+    jobs_by_transcript: Dict[UUID, List[ClassificationJob]] = defaultdict(list)
+    for job in jobs:
+        jobs_by_transcript[job.transcript_id].append(job)
+
+    kept: List[ClassificationJob] = []
+    deferred: List[UUID] = []
+    scheduled_tokens = 0
+    for transcript_id, transcript_jobs in jobs_by_transcript.items():
+        tokens = sum(
+            job.estimated_tokens for job in transcript_jobs
+            if not (job.cache_key and job.cache_key.key in cached_results)
+        )
+        if kept and scheduled_tokens + tokens > budget:
+            deferred.append(transcript_id)
+            continue
+        scheduled_tokens += tokens
+        kept.extend(transcript_jobs)
+    return kept, deferred
+
+
+async def _classify_batch(
+    db: Session,
+    jobs: List[ClassificationJob],
+    counters: Dict[str, int],
+    prompt: Optional[Any] = None,
+    cached_results: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the ClassificationEngine over prepared chunk jobs and persist each transcript.
+
+    Each job is one chunk of a transcript. Chunk results are collected per
+    transcript; once all chunks are in they are merged and saved as a single
+    TranscriptClassification. A failed chunk fails the whole transcript so it
+    is retried later.
+
+    Jobs whose cache key is in `cached_results` are taken straight from the
+    LLM result cache; only the rest go to the engine. Fresh chunk results are
+    written back to the cache in the same commit as the classification.
+
+    The session is shared by all result handlers, so handlers are serialized
+    with a lock, and their blocking database work runs in a worker thread so
+    LLM calls keep running concurrently on the event loop.
+
+    Returns:
+        Engine throughput stats plus saved transcripts per minute
+    """
+    cached_results = cached_results or {}
+    # Pooled per event loop and reused across task runs - not closed here
+    openai_client = get_async_openai_client()
+    db_lock = asyncio.Lock()
+    chunk_results: Dict[UUID, Dict[int, tuple]] = defaultdict(dict)
+    failed_transcripts: set = set()
+
+    async def classify(job: ClassificationJob):
+        return await _call_ai_for_classification_async(job.variables, openai_client, prompt)
+
+    def persist_transcript(transcript_id: UUID, parts: List[tuple]) -> None:
+        """Blocking part of save_transcript (runs in a thread, under db_lock)."""
+        try:
+            transcript = db.query(RawTranscript).filter(RawTranscript.id == transcript_id).first()
+            if not transcript:
+                counters["skipped"] += 1
+                return
+
+            # Only fresh LLM results are written back to the cache
+            classification, theme_ids = _apply_chunk_results(db, transcript, [
+                (job.cache_key if job.cache_key and job.cache_key.key not in cached_results else None, ai_result)
+                for job, ai_result in parts
+            ])
+            db.commit()
+            counters["processed"] += 1
+            logger.info(f"Successfully processed transcript {transcript.id} ({len(parts)} chunk(s))")
+            # Invalidates cached sidebar counts
+            bump_classification_version(str(transcript.workspace_id))
+        except Exception as e:
+            logger.error(f"Error processing transcript {transcript_id}: {e}", exc_info=True)
+            _record_transcript_failure(db, transcript_id, str(e))
+            counters["failed"] += 1
+            return
+
+        # Send Slack notifications to themes (queued, don't block processing)
+        if classification and theme_ids:
+            _enqueue_theme_slack_notifications(classification, theme_ids)
+
+    async def save_transcript(transcript_id: UUID, parts: List[tuple]) -> None:
+        async with db_lock:
+            await asyncio.to_thread(persist_transcript, transcript_id, parts)
+
+    async def apply_result(
+        job: ClassificationJob,
+        ai_result: Optional[Dict[str, Any]],
+        error: Optional[Exception],
+    ) -> None:
+        if job.transcript_id in failed_transcripts:
+            return
+
+        if error is None and "error" in ai_result and not ai_result.get("mappings"):
+            # AI call returned an error payload
+            error = ai_result.get("error", "Unknown error")
+
+        if error is not None:
+            logger.warning(
+                f"AI processing failed for transcript {job.transcript_id} "
+                f"(chunk {job.chunk_index + 1}/{job.chunk_count}): {error}"
+            )
+            failed_transcripts.add(job.transcript_id)
+            chunk_results.pop(job.transcript_id, None)
+            async with db_lock:
+                await asyncio.to_thread(_record_transcript_failure, db, job.transcript_id, str(error))
+            counters["failed"] += 1
+            return
+
+        parts = chunk_results[job.transcript_id]
+        parts[job.chunk_index] = (job, ai_result)
+        if len(parts) < job.chunk_count:
+            return
+
+        del chunk_results[job.transcript_id]
+        await save_transcript(job.transcript_id, [parts[i] for i in range(job.chunk_count)])
+
+    engine = ClassificationEngine(
+        classify_fn=classify,
+        max_in_flight=settings.CLASSIFICATION_MAX_IN_FLIGHT,
+        per_workspace_limit=settings.CLASSIFICATION_PER_WORKSPACE_LIMIT,
+        tokens_per_minute=settings.OPENAI_TOKENS_PER_MINUTE,
+    )
+    pending_jobs = []
+    for job in jobs:
+        if job.cache_key and job.cache_key.key in cached_results:
+            counters["cache_hits"] += 1
+            # Identical transcripts in one batch share a hit: give each its own copy
+            await apply_result(job, copy.deepcopy(cached_results[job.cache_key.key]), None)
+        else:
+            pending_jobs.append(job)
+
+    stats = await engine.run(pending_jobs, on_result=apply_result)
+    throughput = stats.as_dict()
+    # Engine stats count chunk jobs; report whole saved transcripts (cache hits included) too
+    throughput["transcripts_per_minute"] = round(counters["processed"] / (stats.elapsed_seconds / 60), 2)
+    return throughput
 
 
 @shared_task(
@@ -866,108 +999,186 @@ def process_raw_transcripts(
     self,
     workspace_id: Optional[str] = None,
     batch_size: int = BATCH_SIZE,
+    transcript_ids: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     Process unprocessed raw transcripts through AI classification.
 
+    Enqueued by BatchDatabaseService.batch_insert_raw_transcripts with the
+    IDs it just inserted; the beat schedule runs it without IDs as a safety
+    net for anything missed (broker hiccups, retries, expired leases).
+
+    Transcripts are split into token-bounded chunks on speaker turns. Chunk
+    LLM calls run concurrently via the ClassificationEngine; each transcript
+    is merged and committed independently as soon as all its chunks arrive.
+
     Args:
         workspace_id: Optional workspace filter (process all if not specified)
         batch_size: Number of transcripts to process per run
+        transcript_ids: Optional list of raw transcript IDs to process (ingestion-triggered runs)
 
     Returns:
-        Dict with processing stats
+        Dict with processing stats and throughput (transcripts/min, LLM jobs/min, tokens/min)
     """
-    logger.info(f"Starting transcript processing (workspace_id={workspace_id}, batch_size={batch_size})")
+    logger.info(
+        f"Starting transcript processing (workspace_id={workspace_id}, batch_size={batch_size}, "
+        f"transcript_ids={len(transcript_ids) if transcript_ids else 'all'})"
+    )
+
+    if not settings.OPENAI_API_KEY:
+        logger.warning("OpenAI API key not configured, skipping AI processing")
+        return {"processed": 0, "failed": 0, "skipped": 0}
 
     db = SessionLocal()
+    claimed_ids: List[UUID] = []
     try:
-        # Query unprocessed transcripts
-        query = db.query(RawTranscript).filter(
-            RawTranscript.ai_processed == False,
-            RawTranscript.retry_count < MAX_RETRIES,
-        )
-
-        if workspace_id:
-            query = query.filter(RawTranscript.workspace_id == UUID(workspace_id))
-
-        # Order by created_at to process oldest first
-        transcripts = query.order_by(RawTranscript.created_at).limit(batch_size).all()
+        # Lease-based claim - safe to run on any number of workers at once
+        transcripts = _claim_pending_transcripts(db, workspace_id, batch_size, transcript_ids)
+        claimed_ids = [t.id for t in transcripts]
 
         if not transcripts:
             logger.info("No unprocessed transcripts found")
             return {"processed": 0, "failed": 0, "skipped": 0}
 
-        processed = 0
-        failed = 0
-        skipped = 0
+        counters = {"processed": 0, "failed": 0, "skipped": 0, "cache_hits": 0}
 
+        # Pin one prompt version for the whole batch so cache keys match the prompt used
+        try:
+            prompt = _get_classification_prompt()
+            prompt_version = f"langfuse-v{prompt.version}"
+        except Exception as e:
+            logger.warning(f"Classification prompt unavailable before batch, result cache disabled: {e}")
+            prompt, prompt_version = None, None
+
+        # Prepare prompt variables (DB work) before any LLM call starts
+        jobs: List[ClassificationJob] = []
         for transcript in transcripts:
-            classification = None
-            theme_ids = []
+            transcript_id = transcript.id
             try:
-                logger.info(f"Processing transcript {transcript.id} ({transcript.source_type}/{transcript.source_id})")
-
-                # Mark processing started
-                transcript.processing_started_at = datetime.now(timezone.utc)
-                db.commit()
-
-                # Load prompt variables
-                variables = _load_prompt_variables(db, transcript)
-
-                # Call AI
-                ai_result = _call_ai_for_classification(variables)
-
-                if "error" in ai_result and not ai_result.get("mappings"):
-                    # AI call failed
-                    transcript.processing_error = ai_result.get("error", "Unknown error")
-                    transcript.retry_count += 1
-                    failed += 1
-                    logger.warning(f"AI processing failed for transcript {transcript.id}: {ai_result.get('error')}")
-                else:
-                    # Save classification
-                    classification, theme_ids = _save_classification(db, transcript, ai_result)
+                logger.info(f"Preparing transcript {transcript_id} ({transcript.source_type}/{transcript.source_id})")
+
+                variable_chunks = _load_prompt_variable_chunks(db, transcript)
+                for chunk_index, variables in enumerate(variable_chunks):
+                    jobs.append(ClassificationJob(
+                        transcript_id=transcript_id,
+                        workspace_id=transcript.workspace_id,
+                        variables=variables,
+                        estimated_tokens=estimate_tokens(*(str(v) for v in variables.values()))
+                        + CLASSIFICATION_MAX_OUTPUT_TOKENS,
+                        chunk_index=chunk_index,
+                        chunk_count=len(variable_chunks),
+                        cache_key=_classification_cache_key(variables, prompt_version) if prompt_version else None,
+                    ))
+            except Exception as e:
+                logger.error(f"Error preparing transcript {transcript_id}: {e}", exc_info=True)
+                _record_transcript_failure(db, transcript_id, str(e))
+                counters["failed"] += 1
 
-                    # Mark as processed
-                    transcript.ai_processed = True
-                    transcript.processing_completed_at = datetime.now(timezone.utc)
-                    transcript.processing_error = None
-                    processed += 1
-                    logger.info(f"Successfully processed transcript {transcript.id}")
+        logger.info(f"Prompt context cache: {get_prompt_context_cache().stats()}")
 
-                db.commit()
+        # Reuse stored results for identical (transcript, prompt, taxonomy) inputs
+        cached_results = llm_result_cache_service.get_many(db, [j.cache_key for j in jobs if j.cache_key])
+        db.commit()
 
-                # Send Slack notifications to themes (fire and forget, don't block processing)
-                if classification and theme_ids:
-                    _send_theme_slack_notifications(db, classification, theme_ids)
+        jobs, deferred_ids = _limit_jobs_to_run_budget(jobs, cached_results)
+        if deferred_ids:
+            logger.info(f"Run token budget reached, releasing {len(deferred_ids)} transcript(s) for the next run")
+            _release_transcript_leases(db, deferred_ids)
+            counters["deferred"] = len(deferred_ids)
 
-            except Exception as e:
-                logger.error(f"Error processing transcript {transcript.id}: {e}", exc_info=True)
-                # Rollback the failed transaction before updating error info
-                db.rollback()
-                try:
-                    # Re-fetch the transcript after rollback to update error info
-                    transcript = db.query(RawTranscript).filter(RawTranscript.id == transcript.id).first()
-                    if transcript:
-                        transcript.processing_error = str(e)[:1000]  # Truncate error message
-                        transcript.retry_count += 1
-                        db.commit()
-                except Exception as update_err:
-                    logger.error(f"Failed to update transcript error info: {update_err}")
-                    db.rollback()
-                failed += 1
+        throughput = run_async_task(_classify_batch(db, jobs, counters, prompt, cached_results))
+        logger.info(f"Langfuse prompt cache: {get_langfuse_prompt_service().stats()}")
+        logger.info(f"LLM result cache: {llm_result_cache_service.stats()}")
 
         result = {
-            "processed": processed,
-            "failed": failed,
-            "skipped": skipped,
+            **counters,
             "total": len(transcripts),
+            "throughput": throughput,
         }
         logger.info(f"Transcript processing completed: {result}")
         return result
 
+    except SoftTimeLimitExceeded:
+        # Release whatever is still unclassified instead of holding it for the lease period
+        logger.error("Transcript processing hit the soft time limit, releasing unfinished leases")
+        _release_leases_after_timeout(claimed_ids)
+        raise
+
     except Exception as e:
         logger.error(f"Error in process_raw_transcripts: {e}", exc_info=True)
         raise
 
     finally:
         db.close()
+
+
+@shared_task(
+    name="app.sync_engine.tasks.ai_pipeline.transcript_processing.send_theme_slack_notifications",
+    bind=True,
+    max_retries=1,
+    time_limit=300,
+    soft_time_limit=240,
+)
+def send_theme_slack_notifications(self, classification_id: str, theme_ids: List[str]) -> Dict[str, Any]:
+    """
+    Send Slack notifications for a saved transcript classification to its
+    themes' connected channels.
+
+    Args:
+        classification_id: TranscriptClassification ID
+        theme_ids: Theme IDs to notify
+
+    Returns:
+        Dict with sent/failed notification counts
+    """
+    db = SessionLocal()
+    try:
+        classification = db.query(TranscriptClassification).filter(
+            TranscriptClassification.id == UUID(classification_id)
+        ).first()
+        if not classification:
+            logger.warning(f"Classification {classification_id} not found, skipping Slack notifications")
+            return {"sent": 0, "failed": 0}
+
+        result = run_async_task(ThemeSlackNotificationService.send_notifications_for_classification(
+            db=db,
+            classification=classification,
+            theme_ids=[UUID(theme_id) for theme_id in theme_ids],
+        ))
+        if result.get("sent", 0) > 0:
+            logger.info(f"Sent {result['sent']} Slack notification(s) for classification {classification_id}")
+        if result.get("failed", 0) > 0:
+            logger.warning(f"Failed to send {result['failed']} Slack notification(s) for classification {classification_id}")
+        return result
+    except Exception as e:
+        logger.error(f"Error sending Slack notifications for classification {classification_id}: {e}", exc_info=True)
+        return {"sent": 0, "failed": len(theme_ids)}
+    finally:
+        db.close()
+
+
+@shared_task(
+    name="app.sync_engine.tasks.ai_pipeline.transcript_processing.evict_llm_result_cache",
+    bind=True,
+    max_retries=1,
+    time_limit=600,
+    soft_time_limit=540,
+)
+def evict_llm_result_cache(self) -> Dict[str, Any]:
+    """
+    Apply the LLM result cache eviction policy (max age since last use,
+    then a global row cap, least recently used first).
+
+    Returns:
+        Dict with number of evicted entries
+    """
+    db = SessionLocal()
+    try:
+        evicted = llm_result_cache_service.evict(db)
+        return {"evicted": evicted}
+    except Exception as e:
+        logger.error(f"Error evicting LLM result cache: {e}", exc_info=True)
+        db.rollback()
+        raise
+    finally:
+        db.close()
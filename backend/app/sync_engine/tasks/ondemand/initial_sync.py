@@ -82,6 +82,7 @@ def sync_workspace_initial(self, workspace_id: str):
                             limit=50,
                             days_back=30,
                             fetch_transcripts=True,
+                            backfill=True,
                         )
                     )
 
@@ -113,6 +114,7 @@ def sync_workspace_initial(self, workspace_id: str):
                             workspace_id=workspace_id,
                             limit=50,
                             days_back=30,
+                            backfill=True,
                         )
                     )
 
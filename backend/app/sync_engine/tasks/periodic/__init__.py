@@ -1,15 +1,17 @@
 """
 Periodic sync tasks that run on Celery Beat schedule.
 
-These tasks automatically sync data sources at regular intervals.
+These tasks automatically sync data sources at regular intervals, fanning
+out into one subtask per connector.
 AI processing is handled by the state-driven AI pipeline.
 """
 
 from app.sync_engine.tasks.periodic.health import health_check
-from app.sync_engine.tasks.periodic.slack import sync_slack_periodic
-from app.sync_engine.tasks.periodic.gmail import sync_gmail_periodic
-from app.sync_engine.tasks.periodic.gong import sync_gong_periodic
-from app.sync_engine.tasks.periodic.fathom import sync_fathom_periodic
+from app.sync_engine.tasks.periodic.slack import sync_slack_periodic, sync_slack_connector
+from app.sync_engine.tasks.periodic.gmail import sync_gmail_periodic, sync_gmail_connector
+from app.sync_engine.tasks.periodic.gong import sync_gong_periodic, sync_gong_connector
+from app.sync_engine.tasks.periodic.fathom import sync_fathom_periodic, sync_fathom_connector
+from app.sync_engine.tasks.periodic.fanout import summarize_periodic_sync
 from app.sync_engine.tasks.periodic.customer_extraction import (
     extract_customers_periodic,
     extract_customers_for_workspace,
@@ -21,6 +23,11 @@ __all__ = [
     "sync_gmail_periodic",
     "sync_gong_periodic",
     "sync_fathom_periodic",
+    "sync_slack_connector",
+    "sync_gmail_connector",
+    "sync_gong_connector",
+    "sync_fathom_connector",
+    "summarize_periodic_sync",
     "extract_customers_periodic",
     "extract_customers_for_workspace",
 ]
@@ -1,32 +1,78 @@
 """
 Periodic Customer Extraction Task.
 
-NOTE: Customer extraction functionality has been disabled.
-The tasks below are placeholder stubs that return immediately without processing.
+Links messages that were ingested without a customer (older rows, or rows whose
+customer lookup failed during ingestion) to customers extracted from their
+sender info. Each batch is resolved with one CustomerResolver pass, and the
+resolver's in-memory index is kept across all batches of a workspace.
+
+The tasks are not on the beat schedule; run them on demand.
 """
 
 import logging
+from uuid import UUID
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
 
 from app.tasks.celery_app import celery_app
+from app.models.message import Message
+from app.services.customer_extraction_service import CustomerResolver, customer_extraction_service
+from app.sync_engine.tasks.base import engine, cleanup_after_task
 
 logger = logging.getLogger(__name__)
 
 
+def _extract_for_workspace(db: Session, workspace_id: UUID, batch_size: int) -> dict:
+    """Process batches until a batch links nothing (done, or only unlinkable messages left)."""
+    totals = {"processed": 0, "linked": 0, "errors": 0, "customers_created": 0}
+    resolver = CustomerResolver(db, workspace_id)
+
+    while True:
+        stats = customer_extraction_service.process_messages_for_customers(
+            db=db,
+            workspace_id=workspace_id,
+            batch_size=batch_size,
+            resolver=resolver,
+        )
+        for key in ("processed", "linked", "errors"):
+            totals[key] += stats[key]
+        if stats["errors"] or not stats["linked"] or stats["processed"] < batch_size:
+            break
+
+    totals["customers_created"] = resolver.created
+    return totals
+
+
 @celery_app.task(
     name="app.sync_engine.sync_tasks.extract_customers_periodic",
     bind=True,
 )
 def extract_customers_periodic(self, batch_size: int = 200):
     """
-    Periodic task to extract customers from messages.
-
-    NOTE: This task is currently disabled and returns immediately.
+    Extract customers for every workspace that has unlinked messages.
     """
-    logger.info("⏭️ Customer extraction task is disabled - skipping")
-    return {
-        "status": "skipped",
-        "reason": "customer_extraction_disabled",
-    }
+    try:
+        with Session(engine) as db:
+            workspace_ids = [
+                row[0] for row in db.query(Message.workspace_id).filter(
+                    Message.customer_id.is_(None),
+                    or_(
+                        Message.from_email.isnot(None),
+                        Message.author_email.isnot(None),
+                        Message.author_name.isnot(None),
+                    ),
+                ).distinct().all()
+            ]
+
+            results = {}
+            for workspace_id in workspace_ids:
+                results[str(workspace_id)] = _extract_for_workspace(db, workspace_id, batch_size)
+
+        logger.info(f"Customer extraction complete for {len(results)} workspaces")
+        return {"status": "success", "workspaces": results}
+    finally:
+        cleanup_after_task()
 
 
 @celery_app.task(
@@ -36,12 +82,12 @@ def extract_customers_periodic(self, batch_size: int = 200):
 def extract_customers_for_workspace(self, workspace_id: str, batch_size: int = 500):
     """
     Extract customers for a specific workspace.
-
-    NOTE: This task is currently disabled and returns immediately.
     """
-    logger.info(f"⏭️ Customer extraction for workspace {workspace_id} is disabled - skipping")
-    return {
-        "status": "skipped",
-        "reason": "customer_extraction_disabled",
-        "workspace_id": workspace_id,
-    }
+    try:
+        with Session(engine) as db:
+            stats = _extract_for_workspace(db, UUID(workspace_id), batch_size)
+
+        logger.info(f"Customer extraction for workspace {workspace_id}: {stats}")
+        return {"status": "success", "workspace_id": workspace_id, **stats}
+    finally:
+        cleanup_after_task()
@@ -0,0 +1,225 @@
+"""
+Fan-out for periodic connector syncs.
+
+Each periodic sync task (Slack, Gmail, Gong, Fathom) lists the active
+connectors and dispatches one subtask per connector as a Celery chord:
+
+    sync_<source>_periodic
+        -> group(sync_<source>_connector(connector_id), ...)
+        -> summarize_periodic_sync(results, source_type)
+
+Connectors sync in parallel across workers with their own session and the full
+task_time_limit, so a slow tenant only delays its own subtask. At most
+SYNC_MAX_CONCURRENT_PER_WORKSPACE connector syncs of one workspace run at once
+(a Redis semaphore with one expiring entry per holder); a subtask whose
+workspace is busy retries later.
+The chord callback aggregates the per-connector results into one summary.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Dict, List
+from uuid import UUID
+
+from celery import chord, group
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.tasks.celery_app import celery_app
+from app.models.workspace import Workspace
+from app.models.workspace_connector import WorkspaceConnector
+from app.services.cache_service import get_cache_service
+from app.sync_engine.tasks.base import (
+    engine,
+    create_sync_record,
+    finalize_sync_record,
+    cleanup_after_task,
+)
+
+logger = logging.getLogger(__name__)
+
+SLOT_NAMESPACE = "sync_slots"
+# Slots outlive the longest possible sync, then expire if a worker died holding one
+SLOT_TTL = timedelta(seconds=celery_app.conf.task_time_limit or 1800)
+# Retries while the workspace is busy before the connector is skipped for this run
+MAX_SLOT_RETRIES = 10
+
+# Options for per-connector subtasks: chord members must store their results
+CONNECTOR_TASK_OPTIONS = {"bind": True, "ignore_result": False, "max_retries": MAX_SLOT_RETRIES}
+
+SUMMED_FIELDS = ("total_checked", "new_added", "duplicates_skipped", "bytes_downloaded")
+
+
+def dispatch_connector_syncs(source_type: str, connector_ids: List[str], connector_task) -> Dict[str, Any]:
+    """
+    Start one connector_task per connector, summarized by a chord callback.
+
+    Args:
+        source_type: Source type (gmail, slack, gong, fathom)
+        connector_ids: WorkspaceConnector IDs to sync
+        connector_task: Celery task taking a connector ID
+
+    Returns:
+        Dispatch info (the summary is produced by summarize_periodic_sync)
+    """
+    header = group(connector_task.s(connector_id) for connector_id in connector_ids)
+    result = chord(header)(summarize_periodic_sync.s(source_type))
+    logger.info(f"🚀 Dispatched {len(connector_ids)} {source_type} connector syncs (chord {result.id})")
+    return {"status": "dispatched", "source_type": source_type, "count": len(connector_ids), "chord_id": result.id}
+
+
+def run_connector_sync(
+    task,
+    source_type: str,
+    connector_id: str,
+    ingest: Callable[[Session, WorkspaceConnector, Workspace], Dict[str, Any]],
+    source_name: Callable[[WorkspaceConnector], str],
+) -> Dict[str, Any]:
+    """
+    Sync one connector inside a workspace slot and record it in SyncHistory.
+
+    Failures are recorded and returned rather than raised, so one failing
+    connector does not fail the chord. A busy workspace retries the task.
+
+    Args:
+        task: The bound Celery task (for retries)
+        source_type: Source type (gmail, slack, gong, fathom)
+        connector_id: WorkspaceConnector ID
+        ingest: Runs the ingestion; returns the ingestion service result dict
+            (a result with status "error" counts as a failure)
+        source_name: Display name for SyncHistory records
+
+    Returns:
+        Per-connector result for summarize_periodic_sync
+    """
+    summary: Dict[str, Any] = {"connector_id": connector_id, "source_type": source_type, "status": "skipped"}
+
+    try:
+        with Session(engine) as db:
+            connector = db.query(WorkspaceConnector).filter(WorkspaceConnector.id == UUID(connector_id)).first()
+            if not connector or not connector.is_active:
+                logger.info(f"{source_type} connector {connector_id} is gone or inactive, skipping")
+                return {**summary, "reason": "connector_inactive"}
+
+            workspace = db.query(Workspace).filter(Workspace.id == connector.workspace_id).first()
+            if not workspace:
+                logger.warning(f"Workspace not found for connector {connector_id}")
+                return {**summary, "reason": "workspace_not_found"}
+
+            workspace_id = str(workspace.id)
+            summary["workspace_id"] = workspace_id
+
+            cache = get_cache_service()
+            # The task ID survives retries and redelivery, so a rerun reuses its own slot
+            slot_holder = task.request.id or connector_id
+            if not cache.acquire_slot(
+                SLOT_NAMESPACE, workspace_id,
+                holder=slot_holder,
+                limit=settings.SYNC_MAX_CONCURRENT_PER_WORKSPACE,
+                ttl=SLOT_TTL,
+            ):
+                if task.request.retries < MAX_SLOT_RETRIES:
+                    logger.info(f"Workspace {workspace.name} is busy, retrying {source_type} connector {connector_id}")
+                    raise task.retry(countdown=settings.SYNC_SLOT_RETRY_SECONDS)
+                logger.warning(f"Workspace {workspace.name} stayed busy, skipping {source_type} connector {connector_id}")
+                return {**summary, "reason": "workspace_busy"}
+
+            try:
+                logger.info(f"Syncing {source_type} for workspace: {workspace.name} (Connector: {connector_id})")
+                result = ingest(db, connector, workspace)
+                if result.get("status") == "error":
+                    raise RuntimeError(result.get("error") or "Unknown error")
+
+                for field in SUMMED_FIELDS:
+                    summary[field] = result.get(field, 0)
+                summary["status"] = "success"
+
+                # Only create sync history record if new data was found
+                if summary["new_added"] > 0:
+                    sync_record = create_sync_record(
+                        db=db,
+                        workspace_id=workspace_id,
+                        source_type=source_type,
+                        source_name=source_name(connector),
+                        connector_id=connector_id,
+                        trigger_type="periodic",  # This is a scheduled periodic sync
+                    )
+                    finalize_sync_record(
+                        db=db,
+                        sync_record=sync_record,
+                        status="success",
+                        items_processed=summary["total_checked"],
+                        items_new=summary["new_added"],
+                        synced_item_ids=result.get("inserted_ids", []),
+                    )
+                    logger.info(
+                        f"✅ Checked {summary['total_checked']} {source_type} items, "
+                        f"added {summary['new_added']} new for {workspace.name}"
+                    )
+                else:
+                    logger.info(f"ℹ️ Checked {summary['total_checked']} {source_type} items, no new data for {workspace.name}")
+
+            except Exception as e:
+                logger.error(f"❌ Error syncing {source_type} connector {connector_id}: {e}")
+                import traceback
+                traceback.print_exc()
+                db.rollback()
+                summary.update({"status": "failed", "error": str(e)})
+                # Create a failed sync record for errors
+                try:
+                    error_record = create_sync_record(
+                        db=db,
+                        workspace_id=workspace_id,
+                        source_type=source_type,
+                        source_name=source_name(connector),
+                        connector_id=connector_id,
+                        trigger_type="periodic",  # This is a scheduled periodic sync
+                    )
+                    finalize_sync_record(
+                        db=db,
+                        sync_record=error_record,
+                        status="failed",
+                        error_message=str(e),
+                    )
+                except Exception:
+                    pass  # Don't fail if we can't create error record
+            finally:
+                cache.release_slot(SLOT_NAMESPACE, workspace_id, holder=slot_holder)
+
+        return summary
+    finally:
+        # Always cleanup after task to free memory
+        cleanup_after_task()
+
+
+@celery_app.task(
+    name="app.sync_engine.sync_tasks.summarize_periodic_sync",
+    bind=True,
+)
+def summarize_periodic_sync(self, results: List[Dict[str, Any]], source_type: str):
+    """
+    Chord callback: aggregate per-connector results of one periodic sync.
+    """
+    results = [r for r in results if isinstance(r, dict)]
+    summary: Dict[str, Any] = {
+        "status": "success",
+        "source_type": source_type,
+        "connectors": len(results),
+        "successful_connectors": sum(1 for r in results if r.get("status") == "success"),
+        "failed_connectors": sum(1 for r in results if r.get("status") == "failed"),
+        "skipped_connectors": sum(1 for r in results if r.get("status") == "skipped"),
+    }
+    for field in SUMMED_FIELDS:
+        summary[field] = sum(r.get(field, 0) for r in results)
+    summary["failures"] = [
+        {"connector_id": r["connector_id"], "error": r.get("error")}
+        for r in results if r.get("status") == "failed"
+    ]
+
+    logger.info(
+        f"✅ {source_type.capitalize()} periodic sync complete. "
+        f"New items: {summary['new_added']}, checked: {summary['total_checked']}, "
+        f"Connectors: {summary['successful_connectors']} successful, {summary['failed_connectors']} failed, "
+        f"{summary['skipped_connectors']} skipped"
+    )
+    return summary
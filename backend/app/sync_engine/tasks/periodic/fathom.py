@@ -5,6 +5,8 @@ Syncs Fathom sessions from all active connectors every 1 hour.
 Also supports on-demand sync via Sources API when user clicks "Sync All Sources".
 Uses optimized batch ingestion to raw_transcripts table.
 AI processing happens in a separate Celery task (transcript_processing).
+
+Each connector syncs in its own subtask (see periodic/fanout.py).
 """
 
 import logging
@@ -13,18 +15,20 @@ from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from app.tasks.celery_app import celery_app
-from app.models.workspace import Workspace
 from app.models.workspace_connector import WorkspaceConnector
 from app.services.fathom_batch_ingestion_service import fathom_batch_ingestion_service
 from app.sync_engine.tasks.base import (
     engine,
     run_async_task,
-    create_sync_record,
-    finalize_sync_record,
     test_db_connection,
     get_active_connectors,
     cleanup_after_task,
 )
+from app.sync_engine.tasks.periodic.fanout import (
+    CONNECTOR_TASK_OPTIONS,
+    dispatch_connector_syncs,
+    run_connector_sync,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +49,8 @@ def sync_fathom_periodic(self):
     - Runs every 1 hour via Celery Beat
     - Also triggered on-demand via Sources API ("Sync All Sources")
     - Only syncs workspaces with active Fathom connectors
-    - Fetches latest Fathom sessions from the last 24 hours
-    - Stores raw data in raw_transcripts table (ai_processed=False)
-    - AI processing happens separately via transcript_processing task
+    - Dispatches one sync_fathom_connector subtask per connector; the chord
+      callback logs the combined summary (including bytes downloaded)
     """
     try:
         logger.info("🚀 Starting periodic Fathom sync task")
@@ -64,112 +67,22 @@ def sync_fathom_periodic(self):
             get_active_connectors(db, "fathom")
 
             # Get all workspaces with active Fathom connectors
-            fathom_connectors = db.query(WorkspaceConnector).filter(
-                and_(
-                    WorkspaceConnector.connector_type == "fathom",
-                    WorkspaceConnector.is_active == True
-                )
-            ).all()
-
-            logger.info(f"Found {len(fathom_connectors)} active Fathom connectors to sync")
-
-            if not fathom_connectors:
-                logger.info("No active Fathom connectors found. Skipping Fathom sync.")
-                return {"status": "skipped", "reason": "no_active_connectors", "count": 0}
-
-            total_ingested = 0
-            successful_workspaces = 0
-            failed_workspaces = 0
-
-            for connector in fathom_connectors:
-                try:
-                    workspace = db.query(Workspace).filter(
-                        Workspace.id == connector.workspace_id
-                    ).first()
-
-                    if not workspace:
-                        logger.warning(f"Workspace not found for connector {connector.id}")
-                        continue
-
-                    logger.info(f"Syncing Fathom sessions for workspace: {workspace.name}")
-
-                    # Run the optimized batch ingestion (data storage only, no AI)
-                    result = run_async_task(
-                        fathom_batch_ingestion_service.ingest_sessions(
-                            db=db,
-                            workspace_id=str(workspace.id),
-                            limit=60,
-                            days_back=1,
-                            min_duration_seconds=0
-                        )
+            connector_ids = [
+                str(row[0]) for row in db.query(WorkspaceConnector.id).filter(
+                    and_(
+                        WorkspaceConnector.connector_type == "fathom",
+                        WorkspaceConnector.is_active == True
                     )
+                ).all()
+            ]
 
-                    # Extract counts and IDs from result
-                    total_checked = result.get("total_checked", 0)
-                    new_added = result.get("new_added", 0)
-                    inserted_ids = result.get("inserted_ids", [])
-
-                    # Only create sync history record if new data was found
-                    if new_added > 0:
-                        sync_record = create_sync_record(
-                            db=db,
-                            workspace_id=str(workspace.id),
-                            source_type="fathom",
-                            source_name="Fathom",
-                            connector_id=str(connector.id),
-                            trigger_type="periodic"
-                        )
-                        finalize_sync_record(
-                            db=db,
-                            sync_record=sync_record,
-                            status="success",
-                            items_processed=total_checked,
-                            items_new=new_added,
-                            synced_item_ids=inserted_ids,
-                        )
-                        logger.info(f"✅ Checked {total_checked} Fathom sessions, added {new_added} new for {workspace.name}")
-                    else:
-                        logger.info(f"ℹ️ Checked {total_checked} Fathom sessions, no new data for {workspace.name}")
-
-                    total_ingested += new_added
-                    successful_workspaces += 1
-
-                except Exception as e:
-                    failed_workspaces += 1
-                    logger.error(f"❌ Error syncing Fathom sessions for workspace {connector.workspace_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Create a failed sync record for errors
-                    try:
-                        error_record = create_sync_record(
-                            db=db,
-                            workspace_id=str(workspace.id),
-                            source_type="fathom",
-                            source_name="Fathom",
-                            connector_id=str(connector.id),
-                            trigger_type="periodic",  # This is a scheduled periodic sync
-                        )
-                        finalize_sync_record(
-                            db=db,
-                            sync_record=error_record,
-                            status="failed",
-                            error_message=str(e),
-                        )
-                    except Exception:
-                        pass
-                    continue
-
-            logger.info(
-                f"✅ Fathom periodic sync complete. "
-                f"Total sessions: {total_ingested}, "
-                f"Workspaces: {successful_workspaces} successful, {failed_workspaces} failed"
-            )
-            return {
-                "status": "success",
-                "total_ingested": total_ingested,
-                "successful_workspaces": successful_workspaces,
-                "failed_workspaces": failed_workspaces
-            }
+        logger.info(f"Found {len(connector_ids)} active Fathom connectors to sync")
+
+        if not connector_ids:
+            logger.info("No active Fathom connectors found. Skipping Fathom sync.")
+            return {"status": "skipped", "reason": "no_active_connectors", "count": 0}
+
+        return dispatch_connector_syncs("fathom", connector_ids, sync_fathom_connector)
 
     except Exception as e:
         logger.error(f"❌ Fatal error in Fathom periodic sync: {e}")
@@ -179,3 +92,34 @@ def sync_fathom_periodic(self):
     finally:
         # Always cleanup after task to free memory
         cleanup_after_task()
+
+
+@celery_app.task(
+    name="app.sync_engine.sync_tasks.sync_fathom_connector",
+    **CONNECTOR_TASK_OPTIONS,
+)
+def sync_fathom_connector(self, connector_id: str):
+    """
+    Sync one Fathom connector.
+
+    - Fetches every Fathom session since the connector watermark (first sync: last 24 hours)
+    - Downloads transcripts only for sessions not stored yet
+    - Stores raw data in raw_transcripts table (ai_processed=False)
+    - AI processing happens separately via transcript_processing task
+    """
+    def ingest(db, connector, workspace):
+        # Run the optimized batch ingestion (data storage only, no AI)
+        result = run_async_task(
+            fathom_batch_ingestion_service.ingest_sessions(
+                db=db,
+                workspace_id=str(workspace.id),
+                limit=None,
+                days_back=1,
+                min_duration_seconds=0,
+                incremental=True,
+            )
+        )
+        logger.info(f"Fathom sync for {workspace.name} downloaded {result.get('bytes_downloaded', 0)} bytes")
+        return result
+
+    return run_connector_sync(self, "fathom", connector_id, ingest, source_name=lambda connector: "Fathom")
@@ -5,6 +5,8 @@ Syncs Gong calls from all active connectors every 1 hour.
 Also supports on-demand sync via Sources API when user clicks "Sync All Sources".
 Uses optimized batch ingestion to raw_transcripts table.
 AI processing happens in a separate Celery task (transcript_processing).
+
+Each connector syncs in its own subtask (see periodic/fanout.py).
 """
 
 import logging
@@ -13,18 +15,20 @@ from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from app.tasks.celery_app import celery_app
-from app.models.workspace import Workspace
 from app.models.workspace_connector import WorkspaceConnector
 from app.services.gong_ingestion_service import gong_ingestion_service
 from app.sync_engine.tasks.base import (
     engine,
     run_async_task,
-    create_sync_record,
-    finalize_sync_record,
     test_db_connection,
     get_active_connectors,
     cleanup_after_task,
 )
+from app.sync_engine.tasks.periodic.fanout import (
+    CONNECTOR_TASK_OPTIONS,
+    dispatch_connector_syncs,
+    run_connector_sync,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +49,8 @@ def sync_gong_periodic(self):
     - Runs every 1 hour via Celery Beat
     - Also triggered on-demand via Sources API ("Sync All Sources")
     - Only syncs workspaces with active Gong connectors
-    - Fetches latest Gong calls from the last 24 hours
-    - Stores raw data in raw_transcripts table (ai_processed=False)
-    - AI processing happens separately via transcript_processing task
+    - Dispatches one sync_gong_connector subtask per connector; the chord
+      callback logs the combined summary
     """
     try:
         logger.info("🚀 Starting periodic Gong sync task")
@@ -64,112 +67,22 @@ def sync_gong_periodic(self):
             get_active_connectors(db, "gong")
 
             # Get all workspaces with active Gong connectors
-            gong_connectors = db.query(WorkspaceConnector).filter(
-                and_(
-                    WorkspaceConnector.connector_type == "gong",
-                    WorkspaceConnector.is_active == True
-                )
-            ).all()
-
-            logger.info(f"Found {len(gong_connectors)} active Gong connectors to sync")
-
-            if not gong_connectors:
-                logger.info("No active Gong connectors found. Skipping Gong sync.")
-                return {"status": "skipped", "reason": "no_active_connectors", "count": 0}
-
-            total_ingested = 0
-            successful_workspaces = 0
-            failed_workspaces = 0
-
-            for connector in gong_connectors:
-                try:
-                    workspace = db.query(Workspace).filter(
-                        Workspace.id == connector.workspace_id
-                    ).first()
-
-                    if not workspace:
-                        logger.warning(f"Workspace not found for connector {connector.id}")
-                        continue
-
-                    logger.info(f"Syncing Gong calls for workspace: {workspace.name}")
-
-                    # Run the optimized batch ingestion (data storage only, no AI)
-                    result = run_async_task(
-                        gong_ingestion_service.ingest_calls(
-                            db=db,
-                            workspace_id=str(workspace.id),
-                            limit=60,
-                            days_back=1,
-                            fetch_transcripts=True
-                        )
+            connector_ids = [
+                str(row[0]) for row in db.query(WorkspaceConnector.id).filter(
+                    and_(
+                        WorkspaceConnector.connector_type == "gong",
+                        WorkspaceConnector.is_active == True
                     )
+                ).all()
+            ]
 
-                    # Extract counts and IDs from result
-                    total_checked = result.get("total_checked", 0)
-                    new_added = result.get("new_added", 0)
-                    inserted_ids = result.get("inserted_ids", [])
-
-                    # Only create sync history record if new data was found
-                    if new_added > 0:
-                        sync_record = create_sync_record(
-                            db=db,
-                            workspace_id=str(workspace.id),
-                            source_type="gong",
-                            source_name="Gong",
-                            connector_id=str(connector.id),
-                            trigger_type="periodic",  # This is a scheduled periodic sync
-                        )
-                        finalize_sync_record(
-                            db=db,
-                            sync_record=sync_record,
-                            status="success",
-                            items_processed=total_checked,
-                            items_new=new_added,
-                            synced_item_ids=inserted_ids,
-                        )
-                        logger.info(f"✅ Checked {total_checked} Gong calls, added {new_added} new for {workspace.name}")
-                    else:
-                        logger.info(f"ℹ️ Checked {total_checked} Gong calls, no new data for {workspace.name}")
-
-                    total_ingested += new_added
-                    successful_workspaces += 1
-
-                except Exception as e:
-                    failed_workspaces += 1
-                    logger.error(f"❌ Error syncing Gong calls for workspace {connector.workspace_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Create a failed sync record for errors
-                    try:
-                        error_record = create_sync_record(
-                            db=db,
-                            workspace_id=str(workspace.id),
-                            source_type="gong",
-                            source_name="Gong",
-                            connector_id=str(connector.id),
-                            trigger_type="periodic",  # This is a scheduled periodic sync
-                        )
-                        finalize_sync_record(
-                            db=db,
-                            sync_record=error_record,
-                            status="failed",
-                            error_message=str(e),
-                        )
-                    except Exception:
-                        pass
-                    continue
-
-            logger.info(
-                f"✅ Gong periodic sync complete. "
-                f"Total calls: {total_ingested}, "
-                f"Workspaces: {successful_workspaces} successful, {failed_workspaces} failed"
-            )
-            return {
-                "status": "success",
-                "total_ingested": total_ingested,
-                "successful_workspaces": successful_workspaces,
-                "failed_workspaces": failed_workspaces
-            }
+        logger.info(f"Found {len(connector_ids)} active Gong connectors to sync")
+
+        if not connector_ids:
+            logger.info("No active Gong connectors found. Skipping Gong sync.")
+            return {"status": "skipped", "reason": "no_active_connectors", "count": 0}
+
+        return dispatch_connector_syncs("gong", connector_ids, sync_gong_connector)
 
     except Exception as e:
         logger.error(f"❌ Fatal error in Gong periodic sync: {e}")
@@ -179,3 +92,32 @@ def sync_gong_periodic(self):
     finally:
         # Always cleanup after task to free memory
         cleanup_after_task()
+
+
+@celery_app.task(
+    name="app.sync_engine.sync_tasks.sync_gong_connector",
+    **CONNECTOR_TASK_OPTIONS,
+)
+def sync_gong_connector(self, connector_id: str):
+    """
+    Sync one Gong connector.
+
+    - Fetches every Gong call since the connector watermark (first sync: last 24 hours),
+      following Gong's cursor instead of truncating
+    - Stores raw data in raw_transcripts table (ai_processed=False)
+    - AI processing happens separately via transcript_processing task
+    """
+    def ingest(db, connector, workspace):
+        # Run the optimized batch ingestion (data storage only, no AI)
+        return run_async_task(
+            gong_ingestion_service.ingest_calls(
+                db=db,
+                workspace_id=str(workspace.id),
+                limit=None,
+                days_back=1,
+                fetch_transcripts=True,
+                incremental=True,
+            )
+        )
+
+    return run_connector_sync(self, "gong", connector_id, ingest, source_name=lambda connector: "Gong")
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timezone
 
 from app.tasks.celery_app import celery_app
+from app.services.connector_http import connector_http
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +16,16 @@ def health_check():
     """
     Health check task to verify Celery sync engine is working.
 
-    Runs every 5 minutes to confirm the worker is alive.
+    Runs every 5 minutes to confirm the worker is alive. Also logs the
+    connector HTTP request metrics of the worker process that runs it.
     """
     logger.info("✅ Celery sync engine health check: OK")
+    http_metrics = connector_http.get_metrics()
+    for key, metrics in http_metrics.items():
+        logger.info(f"📊 Connector HTTP {key}: {metrics}")
     return {
         "status": "healthy",
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "service": "sync_engine"
+        "service": "sync_engine",
+        "connector_http": http_metrics,
     }
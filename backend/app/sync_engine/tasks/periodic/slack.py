@@ -4,6 +4,8 @@ Periodic Slack sync task.
 Syncs Slack messages from all active workspace connectors every 15 minutes.
 Uses optimized batch ingestion - data storage only, no AI extraction.
 AI extraction happens in a separate batch processing task.
+
+Each connector syncs in its own subtask (see periodic/fanout.py).
 """
 
 import logging
@@ -12,18 +14,20 @@ from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from app.tasks.celery_app import celery_app
-from app.models.workspace import Workspace
 from app.models.workspace_connector import WorkspaceConnector
 from app.services.slack_batch_ingestion_service import slack_batch_ingestion_service
 from app.sync_engine.tasks.base import (
     engine,
     run_async_task,
-    create_sync_record,
-    finalize_sync_record,
     test_db_connection,
     get_active_connectors,
     cleanup_after_task,
 )
+from app.sync_engine.tasks.periodic.fanout import (
+    CONNECTOR_TASK_OPTIONS,
+    dispatch_connector_syncs,
+    run_connector_sync,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +47,8 @@ def sync_slack_periodic(self):
     This task:
     - Runs every 15 minutes
     - Only syncs active Slack connectors
-    - Fetches messages from selected channels
-    - Stores messages in Message table with tier1_processed=False
-    - Creates SyncHistory records for tracking
+    - Dispatches one sync_slack_connector subtask per connector; the chord
+      callback logs the combined summary
 
     AI extraction is NOT performed here - it happens in a separate batch task.
     """
@@ -64,112 +67,22 @@ def sync_slack_periodic(self):
             get_active_connectors(db, "slack")
 
             # Get all active Slack connectors
-            connectors = db.query(WorkspaceConnector).filter(
-                and_(
-                    WorkspaceConnector.connector_type == "slack",
-                    WorkspaceConnector.is_active == True
-                )
-            ).all()
-
-            logger.info(f"Found {len(connectors)} active Slack connectors to sync")
-
-            if not connectors:
-                logger.info("No active Slack connectors found. Skipping Slack sync.")
-                return {"status": "skipped", "reason": "no_active_connectors", "count": 0}
-
-            total_synced = 0
-            successful_workspaces = 0
-            failed_workspaces = 0
-
-            for connector in connectors:
-                sync_record = None
-                try:
-                    workspace = db.query(Workspace).filter(
-                        Workspace.id == connector.workspace_id
-                    ).first()
-
-                    if not workspace:
-                        logger.warning(f"Workspace not found for connector {connector.id}")
-                        continue
-
-                    logger.info(f"Syncing Slack for workspace: {workspace.name} (Connector: {connector.external_name or connector.name})")
-
-                    # Use optimized batch ingestion (data storage only, no AI)
-                    result = run_async_task(
-                        slack_batch_ingestion_service.ingest_messages(
-                            connector_id=str(connector.id),
-                            db=db,
-                            hours_back=24
-                        )
+            connector_ids = [
+                str(row[0]) for row in db.query(WorkspaceConnector.id).filter(
+                    and_(
+                        WorkspaceConnector.connector_type == "slack",
+                        WorkspaceConnector.is_active == True
                     )
+                ).all()
+            ]
 
-                    # Extract counts and IDs from result
-                    total_checked = result.get("total_checked", 0)
-                    new_added = result.get("new_added", 0)
-                    duplicates_skipped = result.get("duplicates_skipped", 0)
-                    inserted_ids = result.get("inserted_ids", [])
-
-                    # Only create sync history record if new data was found
-                    if new_added > 0:
-                        sync_record = create_sync_record(
-                            db=db,
-                            workspace_id=str(workspace.id),
-                            source_type="slack",
-                            source_name=connector.external_name or connector.name or "Slack",
-                            connector_id=str(connector.id),
-                            trigger_type="periodic",  # This is a scheduled periodic sync
-                        )
-                        finalize_sync_record(
-                            db=db,
-                            sync_record=sync_record,
-                            status="success",
-                            items_processed=total_checked,
-                            items_new=new_added,
-                            synced_item_ids=inserted_ids,
-                        )
-                        logger.info(f"✅ Checked {total_checked} messages, added {new_added} new for {workspace.name}")
-                    else:
-                        logger.info(f"ℹ️ Checked {total_checked} messages, no new data for {workspace.name}")
-
-                    total_synced += new_added
-                    successful_workspaces += 1
-
-                except Exception as e:
-                    failed_workspaces += 1
-                    logger.error(f"❌ Error syncing Slack for connector {connector.id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Create a failed sync record for errors
-                    try:
-                        error_record = create_sync_record(
-                            db=db,
-                            workspace_id=str(workspace.id),
-                            source_type="slack",
-                            source_name=connector.external_name or connector.name or "Slack",
-                            connector_id=str(connector.id),
-                            trigger_type="periodic",  # This is a scheduled periodic sync
-                        )
-                        finalize_sync_record(
-                            db=db,
-                            sync_record=error_record,
-                            status="failed",
-                            error_message=str(e),
-                        )
-                    except Exception:
-                        pass  # Don't fail if we can't create error record
-                    continue
-
-            logger.info(
-                f"✅ Slack periodic sync complete. "
-                f"Total messages: {total_synced}, "
-                f"Workspaces: {successful_workspaces} successful, {failed_workspaces} failed"
-            )
-            return {
-                "status": "success",
-                "total_messages": total_synced,
-                "successful_workspaces": successful_workspaces,
-                "failed_workspaces": failed_workspaces
-            }
+        logger.info(f"Found {len(connector_ids)} active Slack connectors to sync")
+
+        if not connector_ids:
+            logger.info("No active Slack connectors found. Skipping Slack sync.")
+            return {"status": "skipped", "reason": "no_active_connectors", "count": 0}
+
+        return dispatch_connector_syncs("slack", connector_ids, sync_slack_connector)
 
     except Exception as e:
         logger.error(f"❌ Fatal error in Slack periodic sync: {e}")
@@ -179,3 +92,33 @@ def sync_slack_periodic(self):
     finally:
         # Always cleanup after task to free memory
         cleanup_after_task()
+
+
+@celery_app.task(
+    name="app.sync_engine.sync_tasks.sync_slack_connector",
+    **CONNECTOR_TASK_OPTIONS,
+)
+def sync_slack_connector(self, connector_id: str):
+    """
+    Sync one Slack connector.
+
+    - Fetches messages from selected channels newer than each channel's watermark
+      (first sync: last 24 hours), paging until caught up
+    - Stores messages in Message table with tier1_processed=False
+    - Creates SyncHistory records for tracking
+    """
+    def ingest(db, connector, workspace):
+        # Use optimized batch ingestion (data storage only, no AI)
+        return run_async_task(
+            slack_batch_ingestion_service.ingest_messages(
+                connector_id=str(connector.id),
+                db=db,
+                hours_back=24,
+                incremental=True,
+            )
+        )
+
+    return run_connector_sync(
+        self, "slack", connector_id, ingest,
+        source_name=lambda connector: connector.external_name or connector.name or "Slack",
+    )
@@ -34,6 +34,7 @@ celery_app = Celery(
         "app.sync_engine.tasks.periodic.gmail",
         "app.sync_engine.tasks.periodic.gong",
         "app.sync_engine.tasks.periodic.fathom",
+        "app.sync_engine.tasks.periodic.fanout",
         # === ON-DEMAND TASKS (user-triggered) ===
         "app.sync_engine.tasks.ondemand.gmail",
         "app.sync_engine.tasks.ondemand.slack",
@@ -43,6 +44,7 @@ celery_app = Celery(
         "app.sync_engine.tasks.ondemand.initial_sync",
         # === TRANSCRIPT PROCESSING ===
         "app.sync_engine.tasks.ai_pipeline.transcript_processing",
+        "app.sync_engine.tasks.ai_pipeline.batch_classification",
     ]
 )
 
@@ -154,10 +156,20 @@ celery_app.conf.beat_schedule = {
     },
 
     # === TRANSCRIPT PROCESSING ===
-    # Process raw transcripts every 2 minutes
+    # Safety net only - ingestion enqueues processing for the transcripts it inserts
     "process-raw-transcripts": {
         "task": "app.sync_engine.tasks.ai_pipeline.transcript_processing.process_raw_transcripts",
-        "schedule": schedule(run_every=120),  # 120 seconds = 2 minutes
+        "schedule": schedule(run_every=900),  # 900 seconds = 15 minutes
+    },
+    # Poll OpenAI Batch API backfill jobs every 5 minutes (and start one for large backlogs)
+    "poll-classification-batches": {
+        "task": "app.sync_engine.tasks.ai_pipeline.batch_classification.poll_classification_batches",
+        "schedule": schedule(run_every=300),  # 300 seconds = 5 minutes
+    },
+    # Evict old LLM result cache entries once a day
+    "evict-llm-result-cache": {
+        "task": "app.sync_engine.tasks.ai_pipeline.transcript_processing.evict_llm_result_cache",
+        "schedule": schedule(run_every=86400),  # 86400 seconds = 24 hours
     },
 }
 
@@ -165,7 +177,7 @@ logger.info(f"Celery app initialized with broker: {settings.REDIS_URL}")
 logger.info("Data Ingestion (periodic):")
 logger.info("  - Slack: every 30 min | Gong: every 1 hour | Fathom: every 1 hour | Gmail: every 31 min")
 logger.info("Transcript Processing (periodic):")
-logger.info("  - Process raw transcripts: every 2 min")
+logger.info("  - Process raw transcripts: on ingest + every 15 min | Poll batch backfills: every 5 min | Evict LLM result cache: daily")
 
 
 # ============================================================================
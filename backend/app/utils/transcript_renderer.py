@@ -0,0 +1,280 @@
+"""
+Transcript Renderer
+
+Single renderer for raw transcript JSON (raw_transcripts.raw_data) from Gong and
+Fathom. It replaces the copies that used to live in the AI pipeline,
+SourcesService and TranscriptClassificationService.
+
+Rendering is generator based: speaker turns are produced one at a time straight
+from the transcript segments, with no intermediate list of lines. The
+classification chunker consumes turns as a stream, and callers that only need
+the beginning of a long call pass max_tokens so rendering stops as soon as the
+budget is used up instead of formatting the whole call.
+
+Supported raw_data formats:
+1. Nested format from gong_ingestion_service: {call_data: {..., parties: [...]}, transcript: {...}}
+2. Direct Gong format: {parties: [...], transcript: [...], metaData: {...}}
+3. Fathom format: {title, transcript: [{text, speaker: {display_name, ...}, timestamp}], calendar_invitees, ...}
+
+Styles:
+- "block" (default): call header, then "Name (email):\\n  text\\n" per turn, joined by newlines.
+  Used for LLM prompts and the transcript view.
+- "inline": no header, "Name (email): text" per turn, separated by blank lines.
+  Used by the source detail view.
+
+Usage:
+    text = format_transcript(raw_data)
+    for piece in render_transcript(raw_data, max_tokens=4000):
+        ...
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+# Rough chars-per-token ratio for English transcripts (OpenAI guidance)
+CHARS_PER_TOKEN = 4
+
+STYLE_BLOCK = "block"
+STYLE_INLINE = "inline"
+
+NO_TRANSCRIPT = "No transcript available."
+NO_CONTENT = "No transcript content found."
+NOT_RECOGNIZED = "Transcript format not recognized."
+TRUNCATED_MARKER = "[Transcript truncated]"
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Estimate the number of prompt tokens for the given texts."""
+    return sum(len(t or "") for t in texts) // CHARS_PER_TOKEN + 1
+
+
+def render_turn(name: str, email: str, text: str, style: str = STYLE_BLOCK) -> str:
+    """Render one speaker turn: "Name (email): what they said"."""
+    speaker = f"{name} ({email})" if email else name
+    if style == STYLE_INLINE:
+        return f"{speaker}: {text}"
+    return f"{speaker}:\n  {text}\n"
+
+
+def is_fathom_transcript(raw_data: Dict[str, Any]) -> bool:
+    """Detect Fathom format by checking for Fathom-specific fields."""
+    return (
+        'recorded_by' in raw_data or
+        'calendar_invitees' in raw_data or
+        'share_url' in raw_data or
+        'recording_id' in raw_data
+    )
+
+
+def _transcript_segments(raw_data: Dict[str, Any]) -> Any:
+    """
+    Get the transcript segment list without copying it.
+
+    In the nested Gong format raw_data['transcript'] is the transcript API
+    response and the segments live one level down.
+    """
+    transcript_data = raw_data.get('transcript', {})
+    if isinstance(transcript_data, dict):
+        return transcript_data.get('transcript', [])
+    if isinstance(transcript_data, list):
+        return transcript_data
+    return []
+
+
+def _render_header(title: str, started: str) -> str:
+    lines = ["=" * 80, f"Call: {title}"]
+    if started:
+        lines.append(f"Date: {started}")
+    lines.append("=" * 80)
+    lines.append("")
+    return "\n".join(lines)
+
+
+def transcript_header(raw_data: Dict[str, Any]) -> str:
+    """Render the call header block (title and date)."""
+    if is_fathom_transcript(raw_data):
+        # Try both title field names; prefer recording_start_time for the date
+        title = raw_data.get('title') or raw_data.get('meeting_title', 'Untitled Call')
+        started = raw_data.get('recording_start_time') or raw_data.get('created_at', '')
+        return _render_header(title, started)
+
+    # Gong: try nested location first (call_data.metaData), then root level
+    call_data = raw_data.get('call_data', {})
+    call_metadata = call_data.get('metaData', {}) if call_data else {}
+    if not call_metadata:
+        call_metadata = raw_data.get('call_metadata', raw_data.get('metaData', {}))
+    return _render_header(call_metadata.get('title', 'Untitled Call'), call_metadata.get('started', ''))
+
+
+def _gong_speaker_map(raw_data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Map Gong speakerId -> name/email, from call_data.parties or root-level parties."""
+    call_data = raw_data.get('call_data', {})
+    parties = call_data.get('parties', []) if call_data else []
+    if not parties:
+        parties = raw_data.get('parties', [])
+
+    speaker_map = {}
+    for party in parties:
+        speaker_id = party.get('speakerId')
+        if speaker_id:
+            speaker_map[str(speaker_id)] = {
+                'name': party.get('name', 'Unknown'),
+                'email': party.get('emailAddress', ''),
+            }
+    return speaker_map
+
+
+def _fathom_email_map(raw_data: Dict[str, Any]) -> Dict[str, str]:
+    """Map Fathom speaker display name -> email, from calendar invitees and the recorder."""
+    email_map = {}
+    for invitee in raw_data.get('calendar_invitees', []) or []:
+        email = invitee.get('email', '')
+        matched_speaker = invitee.get('matched_speaker_display_name')
+        if matched_speaker:
+            email_map[matched_speaker] = email
+        if invitee.get('name'):
+            email_map[invitee['name']] = email
+
+    recorded_by = raw_data.get('recorded_by', {})
+    if recorded_by and recorded_by.get('name'):
+        email_map[recorded_by['name']] = recorded_by.get('email', '')
+    return email_map
+
+
+def _fathom_turn(segment: Dict[str, Any], email_map: Dict[str, str]) -> Optional[Tuple[str, str, str]]:
+    text = (segment.get('text') or '').strip()
+    if not text:
+        return None
+    speaker = segment.get('speaker') or {}
+    name = speaker.get('display_name', 'Unknown Speaker')
+    email = (
+        speaker.get('matched_calendar_invitee_email', '') or
+        speaker.get('email', '') or
+        email_map.get(name, '')
+    )
+    return name, email, text
+
+
+def _gong_turn(segment: Dict[str, Any], speaker_map: Dict[str, Dict[str, str]]) -> Optional[Tuple[str, str, str]]:
+    speaker_info = speaker_map.get(str(segment.get('speakerId', '')), {'name': 'Unknown Speaker', 'email': ''})
+
+    sentences = segment.get('sentences', [])
+    if not sentences:
+        text = segment.get('text', '')
+        if not text:
+            return None
+        sentences = [{'text': text}]
+
+    # Combine all sentences for this speaker segment
+    text_parts = []
+    for sentence in sentences:
+        if isinstance(sentence, dict):
+            text = (sentence.get('text') or '').strip()
+            if text:
+                text_parts.append(text)
+        elif isinstance(sentence, str):
+            text_parts.append(sentence.strip())
+
+    if not text_parts:
+        return None
+    return speaker_info['name'], speaker_info['email'], ' '.join(text_parts)
+
+
+def iter_transcript_turns(raw_data: Dict[str, Any]) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (name, email, text) speaker turns in order, one segment at a time.
+
+    Segments carrying a Fathom-style speaker object are handled even inside
+    Gong-shaped payloads. Empty segments are skipped.
+    """
+    if not raw_data:
+        return
+
+    segments = _transcript_segments(raw_data)
+    if not isinstance(segments, list):
+        return
+
+    fathom = is_fathom_transcript(raw_data)
+    speaker_map = {} if fathom else _gong_speaker_map(raw_data)
+    email_map = _fathom_email_map(raw_data) if fathom else {}
+
+    for segment in segments:
+        if not isinstance(segment, dict):
+            continue
+        if fathom or isinstance(segment.get('speaker'), dict):
+            turn = _fathom_turn(segment, email_map)
+        else:
+            turn = _gong_turn(segment, speaker_map)
+        if turn is not None:
+            yield turn
+
+
+def transcript_sections(raw_data: Dict[str, Any], style: str = STYLE_BLOCK) -> Tuple[str, Iterator[str]]:
+    """
+    Split a transcript into its header and a lazy iterator of rendered turns.
+
+    Joining the header and all turns with newlines ("block") or blank lines
+    ("inline") gives format_transcript()'s output. Turns are rendered on demand,
+    which lets the classification chunker split on turn boundaries while
+    consuming the transcript as a stream.
+
+    Returns:
+        Tuple of (header, turns). Header is empty for the "inline" style and
+        when the transcript cannot be rendered (turns then holds one message).
+    """
+    if not raw_data:
+        return "", iter([NO_TRANSCRIPT])
+
+    if not isinstance(_transcript_segments(raw_data), list):
+        if 'content' in raw_data:
+            return "", iter([str(raw_data['content'])])
+        return "", iter([NOT_RECOGNIZED])
+
+    header = transcript_header(raw_data) if style == STYLE_BLOCK else ""
+    return header, (render_turn(name, email, text, style) for name, email, text in iter_transcript_turns(raw_data))
+
+
+def render_transcript(
+    raw_data: Dict[str, Any],
+    style: str = STYLE_BLOCK,
+    max_tokens: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Render a transcript as a stream of text pieces (header first, then turns).
+
+    Pieces are meant to be joined with join_transcript(). When max_tokens is
+    set, rendering stops before the first turn that would exceed the budget
+    and a "[Transcript truncated]" marker is yielded instead. The header and
+    the first turn are always included.
+    """
+    header, turns = transcript_sections(raw_data, style)
+    used = 0
+    if header:
+        used += estimate_tokens(header)
+        yield header
+
+    rendered_any = False
+    for turn in turns:
+        if max_tokens is not None:
+            used += estimate_tokens(turn)
+            if used > max_tokens and rendered_any:
+                yield TRUNCATED_MARKER
+                return
+        rendered_any = True
+        yield turn
+
+    if not rendered_any and style == STYLE_INLINE:
+        yield NO_CONTENT
+
+
+def join_transcript(pieces: Iterable[str], style: str = STYLE_BLOCK) -> str:
+    """Join rendered pieces into the final transcript text."""
+    return ("\n\n" if style == STYLE_INLINE else "\n").join(pieces)
+
+
+def format_transcript(
+    raw_data: Dict[str, Any],
+    style: str = STYLE_BLOCK,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """Render a transcript to a single string. See render_transcript()."""
+    return join_transcript(render_transcript(raw_data, style, max_tokens), style)
@@ -26,6 +26,8 @@ from app.models.user import User
 from app.models.transcript_classification import TranscriptClassification
 from app.models.theme import Theme
 from app.models.sub_theme import SubTheme
+from app.services.cache_service import bump_classification_version
+from app.services.transcript_insights_service import transcript_insights_service
 
 
 def find_workspace_by_email(db: Session, email: str) -> Optional[UUID]:
@@ -114,8 +116,11 @@ def backfill_arrays(db: Session, workspace_id: UUID) -> dict:
         
         # Update the record
         try:
+            # Theme counts in the insights rollup come from theme_ids
+            previous = transcript_insights_service.snapshot(tc)
             tc.theme_ids = theme_ids_list if theme_ids_list else None
             tc.sub_theme_ids = sub_theme_ids_list if sub_theme_ids_list else None
+            transcript_insights_service.record_classification(db, tc, previous)
             db.commit()
             updated += 1
             
@@ -174,7 +179,10 @@ def main():
                 sys.exit(1)
         
         # Run backfill
-        backfill_arrays(db, workspace_id)
+        result = backfill_arrays(db, workspace_id)
+
+        if result["updated"]:
+            bump_classification_version(str(workspace_id))
 
 
 if __name__ == "__main__":
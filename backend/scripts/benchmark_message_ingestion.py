@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""
+Benchmark message ingestion: ON CONFLICT upsert vs. the previous pre-select path.
+
+For each fixture size, synthetic Slack-style messages are inserted into a real
+database twice per path:
+1. Fresh insert (every row is new)
+2. Re-run of the same rows (every row is a duplicate, the common case for
+   periodic syncs that re-read a window)
+
+The legacy path (SELECT existing external_ids, then bulk_insert_mappings in
+chunks of 100) is reimplemented here so the comparison keeps working after it
+was removed from BatchDatabaseService. Customer extraction is disabled for
+both paths by leaving author info empty, so only the insert path is measured.
+
+Every run uses its own external_id prefix and deletes its rows afterwards.
+
+Usage:
+    # From backend directory:
+    python scripts/benchmark_message_ingestion.py --workspace-id <uuid> --connector-id <uuid>
+    python scripts/benchmark_message_ingestion.py --workspace-id <uuid> --connector-id <uuid> --rows 10000 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+from uuid import UUID
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.models.message import Message  # noqa: E402
+from app.services.batch_db_service import batch_db_service  # noqa: E402
+
+LEGACY_BATCH_SIZE = 100
+
+
+def build_messages(count: int, prefix: str) -> List[Dict[str, Any]]:
+    """Slack-shaped message dicts as produced by the Slack batch ingestion."""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "external_id": f"{prefix}-{n}",
+            "content": f"Benchmark message {n}: the export keeps timing out on large workspaces",
+            "channel_id": "CBENCH",
+            "channel_name": "benchmark",
+            "thread_id": None,
+            "sent_at": now,
+            "metadata": {"benchmark": True},
+        }
+        for n in range(count)
+    ]
+
+
+def legacy_insert(db, messages: List[Dict[str, Any]], workspace_id: str, connector_id: str) -> int:
+    """Pre-select existing external_ids, then bulk_insert_mappings in chunks."""
+    external_ids = [m["external_id"] for m in messages]
+    existing = set()
+    for i in range(0, len(external_ids), 1000):
+        rows = db.query(Message.external_id).filter(
+            Message.workspace_id == UUID(workspace_id),
+            Message.source == "slack",
+            Message.external_id.in_(external_ids[i:i + 1000]),
+        ).all()
+        existing.update(r[0] for r in rows)
+
+    inserted = 0
+    now = datetime.now(timezone.utc)
+    for i in range(0, len(messages), LEGACY_BATCH_SIZE):
+        mappings = []
+        for msg in messages[i:i + LEGACY_BATCH_SIZE]:
+            if msg["external_id"] in existing:
+                continue
+            mappings.append({
+                "id": uuid.uuid4(),
+                "external_id": msg["external_id"],
+                "content": msg["content"],
+                "source": "slack",
+                "workspace_id": UUID(workspace_id),
+                "connector_id": UUID(connector_id),
+                "channel_id": msg["channel_id"],
+                "channel_name": msg["channel_name"],
+                "message_metadata": msg["metadata"],
+                "sent_at": msg["sent_at"],
+                "created_at": now,
+                "updated_at": now,
+                "tier1_processed": False,
+                "tier2_processed": False,
+            })
+        if mappings:
+            db.bulk_insert_mappings(Message, mappings)
+            inserted += len(mappings)
+    db.commit()
+    return inserted
+
+
+def upsert_insert(db, messages: List[Dict[str, Any]], workspace_id: str, connector_id: str) -> int:
+    result = batch_db_service.batch_insert_messages(
+        db=db, messages=messages, workspace_id=workspace_id, connector_id=connector_id, source="slack"
+    )
+    return result["new_added"]
+
+
+def cleanup(db, workspace_id: str, prefix: str) -> None:
+    db.query(Message).filter(
+        Message.workspace_id == UUID(workspace_id),
+        Message.external_id.like(f"{prefix}-%"),
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+def run(name: str, insert: Callable, rows: int, workspace_id: str, connector_id: str) -> Dict[str, Any]:
+    prefix = f"bench-{name}-{uuid.uuid4().hex[:8]}"
+    messages = build_messages(rows, prefix)
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        inserted = insert(db, messages, workspace_id, connector_id)
+        fresh = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reinserted = insert(db, messages, workspace_id, connector_id)
+        rerun = time.perf_counter() - start
+
+        if inserted != rows or reinserted != 0:
+            raise SystemExit(f"{name}: expected {rows}/0 inserted, got {inserted}/{reinserted}")
+        return {"path": name, "rows": rows, "fresh_rps": rows / fresh, "rerun_rps": rows / rerun}
+    finally:
+        cleanup(db, workspace_id, prefix)
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark message ingestion paths")
+    parser.add_argument("--workspace-id", required=True, help="Workspace to insert benchmark rows into")
+    parser.add_argument("--connector-id", required=True, help="Connector the benchmark rows belong to")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 50000, 100000],
+                        help="Messages per fixture")
+    args = parser.parse_args()
+
+    results = []
+    for rows in args.rows:
+        results.append(run("legacy", legacy_insert, rows, args.workspace_id, args.connector_id))
+        results.append(run("upsert", upsert_insert, rows, args.workspace_id, args.connector_id))
+
+    header = f"{'path':<8}{'rows':>9}{'fresh rows/s':>15}{'rerun rows/s':>15}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['path']:<8}{r['rows']:>9}{r['fresh_rps']:>15.0f}{r['rerun_rps']:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
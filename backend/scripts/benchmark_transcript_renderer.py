@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+"""
+Benchmark the streaming transcript renderer against the previous formatters.
+
+Builds synthetic Gong (nested) and Fathom raw_data fixtures of increasing size
+(a 2-hour call is several MB of JSON), then for each fixture:
+1. Checks the renderer output is identical to the legacy list-building formatter
+2. Times both (best of --repeat runs)
+3. Measures peak Python memory allocated while formatting (tracemalloc)
+4. Times a budgeted render (--max-tokens) that stops early
+
+The legacy formatters are copied here verbatim from before the renderer was
+introduced so the comparison keeps working after they were removed.
+
+Usage:
+    # From backend directory:
+    python scripts/benchmark_transcript_renderer.py
+    python scripts/benchmark_transcript_renderer.py --turns 500 5000 20000 --repeat 5 --max-tokens 12000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.transcript_renderer import format_transcript  # noqa: E402
+
+WORDS = (
+    "we need the export to work with our reporting pipeline and the dashboard keeps timing out "
+    "when the team loads more than a quarter of data so pricing renewal depends on fixing it"
+).split()
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30))).capitalize() + "."
+
+
+def build_gong_fixture(turns: int, seed: int = 7) -> Dict[str, Any]:
+    """Nested gong_ingestion_service format with `turns` speaker segments."""
+    rng = random.Random(seed)
+    parties = [
+        {"speakerId": str(1000 + i), "name": f"Speaker {i}", "emailAddress": f"speaker{i}@example.com"}
+        for i in range(6)
+    ]
+    segments = [
+        {
+            "speakerId": rng.choice(parties)["speakerId"],
+            "topic": None,
+            "sentences": [
+                {"start": n * 1000, "end": n * 1000 + 900, "text": _sentence(rng)}
+                for n in range(rng.randint(1, 6))
+            ],
+        }
+        for _ in range(turns)
+    ]
+    return {
+        "call_data": {
+            "metaData": {"title": "Quarterly business review", "started": "2026-01-22T20:14:49Z"},
+            "parties": parties,
+        },
+        "transcript": {"callId": "1234567890", "transcript": segments},
+    }
+
+
+def build_fathom_fixture(turns: int, seed: int = 7) -> Dict[str, Any]:
+    """Fathom format with `turns` transcript entries."""
+    rng = random.Random(seed)
+    invitees = [{"name": f"Speaker {i}", "email": f"speaker{i}@example.com"} for i in range(6)]
+    entries = []
+    for n in range(turns):
+        invitee = rng.choice(invitees)
+        entries.append({
+            "text": " ".join(_sentence(rng) for _ in range(rng.randint(1, 4))),
+            "speaker": {"display_name": invitee["name"], "matched_calendar_invitee_email": None},
+            "timestamp": f"{n // 3600:02d}:{(n // 60) % 60:02d}:{n % 60:02d}",
+        })
+    return {
+        "title": "Customer onboarding",
+        "recording_start_time": "2026-01-22T20:14:49Z",
+        "recording_id": 42,
+        "transcript": entries,
+        "calendar_invitees": invitees,
+        "recorded_by": invitees[0],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Legacy formatters (pipeline version, prior to the shared renderer)
+# ---------------------------------------------------------------------------
+
+def legacy_format(raw_data: Dict[str, Any]) -> str:
+    if not raw_data:
+        return "No transcript available."
+    is_fathom = (
+        'recorded_by' in raw_data or
+        'calendar_invitees' in raw_data or
+        'share_url' in raw_data or
+        'recording_id' in raw_data
+    )
+    return _legacy_fathom(raw_data) if is_fathom else _legacy_gong(raw_data)
+
+
+def _legacy_fathom(raw_data: Dict[str, Any]) -> str:
+    lines = []
+    title = raw_data.get('title') or raw_data.get('meeting_title', 'Untitled Call')
+    started = raw_data.get('recording_start_time') or raw_data.get('created_at', '')
+    lines.append("=" * 80)
+    lines.append(f"Call: {title}")
+    if started:
+        lines.append(f"Date: {started}")
+    lines.append("=" * 80)
+    lines.append("")
+
+    invitee_map = {}
+    for invitee in raw_data.get('calendar_invitees', []):
+        name = invitee.get('name', '')
+        email = invitee.get('email', '')
+        matched_speaker = invitee.get('matched_speaker_display_name')
+        if matched_speaker:
+            invitee_map[matched_speaker] = {'name': name, 'email': email}
+        if name:
+            invitee_map[name] = {'name': name, 'email': email}
+    recorded_by = raw_data.get('recorded_by', {})
+    if recorded_by and recorded_by.get('name', ''):
+        invitee_map[recorded_by['name']] = {'name': recorded_by['name'], 'email': recorded_by.get('email', '')}
+
+    transcript_segments = raw_data.get('transcript', [])
+    if not isinstance(transcript_segments, list):
+        return "No transcript content found."
+
+    for segment in transcript_segments:
+        if not isinstance(segment, dict):
+            continue
+        speaker_data = segment.get('speaker', {})
+        display_name = speaker_data.get('display_name', 'Unknown Speaker')
+        email = speaker_data.get('matched_calendar_invitee_email', '')
+        if not email and display_name in invitee_map:
+            email = invitee_map[display_name].get('email', '')
+        text = segment.get('text', '').strip()
+        if not text:
+            continue
+        lines.append(f"{display_name} ({email}):" if email else f"{display_name}:")
+        lines.append(f"  {text}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _legacy_gong(raw_data: Dict[str, Any]) -> str:
+    call_data = raw_data.get('call_data', {})
+    parties = call_data.get('parties', []) if call_data else []
+    if not parties:
+        parties = raw_data.get('parties', [])
+    speaker_map = {}
+    for party in parties:
+        speaker_id = party.get('speakerId')
+        if speaker_id:
+            speaker_map[str(speaker_id)] = {'name': party.get('name', 'Unknown'), 'email': party.get('emailAddress', '')}
+
+    transcript_data = raw_data.get('transcript', {})
+    if isinstance(transcript_data, dict):
+        transcript_segments = transcript_data.get('transcript', [])
+    elif isinstance(transcript_data, list):
+        transcript_segments = transcript_data
+    else:
+        transcript_segments = []
+    if not isinstance(transcript_segments, list):
+        if 'content' in raw_data:
+            return str(raw_data['content'])
+        return "Transcript format not recognized."
+
+    lines = []
+    call_metadata = call_data.get('metaData', {}) if call_data else {}
+    if not call_metadata:
+        call_metadata = raw_data.get('call_metadata', raw_data.get('metaData', {}))
+    lines.append("=" * 80)
+    lines.append(f"Call: {call_metadata.get('title', 'Untitled Call')}")
+    if call_metadata.get('started', ''):
+        lines.append(f"Date: {call_metadata['started']}")
+    lines.append("=" * 80)
+    lines.append("")
+
+    for segment in transcript_segments:
+        if not isinstance(segment, dict):
+            continue
+        speaker_info = speaker_map.get(str(segment.get('speakerId', '')), {'name': 'Unknown Speaker', 'email': ''})
+        sentences = segment.get('sentences', [])
+        if not sentences:
+            text = segment.get('text', '')
+            if not text:
+                continue
+            sentences = [{'text': text}]
+        text_parts = []
+        for sentence in sentences:
+            if isinstance(sentence, dict):
+                text = sentence.get('text', '').strip()
+                if text:
+                    text_parts.append(text)
+            elif isinstance(sentence, str):
+                text_parts.append(sentence.strip())
+        if not text_parts:
+            continue
+        name, email = speaker_info['name'], speaker_info['email']
+        lines.append(f"{name} ({email}):" if email else f"{name}:")
+        lines.append(f"  {' '.join(text_parts)}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def _best_time(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def benchmark(name: str, raw_data: Dict[str, Any], repeat: int, max_tokens: int) -> Dict[str, Any]:
+    json_bytes = len(json.dumps(raw_data))
+
+    legacy_text = legacy_format(raw_data)
+    new_text = format_transcript(raw_data)
+    if legacy_text != new_text:
+        raise SystemExit(f"{name}: renderer output differs from legacy formatter")
+
+    return {
+        "fixture": name,
+        "json_mb": json_bytes / 1_000_000,
+        "text_mb": len(new_text) / 1_000_000,
+        "legacy_ms": _best_time(lambda: legacy_format(raw_data), repeat) * 1000,
+        "renderer_ms": _best_time(lambda: format_transcript(raw_data), repeat) * 1000,
+        "budget_ms": _best_time(lambda: format_transcript(raw_data, max_tokens=max_tokens), repeat) * 1000,
+        "legacy_peak_mb": _peak_memory(lambda: legacy_format(raw_data)) / 1_000_000,
+        "renderer_peak_mb": _peak_memory(lambda: format_transcript(raw_data)) / 1_000_000,
+        "budget_peak_mb": _peak_memory(lambda: format_transcript(raw_data, max_tokens=max_tokens)) / 1_000_000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transcript rendering")
+    parser.add_argument("--turns", type=int, nargs="+", default=[500, 5000, 20000],
+                        help="Speaker turns per fixture (a 2-hour call is roughly 2000-4000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per measurement (best is reported)")
+    parser.add_argument("--max-tokens", type=int, default=12000, help="Token budget for the budgeted render")
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    for turns in args.turns:
+        rows.append(benchmark(f"gong-{turns}", build_gong_fixture(turns), args.repeat, args.max_tokens))
+        rows.append(benchmark(f"fathom-{turns}", build_fathom_fixture(turns), args.repeat, args.max_tokens))
+
+    print("Output identical to legacy formatter for all fixtures.\n")
+    header = (f"{'fixture':<14}{'json MB':>9}{'text MB':>9}{'legacy ms':>11}{'new ms':>9}"
+              f"{'budget ms':>11}{'legacy peak':>13}{'new peak':>10}{'budget peak':>13}")
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        print(f"{r['fixture']:<14}{r['json_mb']:>9.2f}{r['text_mb']:>9.2f}{r['legacy_ms']:>11.1f}"
+              f"{r['renderer_ms']:>9.1f}{r['budget_ms']:>11.1f}{r['legacy_peak_mb']:>12.2f}M"
+              f"{r['renderer_peak_mb']:>9.2f}M{r['budget_peak_mb']:>12.2f}M")
+
+
+if __name__ == "__main__":
+    main()
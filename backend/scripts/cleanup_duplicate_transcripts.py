@@ -1,8 +1,11 @@
 """
 Cleanup script to remove duplicate transcripts from raw_transcripts table.
 
-Keeps only the most recent record (by created_at) for each unique
-(workspace_id, source_type, source_id) combination.
+Duplicates are transcripts with the same title on the same day. The
+add_raw_transcript_dedup_key migration gave the most recent record (by
+created_at) of each group the dedup_key; the older copies were left with a
+NULL dedup_key and are what this script deletes. New inserts can no longer
+create duplicates (unique index on workspace_id + dedup_key).
 
 Usage:
     python -m scripts.cleanup_duplicate_transcripts [--dry-run]
@@ -22,26 +25,11 @@ from app.core.database import SessionLocal
 
 
 def find_duplicates(db):
-    """Find all duplicate transcripts (same title + same date)."""
+    """Find all duplicate transcripts (same title + same date, no dedup_key)."""
     query = text("""
-        WITH duplicates AS (
-            SELECT
-                id,
-                workspace_id,
-                source_type,
-                source_id,
-                title,
-                transcript_date,
-                created_at,
-                ROW_NUMBER() OVER (
-                    PARTITION BY workspace_id, COALESCE(title, ''), DATE(COALESCE(transcript_date, created_at))
-                    ORDER BY created_at DESC
-                ) as row_num
-            FROM raw_transcripts
-        )
-        SELECT id, workspace_id, source_type, source_id, title, created_at, row_num
-        FROM duplicates
-        WHERE row_num > 1
+        SELECT id, workspace_id, source_type, source_id, title, created_at
+        FROM raw_transcripts
+        WHERE dedup_key IS NULL
         ORDER BY workspace_id, title, created_at DESC
     """)
 
@@ -52,23 +40,11 @@ def find_duplicates(db):
 def count_duplicates(db):
     """Count total duplicates grouped by workspace (same title + same date)."""
     query = text("""
-        WITH duplicates AS (
-            SELECT
-                workspace_id,
-                title,
-                transcript_date,
-                created_at,
-                ROW_NUMBER() OVER (
-                    PARTITION BY workspace_id, COALESCE(title, ''), DATE(COALESCE(transcript_date, created_at))
-                    ORDER BY created_at DESC
-                ) as row_num
-            FROM raw_transcripts
-        )
         SELECT
             workspace_id,
             COUNT(*) as duplicate_count
-        FROM duplicates
-        WHERE row_num > 1
+        FROM raw_transcripts
+        WHERE dedup_key IS NULL
         GROUP BY workspace_id
     """)
 
@@ -81,16 +57,7 @@ def delete_duplicates(db, dry_run=False):
 
     # First, get the IDs of records to delete
     delete_query = text("""
-        WITH duplicates AS (
-            SELECT
-                id,
-                ROW_NUMBER() OVER (
-                    PARTITION BY workspace_id, COALESCE(title, ''), DATE(COALESCE(transcript_date, created_at))
-                    ORDER BY created_at DESC
-                ) as row_num
-            FROM raw_transcripts
-        )
-        SELECT id FROM duplicates WHERE row_num > 1
+        SELECT id FROM raw_transcripts WHERE dedup_key IS NULL
     """)
 
     result = db.execute(delete_query)
@@ -172,7 +139,7 @@ def main():
             print(f"  ID: {dup[0]}")
             print(f"    source_type: {dup[2]}, source_id: {dup[3]}")
             print(f"    title: {dup[4][:50]}..." if dup[4] and len(dup[4]) > 50 else f"    title: {dup[4]}")
-            print(f"    created_at: {dup[5]}, row_num: {dup[6]}")
+            print(f"    created_at: {dup[5]}")
             print()
 
         if args.dry_run:
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+"""
+Local stand-in for the Gmail API.
+
+Lets the Gmail ingestion path (app/services/gmail_batch_ingestion_service.py)
+run end to end against synthetic mailboxes, and counts how many HTTP requests
+and API calls a sync costs. Implements just what the ingestion uses:
+
+    GET  /gmail/v1/users/me/profile          current historyId
+    GET  /gmail/v1/users/me/history          users.history.list (messageAdded/labelAdded)
+    GET  /gmail/v1/users/me/threads          threads.list (labelIds, q=after:<epoch>, pageToken)
+    GET  /gmail/v1/users/me/threads/{id}     threads.get (format=full|metadata)
+    POST /batch/gmail/v1                     batch HTTP requests (multipart/mixed)
+
+Admin endpoints:
+
+    POST /admin/add-threads?count=N          deliver N new threads (bumps the historyId)
+    GET  /admin/stats                        request counters; POST resets them
+
+Usage:
+    # From backend directory:
+    python scripts/gmail_api_stub_server.py --port 8766 --threads 500 --labels INBOX,Label_support
+
+    # In another shell, sync a Gmail connector whose enabled labels match --labels:
+    GMAIL_API_BASE_URL=http://localhost:8766 python scripts/gmail_api_stub_server.py --drive --connector-id <uuid>
+"""
+
+import argparse
+import base64
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from email import policy
+from email.parser import BytesParser
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Add parent directory to path for imports (--drive mode)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+THREADS = {}
+HISTORY = []
+STATE = {"history_id": 1000, "labels": ["INBOX"], "http_requests": 0, "api_calls": 0}
+LOCK = threading.Lock()
+
+
+def _add_threads(count: int) -> None:
+    """Deliver `count` new single-message threads, spread over the labels."""
+    with LOCK:
+        for _ in range(count):
+            STATE["history_id"] += 1
+            n = len(THREADS)
+            thread_id = uuid.uuid4().hex[:16]
+            label_id = STATE["labels"][n % len(STATE["labels"])]
+            sent = time.time() - 60
+            message = {
+                "id": uuid.uuid4().hex[:16],
+                "threadId": thread_id,
+                "labelIds": [label_id],
+                "snippet": f"Stub thread {n}",
+                "internalDate": str(int(sent * 1000)),
+                "historyId": str(STATE["history_id"]),
+                "headers": [
+                    {"name": "From", "value": f"Customer {n} <user{n}@customer{n % 50}.example>"},
+                    {"name": "To", "value": "support@headway.example"},
+                    {"name": "Subject", "value": f"Stub thread {n}: export keeps timing out"},
+                    {"name": "Date", "value": formatdate(sent)},
+                ],
+                "body": f"Hi team, the export keeps timing out on large workspaces (thread {n}).",
+            }
+            THREADS[thread_id] = {"id": thread_id, "historyId": str(STATE["history_id"]), "messages": [message]}
+            HISTORY.append({
+                "id": str(STATE["history_id"]),
+                "messagesAdded": [{"message": {k: message[k] for k in ("id", "threadId", "labelIds")}}],
+            })
+
+
+def _thread_resource(thread: dict, thread_format: str, headers: list) -> dict:
+    messages = []
+    for message in thread["messages"]:
+        payload = {"mimeType": "text/plain", "headers": message["headers"]}
+        if thread_format == "metadata":
+            wanted = {h.lower() for h in headers}
+            payload["headers"] = [h for h in message["headers"] if not wanted or h["name"].lower() in wanted]
+        else:
+            data = base64.urlsafe_b64encode(message["body"].encode("utf-8")).decode("ascii")
+            payload["body"] = {"size": len(message["body"]), "data": data}
+        messages.append({
+            "id": message["id"],
+            "threadId": message["threadId"],
+            "labelIds": message["labelIds"],
+            "snippet": message["snippet"],
+            "internalDate": message["internalDate"],
+            "historyId": message["historyId"],
+            "payload": payload,
+        })
+    return {"id": thread["id"], "historyId": thread["historyId"], "snippet": messages[-1]["snippet"], "messages": messages}
+
+
+def _page(items: list, query: dict, default_size: int) -> tuple:
+    start = int(query.get("pageToken", ["0"])[0] or 0)
+    size = int(query.get("maxResults", [default_size])[0])
+    end = start + size
+    return items[start:end], (str(end) if end < len(items) else None)
+
+
+def _call(path: str, query: dict) -> tuple:
+    """Serve one Gmail API call. Returns (status, payload)."""
+    with LOCK:
+        STATE["api_calls"] += 1
+
+    if path.endswith("/users/me/profile"):
+        return 200, {"emailAddress": "support@headway.example", "historyId": str(STATE["history_id"])}
+
+    if path.endswith("/users/me/history"):
+        start = int(query.get("startHistoryId", ["0"])[0])
+        if HISTORY and start < int(HISTORY[0]["id"]) - 1:
+            return 404, {"error": {"code": 404, "message": "Requested entity was not found."}}
+        records = [h for h in HISTORY if int(h["id"]) > start]
+        page, token = _page(records, query, 100)
+        payload = {"history": page, "historyId": str(STATE["history_id"])}
+        if token:
+            payload["nextPageToken"] = token
+        return 200, payload
+
+    match = re.search(r"/users/me/threads/([^/]+)$", path)
+    if match:
+        thread = THREADS.get(match.group(1))
+        if not thread:
+            return 404, {"error": {"code": 404, "message": "Requested entity was not found."}}
+        return 200, _thread_resource(thread, query.get("format", ["full"])[0], query.get("metadataHeaders", []))
+
+    if path.endswith("/users/me/threads"):
+        label_ids = set(query.get("labelIds", []))
+        after = None
+        q = query.get("q", [""])[0]
+        after_match = re.search(r"after:(\d+)", q)
+        if after_match:
+            after = int(after_match.group(1))
+        threads = [
+            t for t in reversed(list(THREADS.values()))
+            if (not label_ids or label_ids & set(t["messages"][-1]["labelIds"]))
+            and (after is None or int(t["messages"][-1]["internalDate"]) // 1000 > after)
+        ]
+        page, token = _page([{"id": t["id"], "historyId": t["historyId"]} for t in threads], query, 100)
+        payload = {"threads": page, "resultSizeEstimate": len(threads)}
+        if token:
+            payload["nextPageToken"] = token
+        return 200, payload
+
+    return 404, {"error": {"code": 404, "message": "not found"}}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def _send(self, body: bytes, content_type: str, status: int = 200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, payload: dict, status: int = 200) -> None:
+        self._send(json.dumps(payload).encode("utf-8"), "application/json", status)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length)
+
+    def _count_request(self) -> None:
+        with LOCK:
+            STATE["http_requests"] += 1
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/admin/stats":
+            return self._send_json({k: STATE[k] for k in ("http_requests", "api_calls", "history_id")})
+        self._count_request()
+        status, payload = _call(url.path, parse_qs(url.query))
+        return self._send_json(payload, status)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path == "/admin/add-threads":
+            _add_threads(int(parse_qs(url.query).get("count", ["10"])[0]))
+            return self._send_json({"threads": len(THREADS), "history_id": STATE["history_id"]})
+        if url.path == "/admin/stats":
+            with LOCK:
+                STATE["http_requests"] = 0
+                STATE["api_calls"] = 0
+            return self._send_json({"reset": True})
+        if url.path != "/batch/gmail/v1":
+            return self._send_json({"error": {"message": "not found"}}, 404)
+
+        self._count_request()
+        raw = self._read_body()
+        message = BytesParser(policy=policy.HTTP).parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode("utf-8") + raw
+        )
+        boundary = f"batch_{uuid.uuid4().hex}"
+        chunks = []
+        for part in message.iter_parts():
+            inner = part.get_payload(decode=True) or part.get_payload().encode("utf-8")
+            request_line = inner.decode("utf-8").split("\r\n", 1)[0].split("\n", 1)[0]
+            _, target, _ = request_line.split(" ", 2)
+            inner_url = urlsplit(target)
+            status, payload = _call(inner_url.path, parse_qs(inner_url.query))
+            content_id = (part["Content-ID"] or "").strip("<>")
+            chunks.append(
+                f"--{boundary}\r\n"
+                f"Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                f"Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{json.dumps(payload)}\r\n"
+            )
+        body = ("".join(chunks) + f"--{boundary}--\r\n").encode("utf-8")
+        return self._send(body, f"multipart/mixed; boundary={boundary}")
+
+    def log_message(self, format, *args):
+        print(f"[stub] {self.command} {self.path} -> {args[1] if len(args) > 1 else ''}")
+
+
+def drive(connector_id: str, new_threads: int) -> None:
+    """Run two incremental syncs through the real service, with new mail in between."""
+    import requests
+
+    from app.core.config import settings
+    from app.core.database import SessionLocal
+    from app.services.gmail_batch_ingestion_service import gmail_batch_ingestion_service
+
+    base = settings.GMAIL_API_BASE_URL.rstrip("/")
+    db = SessionLocal()
+    try:
+        for run in (1, 2):
+            if run == 2:
+                requests.post(f"{base}/admin/add-threads", params={"count": new_threads})
+            requests.post(f"{base}/admin/stats")
+            started = time.perf_counter()
+            result = gmail_batch_ingestion_service.ingest_messages_for_connector(
+                connector_id=connector_id, db=db, incremental=True
+            )
+            elapsed = time.perf_counter() - started
+            stats = requests.get(f"{base}/admin/stats").json()
+            print(
+                f"Sync {run}: status={result['status']} checked={result['total_checked']} "
+                f"new={result['new_added']} skipped={result['duplicates_skipped']} "
+                f"http_requests={stats['http_requests']} api_calls={stats['api_calls']} in {elapsed:.2f}s"
+            )
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Gmail API")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--threads", type=int, default=500, help="Threads in the mailbox at startup")
+    parser.add_argument("--labels", type=str, default="INBOX", help="Comma-separated label IDs to spread threads over")
+    parser.add_argument("--drive", action="store_true", help="Run two syncs using GMAIL_API_BASE_URL")
+    parser.add_argument("--connector-id", type=str, default=None, help="Gmail connector for --drive")
+    parser.add_argument("--new-threads", type=int, default=25, help="Threads delivered between --drive syncs")
+    args = parser.parse_args()
+
+    if args.drive:
+        if not args.connector_id:
+            parser.error("--drive requires --connector-id")
+        drive(args.connector_id, args.new_threads)
+        return
+
+    STATE["labels"] = [label.strip() for label in args.labels.split(",") if label.strip()]
+    _add_threads(args.threads)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StubHandler)
+    print(f"Gmail API stand-in listening on http://127.0.0.1:{args.port} ({len(THREADS)} threads)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+Load test the dashboard read endpoints under concurrent requests.
+
+Fires the hot read endpoints (transcript insights, transcript counts,
+executive insights) with increasing concurrency against a running API and
+reports throughput and latency percentiles. Alongside the load it polls
+/api/test, a route that never touches the database: when DB work blocks the
+event loop, its latency climbs with the load; when queries run on the async
+engine or in the threadpool it stays flat.
+
+Compare before/after by running it against a server on each revision with
+the same worker count (e.g. `uvicorn app.main:app --workers 1`).
+
+Snapshot caches (executive insights, transcript counts) turn repeat requests
+into cache hits; pass --refresh to force executive insights to recompute on
+every request, or stop Redis to measure the database path alone.
+
+Usage:
+    # From backend directory:
+    python scripts/load_test_read_endpoints.py --token <jwt> --workspace-id <uuid>
+    python scripts/load_test_read_endpoints.py --token <jwt> --workspace-id <uuid> \\
+        --base-url http://localhost:8000 --concurrency 1 10 50 --requests 200 --refresh
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+# Route that doesn't touch the database; its latency shows event loop stalls
+PROBE_PATH = "/api/test"
+PROBE_INTERVAL_SECONDS = 0.05
+
+
+def endpoints(workspace_id: str, refresh: bool) -> List[str]:
+    return [
+        "/api/v1/themes/transcript-classifications/insights",
+        "/api/v1/themes/transcript-classifications/counts",
+        f"/api/v1/features/executive-insights?workspace_id={workspace_id}"
+        + ("&refresh=true" if refresh else ""),
+    ]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def poll_probe(client: httpx.AsyncClient, stop: asyncio.Event, latencies: List[float]) -> None:
+    """Measure PROBE_PATH latency until stop is set."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            await client.get(PROBE_PATH)
+            latencies.append(time.perf_counter() - started)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    paths: List[str],
+    concurrency: int,
+    total_requests: int,
+) -> Dict[str, Any]:
+    """Send total_requests spread over the paths with `concurrency` in flight."""
+    latencies: List[float] = []
+    probe_latencies: List[float] = []
+    errors = 0
+    next_request = 0
+
+    async def worker() -> None:
+        nonlocal errors, next_request
+        while next_request < total_requests:
+            path = paths[next_request % len(paths)]
+            next_request += 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(poll_probe(client, stop, probe_latencies))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe_task
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "probe_p95_ms": percentile(probe_latencies, 0.95) * 1000,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    paths = endpoints(args.workspace_id, args.refresh)
+    headers = {"Authorization": f"Bearer {args.token}"}
+    limits = httpx.Limits(max_connections=max(args.concurrency) + 5)
+
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits, timeout=120) as client:
+        # Warm up connections, auth and caches
+        for path in paths:
+            response = await client.get(path)
+            print(f"warm-up {response.status_code} {path}")
+
+        results = [
+            await run_level(client, paths, concurrency, args.requests)
+            for concurrency in args.concurrency
+        ]
+
+    print()
+    header = f"{'conc':>5}{'reqs':>7}{'errors':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'probe p95 ms':>14}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['concurrency']:>5}{r['requests']:>7}{r['errors']:>8}{r['rps']:>9.1f}"
+            f"{r['p50_ms']:>9.0f}{r['p95_ms']:>9.0f}{r['probe_p95_ms']:>14.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test dashboard read endpoints")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="API base URL")
+    parser.add_argument("--token", required=True, help="Bearer token of a workspace user")
+    parser.add_argument("--workspace-id", required=True, help="Workspace UUID (executive insights)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50], help="Concurrency levels")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per concurrency level")
+    parser.add_argument("--refresh", action="store_true", help="Bypass the executive insights snapshot")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
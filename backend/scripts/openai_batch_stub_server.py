@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+"""
+Local stand-in for the OpenAI Files + Batch API.
+
+Lets the Batch API backfill path (app/sync_engine/tasks/ai_pipeline/batch_classification.py)
+run end to end without an OpenAI account or cost. Implements just what the backfill uses:
+
+    POST /v1/files                  upload a JSONL batch input (multipart)
+    GET  /v1/files/{id}/content     download input/output files
+    POST /v1/batches                create a batch
+    GET  /v1/batches/{id}           retrieve a batch (completes after --complete-after seconds)
+    GET  /v1/batches                list batches, newest first (used to adopt stuck submissions)
+
+Each request gets a canned classification that maps the transcript to the first
+theme/sub-theme IDs found in the prompt, with token usage estimated from the prompt size.
+Use --fail-rate to make a fraction of requests fail.
+
+Usage:
+    # From backend directory:
+    python scripts/openai_batch_stub_server.py --port 8765 --complete-after 5
+
+    # In another shell, point the backfill at it and drive it by hand:
+    OPENAI_BATCH_BASE_URL=http://localhost:8765/v1 python scripts/openai_batch_stub_server.py --drive
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import os
+import time
+import uuid
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+# Add parent directory to path for imports (--drive mode)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+UUID_ID_PATTERN = re.compile(r"\(ID: ([0-9a-fA-F-]{36})\)")
+
+FILES = {}
+BATCHES = {}
+OPTIONS = {"complete_after": 5.0, "fail_rate": 0.0}
+
+
+def _fake_completion(body: dict) -> dict:
+    """Build a chat.completion response for one batch request."""
+    prompt_text = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+    ids = UUID_ID_PATTERN.findall(prompt_text)
+    mappings = []
+    if len(ids) >= 2:
+        mappings.append({
+            "theme_id": ids[0],
+            "sub_theme_id": ids[1],
+            "feature_request": "Stub feature request",
+            "confidence": 0.9,
+        })
+    content = json.dumps({
+        "mappings": mappings,
+        "call_metadata": {"call_type": "stub", "overall_sentiment": 0.0},
+    })
+    prompt_tokens = len(prompt_text) // 4 + 1
+    completion_tokens = len(content) // 4 + 1
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-4o-mini"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def _new_file(content: bytes, filename: str, purpose: str) -> dict:
+    file_id = f"file-{uuid.uuid4().hex[:24]}"
+    FILES[file_id] = {
+        "meta": {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        },
+        "content": content,
+    }
+    return FILES[file_id]["meta"]
+
+
+def _finish_batch(batch: dict) -> None:
+    """Run every request of a batch and attach output/error files."""
+    lines = FILES[batch["input_file_id"]]["content"].decode("utf-8").splitlines()
+    outputs, errors = [], []
+    for line in lines:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        if random.random() < OPTIONS["fail_rate"]:
+            errors.append({
+                "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+                "custom_id": request["custom_id"],
+                "response": None,
+                "error": {"code": "stub_failure", "message": "Simulated failure"},
+            })
+            continue
+        outputs.append({
+            "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+            "custom_id": request["custom_id"],
+            "response": {"status_code": 200, "request_id": uuid.uuid4().hex, "body": _fake_completion(request["body"])},
+            "error": None,
+        })
+
+    if outputs:
+        data = "\n".join(json.dumps(o) for o in outputs).encode("utf-8")
+        batch["output_file_id"] = _new_file(data, "batch_output.jsonl", "batch_output")["id"]
+    if errors:
+        data = "\n".join(json.dumps(e) for e in errors).encode("utf-8")
+        batch["error_file_id"] = _new_file(data, "batch_errors.jsonl", "batch_output")["id"]
+
+    now = int(time.time())
+    batch.update({
+        "status": "completed",
+        "finalizing_at": now,
+        "completed_at": now,
+        "request_counts": {"total": len(outputs) + len(errors), "completed": len(outputs), "failed": len(errors)},
+    })
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def _send_json(self, payload: dict, status: int = 200) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length)
+
+    def do_POST(self):
+        if self.path.rstrip("/").endswith("/files"):
+            raw = self._read_body()
+            message = BytesParser(policy=policy.HTTP).parsebytes(
+                f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode("utf-8") + raw
+            )
+            content, filename, purpose = b"", "upload.jsonl", "batch"
+            for part in message.iter_parts():
+                name = part.get_param("name", header="content-disposition")
+                if name == "file":
+                    content = part.get_payload(decode=True) or b""
+                    filename = part.get_filename() or filename
+                elif name == "purpose":
+                    purpose = (part.get_payload(decode=True) or b"batch").decode("utf-8")
+            return self._send_json(_new_file(content, filename, purpose))
+
+        if self.path.rstrip("/").endswith("/batches"):
+            request = json.loads(self._read_body() or b"{}")
+            if request.get("input_file_id") not in FILES:
+                return self._send_json({"error": {"message": "input file not found"}}, 404)
+            batch_id = f"batch_{uuid.uuid4().hex[:24]}"
+            now = int(time.time())
+            BATCHES[batch_id] = {
+                "id": batch_id,
+                "object": "batch",
+                "endpoint": request.get("endpoint"),
+                "errors": None,
+                "input_file_id": request["input_file_id"],
+                "completion_window": request.get("completion_window", "24h"),
+                "status": "in_progress",
+                "output_file_id": None,
+                "error_file_id": None,
+                "created_at": now,
+                "in_progress_at": now,
+                "expires_at": now + 86400,
+                "completed_at": None,
+                "request_counts": {"total": 0, "completed": 0, "failed": 0},
+                "metadata": request.get("metadata"),
+            }
+            return self._send_json(BATCHES[batch_id])
+
+        return self._send_json({"error": {"message": "not found"}}, 404)
+
+    def do_GET(self):
+        match = re.search(r"/files/([^/]+)/content$", self.path)
+        if match:
+            stored = FILES.get(match.group(1))
+            if not stored:
+                return self._send_json({"error": {"message": "file not found"}}, 404)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(stored["content"])))
+            self.end_headers()
+            self.wfile.write(stored["content"])
+            return
+
+        if urlparse(self.path).path.rstrip("/").endswith("/batches"):
+            batches = sorted(BATCHES.values(), key=lambda b: b["created_at"], reverse=True)
+            return self._send_json({"object": "list", "data": batches, "has_more": False})
+
+        match = re.search(r"/batches/([^/]+)$", self.path)
+        if match:
+            batch = BATCHES.get(match.group(1))
+            if not batch:
+                return self._send_json({"error": {"message": "batch not found"}}, 404)
+            if batch["status"] == "in_progress" and time.time() - batch["created_at"] >= OPTIONS["complete_after"]:
+                _finish_batch(batch)
+            return self._send_json(batch)
+
+        return self._send_json({"error": {"message": "not found"}}, 404)
+
+    def log_message(self, format, *args):
+        print(f"[stub] {self.command} {self.path} -> {args[1] if len(args) > 1 else ''}")
+
+
+def drive(poll_interval: float, workspace_id: str = None, max_transcripts: int = None) -> None:
+    """Submit one backfill batch through the real task code and poll it until applied."""
+    from app.core.database import SessionLocal
+    from app.sync_engine.tasks.ai_pipeline.batch_classification import poll_batches, submit_batch
+
+    db = SessionLocal()
+    try:
+        print(f"Submit: {submit_batch(db, workspace_id, max_transcripts)}")
+        while True:
+            summary = poll_batches(db)
+            print(f"Poll: polled={summary.get('polled')} applied={summary.get('applied')} released={summary.get('released')}")
+            for report in summary.get("reports", []):
+                print(json.dumps(report, indent=2))
+            if summary.get("reports") or not summary.get("polled"):
+                break
+            time.sleep(poll_interval)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenAI Batch API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--complete-after", type=float, default=5.0, help="Seconds before a batch completes")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests that fail (0-1)")
+    parser.add_argument("--drive", action="store_true", help="Submit and poll a batch using OPENAI_BATCH_BASE_URL")
+    parser.add_argument("--workspace-id", type=str, default=None, help="Workspace filter for --drive")
+    parser.add_argument("--max-transcripts", type=int, default=None, help="Batch size for --drive")
+    args = parser.parse_args()
+
+    if args.drive:
+        drive(poll_interval=max(args.complete_after / 2, 1.0), workspace_id=args.workspace_id,
+              max_transcripts=args.max_transcripts)
+        return
+
+    OPTIONS["complete_after"] = args.complete_after
+    OPTIONS["fail_rate"] = args.fail_rate
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StubHandler)
+    print(f"OpenAI Batch API stand-in listening on http://127.0.0.1:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
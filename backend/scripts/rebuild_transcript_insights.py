@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Rebuild the transcript insights rollup from transcript classifications.
+
+The rollup (transcript_insight_rollups) is updated as classifications are
+saved. The migration that adds it only creates the table, so run this with
+--all once as a deploy step after that migration to count existing
+classifications. Run it again after anything that changes classifications
+outside _save_classification() (manual SQL, restored data).
+
+Usage:
+    python scripts/rebuild_transcript_insights.py --email anurag@grexit.com
+    python scripts/rebuild_transcript_insights.py --workspace-id <uuid>
+    python scripts/rebuild_transcript_insights.py --all
+"""
+
+import argparse
+import sys
+import os
+from uuid import UUID
+from typing import Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import Session
+from app.core.database import engine
+from app.models.workspace import Workspace
+from app.models.user import User
+from app.models.transcript_classification import TranscriptClassification
+from app.services.transcript_insights_service import transcript_insights_service
+
+
+def find_workspace_by_email(db: Session, email: str) -> Optional[UUID]:
+    """Find workspace_id for a user by email."""
+    user = db.query(User).filter(User.email == email).first()
+    if not user:
+        print(f"❌ User not found: {email}")
+        return None
+
+    workspace_id = user.workspace_id
+    if not workspace_id:
+        print(f"❌ User {email} does not have a workspace")
+        return None
+
+    return workspace_id
+
+
+def rebuild_workspace(db: Session, workspace_id: UUID) -> int:
+    """Rebuild one workspace's rollup in its own transaction."""
+    print(f"\n🔄 Rebuilding transcript insights for workspace: {workspace_id}")
+    try:
+        counted = transcript_insights_service.rebuild(db, workspace_id)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"   ❌ Failed: {e}")
+        return 0
+    print(f"   ✅ Counted {counted} classifications")
+    return counted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the transcript insights rollup")
+    parser.add_argument(
+        "--email",
+        type=str,
+        help="User email to find workspace"
+    )
+    parser.add_argument(
+        "--workspace-id",
+        type=str,
+        help="Workspace UUID (alternative to --email)"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Rebuild every workspace that has transcript classifications"
+    )
+
+    args = parser.parse_args()
+
+    if not args.email and not args.workspace_id and not args.all:
+        print("❌ One of --email, --workspace-id or --all is required")
+        sys.exit(1)
+
+    with Session(engine) as db:
+        if args.all:
+            workspace_ids = [
+                row[0] for row in db.query(TranscriptClassification.workspace_id).distinct().all()
+            ]
+            print(f"✅ Found {len(workspace_ids)} workspaces with transcript classifications")
+        elif args.workspace_id:
+            workspace_id = UUID(args.workspace_id)
+            workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+            if not workspace:
+                print(f"❌ Workspace not found: {args.workspace_id}")
+                sys.exit(1)
+            print(f"✅ Using workspace: {workspace.name} ({workspace_id})")
+            workspace_ids = [workspace_id]
+        else:
+            workspace_id = find_workspace_by_email(db, args.email)
+            if not workspace_id:
+                sys.exit(1)
+            workspace_ids = [workspace_id]
+
+        total = 0
+        for workspace_id in workspace_ids:
+            total += rebuild_workspace(db, workspace_id)
+
+        print(f"\n✅ Done: {total} classifications across {len(workspace_ids)} workspaces")
+
+
+if __name__ == "__main__":
+    main()
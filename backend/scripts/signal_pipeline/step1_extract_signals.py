@@ -4,6 +4,10 @@ Stage 1: Signal Extraction (per transcript).
 
 Reads .txt (and optional .json) from input dir, extracts product signals via one LLM call
 per transcript using prompts/step1_extract_signals.txt, writes signals to pipeline_output_dir/signals/.
+
+Raw LLM responses are stored in the shared llm_result_cache table (keyed on transcript text,
+prompt template and model) when the database is reachable, so re-runs over the same files
+do not call the model again. Pass --no-cache to disable.
 """
 
 import argparse
@@ -20,6 +24,7 @@ sys.path.insert(0, str(BACKEND_DIR))
 from openai import OpenAI
 
 from app.core.config import Settings
+from app.services.llm_result_cache_service import LLMCacheKey, content_hash, llm_result_cache_service
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROMPT_PATH = SCRIPT_DIR / "prompts" / "step1_extract_signals.txt"
@@ -221,20 +226,60 @@ def _parse_asks_response(raw: str) -> list[dict]:
     return result
 
 
+CACHE_NAMESPACE = "signal_extraction"
+
+
+def open_result_cache_session(enabled: bool):
+    """Open a DB session for the shared LLM result cache, or None if disabled/unreachable."""
+    if not enabled:
+        return None
+    try:
+        from sqlalchemy import text
+        from app.core.database import SessionLocal
+        db = SessionLocal()
+        db.execute(text("SELECT 1"))
+        return db
+    except Exception as e:
+        print(f"LLM result cache unavailable ({e}); calling the model for every transcript")
+        return None
+
+
 def extract_signals_for_transcript(
     client: OpenAI,
     messages: list,
     model: str = "gpt-4o-mini",
+    cache_db=None,
+    prompt_version: str = "",
 ) -> list[dict]:
     openai_messages = _messages_to_openai_format(messages)
-    response = client.chat.completions.create(
-        model=model,
-        messages=openai_messages,
-        temperature=0,
-        response_format={"type": "json_object"},
-        max_tokens=4000,
-    )
-    raw = response.choices[0].message.content or "[]"
+    cache_key = None
+    raw = None
+    if cache_db is not None:
+        cache_key = LLMCacheKey(
+            namespace=CACHE_NAMESPACE,
+            content_hash=content_hash(json.dumps(openai_messages, sort_keys=True)),
+            prompt_version=prompt_version,
+            taxonomy_version="",
+            model=model,
+        )
+        cached = llm_result_cache_service.get(cache_db, cache_key)
+        cache_db.commit()
+        if cached is not None:
+            raw = cached.get("raw")
+            print("(cached LLM result)")
+
+    if raw is None:
+        response = client.chat.completions.create(
+            model=model,
+            messages=openai_messages,
+            temperature=0,
+            response_format={"type": "json_object"},
+            max_tokens=4000,
+        )
+        raw = response.choices[0].message.content or "[]"
+        if cache_key is not None:
+            llm_result_cache_service.put(cache_db, cache_key, {"raw": raw})
+            cache_db.commit()
     print("--- OpenAI raw response ---")
     print(raw)
     print("--- end raw response ---")
@@ -250,6 +295,7 @@ def main() -> None:
     parser.add_argument("--incremental", action="store_true", help="Only process transcripts not in processed_transcripts.json; append to all_signals; update manifest")
     parser.add_argument("--manifest", type=str, default=None, help="Path to processed_transcripts.json (default: output_dir/signals/processed_transcripts.json)")
     parser.add_argument("--transcript", type=str, default=None, help="Process only this transcript file (e.g. backend/gong_transcripts/06_xxx.txt)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the shared LLM result cache")
     args = parser.parse_args()
 
     input_dir = Path(args.input_dir)
@@ -279,6 +325,8 @@ def main() -> None:
 
     client = OpenAI(api_key=settings.OPENAI_API_KEY)
     prompt_template = load_prompt_template()
+    prompt_version = "file-" + content_hash(prompt_template)[:12]
+    cache_db = open_result_cache_session(not args.no_cache)
 
     if not args.transcript:
         if args.incremental:
@@ -304,7 +352,7 @@ def main() -> None:
         text, meta = load_transcript_and_metadata(txt_path, input_dir)
         user_content = _build_user_message(prompt_template, text)
         messages = [{"role": "user", "content": user_content}]
-        signals = extract_signals_for_transcript(client, messages, args.model)
+        signals = extract_signals_for_transcript(client, messages, args.model, cache_db, prompt_version)
 
         record = {
             "transcript_id": transcript_id,
@@ -320,6 +368,10 @@ def main() -> None:
         with open(per_file, "w", encoding="utf-8") as f:
             json.dump(record, f, indent=2, ensure_ascii=False, default=str)
 
+    if cache_db is not None:
+        print(f"LLM result cache: {llm_result_cache_service.stats()}")
+        cache_db.close()
+
     if args.incremental or args.transcript:
         # Append to existing all_signals (incremental or single --transcript)
         all_path = signals_dir / "all_signals.json"
@@ -27,6 +27,8 @@ from app.models.workspace import Workspace
 from app.models.transcript_classification import TranscriptClassification
 from app.models.theme import Theme
 from app.models.sub_theme import SubTheme
+from app.services.cache_service import bump_classification_version
+from app.services.transcript_insights_service import transcript_insights_service
 
 
 def find_workspace_by_email(db: Session, email: str) -> Optional[UUID]:
@@ -116,11 +118,14 @@ def update_classification_themes(db: Session, workspace_id: UUID) -> dict:
             
             # Update if we found valid IDs
             if theme_id or sub_theme_id:
+                previous = transcript_insights_service.snapshot(tc)
                 if theme_id:
                     tc.theme_id = theme_id
                 if sub_theme_id:
                     tc.sub_theme_id = sub_theme_id
                 tc.updated_at = datetime.now(timezone.utc)
+                # Same rollup path as _save_classification (net zero unless theme_ids changed)
+                transcript_insights_service.record_classification(db, tc, previous)
                 updated_count += 1
             else:
                 skipped_count += 1
@@ -130,6 +135,8 @@ def update_classification_themes(db: Session, workspace_id: UUID) -> dict:
             error_count += 1
     
     db.commit()
+    # Sidebar counts include the top-level theme_id/sub_theme_id
+    bump_classification_version(str(workspace_id))
     
     return {
         'total': len(classifications),
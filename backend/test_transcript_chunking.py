@@ -0,0 +1,135 @@
+"""
+Tests for transcript chunking and chunk result merging (map-reduce classification)
+
+Pure helpers, no database or API keys needed:
+    pytest test_transcript_chunking.py
+"""
+import sys
+import os
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.sync_engine.tasks.ai_pipeline.transcript_chunking import chunk_transcript, merge_chunk_results
+
+HEADER = "Call: Demo\n"
+
+
+def _turn(speaker: str, words: int = 80) -> str:
+    """A speaker turn block of roughly 5 chars per word."""
+    return f"{speaker}\n  " + " ".join(["word"] * words) + "\n"
+
+
+def test_short_transcript_is_one_unmarked_chunk():
+    """A transcript within budget is the header and turns, unchanged"""
+    turns = [_turn("Alice", 5), _turn("Bob", 5)]
+
+    chunks = chunk_transcript(HEADER, iter(turns), max_tokens=12000)
+
+    assert chunks == ["\n".join([HEADER] + turns)]
+    assert "[Transcript part" not in chunks[0]
+
+
+def test_long_transcript_splits_on_whole_turns():
+    """Each chunk repeats the header, then a part marker, then whole turns in order"""
+    turns = [_turn(f"Speaker {i}") for i in range(5)]
+
+    chunks = chunk_transcript(HEADER, iter(turns), max_tokens=300)
+
+    assert len(chunks) == 3
+    seen_turns = []
+    for index, chunk in enumerate(chunks, start=1):
+        assert chunk.startswith(HEADER + "\n" + f"[Transcript part {index} of 3]\n")
+        seen_turns.extend(t for t in turns if t in chunk)
+    assert seen_turns == turns
+
+
+def test_chunks_without_header_start_with_marker():
+    """No header: the part marker is the first line of every chunk"""
+    turns = [_turn(f"Speaker {i}") for i in range(5)]
+
+    chunks = chunk_transcript("", iter(turns), max_tokens=300)
+
+    assert [c.splitlines()[0] for c in chunks] == [f"[Transcript part {i} of 3]" for i in (1, 2, 3)]
+
+
+def test_oversized_turn_is_split_with_speaker_repeated():
+    """A single turn over budget is split on whitespace, each piece keeping the speaker line"""
+    turn = _turn("Alice", 600)
+
+    chunks = chunk_transcript("", iter([turn]), max_tokens=300)
+
+    assert len(chunks) > 1
+    words = 0
+    for chunk in chunks:
+        lines = [line for line in chunk.splitlines()[1:] if line]
+        # Speaker line, then its text, for every piece
+        assert lines[0::2] == ["Alice"] * (len(lines) // 2)
+        words += sum(len(line.split()) for line in lines[1::2])
+    assert words == 600
+
+
+def test_empty_transcript_is_one_chunk():
+    """No turns still yields one chunk (the header)"""
+    assert chunk_transcript(HEADER, iter([]), max_tokens=300) == [HEADER]
+
+
+def test_single_result_is_returned_unchanged():
+    """One chunk: the result is passed through without a chunk_count"""
+    result = {"mappings": [], "call_metadata": {"overall_sentiment": 0.5}}
+
+    assert merge_chunk_results([result]) is result
+
+
+def test_merge_averages_scores_and_sums_counts():
+    """Score fields are averaged, count fields summed, other numbers keep the first chunk's value"""
+    merged = merge_chunk_results([
+        {
+            "call_metadata": {"overall_sentiment": 0.6, "duration_minutes": 45},
+            "confidence": 0.9,
+            "signal_count": 2,
+            "mentions": 1,
+        },
+        {
+            "call_metadata": {"overall_sentiment": -0.2, "duration_minutes": 45},
+            "confidence": 0.7,
+            "signal_count": 3,
+            "mentions": 4,
+        },
+    ])
+
+    assert merged["call_metadata"]["overall_sentiment"] == 0.2
+    assert merged["confidence"] == 0.8
+    assert merged["call_metadata"]["duration_minutes"] == 45
+    assert merged["signal_count"] == 5
+    assert merged["mentions"] == 5
+    assert merged["chunk_count"] == 2
+
+
+def test_merge_concatenates_and_deduplicates_lists():
+    """Lists are concatenated in chunk order; the same mapping or speaker is kept once"""
+    mapping = {"theme_id": "t1", "sub_theme_id": "s1", "feature_request": "Bulk export"}
+    merged = merge_chunk_results([
+        {"mappings": [mapping], "speakers": [{"name": "Alice"}]},
+        {
+            "mappings": [
+                {**mapping, "feature_request": " bulk EXPORT ", "confidence": 0.4},
+                {"theme_id": "t2", "sub_theme_id": None, "feature_request": "SSO"},
+            ],
+            "speakers": [{"name": "alice"}, {"name": "Bob"}],
+        },
+    ])
+
+    assert [m["feature_request"] for m in merged["mappings"]] == ["Bulk export", "SSO"]
+    assert [s["name"] for s in merged["speakers"]] == ["Alice", "Bob"]
+
+
+def test_merge_keeps_first_non_empty_string():
+    """Strings come from the first chunk that has one"""
+    merged = merge_chunk_results([
+        {"call_metadata": {"call_type": ""}},
+        {"call_metadata": {"call_type": "discovery"}},
+        {"call_metadata": {"call_type": "demo"}},
+    ])
+
+    assert merged["call_metadata"]["call_type"] == "discovery"
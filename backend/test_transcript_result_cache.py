@@ -0,0 +1,96 @@
+"""
+Tests for LLM result cache hits shared by identical transcripts in one batch
+
+No database or API keys needed (the session is a stand-in):
+    pytest test_transcript_result_cache.py
+"""
+import asyncio
+import sys
+import os
+from types import SimpleNamespace
+from uuid import uuid4
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.sync_engine.tasks.ai_pipeline import transcript_processing
+from app.sync_engine.tasks.ai_pipeline.classification_engine import ClassificationJob
+
+
+class _FakeSession:
+    """Hands out the given transcripts in order, one per lookup."""
+
+    def __init__(self, transcripts):
+        self.transcripts = list(transcripts)
+
+    def query(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return self.transcripts.pop(0)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def _transcript(workspace_id, participant):
+    return SimpleNamespace(
+        id=uuid4(),
+        workspace_id=workspace_id,
+        raw_data={"parties": [{"name": participant, "emailAddress": f"{participant.lower()}@example.com"}]},
+    )
+
+
+def test_jobs_sharing_a_cache_hit_get_their_own_result(monkeypatch):
+    """Two identical transcripts hitting one cache key don't see each other's enrichment"""
+    workspace_id = uuid4()
+    transcripts = [_transcript(workspace_id, "Alice"), _transcript(workspace_id, "Bob")]
+    cache_key = SimpleNamespace(key="shared-key")
+    cached = {"mappings": [{"theme_id": "t1", "feature_request": "Bulk export"}], "customer_metadata": {}}
+    jobs = [
+        ClassificationJob(
+            transcript_id=t.id, workspace_id=workspace_id, variables={}, estimated_tokens=1, cache_key=cache_key
+        )
+        for t in transcripts
+    ]
+
+    saved = {}
+
+    def apply_chunk_results(db, transcript, parts):
+        ai_result = transcript_processing.merge_chunk_results([result for _, result in parts])
+        saved[transcript.id] = transcript_processing._enrich_ai_result(ai_result, transcript.raw_data)
+        return None, []
+
+    monkeypatch.setattr(transcript_processing, "_apply_chunk_results", apply_chunk_results)
+    monkeypatch.setattr(transcript_processing, "get_async_openai_client", lambda: None)
+    monkeypatch.setattr(transcript_processing, "bump_classification_version", lambda workspace_id: None)
+
+    counters = {"processed": 0, "failed": 0, "skipped": 0, "cache_hits": 0}
+    asyncio.run(transcript_processing._classify_batch(
+        _FakeSession(transcripts), jobs, counters, cached_results={"shared-key": cached}
+    ))
+
+    assert counters["cache_hits"] == 2
+    assert counters["processed"] == 2
+    assert saved[transcripts[0].id]["participants"][0]["name"] == "Alice"
+    assert saved[transcripts[1].id]["participants"][0]["name"] == "Bob"
+    # The cached result itself is never enriched
+    assert "participants" not in cached
+
+
+def test_enrich_ai_result_does_not_mutate_its_input():
+    """Enrichment returns a copy with participants and company from raw_data"""
+    ai_result = {"customer_metadata": {}}
+    raw_data = {"parties": [{"name": "Alice"}], "metaData": {"companyName": "Acme"}}
+
+    enriched = transcript_processing._enrich_ai_result(ai_result, raw_data)
+
+    assert enriched["participants"] == [{"name": "Alice", "email": ""}]
+    assert enriched["customer_metadata"]["company_name"] == "Acme"
+    assert ai_result == {"customer_metadata": {}}